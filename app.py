@@ -565,6 +565,11 @@ def run_gui():
     """Launch GUI mode"""
     print("Starting GUI mode...")
 
+    # 启动时间线从这里开始计时（报告中的 hotkey_armed 即启动到热键可用的耗时）
+    from sonicinput.core.startup_timeline import StartupTimeline
+
+    startup_timeline = StartupTimeline()
+
     try:
 
         def apply_windows_ui_font(qt_app):
@@ -673,7 +678,7 @@ def run_gui():
         # Create application components (needed to access config)
         from sonicinput.core.di_container import create_container
 
-        container = create_container()
+        container = create_container(startup_timeline)
 
         # Load theme color from config
         from sonicinput.core.interfaces.config import IConfigService
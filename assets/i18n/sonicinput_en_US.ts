@@ -739,30 +739,30 @@ This may take a few seconds.</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="193"/>
-        <source>Cooldown Configuration</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="212"/>
+        <source>Rate Limit Configuration</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="194"/>
-        <source>Cooldown between records:</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="217"/>
+        <source>Cloud requests per minute:</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="195"/>
-        <source> seconds</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="221"/>
+        <source>Unlimited</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="197"/>
-        <source>Delay between processing each record.
-Useful for avoiding API rate limits when using cloud transcription.</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="79"/>
+        <source>Maximum cloud transcription requests per minute.
+Requests are sent in parallel up to this limit.</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="204"/>
-        <source>Recommended: 5 seconds for cloud providers to avoid rate limits.
-For local transcription (sherpa-onnx), 0-1 seconds is sufficient.</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="89"/>
+        <source>Set this to your provider&apos;s quota to avoid rate limit errors.
+Local transcription (sherpa-onnx) is not rate limited.</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
@@ -776,8 +776,8 @@ For local transcription (sherpa-onnx), 0-1 seconds is sufficient.</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="216"/>
-        <source>Based on average transcription time (5s for cloud, 0.2s for local) + CD time.</source>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="111"/>
+        <source>Based on 5s per cloud request with 4 parallel requests, capped by the rate limit. Local transcription is usually much faster.</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
@@ -1147,6 +1147,11 @@ Time: {time}</source>
 </context>
 <context>
     <name>HistoryTab</name>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="62"/>
+        <source>Waiting for dictation to finish...</source>
+        <translation type="unfinished"></translation>
+    </message>
     <message>
         <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="60"/>
         <source>Loading audio file...</source>
@@ -1314,8 +1319,8 @@ Time: {time}</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1328"/>
-        <source>Re-transcribe all history records with customizable cooldown delay</source>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1229"/>
+        <source>Re-transcribe all history records in parallel (resumable)</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
@@ -1428,10 +1433,10 @@ Time: {time}</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1700"/>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1648"/>
         <source>You are about to re-transcribe {total} records.
 
-Cooldown: {cooldown} seconds between records
+Cloud rate limit: {rate}
 This operation may take a long time and consume API quota.
 
 Are you sure you want to continue?</source>
@@ -1514,8 +1519,31 @@ Current record: {record_id}...</source>
         <translation type="unfinished"></translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1875"/>
-        <source>Batch reprocessing operation has been canceled.</source>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1839"/>
+        <source>Batch reprocessing operation has been canceled.
+Progress has been saved and can be resumed next time.</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1610"/>
+        <source>Resume Batch Reprocessing</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1613"/>
+        <source>A previous batch reprocessing run was interrupted after {processed} of {total} records.
+
+Resume from where it stopped? Choose No to start over.</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1637"/>
+        <source>{rate} requests per minute</source>
+        <translation type="unfinished"></translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1640"/>
+        <source>Unlimited</source>
         <translation type="unfinished"></translation>
     </message>
 </context>
@@ -2190,6 +2218,11 @@ Please check the system tray and logs for test results.</source>
         <source>Failed to test model: {error}</source>
         <translation type="unfinished"></translation>
     </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_window.py" line="1250"/>
+        <source>Downloading model {model}: {done:.1f} / {total:.1f} MB</source>
+        <translation type="unfinished"></translation>
+    </message>
     <message>
         <location filename="../../src/sonicinput/ui/settings_window.py" line="1266"/>
         <source>System Default</source>
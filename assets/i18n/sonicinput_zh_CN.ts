@@ -749,33 +749,33 @@ This may take a few seconds.</source>
         <translation>待处理记录总数:</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="193" />
-        <source>Cooldown Configuration</source>
-        <translation>冷却时间配置</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="212" />
+        <source>Rate Limit Configuration</source>
+        <translation>速率限制配置</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="194" />
-        <source>Cooldown between records:</source>
-        <translation>记录间冷却时间:</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="217" />
+        <source>Cloud requests per minute:</source>
+        <translation>云端每分钟请求数:</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="195" />
-        <source> seconds</source>
-        <translation> 秒</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="221" />
+        <source>Unlimited</source>
+        <translation>不限制</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="197" />
-        <source>Delay between processing each record.
-Useful for avoiding API rate limits when using cloud transcription.</source>
-        <translation>处理每条记录之间的延迟。
-用于在使用云端转录时避免 API 速率限制。</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="79" />
+        <source>Maximum cloud transcription requests per minute.
+Requests are sent in parallel up to this limit.</source>
+        <translation>云端转录每分钟最多请求数。
+在此限制内并行发送请求。</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="204" />
-        <source>Recommended: 5 seconds for cloud providers to avoid rate limits.
-For local transcription (sherpa-onnx), 0-1 seconds is sufficient.</source>
-        <translation>建议: 云端提供商设置为 5 秒以避免速率限制。
-本地转录(sherpa-onnx)设置为 0-1 秒即可。</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="89" />
+        <source>Set this to your provider's quota to avoid rate limit errors.
+Local transcription (sherpa-onnx) is not rate limited.</source>
+        <translation>请设置为服务商的配额，以避免触发速率限制错误。
+本地转录(sherpa-onnx)不受速率限制。</translation>
     </message>
     <message>
         <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="211" />
@@ -788,9 +788,9 @@ For local transcription (sherpa-onnx), 0-1 seconds is sufficient.</source>
         <translation>预计总时间:</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="216" />
-        <source>Based on average transcription time (5s for cloud, 0.2s for local) + CD time.</source>
-        <translation>基于平均转录时间(云端 5 秒，本地 0.2 秒) + CD 时间。</translation>
+        <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="111" />
+        <source>Based on 5s per cloud request with 4 parallel requests, capped by the rate limit. Local transcription is usually much faster.</source>
+        <translation>按每次云端请求 5 秒、4 个并行请求估算，并受速率限制约束。本地转录通常快得多。</translation>
     </message>
     <message>
         <location filename="../../src/sonicinput/ui/dialogs/batch_reprocess_dialog.py" line="223" />
@@ -1183,6 +1183,11 @@ Time: {time}</source>
 </context>
 <context>
     <name>HistoryTab</name>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="62" />
+        <source>Waiting for dictation to finish...</source>
+        <translation>正在等待听写结束...</translation>
+    </message>
     <message>
         <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="60" />
         <source>Loading audio file...</source>
@@ -1350,9 +1355,9 @@ Time: {time}</source>
         <translation>批量重处理</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1328" />
-        <source>Re-transcribe all history records with customizable cooldown delay</source>
-        <translation>使用可配置冷却时间重新转录所有历史记录</translation>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1229" />
+        <source>Re-transcribe all history records in parallel (resumable)</source>
+        <translation>并行重新转录所有历史记录(可断点续传)</translation>
     </message>
     <message>
         <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1335" />
@@ -1464,16 +1469,16 @@ Time: {time}</source>
         <translation>确认批量重处理</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1700" />
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1648" />
         <source>You are about to re-transcribe {total} records.
 
-Cooldown: {cooldown} seconds between records
+Cloud rate limit: {rate}
 This operation may take a long time and consume API quota.
 
 Are you sure you want to continue?</source>
         <translation>您即将重新转录 {total} 条记录。
 
-冷却时间: 记录间 {cooldown} 秒
+云端速率限制: {rate}
 此操作可能耗时较长并消耗 API 配额。
 
 您确定要继续吗?</translation>
@@ -1556,9 +1561,35 @@ Current record: {record_id}...</source>
         <translation>批量重处理已取消</translation>
     </message>
     <message>
-        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1875" />
-        <source>Batch reprocessing operation has been canceled.</source>
-        <translation>批量重处理操作已取消。</translation>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1839" />
+        <source>Batch reprocessing operation has been canceled.
+Progress has been saved and can be resumed next time.</source>
+        <translation>批量重处理操作已取消。
+进度已保存，下次可继续处理。</translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1610" />
+        <source>Resume Batch Reprocessing</source>
+        <translation>继续批量重处理</translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1613" />
+        <source>A previous batch reprocessing run was interrupted after {processed} of {total} records.
+
+Resume from where it stopped? Choose No to start over.</source>
+        <translation>上次批量重处理在完成 {processed}/{total} 条记录后中断。
+
+是否从中断处继续?选择“否”将从头开始。</translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1637" />
+        <source>{rate} requests per minute</source>
+        <translation>每分钟 {rate} 次请求</translation>
+    </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_tabs/history_tab.py" line="1640" />
+        <source>Unlimited</source>
+        <translation>不限制</translation>
     </message>
 </context>
 <context>
@@ -2302,6 +2333,11 @@ Please check the system tray and logs for test results.</source>
         <source>Failed to test model: {error}</source>
         <translation>测试模型失败: {error}</translation>
     </message>
+    <message>
+        <location filename="../../src/sonicinput/ui/settings_window.py" line="1250" />
+        <source>Downloading model {model}: {done:.1f} / {total:.1f} MB</source>
+        <translation>正在下载模型 {model}: {done:.1f} / {total:.1f} MB</translation>
+    </message>
     <message>
         <location filename="../../src/sonicinput/ui/settings_window.py" line="1266" />
         <source>System Default</source>
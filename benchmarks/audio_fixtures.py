@@ -0,0 +1,67 @@
+"""
+Shared audio inputs for the benchmarks
+
+Benchmarks run on a synthetic utterance by default so they need no data
+files; --fixtures points them at a directory of real WAV recordings (each
+optionally paired with a reference transcript in a .txt file of the same
+name) instead.
+"""
+
+import sys
+import wave
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.speech.warmup import SAMPLE_RATE, synthetic_utterance
+
+Fixture = Tuple[str, np.ndarray, Optional[str]]
+
+
+def read_wav(path: Path) -> Tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV file as mono float32, returning (audio, rate)"""
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path.name}: expected 16-bit PCM")
+        frames = wav.readframes(wav.getnframes())
+        channels = wav.getnchannels()
+        sample_rate = wav.getframerate()
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio, sample_rate
+
+
+def load_fixtures(
+    directory: Optional[str], synthetic_seconds: float = 5.0
+) -> List[Fixture]:
+    """Return [(name, 16 kHz audio, reference or None)]
+
+    Without a directory a single synthetic utterance is returned.
+    """
+    if directory is None:
+        return [("synthetic", synthetic_utterance(synthetic_seconds), None)]
+    fixtures = []
+    for wav_path in sorted(Path(directory).glob("*.wav")):
+        audio, sample_rate = read_wav(wav_path)
+        if sample_rate != SAMPLE_RATE:
+            raise ValueError(f"{wav_path.name}: expected 16 kHz audio")
+        txt_path = wav_path.with_suffix(".txt")
+        reference = (
+            txt_path.read_text(encoding="utf-8").strip() if txt_path.exists() else None
+        )
+        fixtures.append((wav_path.stem, audio, reference))
+    if not fixtures:
+        raise SystemExit(f"No .wav fixtures found in {directory}")
+    return fixtures
+
+
+def concatenated_audio(fixtures: List[Fixture], seconds: float) -> np.ndarray:
+    """Repeat the fixture audio back to back until it is `seconds` long"""
+    audio = np.concatenate([fixture[1] for fixture in fixtures])
+    target = int(seconds * SAMPLE_RATE)
+    repeats = -(-target // audio.size)
+    return np.tile(audio, repeats)[:target]
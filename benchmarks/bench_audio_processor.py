@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+AudioProcessor stage benchmark
+
+Times each AudioProcessor stage on the same input so a slow stage stands
+out: resampling from 44.1 kHz and 48 kHz to 16 kHz, normalization, noise
+reduction, silence removal, the full convert_to_whisper_format() pipeline
+and get_audio_statistics(). Each stage reports the best of several repeats
+in milliseconds and as a multiple of real time. Input is a synthetic
+utterance, or the --fixtures WAV files concatenated to --seconds.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_audio_processor.py --seconds 30
+    uv run python benchmarks/bench_audio_processor.py --fixtures path/to/wavs
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.audio.processor import AudioProcessor
+from sonicinput.speech.warmup import SAMPLE_RATE, synthetic_utterance
+
+from audio_fixtures import concatenated_audio, load_fixtures
+
+
+def _best_ms(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _stage(func, seconds: float, repeats: int) -> dict:
+    ms = _best_ms(func, repeats)
+    return {
+        "ms": round(ms, 3),
+        "x_realtime": round(seconds * 1000 / ms, 1) if ms else None,
+    }
+
+
+def run(seconds: float, repeats: int, fixtures_dir=None) -> dict:
+    processor = AudioProcessor()
+    if fixtures_dir is None:
+        audio = synthetic_utterance(seconds)
+    else:
+        audio = concatenated_audio(load_fixtures(fixtures_dir), seconds)
+    # Pauses between utterances so remove_silence has something to cut
+    pause = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    with_pauses = np.concatenate(
+        [part for chunk in np.array_split(audio, 4) for part in (chunk, pause)]
+    )
+    paused_seconds = with_pauses.size / SAMPLE_RATE
+
+    stages = {}
+    for rate in (44100, 48000):
+        source = synthetic_utterance(seconds, sample_rate=rate)
+        stages[f"resample_{rate}"] = _stage(
+            lambda: processor.resample_to_16khz(source, rate), seconds, repeats
+        )
+    stages["normalize"] = _stage(
+        lambda: processor.normalize_audio(audio), seconds, repeats
+    )
+    stages["noise_reduction"] = _stage(
+        lambda: processor.apply_noise_reduction(audio), seconds, repeats
+    )
+    stages["remove_silence"] = _stage(
+        lambda: processor.remove_silence(with_pauses), paused_seconds, repeats
+    )
+    stages["whisper_format"] = _stage(
+        lambda: processor.convert_to_whisper_format(audio), seconds, repeats
+    )
+    stages["whisper_format_remove_silence"] = _stage(
+        lambda: processor.convert_to_whisper_format(with_pauses, remove_silence=True),
+        paused_seconds,
+        repeats,
+    )
+    stages["statistics"] = _stage(
+        lambda: processor.get_audio_statistics(audio), seconds, repeats
+    )
+
+    return {
+        "benchmark": "audio_processor",
+        "python": sys.version.split()[0],
+        "audio_seconds": seconds,
+        "source": "fixtures" if fixtures_dir else "synthetic",
+        "repeats": repeats,
+        "stages": stages,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--fixtures", help="directory of 16 kHz .wav files")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.seconds, args.repeats, args.fixtures), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+AudioRecorder buffer benchmark
+
+Drives AudioRecorder from a fake input stream instead of a microphone, so
+it runs headless and measures only the recorder's own work:
+- capture: the recording thread reading, converting and buffering a
+  pre-generated recording as fast as the stream hands it out, then
+  stop_recording() (thread join, stream close and the final concatenate)
+- buffers: for 1, 5 and 15 minute recordings, the total cost of the
+  streaming chunk extraction (_on_chunk_ready every --chunk-seconds), the
+  final get_remaining_audio_for_streaming() and a full get_audio_data()
+
+The fake stream replaces the PyAudio instance after the recorder starts.
+PyAudio is a Windows-only dependency; where it is not installed a minimal
+stand-in module providing the same names is registered so the recorder
+module can be imported.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_audio_recorder.py --minutes 1 5 15
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.speech.warmup import SAMPLE_RATE, synthetic_utterance
+
+from audio_fixtures import concatenated_audio, load_fixtures
+
+
+class FakeStream:
+    """Hands out a pre-generated int16 recording chunk by chunk
+
+    Once the recording is used up it behaves like an idle device: it
+    signals `drained` and paces further reads at the real chunk rate.
+    """
+
+    def __init__(self, pcm: bytes, chunk_bytes: int, chunk_seconds: float):
+        self._pcm = pcm
+        self._offset = 0
+        self._chunk_bytes = chunk_bytes
+        self._chunk_seconds = chunk_seconds
+        self._silence = bytes(chunk_bytes)
+        self.drained = threading.Event()
+
+    def read(self, num_frames, exception_on_overflow=True):
+        if self._offset >= len(self._pcm):
+            self.drained.set()
+            time.sleep(self._chunk_seconds)
+            return self._silence
+        data = self._pcm[self._offset : self._offset + self._chunk_bytes]
+        self._offset += self._chunk_bytes
+        return data
+
+    def stop_stream(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    """The subset of pyaudio.PyAudio the recorder uses"""
+
+    def __init__(self):
+        self.stream = None
+
+    def open(self, **kwargs):
+        return self.stream
+
+    def get_device_count(self):
+        return 0
+
+    def terminate(self):
+        pass
+
+
+def _import_recorder():
+    try:
+        import pyaudio  # noqa: F401
+    except ImportError:
+        stand_in = types.ModuleType("pyaudio")
+        stand_in.PyAudio = FakePyAudio
+        stand_in.paInt16 = 8
+        sys.modules["pyaudio"] = stand_in
+    from sonicinput.audio.recorder import AudioRecorder
+
+    return AudioRecorder
+
+
+def _create_recorder(chunk_size: int, chunk_seconds: float):
+    recorder = _import_recorder()(sample_rate=SAMPLE_RATE, chunk_size=chunk_size)
+    if recorder._audio is not None:
+        recorder._audio.terminate()
+    recorder._audio = FakePyAudio()
+    recorder.chunk_duration = chunk_seconds
+    return recorder
+
+
+def _to_pcm(audio: np.ndarray) -> bytes:
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+
+def bench_capture(audio: np.ndarray, chunk_size: int) -> dict:
+    recorder = _create_recorder(chunk_size, chunk_seconds=float("inf"))
+    stream = FakeStream(_to_pcm(audio), chunk_size * 2, chunk_size / SAMPLE_RATE)
+    recorder._audio.stream = stream
+    try:
+        start = time.perf_counter()
+        recorder.start_recording()
+        stream.drained.wait()
+        capture_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        captured, _ = recorder.stop_recording()
+        stop_ms = (time.perf_counter() - start) * 1000
+    finally:
+        recorder.stop()
+
+    audio_seconds = audio.size / SAMPLE_RATE
+    return {
+        "audio_seconds": round(audio_seconds, 1),
+        "x_realtime": round(audio_seconds / capture_seconds, 1),
+        "stop_recording_ms": round(stop_ms, 2),
+        "captured_samples": int(captured.size),
+    }
+
+
+def bench_buffers(minutes: float, chunk_size: int, chunk_seconds: float) -> dict:
+    """Replay the buffer operations of a recording of the given length"""
+    recorder = _create_recorder(chunk_size, chunk_seconds)
+    chunk = synthetic_utterance(chunk_size / SAMPLE_RATE)
+    total_chunks = int(minutes * 60 * SAMPLE_RATE / chunk_size)
+    chunks_per_callback = max(1, int(chunk_seconds * SAMPLE_RATE / chunk_size))
+    sent = []
+    recorder.chunk_callback = lambda audio: sent.append(audio.size)
+
+    chunk_ready_seconds = 0.0
+    recorder._recording = True
+    try:
+        for i in range(1, total_chunks + 1):
+            # Each read yields a freshly allocated array, as in _record_audio
+            with recorder._data_lock:
+                recorder._audio_data.append(chunk.copy())
+            if i % chunks_per_callback == 0:
+                start = time.perf_counter()
+                recorder._on_chunk_ready()
+                chunk_ready_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        remaining = recorder.get_remaining_audio_for_streaming()
+        remaining_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        recorder.get_audio_data()
+        audio_data_ms = (time.perf_counter() - start) * 1000
+    finally:
+        recorder._recording = False
+        recorder.stop()
+
+    return {
+        "minutes": minutes,
+        "chunks": total_chunks,
+        "streaming_chunks_sent": len(sent) + (1 if remaining.size else 0),
+        "on_chunk_ready_total_ms": round(chunk_ready_seconds * 1000, 2),
+        "remaining_audio_ms": round(remaining_ms, 2),
+        "get_audio_data_ms": round(audio_data_ms, 2),
+    }
+
+
+def run(
+    minutes,
+    chunk_size=4096,
+    chunk_seconds=15.0,
+    capture_seconds=60.0,
+    fixtures_dir=None,
+) -> dict:
+    if fixtures_dir is None:
+        audio = synthetic_utterance(capture_seconds)
+    else:
+        audio = concatenated_audio(load_fixtures(fixtures_dir), capture_seconds)
+
+    return {
+        "benchmark": "audio_recorder",
+        "python": sys.version.split()[0],
+        "chunk_size": chunk_size,
+        "chunk_seconds": chunk_seconds,
+        "source": "fixtures" if fixtures_dir else "synthetic",
+        "capture": bench_capture(audio, chunk_size),
+        "buffers": [bench_buffers(m, chunk_size, chunk_seconds) for m in minutes],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", nargs="*", type=float, default=[1, 5, 15])
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument(
+        "--chunk-seconds",
+        type=float,
+        default=15.0,
+        help="streaming chunk duration (audio.streaming_chunk_duration)",
+    )
+    parser.add_argument(
+        "--capture-seconds", type=float, default=60.0, help="fake stream length"
+    )
+    parser.add_argument("--fixtures", help="directory of 16 kHz .wav files")
+    args = parser.parse_args()
+
+    result = run(
+        args.minutes,
+        args.chunk_size,
+        args.chunk_seconds,
+        args.capture_seconds,
+        args.fixtures,
+    )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Batch reprocessing benchmark
+
+Reprocesses a synthetic history database with the pipelined
+BatchReprocessingEngine and, for comparison, with a serial loop equivalent
+to the previous per-record worker (load -> transcribe -> update, without the
+cooldown sleep). Transcription is simulated with a fixed per-call overhead
+plus a per-record cost so that batching and concurrency effects are visible
+without a model download. Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_batch_reprocessing.py --records 10000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import wave
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.batch_reprocessing_engine import (
+    BatchReprocessingEngine,
+)
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import HistoryStorageService
+
+
+def _load_wav(path: str) -> np.ndarray:
+    with wave.open(path, "rb") as wav_file:
+        frames = wav_file.readframes(wav_file.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class _SimulatedASR:
+    """Fixed per-call overhead + per-record cost (seconds)"""
+
+    def __init__(self, call_overhead: float, per_record: float):
+        self.call_overhead = call_overhead
+        self.per_record = per_record
+
+    def transcribe_batch(self, audio_batch, language=None, temperature=0.0):
+        time.sleep(self.call_overhead + self.per_record * len(audio_batch))
+        return [{"success": True, "text": "reprocessed"} for _ in audio_batch]
+
+    def transcribe_sync(self, audio_data, language=None, temperature=0.0):
+        time.sleep(self.call_overhead + self.per_record)
+        return {"success": True, "text": "reprocessed"}
+
+
+def _make_config(storage_path: Path, provider: str) -> Mock:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+        ConfigKeys.TRANSCRIPTION_PROVIDER: provider,
+        ConfigKeys.AI_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    return config
+
+
+def _populate(service: HistoryStorageService, count: int) -> None:
+    recordings_dir = service.get_storage_path() / "recordings"
+    samples = (np.sin(np.linspace(0, 200, 16000)) * 8000).astype(np.int16)
+    payload = samples.tobytes()
+    now = datetime.now()
+    records = []
+    for i in range(count):
+        audio_path = recordings_dir / f"bench_{i:06d}.wav"
+        with wave.open(str(audio_path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(payload)
+        records.append(
+            HistoryRecord(
+                id=f"bench-{i:06d}",
+                timestamp=now - timedelta(seconds=i),
+                audio_file_path=str(audio_path),
+                duration=1.0,
+                transcription_text="original",
+                transcription_provider="local",
+                transcription_status="success",
+            )
+        )
+    service.save_records_batch(records)
+
+
+def _run_serial(service, asr, limit: int) -> float:
+    start = time.perf_counter()
+    for record in service.get_records(limit=limit):
+        audio = _load_wav(record.audio_file_path)
+        result = asr.transcribe_sync(audio)
+        record.transcription_text = result["text"]
+        record.final_text = result["text"]
+        service.update_record(record)
+    return time.perf_counter() - start
+
+
+def _run_engine(service, asr, config, limit, **kwargs) -> dict:
+    engine = BatchReprocessingEngine(
+        service, asr, config, audio_loader=_load_wav, **kwargs
+    )
+    start = time.perf_counter()
+    stats = engine.run(resume=False, limit=limit)
+    elapsed = time.perf_counter() - start
+    return {
+        "seconds": round(elapsed, 3),
+        "records_per_second": round(stats.success / elapsed, 1) if elapsed else None,
+        "success": stats.success,
+        "failed": stats.failed + stats.skipped,
+    }
+
+
+def run(args) -> dict:
+    asr = _SimulatedASR(args.call_overhead_ms / 1000, args.per_record_ms / 1000)
+    with tempfile.TemporaryDirectory(prefix="sonicinput_bench_") as tmp:
+        service = HistoryStorageService(_make_config(Path(tmp), "local"))
+        if not service.start():
+            raise RuntimeError("HistoryStorageService failed to start")
+        try:
+            populate_start = time.perf_counter()
+            _populate(service, args.records)
+            populate_seconds = time.perf_counter() - populate_start
+
+            serial_limit = min(args.records, args.serial_sample)
+            serial_seconds = _run_serial(service, asr, serial_limit)
+            serial_rate = serial_limit / serial_seconds if serial_seconds else 0
+
+            local = _run_engine(
+                service,
+                asr,
+                _make_config(Path(tmp), "local"),
+                None,
+                asr_batch_size=args.batch_size,
+            )
+            cloud = _run_engine(
+                service,
+                asr,
+                _make_config(Path(tmp), "groq"),
+                None,
+                cloud_concurrency=args.cloud_concurrency,
+                requests_per_minute=args.requests_per_minute,
+            )
+        finally:
+            service.stop()
+
+    return {
+        "benchmark": "batch_reprocessing",
+        "records": args.records,
+        "simulated_call_overhead_ms": args.call_overhead_ms,
+        "simulated_per_record_ms": args.per_record_ms,
+        "populate_seconds": round(populate_seconds, 3),
+        "serial": {
+            "sampled_records": serial_limit,
+            "records_per_second": round(serial_rate, 1),
+            "projected_seconds": round(args.records / serial_rate, 3)
+            if serial_rate
+            else None,
+        },
+        "engine_local_batched": local,
+        "engine_cloud_concurrent": cloud,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--serial-sample", type=int, default=500)
+    parser.add_argument("--call-overhead-ms", type=float, default=4.0)
+    parser.add_argument("--per-record-ms", type=float, default=1.0)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--cloud-concurrency", type=int, default=4)
+    parser.add_argument("--requests-per-minute", type=float, default=0)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Cloud transcription client benchmark
+
+Runs the Groq, SiliconFlow and Qwen clients against a local HTTP stub that
+answers immediately with a canned response in each provider's format, so
+no API key or network is needed. Measures the client-side cost of a
+transcribe() call -- WAV encoding (plus base64 for Qwen), request
+building, the HTTP round trip on a pooled connection and response parsing
+-- for several audio lengths.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_cloud_clients.py --seconds 5 30 --requests 20
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.speech.groq_speech_service import GroqSpeechService
+from sonicinput.speech.qwen_engine import QwenEngine
+from sonicinput.speech.siliconflow_engine import SiliconFlowEngine
+from sonicinput.speech.warmup import synthetic_utterance
+
+_TEXT = "今天下午三点开会讨论项目进度"
+
+RESPONSES = {
+    "/groq": {
+        "text": _TEXT,
+        "language": "zh",
+        "segments": [{"start": 0.0, "end": 2.0, "text": _TEXT, "avg_logprob": -0.2}],
+    },
+    "/siliconflow": {"text": _TEXT},
+    "/qwen": {
+        "output": {
+            "choices": [
+                {
+                    "message": {
+                        "content": [{"text": _TEXT}],
+                        "annotations": [{"language": "zh", "emotion": "neutral"}],
+                    }
+                }
+            ]
+        }
+    },
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this the stub
+    # adds a delayed-ACK stall to every request
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(RESPONSES[self.path]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _clients(base_url: str) -> dict:
+    clients = {
+        "groq": GroqSpeechService(api_key="bench"),
+        "siliconflow": SiliconFlowEngine(api_key="bench"),
+        "qwen": QwenEngine(api_key="bench"),
+    }
+    for name, client in clients.items():
+        client.api_endpoint = f"{base_url}/{name}"
+    return clients
+
+
+def bench_client(client, audio, requests: int) -> dict:
+    # The first call opens the pooled connection
+    result = client.transcribe(audio, max_retries=0)
+    if "error" in result:
+        return {"error": result["error"]}
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.transcribe(audio, max_retries=0)
+        latencies.append(time.perf_counter() - start)
+    return {
+        "mean_ms": round(statistics.mean(latencies) * 1000, 3),
+        "min_ms": round(min(latencies) * 1000, 3),
+        "text_ok": result.get("text") == _TEXT,
+    }
+
+
+def run(seconds, requests: int) -> dict:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    results = {}
+    try:
+        clients = _clients(base_url)
+        for duration in seconds:
+            audio = synthetic_utterance(duration)
+            results[f"{duration:g}s"] = {
+                name: bench_client(client, audio, requests)
+                for name, client in clients.items()
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {
+        "benchmark": "cloud_clients",
+        "python": sys.version.split()[0],
+        "requests": requests,
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", nargs="*", type=float, default=[5.0, 30.0])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.seconds, args.requests), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Config get_setting throughput benchmark
+
+Measures lookups per second on a RefactoredConfigService loaded with the
+default configuration, for the keys read on every recording / AI call:
+- get_setting through the precompiled flat index
+- the same lookups with the old split-and-walk implementation (reference)
+- typed accessors generated from ConfigKeys
+- the cost of rebuilding the index on set_setting
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_config_get_setting.py --iterations 200000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.config.config_service_refactored import (
+    RefactoredConfigService,
+)
+
+HOT_KEYS = (
+    ConfigKeys.AI_PROVIDER,
+    "ai.openrouter.model_id",
+    ConfigKeys.AI_PROMPT,
+    ConfigKeys.AI_ENABLED,
+    ConfigKeys.TRANSCRIPTION_PROVIDER,
+    ConfigKeys.TRANSCRIPTION_LOCAL_STREAMING_MODE,
+    ConfigKeys.AUDIO_SAMPLE_RATE,
+    "missing.key",
+)
+
+
+def _walk(config, key, default=None):
+    """The pre-index lookup: split the key and walk the nested dicts"""
+    value = config
+    for k in key.split("."):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return default
+    return value
+
+
+def _rate(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return round(iterations / elapsed)
+
+
+def run(iterations: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        service = RefactoredConfigService(config_path=str(Path(tmp) / "config.json"))
+        service.load_config()
+        config = service._reader._config
+        typed = service.typed
+        get_setting = service.get_setting
+
+        def indexed():
+            for key in HOT_KEYS:
+                get_setting(key)
+
+        def walked():
+            for key in HOT_KEYS:
+                _walk(config, key)
+
+        def accessors():
+            typed.ai_provider
+            typed.ai_prompt
+            typed.ai_enabled
+            typed.transcription_provider
+            typed.transcription_local_streaming_mode
+            typed.audio_sample_rate
+
+        lookups = len(HOT_KEYS)
+        result = {
+            "benchmark": "config_get_setting",
+            "python": sys.version.split()[0],
+            "iterations": iterations,
+            "get_setting_per_sec": _rate(indexed, iterations) * lookups,
+            "nested_walk_per_sec": _rate(walked, iterations) * lookups,
+            "typed_accessor_per_sec": _rate(accessors, iterations) * 6,
+        }
+
+        set_iterations = max(1, iterations // 100)
+        values = ("groq", "openrouter")
+        start = time.perf_counter()
+        for i in range(set_iterations):
+            service._writer.set_setting(ConfigKeys.AI_PROVIDER, values[i % 2])
+            service._reader._config = service._writer._config
+        result["index_rebuild_us"] = round(
+            (time.perf_counter() - start) / set_iterations * 1e6, 2
+        )
+        result["speedup"] = round(
+            result["get_setting_per_sec"] / result["nested_walk_per_sec"], 2
+        )
+        service._writer.cleanup()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
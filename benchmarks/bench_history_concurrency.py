@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+History database concurrency benchmark
+
+Simulates the history tab paging and searching from several reader threads
+while a background writer keeps saving and updating records (as the
+recording pipeline and batch reprocessing do). Reports reader and writer
+throughput, read latency percentiles and the connection pool state before
+and after stop(). Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_history_concurrency.py --seconds 10 --readers 4
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import HistoryStorageService
+
+_WORDS = "meeting schedule deadline review 项目 进度 接口 文档 测试 结果".split()
+
+
+def _make_record(i: int, rng: random.Random) -> HistoryRecord:
+    text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 30)))
+    return HistoryRecord(
+        id=f"bench-{i:08d}",
+        timestamp=datetime(2024, 1, 1) + timedelta(seconds=i * 11),
+        audio_file_path=f"recordings/bench_{i:08d}.wav",
+        duration=round(rng.uniform(1.0, 20.0), 2),
+        transcription_text=text,
+        transcription_provider="local",
+        transcription_status="success",
+        ai_status="skipped",
+        final_text=text,
+    )
+
+
+def _percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index] * 1000, 3)
+
+
+def _reader(service, stop, rng_seed, latencies, counts):
+    rng = random.Random(rng_seed)
+    local = []
+    ops = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        choice = rng.random()
+        if choice < 0.5:
+            service.get_records(limit=50, offset=rng.randint(0, 20) * 50)
+        elif choice < 0.8:
+            service.search_records(query=rng.choice(_WORDS), limit=50)
+        else:
+            service.get_aggregate_stats()
+        local.append(time.perf_counter() - start)
+        ops += 1
+    latencies.extend(local)
+    counts.append(ops)
+
+
+def _writer(service, stop, start_index, batch_size, counts):
+    rng = random.Random(7)
+    index = start_index
+    ops = 0
+    while not stop.is_set():
+        records = [_make_record(index + i, rng) for i in range(batch_size)]
+        service.save_records_batch(records)
+        index += batch_size
+        record = records[0]
+        record.final_text = record.final_text.upper()
+        service.update_record(record)
+        ops += batch_size + 1
+    counts.append(ops)
+
+
+def run(args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sonicinput_bench_") as tmp:
+        settings = {
+            ConfigKeys.HISTORY_STORAGE_PATH: tmp,
+            ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+            ConfigKeys.HISTORY_DB_READ_POOL_SIZE: args.pool_size,
+        }
+        config = Mock()
+        config.get_setting.side_effect = lambda key, default=None: settings.get(
+            key, default
+        )
+        service = HistoryStorageService(config)
+        if not service.start():
+            raise RuntimeError("HistoryStorageService failed to start")
+
+        rng = random.Random(42)
+        service.save_records_batch([_make_record(i, rng) for i in range(args.records)])
+
+        stop = threading.Event()
+        latencies: list = []
+        read_counts: list = []
+        write_counts: list = []
+        threads = [
+            threading.Thread(
+                target=_reader, args=(service, stop, i, latencies, read_counts)
+            )
+            for i in range(args.readers)
+        ]
+        threads.append(
+            threading.Thread(
+                target=_writer,
+                args=(service, stop, args.records, args.write_batch, write_counts),
+            )
+        )
+        for thread in threads:
+            thread.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        manager = service._connections
+        pool_before_stop = manager.stats()
+        service.stop()
+        pool_after_stop = manager.stats()
+
+    reads = sum(read_counts)
+    writes = sum(write_counts)
+    return {
+        "benchmark": "history_concurrency",
+        "seed_records": args.records,
+        "reader_threads": args.readers,
+        "seconds": args.seconds,
+        "reads_per_second": round(reads / args.seconds, 1),
+        "records_written_per_second": round(writes / args.seconds, 1),
+        "read_latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": _percentile(latencies, 100),
+        },
+        "connections_before_stop": pool_before_stop,
+        "connections_after_stop": pool_after_stop,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-batch", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+History query latency benchmark
+
+Seeds a fresh history database with 1k and 100k records and times the
+queries behind the history tab and batch jobs at each size: the first
+page, the last page by OFFSET and the same page by keyset
+(get_records_after), text search with and without a status filter, the
+total count and aggregate stats used by the pager, and a lookup by id. Each query reports the best of several
+repeats in milliseconds.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_history_queries.py --records 1000 100000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import HistoryStorageService
+
+_WORDS = "meeting schedule deadline review 项目 进度 接口 文档 测试 结果".split()
+_AI_STATUSES = ["success", "skipped", "failed"]
+_PAGE = 50  # history tab page size
+
+
+def _make_record(i: int, rng: random.Random) -> HistoryRecord:
+    text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 30)))
+    return HistoryRecord(
+        id=f"bench-{i:08d}",
+        timestamp=datetime(2024, 1, 1) + timedelta(seconds=i * 11),
+        audio_file_path=f"recordings/bench_{i:08d}.wav",
+        duration=round(rng.uniform(1.0, 20.0), 2),
+        transcription_text=text,
+        transcription_provider="local",
+        transcription_status="success",
+        ai_status=rng.choice(_AI_STATUSES),
+        final_text=text,
+    )
+
+
+def _create_service(storage_path: str) -> HistoryStorageService:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: storage_path,
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    service = HistoryStorageService(config)
+    if not service.start():
+        raise RuntimeError("HistoryStorageService failed to start")
+    return service
+
+
+def _best_ms(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def bench_size(records: int, repeats: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sonicinput_bench_") as tmp:
+        service = _create_service(tmp)
+        try:
+            rng = random.Random(42)
+            start = time.perf_counter()
+            for first in range(0, records, 5000):
+                batch = range(first, min(records, first + 5000))
+                service.save_records_batch([_make_record(i, rng) for i in batch])
+            seed_seconds = time.perf_counter() - start
+
+            middle = service.get_records(limit=1, offset=records // 2)[0]
+            # deep_page and keyset_page fetch the same rows: the last page in
+            # ascending order, by OFFSET and by the cursor just before it
+            depth = max(records - _PAGE, 1)
+            cursor = service.get_records(
+                limit=1, offset=depth - 1, order_by="timestamp ASC"
+            )[0]
+            after = (cursor.timestamp.isoformat(), cursor.id)
+            queries = {
+                "first_page": lambda: service.get_records(limit=_PAGE),
+                "deep_page": lambda: service.get_records(
+                    limit=_PAGE, offset=depth, order_by="timestamp ASC"
+                ),
+                "keyset_page": lambda: service.get_records_after(after, limit=_PAGE),
+                "search": lambda: service.search_records(query="deadline", limit=_PAGE),
+                "search_filtered": lambda: service.search_records(
+                    query="项目", ai_status="failed", limit=_PAGE
+                ),
+                "total_count": lambda: service.get_total_count(),
+                "search_count": lambda: service.get_total_count(query="deadline"),
+                "aggregate_stats": lambda: service.get_aggregate_stats(),
+                "by_id": lambda: service.get_record_by_id(middle.id),
+            }
+            timings = {
+                name: _best_ms(query, repeats) for name, query in queries.items()
+            }
+        finally:
+            service.stop()
+
+    return {
+        "records": records,
+        "seed_records_per_second": round(records / seed_seconds, 1),
+        "query_ms": timings,
+    }
+
+
+def run(records, repeats: int) -> dict:
+    return {
+        "benchmark": "history_queries",
+        "python": sys.version.split()[0],
+        "repeats": repeats,
+        "results": [bench_size(count, repeats) for count in records],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", nargs="*", type=int, default=[1000, 100000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.records, args.repeats), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+History retention benchmark
+
+Measures bulk deletion of history records (single transaction + batched
+file unlink) through the retention engine, followed by WAL checkpoint and
+VACUUM. Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_history_retention.py --records 50000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import (
+    HistoryRetentionManager,
+    HistoryStorageService,
+    RetentionPolicy,
+)
+
+
+def _create_service(storage_path: Path) -> HistoryStorageService:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    service = HistoryStorageService(config)
+    if not service.start():
+        raise RuntimeError("HistoryStorageService failed to start")
+    return service
+
+
+def _populate(service: HistoryStorageService, count: int, file_size: int) -> float:
+    recordings_dir = service.get_storage_path() / "recordings"
+    now = datetime.now()
+    payload = b"\0" * file_size
+    records = []
+
+    start = time.perf_counter()
+    for i in range(count):
+        audio_path = recordings_dir / f"bench_{i:06d}.wav"
+        audio_path.write_bytes(payload)
+        records.append(
+            HistoryRecord(
+                id=f"bench-{i:06d}",
+                timestamp=now - timedelta(minutes=i),
+                audio_file_path=str(audio_path),
+                duration=2.5,
+                transcription_text=f"benchmark transcription {i}",
+                transcription_provider="local",
+                transcription_status="success",
+                ai_status="skipped",
+                final_text=f"benchmark transcription {i}",
+            )
+        )
+    service.save_records_batch(records)
+    return time.perf_counter() - start
+
+
+def run(record_count: int, keep: int, file_size: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sonicinput_bench_") as tmp:
+        service = _create_service(Path(tmp))
+        try:
+            populate_seconds = _populate(service, record_count, file_size)
+
+            manager = HistoryRetentionManager(
+                service, policy=RetentionPolicy(max_records=keep)
+            )
+            start = time.perf_counter()
+            report = manager.run_once(force_vacuum=True)
+            elapsed = time.perf_counter() - start
+
+            return {
+                "benchmark": "history_retention",
+                "records": record_count,
+                "kept": keep,
+                "populate_seconds": round(populate_seconds, 3),
+                "retention_seconds": round(elapsed, 3),
+                "records_per_second": round(report.records_deleted / elapsed, 1)
+                if elapsed > 0
+                else None,
+                "report": report.to_dict(),
+            }
+        finally:
+            service.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=50000)
+    parser.add_argument("--keep", type=int, default=1000)
+    parser.add_argument("--file-size", type=int, default=256)
+    args = parser.parse_args()
+
+    result = run(args.records, args.keep, args.file_size)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
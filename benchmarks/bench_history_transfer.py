@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+History export/import benchmark
+
+Generates a realistic history fixture (JSONL, streamed to disk), bulk
+imports it into an empty database, then exports it again as JSONL and CSV
+(optionally with an audio tarball). Throughput is reported in records per
+second together with the process peak RSS, which should stay flat as the
+record count grows. Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_history_transfer.py --records 100000
+    uv run python benchmarks/bench_history_transfer.py --fixture-only fixture.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import wave
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import (
+    HistoryExporter,
+    HistoryImporter,
+    HistoryStorageService,
+)
+
+_WORDS = (
+    "今天 我们 讨论 一下 项目 进度 需要 确认 接口 文档 the meeting schedule "
+    "deadline review please update 测试 结果 已经 提交 明天 继续"
+).split()
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+
+        # Linux 以 KB 为单位，macOS 以字节为单位
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        return 0.0
+
+
+def write_fixture(path: Path, count: int, audio_dir: Path = None) -> None:
+    """流式生成 count 条历史记录（JSONL），可选为每条记录生成 0.5 秒静音 WAV"""
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    silence = b"\0\0" * 8000
+    with open(path, "w", encoding="utf-8") as out:
+        for i in range(count):
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 40)))
+            refined = rng.random() < 0.6
+            audio_file = None
+            if audio_dir is not None:
+                audio_file = f"fixture_{i:07d}.wav"
+                with wave.open(str(audio_dir / audio_file), "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)
+                    wav_file.setframerate(16000)
+                    wav_file.writeframes(silence)
+            row = {
+                "id": f"fixture-{i:07d}",
+                "timestamp": (start + timedelta(seconds=i * 37)).isoformat(),
+                "audio_file_path": str(audio_dir / audio_file)
+                if audio_file
+                else f"recordings/fixture_{i:07d}.wav",
+                "duration": round(rng.uniform(0.8, 30.0), 2),
+                "transcription_text": text,
+                "transcription_provider": rng.choice(["local", "groq", "siliconflow"]),
+                "transcription_status": "success",
+                "transcription_error": None,
+                "ai_optimized_text": text.capitalize() if refined else None,
+                "ai_provider": "groq" if refined else None,
+                "ai_status": "success" if refined else "skipped",
+                "ai_error": None,
+                "final_text": text.capitalize() if refined else text,
+            }
+            out.write(json.dumps(row, ensure_ascii=False))
+            out.write("\n")
+
+
+def _create_service(storage_path: Path) -> HistoryStorageService:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    service = HistoryStorageService(config)
+    if not service.start():
+        raise RuntimeError("HistoryStorageService failed to start")
+    return service
+
+
+def run(record_count: int, with_audio: bool, batch_size: int) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sonicinput_bench_") as tmp:
+        tmp_path = Path(tmp)
+        fixture = tmp_path / "fixture.jsonl"
+        audio_dir = None
+        if with_audio:
+            audio_dir = tmp_path / "fixture_audio"
+            audio_dir.mkdir()
+        write_fixture(fixture, record_count, audio_dir)
+        rss_after_fixture = _peak_rss_mb()
+
+        service = _create_service(tmp_path / "db")
+        try:
+            imported = HistoryImporter(service, batch_size=batch_size).import_records(
+                fixture
+            )
+            rss_after_import = _peak_rss_mb()
+
+            exporter = HistoryExporter(service)
+            jsonl = exporter.export_records(
+                tmp_path / "export.jsonl",
+                audio_archive=tmp_path / "audio.tar" if with_audio else None,
+            )
+            csv_report = exporter.export_records(tmp_path / "export.csv")
+            rss_after_export = _peak_rss_mb()
+        finally:
+            service.stop()
+
+    return {
+        "benchmark": "history_transfer",
+        "records": record_count,
+        "with_audio": with_audio,
+        "import": imported.to_dict(),
+        "export_jsonl": jsonl.to_dict(),
+        "export_csv": csv_report.to_dict(),
+        "peak_rss_mb": {
+            "after_fixture": rss_after_fixture,
+            "after_import": rss_after_import,
+            "after_export": rss_after_export,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--with-audio", action="store_true")
+    parser.add_argument(
+        "--fixture-only",
+        metavar="PATH",
+        help="only write a JSONL fixture of --records records to PATH",
+    )
+    args = parser.parse_args()
+
+    if args.fixture_only:
+        write_fixture(Path(args.fixture_only), args.records)
+        print(json.dumps({"fixture": args.fixture_only, "records": args.records}))
+        return 0
+
+    print(json.dumps(run(args.records, args.with_audio, args.batch_size), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
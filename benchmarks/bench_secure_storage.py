@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Secure storage / AI provider switching benchmark
+
+Measures, in a fresh interpreter:
+- the first AI client creation after the client modules are imported
+  (every BaseAIClient goes through get_secure_storage(), which used to
+  derive the PBKDF2 key inline)
+- steady-state provider switching: creating a client for each provider in
+  turn, as AIProcessingController does on every request
+- the first encrypt/decrypt once the background key derivation finished,
+  and a cached decrypt
+
+Results are printed as JSON in milliseconds.
+
+Usage:
+    uv run python benchmarks/bench_secure_storage.py --switches 50
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.ai.factory import AIClientFactory
+from sonicinput.utils import secure_storage
+
+PROVIDERS = ("openrouter", "groq", "nvidia", "openai_compatible")
+
+
+def _ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+def _create(provider: str):
+    base_url = "http://localhost:8080/v1" if provider == "openai_compatible" else None
+    return AIClientFactory.create_client(provider, "sk-bench-key", base_url)
+
+
+def run(switches: int) -> dict:
+    # Import the client modules first so first_client_ms isolates the
+    # per-client setup (secure storage) from importing requests
+    start = time.perf_counter()
+    for module in ("groq", "nvidia", "openai_compatible", "openrouter"):
+        importlib.import_module(f"sonicinput.ai.{module}")
+    import_ms = _ms(start)
+
+    start = time.perf_counter()
+    _create(PROVIDERS[0])
+    first_client_ms = _ms(start)
+
+    start = time.perf_counter()
+    for i in range(switches):
+        _create(PROVIDERS[i % len(PROVIDERS)])
+    switch_ms = round(_ms(start) / switches, 3)
+
+    storage = secure_storage.get_secure_storage()
+    start = time.perf_counter()
+    token = storage.encrypt("sk-bench-key")
+    first_encrypt_ms = _ms(start)
+
+    # Older SecureStorage versions have no secret cache
+    invalidate = getattr(storage, "invalidate_secrets", None)
+    if invalidate is not None:
+        invalidate()
+    start = time.perf_counter()
+    storage.decrypt(token)
+    decrypt_ms = _ms(start)
+
+    start = time.perf_counter()
+    storage.decrypt(token)
+    cached_decrypt_ms = _ms(start)
+
+    return {
+        "benchmark": "secure_storage",
+        "python": sys.version.split()[0],
+        "switches": switches,
+        "import_ms": import_ms,
+        "first_client_ms": first_client_ms,
+        "switch_ms_per_client": switch_ms,
+        "first_encrypt_ms": first_encrypt_ms,
+        "decrypt_ms": decrypt_ms,
+        "cached_decrypt_ms": cached_decrypt_ms,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--switches", type=int, default=50)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.switches), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+sherpa-onnx model variant benchmark (RTF / WER)
+
+Loads every cached local model variant (int8 / fp32) and decodes a fixture
+set with each, reporting per variant:
+- load time and the thread count used
+- real-time factor (decode time / audio duration)
+- mixed error rate (Chinese per character, English per word) against the
+  reference transcripts
+
+Fixtures are a directory of 16 kHz mono WAV files, each with a reference
+transcript in a .txt file of the same name. Without --fixtures only RTF is
+measured, on a synthetic utterance. Variants that are not cached are
+skipped unless --download is given.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_sherpa_variants.py --fixtures path/to/wavs
+    uv run python benchmarks/bench_sherpa_variants.py --threads 1 2 4 --download
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.speech.asr_metrics import (
+    real_time_factor,
+    word_error_rate,
+)
+from sonicinput.speech.sherpa_models import (
+    SherpaModelManager,
+    physical_core_count,
+    recommended_num_threads,
+)
+from sonicinput.speech.warmup import SAMPLE_RATE
+
+from audio_fixtures import load_fixtures
+
+
+def bench_variant(model_name, variant, num_threads, fixtures, cache_dir):
+    from sonicinput.speech.sherpa_engine import SherpaEngine
+
+    engine = SherpaEngine(
+        model_name, cache_dir=cache_dir, variant=variant, num_threads=num_threads
+    )
+    start = time.perf_counter()
+    if not engine.load_model():
+        return {"error": "load failed"}
+    load_ms = (time.perf_counter() - start) * 1000
+
+    # One untimed pass so first-inference setup does not skew the RTF
+    engine.transcribe(fixtures[0][1][:SAMPLE_RATE])
+
+    decode_seconds = audio_seconds = 0.0
+    pairs = []
+    for _, audio, reference in fixtures:
+        start = time.perf_counter()
+        text = engine.transcribe(audio)["text"]
+        decode_seconds += time.perf_counter() - start
+        audio_seconds += audio.size / SAMPLE_RATE
+        if reference is not None:
+            pairs.append((reference, text))
+    engine.unload_model()
+
+    return {
+        "load_ms": round(load_ms, 1),
+        "audio_seconds": round(audio_seconds, 2),
+        "rtf": round(real_time_factor(decode_seconds, audio_seconds), 4),
+        "wer": round(word_error_rate(pairs), 4) if pairs else None,
+    }
+
+
+def run(models, variants, threads, fixtures_dir, cache_dir, download) -> dict:
+    manager = SherpaModelManager(cache_dir)
+    fixtures = load_fixtures(fixtures_dir)
+    results = []
+    for model_name in models or list(manager.MODELS):
+        for variant in variants or list(manager.MODELS[model_name]["variants"]):
+            if not download and not manager.is_model_cached(model_name, variant):
+                results.append(
+                    {"model": model_name, "variant": variant, "skipped": "not cached"}
+                )
+                continue
+            for num_threads in threads:
+                result = {
+                    "model": model_name,
+                    "variant": variant,
+                    "num_threads": num_threads,
+                }
+                result.update(
+                    bench_variant(model_name, variant, num_threads, fixtures, cache_dir)
+                )
+                results.append(result)
+
+    return {
+        "benchmark": "sherpa_variants",
+        "python": sys.version.split()[0],
+        "physical_cores": physical_core_count(),
+        "fixtures": len(fixtures),
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="*", help="default: all models")
+    parser.add_argument("--variants", nargs="*", help="default: all variants")
+    parser.add_argument(
+        "--threads",
+        nargs="*",
+        type=int,
+        help="thread counts to try (default: the recommended count)",
+    )
+    parser.add_argument("--fixtures", help="directory of .wav + .txt pairs")
+    parser.add_argument("--cache-dir", help="model cache directory")
+    parser.add_argument(
+        "--download", action="store_true", help="download missing variants"
+    )
+    args = parser.parse_args()
+
+    threads = args.threads or [recommended_num_threads()]
+    result = run(
+        args.models,
+        args.variants,
+        threads,
+        args.fixtures,
+        args.cache_dir,
+        args.download,
+    )
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+StreamingCoordinator throughput benchmark
+
+Measures the coordinator's own overhead with instant transcription, so the
+numbers reflect queueing and locking rather than a model:
+- chunked: a producer adds --chunks audio chunks while a consumer thread
+  takes them with get_next_chunk() and completes them, as the transcription
+  worker does; reports chunks per second and producer-to-consumer handoff
+  latency
+- realtime: add_realtime_audio() with a session whose partial text grows
+  on every call, reporting microseconds per 100 ms audio block
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_streaming_coordinator.py --chunks 2000
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.services.dynamic_event_system import (
+    DynamicEventSystem,
+)
+from sonicinput.core.services.streaming_coordinator import (
+    StreamingCoordinator,
+)
+from sonicinput.speech.warmup import SAMPLE_RATE
+
+
+class FakeSession:
+    """Streaming session whose hypothesis grows by one character per block"""
+
+    is_active = True
+
+    def __init__(self):
+        self._text = []
+
+    def add_samples(self, samples):
+        self._text.append("字")
+
+    def get_partial_result(self):
+        return "".join(self._text[-200:])
+
+    def get_final_result(self):
+        return {"text": self.get_partial_result(), "segments": []}
+
+
+def _consume(coordinator, waits):
+    while True:
+        chunk = coordinator.get_next_chunk(timeout=1.0)
+        if chunk is None:
+            if not coordinator.is_streaming():
+                return
+            continue
+        waits.append(chunk.picked_up_at - chunk.timestamp)
+        coordinator.complete_chunk(chunk.chunk_id, {"success": True, "text": "ok"})
+
+
+def bench_chunked(events, chunks: int, chunk_seconds: float) -> dict:
+    coordinator = StreamingCoordinator(events, streaming_mode="chunked")
+    coordinator.start()
+    audio = np.zeros(int(chunk_seconds * SAMPLE_RATE), dtype=np.float32)
+    waits: list = []
+    try:
+        coordinator.start_streaming()
+        consumer = threading.Thread(target=_consume, args=(coordinator, waits))
+        consumer.start()
+
+        start = time.perf_counter()
+        for _ in range(chunks):
+            # The recorder hands over a new array per chunk
+            coordinator.add_streaming_chunk(audio.copy())
+        produced = time.perf_counter() - start
+        while coordinator.get_stats()["completed_chunks"] < chunks:
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+
+        coordinator.stop_streaming()
+        consumer.join()
+    finally:
+        coordinator.stop()
+
+    waits.sort()
+    return {
+        "chunks": chunks,
+        "chunks_per_second": round(chunks / elapsed, 1),
+        "add_chunk_us": round(produced / chunks * 1e6, 2),
+        "handoff_ms": {
+            "p50": round(waits[len(waits) // 2] * 1000, 3),
+            "max": round(waits[-1] * 1000, 3),
+        },
+    }
+
+
+def bench_realtime(events, blocks: int) -> dict:
+    coordinator = StreamingCoordinator(events, streaming_mode="realtime")
+    coordinator.start()
+    block = np.zeros(SAMPLE_RATE // 10, dtype=np.float32)
+    try:
+        coordinator.start_streaming(FakeSession())
+        start = time.perf_counter()
+        for _ in range(blocks):
+            coordinator.add_realtime_audio(block)
+        elapsed = time.perf_counter() - start
+        coordinator.stop_streaming()
+    finally:
+        coordinator.stop()
+
+    return {
+        "blocks": blocks,
+        "add_realtime_audio_us": round(elapsed / blocks * 1e6, 2),
+    }
+
+
+def run(chunks: int, chunk_seconds: float, blocks: int) -> dict:
+    events = DynamicEventSystem()
+    events.start()
+    try:
+        chunked = bench_chunked(events, chunks, chunk_seconds)
+        realtime = bench_realtime(events, blocks)
+    finally:
+        events.stop()
+
+    return {
+        "benchmark": "streaming_coordinator",
+        "python": sys.version.split()[0],
+        "chunk_seconds": chunk_seconds,
+        "chunked": chunked,
+        "realtime": realtime,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--chunk-seconds", type=float, default=1.0)
+    parser.add_argument("--blocks", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.chunks, args.chunk_seconds, args.blocks), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
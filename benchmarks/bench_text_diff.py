@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Realtime text diff benchmark
+
+Replays streaming recognition traces (the sequence of partial hypotheses a
+realtime session emits) through calculate_text_diff and reports, for the
+current linear-time planner and the previous O(m*n) longest-common-substring
+planner:
+- per-update latency (mean / p99 / max) and total time
+- keystrokes sent (backspaces + typed characters)
+- whether the final screen text matches the final hypothesis
+
+Synthetic traces mimic paraformer streaming output: the hypothesis grows one
+or two characters per update, recent characters are revised (a wrong
+homophone that is corrected a few updates later), and occasionally an early
+character is revised. A trace file (JSON array of hypothesis strings) can
+be given instead.
+
+Results are printed as JSON.
+
+Usage:
+    uv run python benchmarks/bench_text_diff.py
+    uv run python benchmarks/bench_text_diff.py --lengths 200 1000 4000
+    uv run python benchmarks/bench_text_diff.py --trace trace.json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sonicinput.core.controllers.text_diff_helper import (
+    calculate_text_diff,
+)
+
+_CORPUS = (
+    "从这个层面上来说便宜的方案未必是最好的选择我们需要综合考虑性能和成本"
+    "今天下午三点在会议室讨论下个季度的产品规划请大家提前准备好相关材料"
+    "实时语音识别会不断修正之前的结果所以输入法需要能够高效地更新已经输入的文本"
+)
+_CONFUSABLE = "的地得在再做作那哪他她它是事式以已意义"
+
+
+def legacy_text_diff(old_text: str, new_text: str) -> tuple[int, str]:
+    """The previous planner: prefix check, then an O(m*n) DP substring search"""
+    if not old_text:
+        return 0, new_text
+    if not new_text:
+        return len(old_text), ""
+
+    common_prefix_len = 0
+    min_len = min(len(old_text), len(new_text))
+    for i in range(min_len):
+        if old_text[i] == new_text[i]:
+            common_prefix_len = i + 1
+        else:
+            break
+    if common_prefix_len >= min_len * 0.5:
+        return len(old_text) - common_prefix_len, new_text[common_prefix_len:]
+
+    m, n = len(old_text), len(new_text)
+    max_len = end_old = end_new = 0
+    prev_row = [0] * (n + 1)
+    for i in range(1, m + 1):
+        curr_row = [0] * (n + 1)
+        for j in range(1, n + 1):
+            if old_text[i - 1] == new_text[j - 1]:
+                curr_row[j] = prev_row[j - 1] + 1
+                if curr_row[j] > max_len:
+                    max_len, end_old, end_new = curr_row[j], i, j
+        prev_row = curr_row
+    start_old, start_new = end_old - max_len, end_new - max_len
+
+    if max_len < min(5, min_len // 3):
+        return len(old_text), new_text
+    return (
+        len(old_text) - (start_old + max_len),
+        new_text[:start_new] + new_text[start_new + max_len :],
+    )
+
+
+def synthetic_trace(length: int, seed: int) -> list:
+    """Partial hypotheses of a paraformer-like streaming session"""
+    rng = random.Random(seed)
+    target = (_CORPUS * (length // len(_CORPUS) + 1))[:length]
+    trace = []
+    pos = 0
+    while pos < length:
+        pos = min(length, pos + rng.choice((1, 1, 2)))
+        hypothesis = list(target[:pos])
+        # A wrong guess for the newest characters, fixed on a later update
+        if rng.random() < 0.4:
+            for k in range(1, min(pos, rng.randint(1, 3)) + 1):
+                hypothesis[-k] = rng.choice(_CONFUSABLE)
+        # Occasionally the model revises an earlier character
+        if pos > 20 and rng.random() < 0.05:
+            hypothesis[rng.randrange(pos // 2, pos)] = rng.choice(_CONFUSABLE)
+        trace.append("".join(hypothesis))
+    trace.append(target)
+    return trace
+
+
+def replay(trace, diff) -> dict:
+    screen = ""
+    last = ""
+    latencies = []
+    keystrokes = 0
+    for hypothesis in trace:
+        if hypothesis == last:
+            continue
+        start = time.perf_counter()
+        backspaces, text = diff(last, hypothesis)
+        latencies.append(time.perf_counter() - start)
+        keystrokes += backspaces + len(text)
+        screen = screen[: len(screen) - backspaces] + text
+        last = hypothesis
+
+    latencies.sort()
+    return {
+        "updates": len(latencies),
+        "total_ms": round(sum(latencies) * 1000, 2),
+        "mean_us": round(statistics.mean(latencies) * 1e6, 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99) - 1] * 1e6, 1),
+        "max_us": round(latencies[-1] * 1e6, 1),
+        "keystrokes": keystrokes,
+        "screen_matches": screen == trace[-1],
+    }
+
+
+def run(traces: dict) -> dict:
+    results = []
+    for name, trace in traces.items():
+        results.append(
+            {
+                "trace": name,
+                "final_length": len(trace[-1]),
+                "linear": replay(trace, calculate_text_diff),
+                "legacy": replay(trace, legacy_text_diff),
+            }
+        )
+    return {
+        "benchmark": "text_diff",
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--lengths",
+        nargs="*",
+        type=int,
+        default=[100, 500, 2000],
+        help="final lengths of the synthetic traces",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--trace", help="JSON array of hypotheses to replay")
+    args = parser.parse_args()
+
+    if args.trace:
+        traces = {
+            Path(args.trace).name: json.loads(
+                Path(args.trace).read_text(encoding="utf-8")
+            )
+        }
+    else:
+        traces = {
+            f"synthetic-{length}": synthetic_trace(length, args.seed)
+            for length in args.lengths
+        }
+
+    print(json.dumps(run(traces), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
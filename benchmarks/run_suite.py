@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Audio-to-text pipeline benchmark suite
+
+Runs the pipeline benchmarks in one process, headless, and collects their
+results into a single JSON document tagged with the package version, git
+commit, Python version and platform:
+- audio_processor: AudioProcessor stages
+- audio_recorder: AudioRecorder capture and buffer operations (fake stream)
+- streaming_coordinator: chunked and realtime StreamingCoordinator overhead
+- sherpa_engines: RTF of every cached sherpa-onnx model variant
+- cloud_clients: Groq / SiliconFlow / Qwen clients against a local HTTP stub
+- history_queries: history database queries at 1k and 100k records
+- event_emit: DynamicEventSystem.emit() cost
+
+A benchmark that fails is recorded with its error and the suite carries
+on. With --compare, every timing and throughput metric is compared with a
+previous suite result and changes beyond --threshold are listed as
+regressions or improvements; the exit status is 1 when there are
+regressions, so the suite can gate a release.
+
+Results are printed as JSON (and written to --output if given).
+
+Usage:
+    uv run python benchmarks/run_suite.py --output bench-0.5.8.json
+    uv run python benchmarks/run_suite.py --compare bench-0.5.8.json
+    uv run python benchmarks/run_suite.py --only audio_processor history_queries
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from sonicinput import __version__  # noqa: E402
+
+
+def _audio_processor(fixtures):
+    import bench_audio_processor
+
+    return bench_audio_processor.run(30.0, 5, fixtures)
+
+
+def _audio_recorder(fixtures):
+    import bench_audio_recorder
+
+    return bench_audio_recorder.run([1, 5, 15], fixtures_dir=fixtures)
+
+
+def _streaming_coordinator(fixtures):
+    import bench_streaming_coordinator
+
+    return bench_streaming_coordinator.run(2000, 1.0, 5000)
+
+
+def _sherpa_engines(fixtures):
+    import bench_sherpa_variants
+
+    from sonicinput.speech.sherpa_models import recommended_num_threads
+
+    return bench_sherpa_variants.run(
+        None, None, [recommended_num_threads()], fixtures, None, False
+    )
+
+
+def _cloud_clients(fixtures):
+    import bench_cloud_clients
+
+    return bench_cloud_clients.run([5.0, 30.0], 20)
+
+
+def _history_queries(fixtures):
+    import bench_history_queries
+
+    return bench_history_queries.run([1000, 100000], 5)
+
+
+def _event_emit(fixtures):
+    import bench_event_emit
+
+    return bench_event_emit.run(200000, 5)
+
+
+BENCHMARKS = {
+    "audio_processor": _audio_processor,
+    "audio_recorder": _audio_recorder,
+    "streaming_coordinator": _streaming_coordinator,
+    "sherpa_engines": _sherpa_engines,
+    "cloud_clients": _cloud_clients,
+    "history_queries": _history_queries,
+    "event_emit": _event_emit,
+}
+
+# Metric direction is inferred from the key names the benchmarks use
+_LOWER_IS_BETTER = re.compile(r"(^|_)(ms|us|ns)($|_)|^(rtf|wer)$")
+_HIGHER_IS_BETTER = re.compile(r"per_second$|^x_realtime$")
+# Keys that identify an entry in a result list (e.g. one record count)
+_ID_KEYS = ("model", "variant", "num_threads", "records", "minutes")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metadata() -> dict:
+    return {
+        "version": __version__,
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _flatten(value, path, out):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(item, path + (str(key),), out)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            label = str(index)
+            if isinstance(item, dict):
+                label = ",".join(f"{k}={item[k]}" for k in _ID_KEYS if k in item)
+                label = label or str(index)
+            _flatten(item, path + (label,), out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[path] = value
+
+
+def _direction(path):
+    """-1 if lower is better, 1 if higher is better, None if not a metric"""
+    if _HIGHER_IS_BETTER.search(path[-1]):
+        return 1
+    if any(_LOWER_IS_BETTER.search(part) for part in path):
+        return -1
+    return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> dict:
+    """List metrics that changed by more than `threshold` (0.1 = 10%)"""
+    old, new = {}, {}
+    _flatten(baseline.get("results", {}), (), old)
+    _flatten(current.get("results", {}), (), new)
+
+    regressions, improvements = [], []
+    for path, value in new.items():
+        direction = _direction(path)
+        before = old.get(path)
+        if direction is None or not before or value <= 0:
+            continue
+        # > 1 means better, whichever way the metric points
+        gain = (value / before) if direction > 0 else (before / value)
+        if 1 / (1 + threshold) <= gain <= 1 + threshold:
+            continue
+        entry = {
+            "metric": ".".join(path),
+            "baseline": before,
+            "current": value,
+            "change": f"{(value / before - 1) * 100:+.1f}%",
+        }
+        (improvements if gain > 1 else regressions).append(entry)
+
+    return {
+        "baseline": baseline.get("metadata", {}),
+        "threshold": threshold,
+        "regressions": regressions,
+        "improvements": improvements,
+    }
+
+
+def run(names, fixtures=None) -> dict:
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        try:
+            result = BENCHMARKS[name](fixtures)
+        except Exception as e:
+            traceback.print_exc()
+            result = {"benchmark": name, "error": f"{type(e).__name__}: {e}"}
+        result["suite_seconds"] = round(time.perf_counter() - start, 2)
+        results[name] = result
+        print(f"{name}: {result['suite_seconds']}s", file=sys.stderr)
+
+    return {"metadata": _metadata(), "results": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--only", nargs="*", choices=list(BENCHMARKS), help="default: all"
+    )
+    parser.add_argument("--fixtures", help="directory of 16 kHz .wav + .txt pairs")
+    parser.add_argument("--output", help="write the suite result to this file")
+    parser.add_argument("--compare", help="previous suite result to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change to report"
+    )
+    args = parser.parse_args()
+
+    result = run(args.only or list(BENCHMARKS), args.fixtures)
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        result["comparison"] = compare(baseline, result, args.threshold)
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    print(output)
+    return 1 if result.get("comparison", {}).get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
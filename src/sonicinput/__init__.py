@@ -1,13 +1,38 @@
 """Sonic Input - Windows语音输入软件
 
 一个基于Whisper和AI优化的Windows语音转文本输入解决方案
+
+导出对象在首次访问时才导入（PEP 562），导入任意子模块不会连带加载整个应用。
 """
 
 __version__ = "0.5.8"
 __author__ = "Oxidane-bot"
 __description__ = "SonicInput"
 
-from .core.voice_input_app import VoiceInputApp
-from .utils import app_logger
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.voice_input_app import VoiceInputApp
+    from .utils import app_logger
+
+_LAZY_IMPORTS = {
+    "VoiceInputApp": ".core.voice_input_app",
+    "app_logger": ".utils",
+}
 
 __all__ = ["VoiceInputApp", "app_logger"]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
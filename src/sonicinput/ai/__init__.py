@@ -1,11 +1,27 @@
-"""AI优化模块初始化"""
+"""AI优化模块初始化
 
-from .base_client import BaseAIClient
-from .factory import AIClientFactory
-from .groq import GroqClient
-from .nvidia import NvidiaClient
-from .openai_compatible import OpenAICompatibleClient
-from .openrouter import OpenRouterClient
+导出对象在首次访问时才导入（PEP 562），避免导入本包就加载 requests。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_client import BaseAIClient
+    from .factory import AIClientFactory
+    from .groq import GroqClient
+    from .nvidia import NvidiaClient
+    from .openai_compatible import OpenAICompatibleClient
+    from .openrouter import OpenRouterClient
+
+_LAZY_IMPORTS = {
+    "BaseAIClient": ".base_client",
+    "AIClientFactory": ".factory",
+    "GroqClient": ".groq",
+    "NvidiaClient": ".nvidia",
+    "OpenAICompatibleClient": ".openai_compatible",
+    "OpenRouterClient": ".openrouter",
+}
 
 __all__ = [
     "BaseAIClient",
@@ -15,3 +31,17 @@ __all__ = [
     "OpenAICompatibleClient",
     "AIClientFactory",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
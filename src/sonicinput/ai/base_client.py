@@ -325,6 +325,9 @@ class BaseAIClient(IAIService):
         """
         self._raw_api_key = api_key
         self._update_headers()
+        # 旧密钥的解密结果不再需要，从内存缓存中清除
+        if self._secure_storage:
+            self._secure_storage.invalidate_secrets()
         app_logger.log_audio_event(
             f"API key updated for {self.get_provider_name()}",
             {"has_key": bool(api_key)},
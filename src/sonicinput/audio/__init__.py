@@ -1,7 +1,35 @@
-"""音频模块初始化"""
+"""音频模块初始化
 
-from .processor import AudioProcessor
-from .recorder import AudioRecorder
-from .visualizer import AudioVisualizer, MiniAudioVisualizer
+导出对象在首次访问时才导入（PEP 562），PyAudio 和 samplerate 按需加载。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .processor import AudioProcessor
+    from .recorder import AudioRecorder
+    from .visualizer import AudioVisualizer, MiniAudioVisualizer
+
+_LAZY_IMPORTS = {
+    "AudioProcessor": ".processor",
+    "AudioRecorder": ".recorder",
+    "AudioVisualizer": ".visualizer",
+    "MiniAudioVisualizer": ".visualizer",
+}
 
 __all__ = ["AudioRecorder", "AudioProcessor", "AudioVisualizer", "MiniAudioVisualizer"]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -1,16 +1,28 @@
 """核心逻辑模块初始化
 
 重构后的核心模块，包含统一的服务组件和应用组件。
+导出对象在首次访问时才导入（PEP 562）。
 """
 
-# 核心服务组件
-# 原有组件（保持向后兼容）
-from .hotkey_manager import HotkeyManager
+import importlib
+from typing import TYPE_CHECKING
 
-# 接口定义（仅保留多实现接口）
-from .interfaces import IAIService, IInputService, ISpeechService
-from .services import ConfigService, EventBus, StateManager
-from .services.events import Events
+if TYPE_CHECKING:
+    from .hotkey_manager import HotkeyManager
+    from .interfaces import IAIService, IInputService, ISpeechService
+    from .services import ConfigService, EventBus, StateManager
+    from .services.events import Events
+
+_LAZY_IMPORTS = {
+    "HotkeyManager": ".hotkey_manager",
+    "IAIService": ".interfaces",
+    "IInputService": ".interfaces",
+    "ISpeechService": ".interfaces",
+    "ConfigService": ".services",
+    "EventBus": ".services",
+    "StateManager": ".services",
+    "Events": ".services.events",
+}
 
 __all__ = [
     # 核心服务组件
@@ -25,3 +37,17 @@ __all__ = [
     # 应用组件
     "HotkeyManager",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
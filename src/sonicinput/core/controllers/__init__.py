@@ -1,12 +1,24 @@
 """控制器模块
 
 包含各个业务控制器的实现，用于拆分 VoiceInputApp 的职责。
+导出对象在首次访问时才导入（PEP 562）。
 """
 
-from .ai_processing_controller import AIProcessingController
-from .input_controller import InputController
-from .recording_controller import RecordingController
-from .transcription_controller import TranscriptionController
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ai_processing_controller import AIProcessingController
+    from .input_controller import InputController
+    from .recording_controller import RecordingController
+    from .transcription_controller import TranscriptionController
+
+_LAZY_IMPORTS = {
+    "AIProcessingController": ".ai_processing_controller",
+    "InputController": ".input_controller",
+    "RecordingController": ".recording_controller",
+    "TranscriptionController": ".transcription_controller",
+}
 
 __all__ = [
     "RecordingController",
@@ -14,3 +26,17 @@ __all__ = [
     "AIProcessingController",
     "InputController",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -192,12 +192,13 @@ class AIProcessingController(
             )
 
             if self._current_record_id:
+                # realtime 模式的 text 为空（已逐字输入），历史记录使用完整转录
                 self._update_ai_status(
                     record_id=self._current_record_id,
                     ai_text=None,
                     status="skipped",
                     error=None,
-                    final_text=text,
+                    final_text=data.get("transcript", text),
                 )
 
             # 不使用AI，直接发送原文本
@@ -15,9 +15,14 @@ from ..interfaces import (
     IStateManager,
 )
 from ..interfaces.state import AppState
+from ..services.config import ConfigKeys
 from ..services.events import Events
 from .base_controller import BaseController
-from .text_diff_helper import calculate_text_diff
+from .realtime_injection import (
+    InjectionPlan,
+    RealtimeInjectionScheduler,
+    StablePrefixPlanner,
+)
 
 
 class InputController(LifecycleComponent, BaseController, IInputController):
@@ -46,8 +51,18 @@ class InputController(LifecycleComponent, BaseController, IInputController):
         # Controller-specific services
         self._input_service = input_service
 
-        # Realtime 模式状态追踪（用于实时文本差量更新）
-        self._last_realtime_text: str = ""  # 上一次输入的实时文本
+        # Realtime 模式注入调度：只输入已稳定的前缀，按帧合并突发更新
+        self._realtime_injection = RealtimeInjectionScheduler(
+            self._inject_realtime_plan,
+            StablePrefixPlanner(
+                stable_updates=config_service.get_setting(
+                    ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_STABLE_UPDATES, 2
+                ),
+                stable_ms=config_service.get_setting(
+                    ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_STABLE_MS, 300
+                ),
+            ),
+        )
 
         # NOTE: Event listener registration moved to _do_start() for hot reload support
         # NOTE: Initialization logging moved to _do_start() for hot reload support
@@ -87,6 +102,8 @@ class InputController(LifecycleComponent, BaseController, IInputController):
         # 关键修复：realtime模式下，文本已经在录音过程中实时输入了
         # 不应该在录音结束后再输入一遍
         if streaming_mode == "realtime":
+            # 提交录音结束后才到达的最后一段文本
+            self._realtime_injection.commit()
             app_logger.log_audio_event(
                 "Skipping final text input in realtime mode (already input during recording)",
                 {
@@ -249,7 +266,7 @@ class InputController(LifecycleComponent, BaseController, IInputController):
         重置 realtime 模式状态，准备接收新的实时文本更新
         """
         # 重置 realtime 文本追踪（用于实时文本差量更新）
-        self._last_realtime_text = ""
+        self._realtime_injection.reset()
 
         # 启动录音模式：SmartTextInput会保存原始剪贴板，并在录音期间禁用中途restore
         try:
@@ -265,50 +282,43 @@ class InputController(LifecycleComponent, BaseController, IInputController):
     def _on_recording_stopped(self, data=None) -> None:
         """处理录音停止事件
 
-        记录录音停止日志，剪贴板恢复会在文本输入完成后自动处理
+        提交尚未稳定的实时文本尾部并记录注入统计，剪贴板恢复会在文本输入
+        完成后自动处理
         """
+        self._realtime_injection.commit()
+        planner = self._realtime_injection.planner
         app_logger.log_audio_event(
             "InputController: Recording stopped",
-            {"last_realtime_text_length": len(self._last_realtime_text)},
+            {
+                "last_realtime_text_length": len(planner.hypothesis),
+                "realtime_injection": planner.get_stats(),
+            },
         )
 
     def _on_realtime_text_updated(self, data: dict) -> None:
         """处理实时文本更新事件（realtime 模式）
 
-        使用差量算法计算文本差异，智能更新输入的文本：
-        1. 计算新文本与上次文本的差异
-        2. 使用退格键删除变化的部分
-        3. 输入新的差异部分
+        交给注入调度器：只输入连续多次更新（或一段时间）未变化的前缀，
+        同一帧内的多次更新合并为一次注入；端点处提交全部文本。
 
         Args:
-            data: 包含 'text' 和 'timestamp' 的字典
+            data: 包含 'text'、'timestamp' 和可选 'endpoint' 的字典
         """
         try:
             new_text = data.get("text", "")
+            last_text = self._realtime_injection.planner.hypothesis
 
             # 空文本或无变化则跳过
-            if not new_text or new_text == self._last_realtime_text:
+            if not new_text or (new_text == last_text and not data.get("endpoint")):
                 return
 
-            app_logger.log_audio_event(
-                "Realtime text update received",
-                {
-                    "old_text": self._last_realtime_text[:30] + "..."
-                    if len(self._last_realtime_text) > 30
-                    else self._last_realtime_text,
-                    "new_text": new_text[:30] + "..."
-                    if len(new_text) > 30
-                    else new_text,
-                },
-            )
-
             # 关键修复：如果新文本为空或显著变短，可能是sherpa reset导致的异常
             # 不应该删除已输入的文本
-            if not new_text or len(new_text) < len(self._last_realtime_text) * 0.5:
+            if len(new_text) < len(last_text) * 0.5:
                 app_logger.log_audio_event(
                     "New text is empty or significantly shorter, likely due to stream reset",
                     {
-                        "old_length": len(self._last_realtime_text),
+                        "old_length": len(last_text),
                         "new_length": len(new_text),
                         "skipping_diff": True,
                     },
@@ -316,48 +326,28 @@ class InputController(LifecycleComponent, BaseController, IInputController):
                 # 不执行差量更新，保持当前已输入的文本
                 return
 
-            # 计算文本差异（差量算法）
-            backspace_count, text_to_append = calculate_text_diff(
-                self._last_realtime_text, new_text
+            self._realtime_injection.submit(
+                new_text, endpoint=bool(data.get("endpoint"))
             )
 
-            app_logger.log_audio_event(
-                "Calculated text diff",
-                {
-                    "backspace_count": backspace_count,
-                    "append_text": text_to_append[:30] + "..."
-                    if len(text_to_append) > 30
-                    else text_to_append,
-                },
-            )
-
-            # 如果需要退格，先删除旧的部分
-            if backspace_count > 0:
-                # 使用退格键删除
-                backspace_text = "\b" * backspace_count
-                self._input_service.input_text(backspace_text)
-                app_logger.log_audio_event(
-                    "Sent backspace keys", {"count": backspace_count}
-                )
-
-            # 输入新的文本
-            if text_to_append:
-                self._input_service.input_text(text_to_append)
-                app_logger.log_audio_event(
-                    "Sent new text",
-                    {
-                        "text": text_to_append[:50] + "..."
-                        if len(text_to_append) > 50
-                        else text_to_append
-                    },
-                )
-
-            # 更新追踪的文本
-            self._last_realtime_text = new_text
-
         except Exception as e:
             app_logger.log_error(e, "_on_realtime_text_updated")
 
+    def _inject_realtime_plan(self, plan: InjectionPlan) -> None:
+        """执行一次实时注入：先退格删除变化的部分，再输入新的部分"""
+        if plan.backspaces > 0:
+            self._input_service.input_text("\b" * plan.backspaces)
+        if plan.text:
+            self._input_service.input_text(plan.text)
+
+        app_logger.log_audio_event(
+            "Realtime text injected",
+            {
+                "backspace_count": plan.backspaces,
+                "text": plan.text[:50] + "..." if len(plan.text) > 50 else plan.text,
+            },
+        )
+
     def _on_transcription_error_restore_clipboard(self, error_msg: str) -> None:
         """处理转录错误事件 - 恢复剪贴板
 
@@ -388,6 +378,7 @@ class InputController(LifecycleComponent, BaseController, IInputController):
         try:
             # Register event listeners (supports hot reload)
             self._register_event_listeners()
+            self._realtime_injection.start()
 
             # Log initialization
             self._log_initialization()
@@ -413,8 +404,9 @@ class InputController(LifecycleComponent, BaseController, IInputController):
             # Cleanup event listeners (supports hot reload)
             self._cleanup_event_listeners()
 
-            # 重置 realtime 文本追踪
-            self._last_realtime_text = ""
+            # 停止 realtime 注入调度
+            self._realtime_injection.stop()
+            self._realtime_injection.reset()
 
             # 确保剪贴板恢复（防止资源泄漏）
             if hasattr(self._input_service, "stop_recording_mode"):
@@ -0,0 +1,288 @@
+"""实时文本注入调度 - 只输入已稳定的前缀
+
+realtime 模式下识别结果的末尾几个字会反复修正。每次部分结果都立即退格
+重打会产生大量按键和可见的闪烁改写。这里改为：
+
+- StablePrefixPlanner：只输入连续 K 次更新或 T 毫秒未变化的前缀；
+  端点（句子结束）或录音结束时一次性提交剩余的不稳定尾部。纯逻辑，
+  时间由调用方传入，可以脱离 Windows 输入环境测试。
+- RealtimeInjectionScheduler：后台线程按帧合并突发更新，每帧最多注入
+  一次，并在尾部按时间变稳定时主动补输入。
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from ...utils import app_logger
+from .text_diff_helper import calculate_text_diff, common_prefix_length
+
+
+@dataclass
+class InjectionPlan:
+    """一次注入：先退格再追加"""
+
+    backspaces: int
+    text: str
+
+    @property
+    def keystrokes(self) -> int:
+        return self.backspaces + len(self.text)
+
+
+class StablePrefixPlanner:
+    """稳定前缀提交策略
+
+    把假设文本按"自哪次更新起未再变化"切成若干段，段的起点单调递增、
+    起始时间和更新序号单调不减，因此已稳定的部分总是一个前缀，可以
+    二分查找。
+    """
+
+    def __init__(self, stable_updates: int = 2, stable_ms: float = 300.0):
+        """初始化提交策略
+
+        Args:
+            stable_updates: 连续多少次更新未变化视为稳定（K）
+            stable_ms: 未变化多少毫秒视为稳定（T）
+        """
+        self.stable_updates = max(1, int(stable_updates))
+        self.stable_seconds = max(0.0, float(stable_ms)) / 1000
+        self.reset()
+
+    def reset(self) -> None:
+        """开始新的听写"""
+        self.hypothesis = ""
+        self.typed = ""
+        self._update_index = 0
+        # 每段 [起点, 起始时间, 起始更新序号]
+        self._runs: List[List[float]] = []
+        self._naive_typed = ""
+        self._stats = {
+            "updates": 0,
+            "injections": 0,
+            "keystrokes": 0,
+            "rewrites": 0,
+            "naive_keystrokes": 0,
+            "naive_rewrites": 0,
+        }
+
+    def observe(self, hypothesis: str, now: float) -> None:
+        """记录一次部分结果
+
+        Args:
+            hypothesis: 当前完整的部分识别文本
+            now: 当前时间（秒，单调时钟）
+        """
+        prefix_len = common_prefix_length(self.hypothesis, hypothesis)
+        while self._runs and self._runs[-1][0] >= prefix_len:
+            self._runs.pop()
+        self._update_index += 1
+        if len(hypothesis) > prefix_len:
+            self._runs.append([prefix_len, now, self._update_index])
+        self.hypothesis = hypothesis
+        self._stats["updates"] += 1
+
+        # 对照：每次更新都立即按差量输入所需的按键
+        backspaces, text = calculate_text_diff(self._naive_typed, hypothesis)
+        self._stats["naive_keystrokes"] += backspaces + len(text)
+        if backspaces:
+            self._stats["naive_rewrites"] += 1
+        self._naive_typed = hypothesis
+
+    def _is_stable(self, run: List[float], now: float) -> bool:
+        return (
+            self._update_index - run[2] >= self.stable_updates
+            or now - run[1] >= self.stable_seconds
+        )
+
+    def stable_length(self, now: float) -> int:
+        """当前已稳定的前缀长度"""
+        low, high = 0, len(self._runs)
+        while low < high:
+            mid = (low + high) // 2
+            if self._is_stable(self._runs[mid], now):
+                low = mid + 1
+            else:
+                high = mid
+        if low == len(self._runs):
+            return len(self.hypothesis)
+        return int(self._runs[low][0])
+
+    def next_stable_time(self, now: float) -> Optional[float]:
+        """最早的未稳定段按时间变稳定的时刻，全部稳定时返回 None"""
+        if self.stable_length(now) >= len(self.hypothesis):
+            return None
+        for run in self._runs:
+            if not self._is_stable(run, now):
+                return run[1] + self.stable_seconds
+        return None
+
+    def plan(self, now: float, commit_all: bool = False) -> Optional[InjectionPlan]:
+        """计算并记下本次需要的注入
+
+        Args:
+            now: 当前时间（秒，单调时钟）
+            commit_all: 提交全部文本（端点或录音结束）
+
+        Returns:
+            注入操作，无需改动时返回 None
+        """
+        target_len = len(self.hypothesis) if commit_all else self.stable_length(now)
+        agreed = common_prefix_length(self.typed, self.hypothesis)
+
+        if agreed < len(self.typed):
+            # 已输入的文本被修正：等修正本身稳定后再改写，避免来回闪烁
+            if target_len <= agreed:
+                return None
+        elif target_len <= len(self.typed):
+            return None
+
+        backspaces, text = calculate_text_diff(self.typed, self.hypothesis[:target_len])
+        if not backspaces and not text:
+            return None
+
+        self.typed = self.typed[: len(self.typed) - backspaces] + text
+        self._stats["injections"] += 1
+        self._stats["keystrokes"] += backspaces + len(text)
+        if backspaces:
+            self._stats["rewrites"] += 1
+        return InjectionPlan(backspaces, text)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """注入统计：实际按键、改写次数，以及相对逐次输入节省的按键"""
+        stats = dict(self._stats)
+        stats["keystrokes_saved"] = stats["naive_keystrokes"] - stats["keystrokes"]
+        stats["rewrites_saved"] = stats["naive_rewrites"] - stats["rewrites"]
+        return stats
+
+
+class RealtimeInjectionScheduler:
+    """按帧合并的实时注入调度器
+
+    submit() 只记录部分结果并唤醒后台线程；后台线程在第一次更新后的
+    下一帧注入，同一帧内的更新合并为一次注入，尾部按时间变稳定时也会
+    在那个时刻补输入。commit() 在调用线程中
+    同步提交全部文本。
+    """
+
+    def __init__(
+        self,
+        inject: Callable[[InjectionPlan], None],
+        planner: Optional[StablePrefixPlanner] = None,
+        frame_interval: float = 1 / 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """初始化调度器
+
+        Args:
+            inject: 执行注入的回调（退格、追加文本）
+            planner: 提交策略，默认 StablePrefixPlanner()
+            frame_interval: 两次注入的最小间隔（秒）
+            clock: 单调时钟
+        """
+        self.planner = planner or StablePrefixPlanner()
+        self._inject = inject
+        self.frame_interval = frame_interval
+        self._clock = clock
+
+        self._cond = threading.Condition()
+        # 注入串行执行（后台帧注入与 commit 之间）
+        self._inject_lock = threading.Lock()
+        self._dirty = False
+        # 第一次未处理更新的时刻：同一帧内随后到达的更新一起注入
+        self._dirty_since = 0.0
+        self._last_injection = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="RealtimeInjection", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def reset(self) -> None:
+        """开始新的听写"""
+        with self._cond:
+            self.planner.reset()
+            self._dirty = False
+
+    def submit(self, hypothesis: str, endpoint: bool = False) -> None:
+        """记录一次部分结果；端点时同步提交全部文本"""
+        with self._cond:
+            now = self._clock()
+            self.planner.observe(hypothesis, now)
+            if not self._dirty:
+                self._dirty_since = now
+            self._dirty = True
+            self._cond.notify_all()
+        if endpoint:
+            self.commit()
+
+    def commit(self) -> Optional[InjectionPlan]:
+        """立即提交全部文本（端点或录音结束）"""
+        with self._inject_lock:
+            with self._cond:
+                plan = self.planner.plan(self._clock(), commit_all=True)
+                self._dirty = False
+            if plan:
+                self._do_inject(plan)
+            return plan
+
+    def flush(self) -> Optional[InjectionPlan]:
+        """注入当前已稳定的部分（后台线程每帧调用）"""
+        with self._inject_lock:
+            with self._cond:
+                plan = self.planner.plan(self._clock())
+                self._dirty = False
+            if plan:
+                self._do_inject(plan)
+            return plan
+
+    def _do_inject(self, plan: InjectionPlan) -> None:
+        self._last_injection = self._clock()
+        try:
+            self._inject(plan)
+        except Exception as e:
+            app_logger.log_error(e, "realtime_injection")
+
+    def _next_wakeup(self) -> Optional[float]:
+        """下次需要检查的时刻，None 表示等待新的更新"""
+        now = self._clock()
+        if self._dirty:
+            return max(
+                self._dirty_since + self.frame_interval,
+                self._last_injection + self.frame_interval,
+            )
+        deadline = self.planner.next_stable_time(now)
+        if deadline is None:
+            return None
+        return max(deadline, self._last_injection + self.frame_interval)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            with self._cond:
+                wakeup = self._next_wakeup()
+                if wakeup is None:
+                    self._cond.wait()
+                    continue
+                delay = wakeup - self._clock()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+            try:
+                self.flush()
+            except Exception as e:
+                app_logger.log_error(e, "realtime_injection_flush")
@@ -176,6 +176,10 @@ class RecordingController(LifecycleComponent, IRecordingController):
                 {"mode": streaming_mode, "provider": provider},
             )
 
+            # 模型被空闲卸载时立即后台重载，与录音并行进行
+            if provider == "local" and hasattr(self._speech_service, "prefetch_model"):
+                self._speech_service.prefetch_model()
+
             # 启动流式会话（如果支持）
             if streaming_mode != "disabled":
                 self._streaming_manager.start_streaming_session()
@@ -323,7 +327,7 @@ class RecordingController(LifecycleComponent, IRecordingController):
         """提交最后的音频块到流式转录
 
         Args:
-            audio_data: 完整音频数据（用于 realtime 模式）
+            audio_data: 完整音频数据
         """
         # 获取当前流式模式
         streaming_mode = self._streaming_manager.get_current_mode()
@@ -340,17 +344,13 @@ class RecordingController(LifecycleComponent, IRecordingController):
 
         try:
             if streaming_mode == "realtime":
-                # realtime 模式：发送完整音频到实时流处理
-                if len(audio_data) == 0:
-                    return
-                if hasattr(self._speech_service, "streaming_coordinator"):
-                    self._speech_service.streaming_coordinator.add_realtime_audio(
-                        audio_data
-                    )
-                    app_logger.log_audio_event(
-                        "Final realtime audio added",
-                        {"audio_length": len(audio_data)},
-                    )
+                # realtime 模式：录音回调已把每个音频块推送到会话，
+                # 再次提交完整音频会让识别流重复解码整段录音；
+                # 最后一段由 stop_streaming 结束会话时解码
+                app_logger.log_audio_event(
+                    "Realtime mode: audio already streamed, skipping final submit",
+                    {"audio_length": len(audio_data)},
+                )
             else:  # chunked
                 # chunked 模式：只发送剩余未发送的增量音频
                 if hasattr(self._audio_service, "get_remaining_audio_for_streaming"):
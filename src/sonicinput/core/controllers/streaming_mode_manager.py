@@ -268,10 +268,23 @@ class StreamingModeManager(LifecycleComponent):
                 if whisper_engine and hasattr(
                     whisper_engine, "create_streaming_session"
                 ):
+                    # 两遍识别：离线模型就绪时由会话在后台重打分每个分段
+                    get_rescorer = getattr(
+                        self._speech_service, "get_segment_rescorer", None
+                    )
+                    rescorer = get_rescorer() if callable(get_rescorer) else None
                     try:
-                        streaming_session = whisper_engine.create_streaming_session()
+                        if rescorer is not None:
+                            streaming_session = whisper_engine.create_streaming_session(
+                                rescorer=rescorer
+                            )
+                        else:
+                            streaming_session = (
+                                whisper_engine.create_streaming_session()
+                            )
                         app_logger.log_audio_event(
-                            "Sherpa streaming session created", {}
+                            "Sherpa streaming session created",
+                            {"rescoring": rescorer is not None},
                         )
                     except Exception as e:
                         app_logger.log_error(e, "create_streaming_session")
@@ -1,56 +1,80 @@
 """文本差异计算工具
 
 用于计算两段文本之间的差异，支持实时文本输入的智能更新。
-"""
-
 
-def find_longest_common_substring(s1: str, s2: str) -> tuple[int, int, int]:
-    """查找两个字符串的最长公共子串
+实时识别的每次部分结果大多只改动末尾几个字，因此先剥离公共前缀，
+只在不稳定的尾部上做匹配；所有算法都是线性时间，长时间听写时每次
+更新的开销不会随整句长度平方增长。
+"""
 
-    Args:
-        s1: 第一个字符串
-        s2: 第二个字符串
+# 公共前缀按块比较的块大小
+_PREFIX_BLOCK = 64
+
+
+def _z_function(s: str) -> list[int]:
+    """Z 数组：z[i] 为 s[i:] 与 s 的最长公共前缀长度（z[0] = len(s)）"""
+    n = len(s)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and s[z[i]] == s[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
+def common_prefix_length(s1: str, s2: str) -> int:
+    """两个字符串的公共前缀长度"""
+    n = min(len(s1), len(s2))
+    i = 0
+    # 先按块比较（切片比较在 C 层完成），再逐字符定位第一个差异
+    while (
+        i + _PREFIX_BLOCK <= n
+        and s1[i : i + _PREFIX_BLOCK] == s2[i : i + _PREFIX_BLOCK]
+    ):
+        i += _PREFIX_BLOCK
+    while i < n and s1[i] == s2[i]:
+        i += 1
+    return i
+
+
+def find_tail_overlap(old_text: str, new_text: str) -> tuple[int, int]:
+    """在 old_text 中查找 new_text 的最长前缀（Z 函数，O(m + n)）
+
+    用于识别流重置后新结果与已输入文本首尾相接的情况：新结果的开头
+    重复了已输入文本末尾的一段。长度相同时取最靠后的位置（退格最少）。
 
     Returns:
-        tuple[int, int, int]: (start_in_s1, start_in_s2, length)
-            - start_in_s1: 公共子串在s1中的起始位置
-            - start_in_s2: 公共子串在s2中的起始位置
-            - length: 公共子串的长度
+        tuple[int, int]: (start_in_old_text, length)，未找到时长度为 0
     """
-    if not s1 or not s2:
-        return 0, 0, 0
-
-    m, n = len(s1), len(s2)
-    # dp[i][j] 表示以s1[i-1]和s2[j-1]结尾的最长公共子串长度
-    max_len = 0
-    end_pos_s1 = 0
-    end_pos_s2 = 0
-
-    # 使用滚动数组优化空间复杂度
-    prev_row = [0] * (n + 1)
+    if not old_text or not new_text:
+        return 0, 0
 
-    for i in range(1, m + 1):
-        curr_row = [0] * (n + 1)
-        for j in range(1, n + 1):
-            if s1[i - 1] == s2[j - 1]:
-                curr_row[j] = prev_row[j - 1] + 1
-                if curr_row[j] > max_len:
-                    max_len = curr_row[j]
-                    end_pos_s1 = i
-                    end_pos_s2 = j
-        prev_row = curr_row
-
-    if max_len == 0:
-        return 0, 0, 0
-
-    return end_pos_s1 - max_len, end_pos_s2 - max_len, max_len
+    # 分隔符不会出现在识别文本中，匹配不会跨越两段
+    z = _z_function(new_text + "\x00" + old_text)
+    offset = len(new_text) + 1
+    best_start = best_len = 0
+    for i in range(len(old_text)):
+        if z[offset + i] >= best_len and z[offset + i] > 0:
+            best_start, best_len = i, z[offset + i]
+    return best_start, best_len
 
 
 def calculate_text_diff(old_text: str, new_text: str) -> tuple[int, str]:
     """计算文本差异（改进的差量算法）
 
-    使用最长公共子串算法来处理实时语音识别中的文本修正。
-    当sherpa-onnx修正之前的识别结果时,算法能够找到公共部分并正确应用修正。
+    光标位于已输入文本末尾，只能退格和追加：
+    1. 有公共前缀（最常见：追加或修正末尾几个字）时，退格到公共前缀处
+       再追加新文本的剩余部分，这是把屏幕文本改成新文本的最少按键方案
+    2. 没有公共前缀时（识别流在端点处重置后的常见情况），查找新结果
+       开头与已输入文本的重叠，保留重叠之前的已输入文本，从重叠处接着
+       输入；屏幕文本仍以新文本结尾，下次更新可以照常与新文本比较
+    3. 没有足够长的重叠时完全重写
 
     Args:
         old_text: 旧文本（上一次输入的文本）
@@ -63,13 +87,16 @@ def calculate_text_diff(old_text: str, new_text: str) -> tuple[int, str]:
 
     Examples:
         >>> calculate_text_diff("你好", "你好世界")
-        (0, "世界")
+        (0, '世界')
 
         >>> calculate_text_diff("你好", "你号")
-        (1, "号")
+        (1, '号')
+
+        >>> calculate_text_diff("今天天气很好我们", "我们去公园")
+        (0, '去公园')
 
         >>> calculate_text_diff("从这个层面上来说便宜", "那制的从这个层面上来说便")
-        (4, "那制的")
+        (10, '那制的从这个层面上来说便')
     """
     # 处理空字符串情况
     if not old_text:
@@ -79,40 +106,22 @@ def calculate_text_diff(old_text: str, new_text: str) -> tuple[int, str]:
         # 新文本为空，删除所有旧文本
         return len(old_text), ""
 
-    # 策略1: 先尝试简单的前缀匹配(最常见的情况:追加)
-    common_prefix_len = 0
+    # 策略1: 公共前缀（最常见的情况：追加或修正末尾）
+    prefix_len = common_prefix_length(old_text, new_text)
+    rewrite = (len(old_text) - prefix_len, new_text[prefix_len:])
+
+    # 有公共前缀：修正发生在句中或末尾，退格到前缀处重写不稳定尾部
+    if prefix_len:
+        return rewrite
+
+    # 策略2: 查找首尾重叠
+    start, overlap_len = find_tail_overlap(old_text, new_text)
+
+    # 重叠太短时视为无关文本，完全重写
     min_len = min(len(old_text), len(new_text))
+    min_overlap = min(5, min_len // 3)  # 至少5个字符或1/3长度
+    if overlap_len == 0 or overlap_len < min_overlap:
+        return rewrite
 
-    for i in range(min_len):
-        if old_text[i] == new_text[i]:
-            common_prefix_len = i + 1
-        else:
-            break
-
-    # 如果找到了较长的公共前缀(超过50%),使用简单算法
-    if common_prefix_len >= min_len * 0.5:
-        backspace_count = len(old_text) - common_prefix_len
-        text_to_append = new_text[common_prefix_len:]
-        return backspace_count, text_to_append
-
-    # 策略2: 前缀匹配失败,使用最长公共子串算法
-    start_old, start_new, lcs_len = find_longest_common_substring(old_text, new_text)
-
-    # 如果没有找到足够长的公共子串,使用完全重写策略
-    min_lcs_threshold = min(5, min_len // 3)  # 至少5个字符或1/3长度
-    if lcs_len < min_lcs_threshold:
-        # 完全重写:删除所有旧文本,输入所有新文本
-        return len(old_text), new_text
-
-    # 找到了公共子串,计算差异
-    # 需要删除的是:从当前光标位置(old_text末尾)到公共子串结束位置
-    # 即:删除 old_text[start_old + lcs_len:] 的内容
-    backspace_count = len(old_text) - (start_old + lcs_len)
-
-    # 需要追加的是:公共子串之前的new_text部分 + 公共子串之后的new_text部分
-    # 即:new_text[:start_new] + new_text[start_new + lcs_len:]
-    text_before_lcs = new_text[:start_new]
-    text_after_lcs = new_text[start_new + lcs_len :]
-    text_to_append = text_before_lcs + text_after_lcs
-
-    return backspace_count, text_to_append
+    keep = start + overlap_len
+    return len(old_text) - keep, new_text[overlap_len:]
@@ -189,6 +189,7 @@ class TranscriptionController(
                 # 从返回结果中提取文本和统计信息
                 text = result.get("text", "")
                 stats = result.get("stats", {})
+                segments = result.get("segments", [])
 
                 app_logger.log_audio_event(
                     "Streaming transcription stopped",
@@ -202,6 +203,10 @@ class TranscriptionController(
                 )
                 text = self._transcribe_from_file_for_cloud()
                 stats = {}
+                segments = []
+
+            # 历史记录保存完整转录（realtime 模式下输入端不再需要它）
+            transcript = text
 
             # 关键修复：Realtime模式下，文本已在录音过程中实时输入，清空最终文本避免重复
             if streaming_mode == "realtime":
@@ -221,7 +226,7 @@ class TranscriptionController(
                     "No text from chunked streaming, falling back to sync transcription",
                     {"streaming_mode": streaming_mode},
                 )
-                text = self._sync_transcribe_last_audio()
+                text = transcript = self._sync_transcribe_last_audio()
 
             transcribe_duration = time.time() - transcribe_start
 
@@ -237,13 +242,17 @@ class TranscriptionController(
 
             # 保存历史记录（转录阶段）
             if self._current_record_id and self._current_audio_file_path:
-                self._save_transcription_record(text=text, status="success", error=None)
+                self._save_transcription_record(
+                    text=transcript, status="success", error=None
+                )
 
             # 发送转录完成事件（包含 streaming_mode）
             self._events.emit(
                 Events.TRANSCRIPTION_COMPLETED,
                 {
                     "text": text,
+                    "transcript": transcript,
+                    "segments": segments,
                     "audio_duration": self._audio_duration,
                     "transcribe_duration": transcribe_duration,
                     "recording_stop_time": self._recording_stop_time,
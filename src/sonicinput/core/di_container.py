@@ -2,10 +2,17 @@
 
 Minimal DI container following YAGNI principle.
 Only provides essential features actually needed by the application.
+
+Startup: registrations may declare their dependencies and a StartupMode.
+start_services() starts those services on a small thread pool as soon as
+their dependencies are up, waits only for the CRITICAL ones, and records
+every step in a StartupTimeline.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Callable, Dict, Type, TypeVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type, TypeVar
 
 # Interface imports for create_container()
 from .interfaces import (
@@ -23,6 +30,7 @@ from .services.ui_services import (
     UIModelService,
     UISettingsService,
 )
+from .startup_timeline import StartupTimeline
 
 # Global singleton instance for HistoryStorageService
 # This must be at module level to work with global keyword in create_history_service()
@@ -38,6 +46,16 @@ class Lifetime(Enum):
     TRANSIENT = "transient"  # New instance each time
 
 
+class StartupMode(Enum):
+    """How start_services() treats a registered singleton"""
+
+    # Started on the startup pool; start_services() waits for it
+    CRITICAL = "critical"
+    # Started on the startup pool without blocking startup; the first
+    # resolve() from another thread waits until its start has finished
+    BACKGROUND = "background"
+
+
 class DIContainer:
     """Simplified dependency injection container
 
@@ -65,17 +83,42 @@ class DIContainer:
         service = container.resolve(IMyService)
     """
 
-    def __init__(self):
-        """Initialize DI container"""
+    # Startup pool size; startup work is mostly I/O and native init
+    STARTUP_WORKERS = 4
+
+    def __init__(self, startup_timeline: Optional[StartupTimeline] = None):
+        """Initialize DI container
+
+        Args:
+            startup_timeline: Timeline that records service startup
+                (a new one is created if omitted)
+        """
         # Core storage
         self._registrations: Dict[Type, tuple[Callable, Lifetime]] = {}
         self._singletons: Dict[Type, Any] = {}
 
+        # Dependency graph and startup policy
+        self._dependencies: Dict[Type, tuple] = {}
+        self._startup_modes: Dict[Type, StartupMode] = {}
+        self.startup_timeline = startup_timeline or StartupTimeline()
+
+        # Singleton creation is serialized per interface so that concurrent
+        # resolve() calls from startup workers build each singleton once
+        self._lock = threading.Lock()
+        self._creation_locks: Dict[Type, threading.RLock] = {}
+
+        # Startup progress: interface -> Event set once its start finished
+        self._startup_events: Dict[Type, threading.Event] = {}
+        self._startup_results: Dict[Type, bool] = {}
+        self._starting = threading.local()
+
     def register_singleton(
         self,
         interface: Type[T],
         implementation: Type[T] = None,
         factory: Callable[[], T] = None,
+        depends_on: Iterable[Type] = (),
+        startup: Optional[StartupMode] = None,
     ) -> "DIContainer":
         """Register a singleton service
 
@@ -83,6 +126,9 @@ class DIContainer:
             interface: Service interface type
             implementation: Service implementation type (if not using factory)
             factory: Factory function to create service (if not using implementation)
+            depends_on: Services the factory resolves; start_services() starts
+                this service only after those are started
+            startup: Start this service in start_services() (None = never)
 
         Returns:
             Self for method chaining
@@ -90,6 +136,12 @@ class DIContainer:
         Example:
             container.register_singleton(IConfigService, ConfigService)
             container.register_singleton(ILogger, factory=lambda: Logger("app"))
+            container.register_singleton(
+                IHotkeyService,
+                factory=create_hotkey_service,
+                depends_on=(IConfigService,),
+                startup=StartupMode.CRITICAL,
+            )
         """
         if implementation is None and factory is None:
             # Self-registration (interface is also implementation)
@@ -97,6 +149,11 @@ class DIContainer:
 
         creator = factory if factory else lambda: self._create(implementation)
         self._registrations[interface] = (creator, Lifetime.SINGLETON)
+        self._dependencies[interface] = tuple(depends_on)
+        if startup is None:
+            self._startup_modes.pop(interface, None)
+        else:
+            self._startup_modes[interface] = startup
         return self
 
     def register_transient(
@@ -104,6 +161,7 @@ class DIContainer:
         interface: Type[T],
         implementation: Type[T] = None,
         factory: Callable[[], T] = None,
+        depends_on: Iterable[Type] = (),
     ) -> "DIContainer":
         """Register a transient service (new instance each time)
 
@@ -111,6 +169,7 @@ class DIContainer:
             interface: Service interface type
             implementation: Service implementation type (if not using factory)
             factory: Factory function to create service (if not using implementation)
+            depends_on: Services the factory resolves
 
         Returns:
             Self for method chaining
@@ -123,6 +182,8 @@ class DIContainer:
 
         creator = factory if factory else lambda: self._create(implementation)
         self._registrations[interface] = (creator, Lifetime.TRANSIENT)
+        self._dependencies[interface] = tuple(depends_on)
+        self._startup_modes.pop(interface, None)
         return self
 
     def resolve(self, interface: Type[T]) -> T:
@@ -145,14 +206,44 @@ class DIContainer:
 
         creator, lifetime = self._registrations[interface]
 
-        # Singleton: reuse existing instance
-        if lifetime == Lifetime.SINGLETON:
-            if interface not in self._singletons:
-                self._singletons[interface] = creator()
-            return self._singletons[interface]
-
         # Transient: create new instance
-        return creator()
+        if lifetime != Lifetime.SINGLETON:
+            return creator()
+
+        # Singleton: reuse existing instance
+        if interface not in self._singletons:
+            with self._creation_lock(interface):
+                if interface not in self._singletons:
+                    self._singletons[interface] = creator()
+        instance = self._singletons[interface]
+
+        # Service still starting in the background: first use waits for it
+        started = self._startup_events.get(interface)
+        if (
+            started is not None
+            and not started.is_set()
+            and interface not in self._starting_here()
+        ):
+            started.wait()
+        return instance
+
+    def _creation_lock(self, interface: Type) -> threading.RLock:
+        with self._lock:
+            lock = self._creation_locks.get(interface)
+            if lock is None:
+                lock = self._creation_locks[interface] = threading.RLock()
+            return lock
+
+    def _starting_here(self) -> Set[Type]:
+        """Interfaces being started by the current thread"""
+        starting = getattr(self._starting, "interfaces", None)
+        if starting is None:
+            starting = self._starting.interfaces = set()
+        return starting
+
+    def get_dependencies(self, interface: Type) -> tuple:
+        """Declared dependencies of a registered service"""
+        return self._dependencies.get(interface, ())
 
     def update_singleton(self, interface: Type[T], new_instance: T) -> None:
         """Update a singleton instance at runtime
@@ -221,6 +312,212 @@ class DIContainer:
                 f"If this service has dependencies, register it with a factory function."
             )
 
+    # ------------------------------------------------------------------
+    # Startup
+    # ------------------------------------------------------------------
+
+    def _startup_order(self) -> List[Type]:
+        """Services with a StartupMode, dependencies first
+
+        Raises:
+            ValueError: If the declared dependencies contain a cycle
+        """
+        order: List[Type] = []
+        state: Dict[Type, str] = {}
+
+        def visit(interface: Type) -> None:
+            mark = state.get(interface)
+            if mark == "done":
+                return
+            if mark == "visiting":
+                raise ValueError(
+                    f"Circular service dependency involving {interface.__name__}"
+                )
+            state[interface] = "visiting"
+            for dependency in self._dependencies.get(interface, ()):
+                visit(dependency)
+            state[interface] = "done"
+            if interface in self._startup_modes:
+                order.append(interface)
+
+        for interface in self._startup_modes:
+            visit(interface)
+        return order
+
+    def _startup_prerequisites(self, interface: Type) -> Set[Type]:
+        """Started services that must be up before interface starts
+
+        Dependencies without a StartupMode are looked through, so a service
+        that depends on a plain singleton which in turn depends on a started
+        service still waits for the latter.
+        """
+        found: Set[Type] = set()
+        stack = list(self._dependencies.get(interface, ()))
+        seen: Set[Type] = set()
+        while stack:
+            dependency = stack.pop()
+            if dependency in seen:
+                continue
+            seen.add(dependency)
+            if dependency in self._startup_modes:
+                found.add(dependency)
+            else:
+                stack.extend(self._dependencies.get(dependency, ()))
+        return found
+
+    def start_services(self, timeout: Optional[float] = None) -> bool:
+        """Resolve and start every service registered with a StartupMode
+
+        Services start on a thread pool as soon as all their dependencies
+        have finished starting, so independent services start concurrently.
+        Only CRITICAL services are waited for; BACKGROUND services keep
+        starting after this returns (see wait_for_startup()).
+
+        Args:
+            timeout: Maximum time to wait for the CRITICAL services
+
+        Returns:
+            True if every CRITICAL service started successfully
+        """
+        from ..utils import app_logger
+
+        order = self._startup_order()
+        if not order:
+            return True
+
+        prerequisites = {i: self._startup_prerequisites(i) for i in order}
+        dependents: Dict[Type, List[Type]] = {i: [] for i in order}
+        for interface, needs in prerequisites.items():
+            for dependency in needs:
+                dependents[dependency].append(interface)
+
+        with self._lock:
+            for interface in order:
+                self._startup_events.setdefault(interface, threading.Event())
+
+        remaining = {i: len(prerequisites[i]) for i in order}
+        unfinished = [len(order)]
+        schedule_lock = threading.Lock()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.STARTUP_WORKERS, len(order)),
+            thread_name_prefix="ServiceStartup",
+        )
+
+        def run(interface: Type) -> None:
+            try:
+                self._start_one(interface)
+            finally:
+                ready = []
+                with schedule_lock:
+                    unfinished[0] -= 1
+                    for dependent in dependents[interface]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            ready.append(dependent)
+                for dependent in ready:
+                    executor.submit(run, dependent)
+                if not unfinished[0]:
+                    # Last start finished: let the idle workers exit
+                    executor.shutdown(wait=False)
+
+        app_logger.log_audio_event(
+            "Starting services",
+            {
+                "component": "di_container",
+                "services": [i.__name__ for i in order],
+                "critical": [
+                    i.__name__
+                    for i in order
+                    if self._startup_modes[i] == StartupMode.CRITICAL
+                ],
+            },
+        )
+
+        for interface in order:
+            if remaining[interface] == 0:
+                executor.submit(run, interface)
+
+        return self.wait_for_startup(timeout, critical_only=True)
+
+    def _start_one(self, interface: Type) -> None:
+        """Resolve and start a single service on a startup worker"""
+        from ..utils import app_logger
+
+        name = interface.__name__
+        span = self.startup_timeline.begin(name)
+        starting = self._starting_here()
+        starting.add(interface)
+        success = False
+        try:
+            service = self.resolve(interface)
+            start = getattr(service, "start", None)
+            if start is None or getattr(service, "is_running", False):
+                success = True
+            else:
+                success = bool(start())
+            if not success:
+                app_logger.log_error(
+                    Exception(f"{name} failed to start"),
+                    f"di_container_start_{name}",
+                )
+        except Exception as e:
+            app_logger.log_error(e, f"di_container_start_{name}")
+        finally:
+            starting.discard(interface)
+            self._startup_results[interface] = success
+            self.startup_timeline.end(span, "ok" if success else "failed")
+            self._startup_events[interface].set()
+
+    def wait_for_startup(
+        self, timeout: Optional[float] = None, critical_only: bool = False
+    ) -> bool:
+        """Wait for services started by start_services()
+
+        Args:
+            timeout: Maximum total time to wait (None = no limit)
+            critical_only: Only wait for CRITICAL services
+
+        Returns:
+            True if all waited-for services finished and started successfully
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = self.startup_timeline.now() + timeout
+
+        with self._lock:
+            pending = list(self._startup_events.items())
+
+        ok = True
+        for interface, event in pending:
+            if (
+                critical_only
+                and self._startup_modes.get(interface) != StartupMode.CRITICAL
+            ):
+                continue
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - self.startup_timeline.now())
+            if not event.wait(remaining):
+                ok = False
+            elif not self._startup_results.get(interface, False):
+                ok = False
+        return ok
+
+    def get_startup_report(self) -> Dict[str, Any]:
+        """Startup timeline report (see StartupTimeline.get_report())"""
+        report = self.startup_timeline.get_report()
+        report["services"] = {
+            interface.__name__: {
+                "mode": self._startup_modes[interface].value,
+                "depends_on": [
+                    d.__name__ for d in self._startup_prerequisites(interface)
+                ],
+                "started": self._startup_results.get(interface),
+            }
+            for interface in self._startup_order()
+        }
+        return report
+
     def is_registered(self, interface: Type) -> bool:
         """Check if service is registered
 
@@ -239,6 +536,10 @@ class DIContainer:
         """
         self._registrations.clear()
         self._singletons.clear()
+        self._dependencies.clear()
+        self._startup_modes.clear()
+        self._startup_events.clear()
+        self._startup_results.clear()
 
     # Backward compatibility aliases
     def get(self, interface: Type[T]) -> T:
@@ -261,9 +562,16 @@ class DIContainer:
 
 
 # Migrated from di_container_enhanced.py (Phase 3.5.2a)
-def create_container() -> "DIContainer":
-    """创建依赖注入容器实例并注册所有服务"""
-    container = DIContainer()
+def create_container(
+    startup_timeline: Optional[StartupTimeline] = None,
+) -> "DIContainer":
+    """创建依赖注入容器实例并注册所有服务
+
+    Args:
+        startup_timeline: 启动时间线（可选）；传入在进程入口处创建的实例，
+            报告中的时间即从启动开始计算
+    """
+    container = DIContainer(startup_timeline)
 
     # NOTE: ConfigReloadServiceRegistry removed in Phase 2 refactor
     # TODO: Replace with new HotReloadManager in Phase 3.5
@@ -298,11 +606,16 @@ def create_container() -> "DIContainer":
         )
 
     container.register_singleton(
-        IConfigService, factory=lambda: create_config_service(container)
+        IConfigService,
+        factory=lambda: create_config_service(container),
+        depends_on=(IEventService,),
+        startup=StartupMode.CRITICAL,
     )
 
     # 状态管理器 - 单例（需要 EventService）
-    container.register_singleton(IStateManager, StateManager)
+    container.register_singleton(
+        IStateManager, StateManager, startup=StartupMode.CRITICAL
+    )
 
     # Hot Reload Manager - 单例 (Phase 3.5.2b: Registered for VoiceInputApp)
     container.register_singleton(HotReloadManager, HotReloadManager)
@@ -326,8 +639,12 @@ def create_container() -> "DIContainer":
             _history_service_instance = HistoryStorageService(config)
         return _history_service_instance
 
+    # 非关键服务：后台启动，首次使用时才等待其启动完成
     container.register_singleton(
-        HistoryStorageService, factory=lambda: create_history_service(container)
+        HistoryStorageService,
+        factory=lambda: create_history_service(container),
+        depends_on=(IConfigService,),
+        startup=StartupMode.BACKGROUND,
     )
 
     # 音频服务 - 瞬态
@@ -347,7 +664,9 @@ def create_container() -> "DIContainer":
         )
 
     container.register_transient(
-        IAudioService, factory=lambda: create_audio_service(container)
+        IAudioService,
+        factory=lambda: create_audio_service(container),
+        depends_on=(IConfigService,),
     )
 
     # 语音服务 - 单例（最复杂的服务）
@@ -419,6 +738,9 @@ def create_container() -> "DIContainer":
                 speech_service_factory=lambda: base_service,
                 event_service=event_service,
                 config_service=config,
+                fallback_service_factory=lambda: (
+                    SpeechServiceFactory.create_cloud_fallback(config)
+                ),
             )
 
             # 启动RefactoredTranscriptionService
@@ -470,8 +792,13 @@ def create_container() -> "DIContainer":
 
             return cloud_service
 
+    # 工厂会探测运行时并启动转录服务，较慢：在后台预先创建，
+    # 与主线程的 UI 初始化重叠
     container.register_singleton(
-        ISpeechService, factory=lambda: create_speech_service(container)
+        ISpeechService,
+        factory=lambda: create_speech_service(container),
+        depends_on=(IConfigService, IEventService),
+        startup=StartupMode.BACKGROUND,
     )
 
     # AI服务 - 瞬态
@@ -492,7 +819,9 @@ def create_container() -> "DIContainer":
         return client
 
     container.register_transient(
-        IAIService, factory=lambda: create_ai_service(container)
+        IAIService,
+        factory=lambda: create_ai_service(container),
+        depends_on=(IConfigService,),
     )
 
     # 输入服务 - 瞬态
@@ -501,7 +830,9 @@ def create_container() -> "DIContainer":
         return SmartTextInput(config_service)
 
     container.register_transient(
-        IInputService, factory=lambda: create_input_service(container)
+        IInputService,
+        factory=lambda: create_input_service(container),
+        depends_on=(IConfigService,),
     )
 
     # 快捷键服务 - 单例（需要热重载支持）
@@ -533,7 +864,10 @@ def create_container() -> "DIContainer":
         return hotkey_service
 
     container.register_singleton(
-        IHotkeyService, factory=lambda: create_hotkey_service(container)
+        IHotkeyService,
+        factory=lambda: create_hotkey_service(container),
+        depends_on=(IConfigService, IEventService),
+        startup=StartupMode.CRITICAL,
     )
 
     # 应用编排器 - 单例（依赖多个核心服务）
@@ -546,11 +880,13 @@ def create_container() -> "DIContainer":
             config_service=config,
             event_service=events,
             state_manager=state,
+            startup_timeline=container.startup_timeline,
         )
 
     container.register_singleton(
         ApplicationOrchestrator,
         factory=lambda: create_application_orchestrator(container),
+        depends_on=(IConfigService, IEventService, IStateManager),
     )
 
     # UI事件桥接器 - 单例（依赖事件服务）
@@ -673,47 +1009,16 @@ def create_container() -> "DIContainer":
 
     # ========================================================================
     # Phase 4 Bug Fix: Start LifecycleComponent services after registration
+    # 按依赖关系并行启动：配置服务就绪后，状态管理器、快捷键、历史记录和
+    # 语音服务同时启动；只等待 CRITICAL 服务
     # ========================================================================
     from ..utils import app_logger
 
-    # Services that need to be started (in dependency order)
-    lifecycle_services = [
-        (IConfigService, "ConfigService"),
-        (IStateManager, "StateManager"),
-        (IHotkeyService, "HotkeyService"),
-        (HistoryStorageService, "HistoryStorageService"),
-    ]
-
-    for service_interface, service_name in lifecycle_services:
-        try:
-            app_logger.log_audio_event(
-                f"Attempting to start {service_name}",
-                {"component": "di_container", "service": service_name},
-            )
-            service = container.resolve(service_interface)
-            has_start_method = hasattr(service, "start")
-            app_logger.log_audio_event(
-                f"{service_name} resolved",
-                {"component": "di_container", "has_start": has_start_method},
-            )
-            if has_start_method:
-                start_result = service.start()
-                if not start_result:
-                    app_logger.log_error(
-                        Exception(f"{service_name} failed to start"),
-                        f"di_container_start_{service_name}",
-                    )
-                else:
-                    app_logger.log_audio_event(
-                        f"{service_name} started successfully",
-                        {"component": "di_container"},
-                    )
-            else:
-                app_logger.log_audio_event(
-                    f"{service_name} has no start() method",
-                    {"component": "di_container"},
-                )
-        except Exception as e:
-            app_logger.log_error(e, f"di_container_start_{service_name}")
+    if not container.start_services():
+        app_logger.log_audio_event(
+            "Some critical services failed to start",
+            {"component": "di_container", "report": container.get_startup_report()},
+        )
+    container.startup_timeline.mark("container_ready")
 
     return container
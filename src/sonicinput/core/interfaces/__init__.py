@@ -4,29 +4,60 @@
 所有服务和组件都应该依赖接口而不是具体实现。
 """
 
+import importlib
 from dataclasses import dataclass
 from datetime import datetime
 
 # Interfaces added after Phase 1.2 cleanup (missing definitions)
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .ai import IAIService
-from .audio import IAudioService
-from .config import IConfigService
-from .controller import (
-    IAIProcessingController,
-    IInputController,
-    IRecordingController,
-    ITranscriptionController,
-)
-from .event import EventPriority, IEventService
-from .hotkey import IHotkeyService
-from .input import IInputService
-from .lifecycle import ComponentState, ILifecycleManaged, ILifecycleManager
-from .speech import ISpeechService
-from .state import AppState, IStateManager, RecordingState
-from .storage import ICacheService, IStorageService
-from .ui import IOverlayComponent, ITrayComponent, IUIComponent
+if TYPE_CHECKING:
+    from .ai import IAIService
+    from .audio import IAudioService
+    from .config import IConfigService
+    from .controller import (
+        IAIProcessingController,
+        IInputController,
+        IRecordingController,
+        ITranscriptionController,
+    )
+    from .event import EventDelivery, EventPriority, IEventService
+    from .hotkey import IHotkeyService
+    from .input import IInputService
+    from .lifecycle import ComponentState, ILifecycleManaged, ILifecycleManager
+    from .speech import ISpeechService
+    from .state import AppState, IStateManager, RecordingState
+    from .storage import ICacheService, IStorageService
+    from .ui import IOverlayComponent, ITrayComponent, IUIComponent
+
+# 接口在首次访问时才导入（PEP 562）：audio/speech 接口依赖 numpy，
+# ui 接口依赖 PySide6，只用到配置或事件接口的模块不必加载它们
+_LAZY_IMPORTS = {
+    "IAIService": ".ai",
+    "IAudioService": ".audio",
+    "IConfigService": ".config",
+    "IAIProcessingController": ".controller",
+    "IInputController": ".controller",
+    "IRecordingController": ".controller",
+    "ITranscriptionController": ".controller",
+    "EventDelivery": ".event",
+    "EventPriority": ".event",
+    "IEventService": ".event",
+    "IHotkeyService": ".hotkey",
+    "IInputService": ".input",
+    "ComponentState": ".lifecycle",
+    "ILifecycleManaged": ".lifecycle",
+    "ILifecycleManager": ".lifecycle",
+    "ISpeechService": ".speech",
+    "AppState": ".state",
+    "IStateManager": ".state",
+    "RecordingState": ".state",
+    "ICacheService": ".storage",
+    "IStorageService": ".storage",
+    "IOverlayComponent": ".ui",
+    "ITrayComponent": ".ui",
+    "IUIComponent": ".ui",
+}
 
 
 @dataclass
@@ -66,6 +97,7 @@ __all__ = [
     "IHotkeyService",
     "IEventService",
     "EventPriority",
+    "EventDelivery",
     # UI组件接口
     "IUIComponent",
     "IOverlayComponent",
@@ -89,3 +121,17 @@ __all__ = [
     # Data types
     "HistoryRecord",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入接口（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
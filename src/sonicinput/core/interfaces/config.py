@@ -1,7 +1,7 @@
 """配置服务接口定义"""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 
 class IConfigService(ABC):
@@ -22,5 +22,12 @@ class IConfigService(ABC):
         """保存配置"""
         pass
 
+    @abstractmethod
+    def subscribe(
+        self, key: str, callback: Callable[[str, Any, Any], None]
+    ) -> Callable[[], None]:
+        """订阅配置项变更，返回取消订阅的函数"""
+        pass
+
 
 __all__ = ["IConfigService"]
@@ -14,6 +14,19 @@ class EventPriority(Enum):
     CRITICAL = 4
 
 
+class EventDelivery(Enum):
+    """监听器投递方式
+
+    INLINE: 在发出事件的线程上同步执行（默认）
+    WORKER: 投递到事件工作线程池，同一监听器按发出顺序串行执行
+    MAIN_THREAD: 投递到 Qt 主线程执行（无 Qt 应用实例时退化为 INLINE）
+    """
+
+    INLINE = "inline"
+    WORKER = "worker"
+    MAIN_THREAD = "main_thread"
+
+
 class IEventService(ABC):
     """事件服务接口"""
 
@@ -33,4 +46,4 @@ class IEventService(ABC):
         pass
 
 
-__all__ = ["EventPriority", "IEventService"]
+__all__ = ["EventDelivery", "EventPriority", "IEventService"]
@@ -1,13 +1,28 @@
 """核心服务模块
 
 包含应用程序的核心业务服务,实现高内聚、低耦合的服务架构。
+导出对象在首次访问时才导入（PEP 562）：导入 services.config 等子包时
+不会连带加载 AI 客户端和转录服务。
 """
 
-from .ai_service import AIService
-from .config_service import ConfigService
-from .event_bus import EventBus
-from .state_manager import StateManager
-from .transcription_service import TranscriptionResult, TranscriptionService
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ai_service import AIService
+    from .config_service import ConfigService
+    from .event_bus import EventBus
+    from .state_manager import StateManager
+    from .transcription_service import TranscriptionResult, TranscriptionService
+
+_LAZY_IMPORTS = {
+    "AIService": ".ai_service",
+    "ConfigService": ".config_service",
+    "EventBus": ".event_bus",
+    "StateManager": ".state_manager",
+    "TranscriptionResult": ".transcription_service",
+    "TranscriptionService": ".transcription_service",
+}
 
 __all__ = [
     "EventBus",
@@ -17,3 +32,17 @@ __all__ = [
     "TranscriptionResult",
     "AIService",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
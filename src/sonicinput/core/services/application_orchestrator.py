@@ -22,6 +22,7 @@ from ..interfaces import (
     IStateManager,
 )
 from ..services.config import ConfigKeys
+from ..startup_timeline import StartupTimeline
 from .events import Events
 from .hot_reload_manager import HotReloadManager
 
@@ -53,6 +54,7 @@ class ApplicationOrchestrator:
         event_service: IEventService,
         state_manager: IStateManager,
         hot_reload_manager: Optional[HotReloadManager] = None,
+        startup_timeline: Optional[StartupTimeline] = None,
     ):
         """初始化应用编排器
 
@@ -61,11 +63,13 @@ class ApplicationOrchestrator:
             event_service: 事件服务
             state_manager: 状态管理器
             hot_reload_manager: 热重载管理器（可选）
+            startup_timeline: 启动时间线（可选，通常与 DI 容器共享）
         """
         self.config = config_service
         self.events = event_service
         self.state = state_manager
         self.hot_reload_manager = hot_reload_manager or HotReloadManager()
+        self.startup_timeline = startup_timeline or StartupTimeline()
 
         # 初始化状态
         self._current_phase = InitializationPhase.NOT_STARTED
@@ -124,6 +128,8 @@ class ApplicationOrchestrator:
             )
             self._execute_phase(InitializationPhase.CONTROLLERS, self._init_controllers)
             self._execute_phase(InitializationPhase.HOTKEY_SETUP, self._init_hotkeys)
+            # 控制器已订阅事件、热键已监听：按下热键即可开始录音
+            self.startup_timeline.mark("hotkey_armed")
             self._execute_phase(
                 InitializationPhase.MODEL_LOADING, self._init_model_loading
             )
@@ -133,8 +139,10 @@ class ApplicationOrchestrator:
             self._startup_complete = True
 
             # 触发启动完成事件
+            self.startup_timeline.mark("startup_completed")
             self.events.emit(Events.APP_STARTUP_COMPLETED)
             app_logger.log_audio_event("Application startup completed successfully", {})
+            self.startup_timeline.log_report()
 
         except Exception as e:
             self._initialization_error = e
@@ -207,6 +215,10 @@ class ApplicationOrchestrator:
         """检查启动是否完成"""
         return self._startup_complete
 
+    def get_startup_report(self) -> Dict[str, Any]:
+        """获取启动时间线报告（marks 中的 hotkey_armed 为热键就绪时刻）"""
+        return self.startup_timeline.get_report()
+
     def register_startup_callback(self, phase: str, callback: Callable) -> None:
         """注册启动阶段回调"""
         if phase not in self._startup_callbacks:
@@ -231,18 +243,24 @@ class ApplicationOrchestrator:
         """执行初始化阶段"""
         self._current_phase = phase
         app_logger.log_audio_event(f"Starting initialization phase: {phase.value}", {})
+        span = self.startup_timeline.begin(phase.value, category="phase")
 
-        # 执行阶段处理器
-        phase_handler()
+        try:
+            # 执行阶段处理器
+            phase_handler()
 
-        # 执行注册的回调
-        callbacks = self._startup_callbacks.get(phase.value, [])
-        for callback in callbacks:
-            try:
-                callback()
-            except Exception as e:
-                app_logger.log_error(e, f"phase_callback_{phase.value}")
+            # 执行注册的回调
+            callbacks = self._startup_callbacks.get(phase.value, [])
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    app_logger.log_error(e, f"phase_callback_{phase.value}")
+        except Exception:
+            self.startup_timeline.end(span, "failed")
+            raise
 
+        self.startup_timeline.end(span)
         app_logger.log_audio_event(f"Completed initialization phase: {phase.value}", {})
 
     def _init_core_services(self) -> None:
@@ -0,0 +1,749 @@
+"""历史记录批量重处理引擎
+
+有界生产者/消费者流水线（不依赖 Qt）：
+
+    键集分页读取 -> 音频解码（IO线程池）
+                 -> 转录（本地模型批量解码 / 云端限速并发）
+                 -> AI优化（独立并发阶段）
+                 -> 批量写回数据库
+
+同时在途的记录数受信号量限制，内存占用与记录总数无关。
+处理进度按“连续完成水位”持久化为检查点，中断后可从检查点恢复；
+进度通过 subscribe() 注册的回调以事件流形式发布。
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ...utils import app_logger
+from .config import ConfigKeys
+
+# maintenance_state 中保存批量重处理检查点的键
+CHECKPOINT_KEY = "batch_reprocess_checkpoint"
+
+# 计入 skipped 的错误类型（音频不可用），其余错误计入 failed：
+# transcription_failed / empty_transcription / transcription_error /
+# record_not_found / update_failed
+SKIP_ERRORS = frozenset(
+    {"no_audio_path", "file_not_found", "load_failed", "load_error"}
+)
+
+# 阶段结束标记
+_SENTINEL = object()
+
+
+@dataclass
+class ReprocessError:
+    """单条记录的处理错误"""
+
+    record_id: str
+    kind: str
+    detail: str = ""
+
+
+@dataclass
+class ReprocessStats:
+    """批量重处理统计"""
+
+    total: int = 0
+    processed: int = 0
+    success: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[ReprocessError] = field(default_factory=list)
+    elapsed: float = 0.0
+    cancelled: bool = False
+    resumed_from: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（用于日志和事件）"""
+        return asdict(self)
+
+
+@dataclass
+class ReprocessEvent:
+    """进度事件
+
+    kind:
+        "started"   - 开始处理（processed 为从检查点恢复的条数）
+        "record"    - 一条记录处理完成并已写回
+        "completed" - 全部结束（含取消），stats 为最终统计
+    """
+
+    kind: str
+    processed: int = 0
+    total: int = 0
+    record_id: Optional[str] = None
+    success: Optional[bool] = None
+    error: Optional[ReprocessError] = None
+    stats: Optional[ReprocessStats] = None
+
+
+def load_checkpoint(history_service) -> Optional[Dict[str, Any]]:
+    """读取上次被中断的批量重处理检查点
+
+    Returns:
+        {"after": (timestamp, id), "processed": int, "total": int}，没有时返回 None
+    """
+    raw = history_service.get_maintenance_value(CHECKPOINT_KEY)
+    if not raw:
+        return None
+    try:
+        checkpoint = json.loads(raw)
+        checkpoint["after"] = tuple(checkpoint["after"])
+        return checkpoint
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class RateLimiter:
+    """令牌桶限速器（线程安全）
+
+    rate_per_minute <= 0 表示不限速。
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self._rate = max(0.0, float(rate_per_minute)) / 60.0
+        self._capacity = max(1, int(burst))
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self._rate <= 0
+
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """获取一个令牌，必要时等待
+
+        Args:
+            stop_event: 置位时放弃等待
+
+        Returns:
+            是否获得令牌（被 stop_event 中断时返回 False）
+        """
+        if self.unlimited:
+            return True
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = (1.0 - self._tokens) / self._rate
+
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+@dataclass
+class _WorkItem:
+    """流水线中的单条记录"""
+
+    index: int
+    record: Any
+    audio: Optional[np.ndarray] = None
+    text: str = ""
+    ai_text: Optional[str] = None
+    ai_status: str = "skipped"
+    ai_provider: Optional[str] = None
+    ai_error: Optional[str] = None
+    error: Optional[ReprocessError] = None
+    cancelled: bool = False
+
+    def fail(self, kind: str, detail: str = "") -> "_WorkItem":
+        self.audio = None
+        self.error = ReprocessError(self.record.id, kind, detail)
+        return self
+
+
+def _default_audio_loader(path: str) -> Optional[np.ndarray]:
+    from ...audio.recorder import AudioRecorder
+
+    return AudioRecorder.load_audio_from_file(path)
+
+
+class BatchReprocessingEngine:
+    """历史记录批量重处理引擎
+
+    线程模型：
+    - 生产者线程：键集分页读取记录，提交到IO线程池解码音频
+    - 转录阶段：本地模型 1 个线程按批解码；云端 N 个线程，经令牌桶限速
+    - AI阶段：M 个线程并发调用 AI 优化（未启用 AI 时跳过）
+    - 写入线程：攒批写回数据库，更新统计、检查点并发布事件
+    """
+
+    def __init__(
+        self,
+        history_service,
+        transcription_service,
+        config_service,
+        ai_processing_controller=None,
+        io_workers: Optional[int] = None,
+        asr_batch_size: int = 8,
+        cloud_concurrency: int = 4,
+        requests_per_minute: float = 0,
+        ai_workers: int = 4,
+        max_in_flight: int = 64,
+        page_size: int = 500,
+        write_batch_size: int = 50,
+        audio_loader: Optional[Callable[[str], Optional[np.ndarray]]] = None,
+    ):
+        """初始化批量重处理引擎
+
+        Args:
+            history_service: 历史记录存储服务
+            transcription_service: 转录服务（transcribe_sync / transcribe_batch）
+            config_service: 配置服务
+            ai_processing_controller: AI处理控制器（可选）
+            io_workers: 音频解码线程数，默认 min(4, CPU数)
+            asr_batch_size: 本地模型单次批量解码的最大条数
+            cloud_concurrency: 云端转录并发请求数
+            requests_per_minute: 云端转录每分钟请求上限，0 表示不限
+            ai_workers: AI优化并发数
+            max_in_flight: 流水线中同时在途的最大记录数
+            page_size: 数据库分页大小
+            write_batch_size: 单次写回数据库的最大条数
+            audio_loader: 音频加载函数，默认 AudioRecorder.load_audio_from_file
+        """
+        self.history_service = history_service
+        self.transcription_service = transcription_service
+        self.config_service = config_service
+        self.ai_processing_controller = ai_processing_controller
+
+        self.io_workers = max(1, io_workers or min(4, os.cpu_count() or 1))
+        self.asr_batch_size = max(1, asr_batch_size)
+        self.cloud_concurrency = max(1, cloud_concurrency)
+        self.ai_workers = max(1, ai_workers)
+        self.max_in_flight = max(1, max_in_flight)
+        self.page_size = max(1, page_size)
+        self.write_batch_size = max(1, write_batch_size)
+        self._rate_limiter = RateLimiter(requests_per_minute)
+        self._audio_loader = audio_loader or _default_audio_loader
+
+        self._subscribers: List[Callable[[ReprocessEvent], None]] = []
+        self._stop_event = threading.Event()
+        self._run_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 公共接口
+    # ------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[ReprocessEvent], None]) -> None:
+        """订阅进度事件（回调在写入线程中调用）"""
+        self._subscribers.append(callback)
+
+    def stop(self) -> None:
+        """请求停止；在途记录被丢弃，检查点保留以便恢复"""
+        self._stop_event.set()
+
+    @property
+    def is_stopping(self) -> bool:
+        return self._stop_event.is_set()
+
+    def get_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """读取已保存的检查点"""
+        return load_checkpoint(self.history_service)
+
+    def clear_checkpoint(self) -> None:
+        """删除检查点（下次从头处理）"""
+        self.history_service.set_maintenance_value(CHECKPOINT_KEY, None)
+
+    def run(self, resume: bool = True, limit: Optional[int] = None) -> ReprocessStats:
+        """同步执行批量重处理（阻塞直到完成或被停止）
+
+        Args:
+            resume: 存在检查点时从检查点继续
+            limit: 本次最多处理的记录数，None 表示全部
+
+        Returns:
+            本次运行的统计结果
+        """
+        with self._run_lock:
+            self._stop_event.clear()
+            return self._run(resume, limit)
+
+    # ------------------------------------------------------------------
+    # 流水线
+    # ------------------------------------------------------------------
+
+    def _run(self, resume: bool, limit: Optional[int]) -> ReprocessStats:
+        start_time = time.time()
+        checkpoint = self.get_checkpoint() if resume else None
+        after = checkpoint["after"] if checkpoint else None
+        base_processed = int(checkpoint.get("processed", 0)) if checkpoint else 0
+
+        total = self.history_service.get_total_count()
+        if limit is not None:
+            total = min(total, base_processed + max(0, limit))
+
+        stats = ReprocessStats(total=total, resumed_from=base_processed)
+        stats.processed = base_processed
+
+        provider = self.config_service.get_setting(
+            ConfigKeys.TRANSCRIPTION_PROVIDER, "local"
+        )
+        language: Optional[str] = "auto"
+        if provider == "local":
+            language = self.config_service.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_LANGUAGE, "zh"
+            )
+        language = None if language == "auto" else language
+
+        ai_enabled = bool(self.config_service.get_setting(ConfigKeys.AI_ENABLED, False))
+        ai_provider = self.config_service.get_setting(ConfigKeys.AI_PROVIDER, "groq")
+
+        ctx = _RunContext(
+            provider=provider,
+            language=language,
+            ai_enabled=ai_enabled,
+            ai_provider=ai_provider,
+            max_in_flight=self.max_in_flight,
+        )
+
+        self._emit(ReprocessEvent("started", processed=base_processed, total=total))
+        app_logger.log_audio_event(
+            "Batch reprocessing started",
+            {
+                "total": total,
+                "resumed_from": base_processed,
+                "provider": provider,
+                "ai_enabled": ai_enabled,
+            },
+        )
+
+        threads: List[threading.Thread] = []
+
+        producer = threading.Thread(
+            target=self._produce,
+            args=(ctx, after, total - base_processed),
+            name="BatchReprocess-Producer",
+            daemon=True,
+        )
+        threads.append(producer)
+
+        if provider == "local":
+            asr_threads = [
+                threading.Thread(
+                    target=self._transcribe_local,
+                    args=(ctx,),
+                    name="BatchReprocess-ASR",
+                    daemon=True,
+                )
+            ]
+        else:
+            asr_threads = [
+                threading.Thread(
+                    target=self._transcribe_cloud,
+                    args=(ctx,),
+                    name=f"BatchReprocess-ASR-{i}",
+                    daemon=True,
+                )
+                for i in range(self.cloud_concurrency)
+            ]
+        threads.extend(asr_threads)
+
+        ai_threads: List[threading.Thread] = []
+        if ai_enabled:
+            ai_threads = [
+                threading.Thread(
+                    target=self._refine,
+                    args=(ctx,),
+                    name=f"BatchReprocess-AI-{i}",
+                    daemon=True,
+                )
+                for i in range(self.ai_workers)
+            ]
+        threads.extend(ai_threads)
+
+        writer = threading.Thread(
+            target=self._write,
+            args=(ctx, stats, after),
+            name="BatchReprocess-Writer",
+            daemon=True,
+        )
+        threads.append(writer)
+
+        for thread in threads:
+            thread.start()
+
+        # 按阶段顺序传递结束标记
+        producer.join()
+        for _ in asr_threads:
+            ctx.asr_queue.put(_SENTINEL)
+        for thread in asr_threads:
+            thread.join()
+        for _ in ai_threads:
+            ctx.ai_queue.put(_SENTINEL)
+        for thread in ai_threads:
+            thread.join()
+        ctx.write_queue.put(_SENTINEL)
+        writer.join()
+
+        stats.cancelled = self._stop_event.is_set() and stats.processed < total
+        stats.elapsed = time.time() - start_time
+        if not stats.cancelled:
+            self.clear_checkpoint()
+
+        app_logger.log_audio_event(
+            "Batch reprocessing cancelled"
+            if stats.cancelled
+            else "Batch reprocessing completed",
+            {
+                "total": stats.total,
+                "processed": stats.processed,
+                "success": stats.success,
+                "skipped": stats.skipped,
+                "failed": stats.failed,
+                "elapsed": round(stats.elapsed, 3),
+            },
+        )
+        self._emit(
+            ReprocessEvent(
+                "completed", processed=stats.processed, total=total, stats=stats
+            )
+        )
+        return stats
+
+    def _produce(
+        self, ctx: "_RunContext", after: Optional[Tuple[str, str]], remaining: int
+    ) -> None:
+        """生产者：分页读取记录并提交音频解码"""
+        index = 0
+        with ThreadPoolExecutor(
+            max_workers=self.io_workers, thread_name_prefix="BatchReprocess-IO"
+        ) as io_pool:
+            while index < remaining and not self._stop_event.is_set():
+                limit = min(self.page_size, remaining - index)
+                records = self.history_service.get_records_after(after, limit)
+                if not records:
+                    break
+
+                for record in records:
+                    if not ctx.acquire_slot(self._stop_event):
+                        return
+                    item = _WorkItem(index=index, record=record)
+                    ctx.keys[index] = (record.timestamp.isoformat(), record.id)
+                    io_pool.submit(self._load, ctx, item)
+                    index += 1
+
+                last = records[-1]
+                after = (last.timestamp.isoformat(), last.id)
+
+    def _load(self, ctx: "_RunContext", item: _WorkItem) -> None:
+        """IO阶段：加载音频"""
+        try:
+            if self._stop_event.is_set():
+                item.cancelled = True
+            elif not item.record.audio_file_path:
+                item.fail("no_audio_path")
+            else:
+                audio = self._audio_loader(item.record.audio_file_path)
+                if audio is None or len(audio) == 0:
+                    item.fail("load_failed")
+                else:
+                    item.audio = audio
+        except FileNotFoundError:
+            item.fail("file_not_found")
+        except Exception as e:
+            item.fail("load_error", str(e))
+
+        if item.audio is not None:
+            ctx.asr_queue.put(item)
+        else:
+            ctx.write_queue.put(item)
+
+    def _transcribe_local(self, ctx: "_RunContext") -> None:
+        """转录阶段（本地模型）：取出已就绪的记录凑批解码"""
+        while True:
+            first = ctx.asr_queue.get()
+            if first is _SENTINEL:
+                return
+
+            batch = [first]
+            finished = False
+            while len(batch) < self.asr_batch_size:
+                try:
+                    item = ctx.asr_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _SENTINEL:
+                    finished = True
+                    break
+                batch.append(item)
+
+            self._wait_for_foreground_idle()
+            if self._stop_event.is_set():
+                for item in batch:
+                    item.cancelled = True
+                    ctx.write_queue.put(item)
+            else:
+                try:
+                    results = self.transcription_service.transcribe_batch(
+                        [item.audio for item in batch], language=ctx.language
+                    )
+                except Exception as e:
+                    app_logger.log_error(e, "batch_reprocessing_transcription")
+                    results = [e] * len(batch)
+
+                for item, result in zip(batch, results):
+                    self._apply_transcription(ctx, item, result)
+
+            if finished:
+                return
+
+    def _transcribe_cloud(self, ctx: "_RunContext") -> None:
+        """转录阶段（云端）：并发请求，经令牌桶限速"""
+        while True:
+            item = ctx.asr_queue.get()
+            if item is _SENTINEL:
+                return
+
+            self._wait_for_foreground_idle()
+            if not self._rate_limiter.acquire(self._stop_event):
+                item.cancelled = True
+                ctx.write_queue.put(item)
+                continue
+
+            try:
+                result: Any = self.transcription_service.transcribe_sync(
+                    audio_data=item.audio, language=ctx.language, temperature=0.0
+                )
+            except Exception as e:
+                app_logger.log_error(e, "batch_reprocessing_transcription")
+                result = e
+            self._apply_transcription(ctx, item, result)
+
+    def _wait_for_foreground_idle(self) -> None:
+        """用户正在听写时暂停转录阶段，直到后台通道开放或引擎停止"""
+        wait = getattr(self.transcription_service, "wait_for_background_slot", None)
+        if not callable(wait):
+            return
+        while not self._stop_event.is_set() and not wait(timeout=0.2):
+            pass
+
+    def _apply_transcription(
+        self, ctx: "_RunContext", item: _WorkItem, result: Any
+    ) -> None:
+        """处理转录结果并路由到下一阶段"""
+        item.audio = None
+        if isinstance(result, Exception):
+            item.fail("transcription_error", str(result))
+        elif not result.get("success", True):
+            item.fail("transcription_failed", str(result.get("error") or ""))
+        else:
+            item.text = result.get("text", "")
+            if not item.text.strip():
+                item.fail("empty_transcription")
+
+        if item.error is None and ctx.ai_enabled:
+            ctx.ai_queue.put(item)
+        else:
+            ctx.write_queue.put(item)
+
+    def _refine(self, ctx: "_RunContext") -> None:
+        """AI阶段：并发优化文本"""
+        while True:
+            item = ctx.ai_queue.get()
+            if item is _SENTINEL:
+                return
+
+            if self._stop_event.is_set():
+                item.cancelled = True
+            elif not self.ai_processing_controller:
+                item.ai_error = "AI controller not available"
+            else:
+                try:
+                    ai_text = self.ai_processing_controller.process_with_ai(
+                        item.text, record_id=item.record.id
+                    )
+                    item.ai_provider = ctx.ai_provider
+                    if ai_text and ai_text.strip():
+                        item.ai_text = ai_text
+                        item.ai_status = "success"
+                    else:
+                        item.ai_text = ai_text
+                        item.ai_status = "failed"
+                        item.ai_error = "AI returned empty text"
+                except Exception as e:
+                    app_logger.log_error(e, "batch_reprocessing_ai")
+                    item.ai_status = "failed"
+                    item.ai_error = str(e)
+
+            ctx.write_queue.put(item)
+
+    def _write(
+        self,
+        ctx: "_RunContext",
+        stats: ReprocessStats,
+        after: Optional[Tuple[str, str]],
+    ) -> None:
+        """写入阶段：攒批写回数据库、更新统计和检查点"""
+        pending: List[_WorkItem] = []
+        done: set = set()
+        watermark = 0  # 下一个尚未完成的序号
+        checkpoint_after = after
+        base_processed = stats.processed
+        finished = False
+
+        while not finished:
+            try:
+                item = ctx.write_queue.get(timeout=0.2)
+            except queue.Empty:
+                item = None
+
+            if item is _SENTINEL:
+                finished = True
+            elif item is not None:
+                pending.append(item)
+                if len(pending) < self.write_batch_size:
+                    continue
+
+            if not pending:
+                continue
+
+            batch, pending = pending, []
+            completed = self._flush(ctx, batch, stats)
+
+            # 推进连续完成水位并持久化检查点
+            done.update(item.index for item in completed)
+            advanced = False
+            while watermark in done:
+                done.discard(watermark)
+                checkpoint_after = ctx.keys.pop(watermark)
+                watermark += 1
+                advanced = True
+            if advanced:
+                self._save_checkpoint(
+                    checkpoint_after, base_processed + watermark, stats.total
+                )
+
+    def _flush(
+        self, ctx: "_RunContext", batch: List[_WorkItem], stats: ReprocessStats
+    ) -> List[_WorkItem]:
+        """写回一批记录，返回已完成（非取消）的条目"""
+        completed = [item for item in batch if not item.cancelled]
+        to_update = [item for item in completed if item.error is None]
+
+        if to_update:
+            records = []
+            for item in to_update:
+                record = item.record
+                record.transcription_text = item.text
+                record.transcription_provider = ctx.provider
+                record.transcription_status = "success"
+                record.transcription_error = None
+                record.ai_optimized_text = item.ai_text
+                record.ai_provider = item.ai_provider
+                record.ai_status = item.ai_status
+                record.ai_error = item.ai_error
+                record.final_text = (
+                    item.ai_text
+                    if item.ai_status == "success" and item.ai_text
+                    else item.text
+                )
+                records.append(record)
+            try:
+                updated = set(self.history_service.update_records_batch(records))
+                for item in to_update:
+                    if item.record.id not in updated:
+                        item.fail("record_not_found")
+            except Exception as e:
+                for item in to_update:
+                    item.fail("update_failed", str(e))
+
+        for item in completed:
+            stats.processed += 1
+            if item.error is None:
+                stats.success += 1
+            else:
+                if item.error.kind in SKIP_ERRORS:
+                    stats.skipped += 1
+                else:
+                    stats.failed += 1
+                stats.errors.append(item.error)
+            self._emit(
+                ReprocessEvent(
+                    "record",
+                    processed=stats.processed,
+                    total=stats.total,
+                    record_id=item.record.id,
+                    success=item.error is None,
+                    error=item.error,
+                )
+            )
+
+        for _ in batch:
+            ctx.release_slot()
+        return completed
+
+    def _save_checkpoint(
+        self, after: Tuple[str, str], processed: int, total: int
+    ) -> None:
+        try:
+            self.history_service.set_maintenance_value(
+                CHECKPOINT_KEY,
+                json.dumps(
+                    {"after": list(after), "processed": processed, "total": total}
+                ),
+            )
+        except Exception as e:
+            app_logger.log_error(e, "batch_reprocessing_checkpoint")
+
+    def _emit(self, event: ReprocessEvent) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                app_logger.log_error(e, "batch_reprocessing_subscriber")
+
+
+class _RunContext:
+    """单次运行的共享状态（队列与在途限额）"""
+
+    def __init__(
+        self,
+        provider: str,
+        language: Optional[str],
+        ai_enabled: bool,
+        ai_provider: Optional[str],
+        max_in_flight: int,
+    ):
+        self.provider = provider
+        self.language = language
+        self.ai_enabled = ai_enabled
+        self.ai_provider = ai_provider
+
+        # 在途限额保证各队列总长度有界
+        self._slots = threading.Semaphore(max_in_flight)
+        self.asr_queue: "queue.Queue[Any]" = queue.Queue()
+        self.ai_queue: "queue.Queue[Any]" = queue.Queue()
+        self.write_queue: "queue.Queue[Any]" = queue.Queue()
+
+        # 序号 -> 记录分页键，用于推进检查点
+        self.keys: Dict[int, Tuple[str, str]] = {}
+
+    def acquire_slot(self, stop_event: threading.Event) -> bool:
+        while not stop_event.is_set():
+            if self._slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def release_slot(self) -> None:
+        self._slots.release()
@@ -1,5 +1,6 @@
 """配置服务模块 - 重构后的模块化结构"""
 
+from .config_accessors import ConfigAccessors
 from .config_backup import ConfigBackupService
 from .config_keys import ConfigKeyGroups, ConfigKeys
 from .config_migrator import ConfigMigrator
@@ -17,4 +18,5 @@ __all__ = [
     "RefactoredConfigService",
     "ConfigKeys",
     "ConfigKeyGroups",
+    "ConfigAccessors",
 ]
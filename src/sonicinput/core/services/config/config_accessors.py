@@ -0,0 +1,73 @@
+"""类型化配置访问器 - 由 ConfigKeys 自动生成
+
+为 ConfigKeys 中的每个常量生成一个只读属性（属性名为常量名的小写形式），
+例如 ConfigKeys.AI_PROVIDER -> accessors.ai_provider。
+属性直接读取 ConfigReader 的扁平索引；期望类型由默认配置推断，
+值缺失或类型不符时返回默认值。
+"""
+
+import copy
+from typing import Any, Dict, Optional, Tuple, Type
+
+from .config_defaults import get_default_config
+from .config_keys import ConfigKeys
+from .config_reader import ConfigReader, flatten_config
+
+_MISSING = object()
+
+
+def _expected_types(default: Any) -> Optional[Tuple[Type, ...]]:
+    """根据默认值推断期望类型，None 表示不做类型检查"""
+    if default is None:
+        return None
+    if isinstance(default, bool):
+        return (bool,)
+    if isinstance(default, float):
+        return (int, float)
+    return (type(default),)
+
+
+class ConfigAccessors:
+    """类型化配置访问器
+
+    属性在模块加载时根据 ConfigKeys 生成，见 KEY_TYPES。
+    """
+
+    # 常量名 -> (配置键, 默认值, 期望类型)
+    KEY_TYPES: Dict[str, Tuple[str, Any, Optional[Tuple[Type, ...]]]] = {}
+
+    def __init__(self, reader: ConfigReader):
+        self._reader = reader
+
+    def get(self, name: str) -> Any:
+        """按 ConfigKeys 常量名读取，例如 get("AI_PROVIDER")"""
+        return getattr(self, name.lower())
+
+
+def _make_property(key: str, default: Any, expected: Optional[Tuple[Type, ...]]):
+    mutable_default = isinstance(default, (dict, list))
+
+    def getter(self: ConfigAccessors) -> Any:
+        value = self._reader._index.get(key, _MISSING)
+        if value is _MISSING or (
+            expected is not None and not isinstance(value, expected)
+        ):
+            return copy.deepcopy(default) if mutable_default else default
+        return value
+
+    type_name = "Any" if expected is None else expected[-1].__name__
+    return property(getter, doc=f"{key} ({type_name})")
+
+
+def _install_accessors() -> None:
+    defaults = flatten_config(get_default_config())
+    for name, key in vars(ConfigKeys).items():
+        if not name.isupper() or not isinstance(key, str):
+            continue
+        default = defaults.get(key)
+        expected = _expected_types(default)
+        ConfigAccessors.KEY_TYPES[name] = (key, default, expected)
+        setattr(ConfigAccessors, name.lower(), _make_property(key, default, expected))
+
+
+_install_accessors()
@@ -21,6 +21,14 @@ def get_default_config() -> Dict[str, Any]:
                 "language": "zh",  # 语言 (zh | en)
                 "auto_load": True,
                 "streaming_mode": "chunked",  # 流式模式 (chunked | realtime)
+                "warm_up": True,  # 加载后预热，消除首次推理延迟
+                "variant": "auto",  # 权重变体 (auto | int8 | fp32)
+                "num_threads": 0,  # 推理线程数，0 = 按物理核心数自动选择
+                "idle_unload_minutes": 15,  # 空闲卸载模型（分钟），0 = 常驻
+                "realtime_stable_updates": 2,  # realtime 输入前需稳定的更新次数
+                "realtime_stable_ms": 300,  # 或稳定的时长（毫秒）
+                "realtime_rescoring": False,  # realtime 两遍识别（离线重打分）
+                "rescoring_model": "paraformer-offline",  # 重打分离线模型
             },
             "groq": {
                 "api_key": "",
@@ -96,6 +104,17 @@ def get_default_config() -> Dict[str, Any]:
         },
         "history": {
             "storage_path": "auto",
+            "database": {
+                "read_pool_size": 4,
+            },
+            "retention": {
+                "enabled": True,
+                "max_age_days": 0,
+                "max_records": 0,
+                "max_storage_mb": 0,
+                "interval_minutes": 60,
+                "vacuum_interval_hours": 168,
+            },
         },
         "logging": {
             "level": "INFO",
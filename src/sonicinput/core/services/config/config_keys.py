@@ -35,6 +35,32 @@ class ConfigKeys:
     TRANSCRIPTION_LOCAL_STREAMING_MODE = "transcription.local.streaming_mode"
     """流式转录模式 (str): "chunked" | "realtime" """
 
+    TRANSCRIPTION_LOCAL_WARM_UP = "transcription.local.warm_up"
+    """加载后预热模型 (bool): 消除首次听写的推理初始化延迟"""
+
+    TRANSCRIPTION_LOCAL_VARIANT = "transcription.local.variant"
+    """本地模型权重变体 (str): "auto" | "int8" | "fp32"，auto 为模型默认变体"""
+
+    TRANSCRIPTION_LOCAL_NUM_THREADS = "transcription.local.num_threads"
+    """本地推理线程数 (int): 0 表示按物理核心数自动选择"""
+
+    TRANSCRIPTION_LOCAL_IDLE_UNLOAD_MINUTES = "transcription.local.idle_unload_minutes"
+    """空闲多少分钟后卸载模型 (int): 0 表示常驻，按下热键时自动重载"""
+
+    TRANSCRIPTION_LOCAL_REALTIME_STABLE_UPDATES = (
+        "transcription.local.realtime_stable_updates"
+    )
+    """realtime 模式：连续多少次更新未变化的文本才输入 (int)"""
+
+    TRANSCRIPTION_LOCAL_REALTIME_STABLE_MS = "transcription.local.realtime_stable_ms"
+    """realtime 模式：未变化多少毫秒的文本才输入 (int)，与更新次数满足其一即可"""
+
+    TRANSCRIPTION_LOCAL_REALTIME_RESCORING = "transcription.local.realtime_rescoring"
+    """realtime 模式两遍识别 (bool): 每段结束后用离线模型在后台重新解码并替换"""
+
+    TRANSCRIPTION_LOCAL_RESCORING_MODEL = "transcription.local.rescoring_model"
+    """两遍识别使用的离线模型 (str): "paraformer-offline" """
+
     # Groq
     TRANSCRIPTION_GROQ_API_KEY = "transcription.groq.api_key"
     """Groq API密钥 (str)"""
@@ -225,6 +251,27 @@ class ConfigKeys:
     HISTORY_STORAGE_PATH = "history.storage_path"
     """历史记录存储路径 (str): "auto"表示自动选择"""
 
+    HISTORY_DB_READ_POOL_SIZE = "history.database.read_pool_size"
+    """空闲只读数据库连接的最大保留数量 (int)"""
+
+    HISTORY_RETENTION_ENABLED = "history.retention.enabled"
+    """启用后台保留策略任务 (bool)"""
+
+    HISTORY_RETENTION_MAX_AGE_DAYS = "history.retention.max_age_days"
+    """记录最长保留天数 (int): 0表示不限制"""
+
+    HISTORY_RETENTION_MAX_RECORDS = "history.retention.max_records"
+    """最多保留的记录数 (int): 0表示不限制"""
+
+    HISTORY_RETENTION_MAX_STORAGE_MB = "history.retention.max_storage_mb"
+    """录音文件最大占用空间 (int): MB，0表示不限制"""
+
+    HISTORY_RETENTION_INTERVAL_MINUTES = "history.retention.interval_minutes"
+    """保留策略执行间隔 (int): 分钟"""
+
+    HISTORY_RETENTION_VACUUM_INTERVAL_HOURS = "history.retention.vacuum_interval_hours"
+    """数据库VACUUM间隔 (int): 小时，0表示从不执行"""
+
     # ==================== Logging (日志配置) ====================
     LOGGING_LEVEL = "logging.level"
     """日志级别 (str): "DEBUG" | "INFO" | "WARNING" | "ERROR" """
@@ -388,6 +435,14 @@ class ConfigKeyGroups:
         ConfigKeys.TRANSCRIPTION_LOCAL_LANGUAGE,
         ConfigKeys.TRANSCRIPTION_LOCAL_AUTO_LOAD,
         ConfigKeys.TRANSCRIPTION_LOCAL_STREAMING_MODE,
+        ConfigKeys.TRANSCRIPTION_LOCAL_WARM_UP,
+        ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT,
+        ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS,
+        ConfigKeys.TRANSCRIPTION_LOCAL_IDLE_UNLOAD_MINUTES,
+        ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_STABLE_UPDATES,
+        ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_STABLE_MS,
+        ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_RESCORING,
+        ConfigKeys.TRANSCRIPTION_LOCAL_RESCORING_MODEL,
     ]
 
     TRANSCRIPTION_CLOUD = [
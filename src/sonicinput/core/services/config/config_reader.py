@@ -1,14 +1,51 @@
-"""配置读取服务 - 单一职责：配置读取和查询"""
+"""配置读取服务 - 单一职责：配置读取和查询
 
+配置加载或整体替换时会预编译一个扁平索引（点分路径 -> 值），
+get_setting 只需一次字典查找，不再每次拆分键名逐层遍历。
+"""
+
+import copy
 import json
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from ....utils import app_logger
 from .config_defaults import get_default_config
 
 T = TypeVar("T")
 
+ConfigSubscriber = Callable[[str, Any, Any], None]
+
+_MISSING = object()
+
+
+def flatten_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """将嵌套配置编译为扁平索引
+
+    每一级路径都会被索引（中间层对应嵌套字典本身），与逐层遍历的结果一致。
+    含 "." 的键无法通过点分路径访问，不进入索引。
+
+    Args:
+        config: 嵌套配置字典
+
+    Returns:
+        点分路径到值的字典
+    """
+    index: Dict[str, Any] = {}
+
+    def walk(node: Dict[str, Any], prefix: str) -> None:
+        for k, value in node.items():
+            if not isinstance(k, str) or "." in k:
+                continue
+            path = f"{prefix}{k}"
+            index[path] = value
+            if isinstance(value, dict):
+                walk(value, path + ".")
+
+    walk(config, "")
+    return index
+
 
 class ConfigReader:
     """配置读取器 - 只负责读取配置"""
@@ -20,8 +57,73 @@ class ConfigReader:
             config_path: 配置文件路径
         """
         self.config_path = config_path
-        self._config: Dict[str, Any] = {}
+        self._config_data: Dict[str, Any] = {}
+        self._index: Dict[str, Any] = {}
         self._default_config = get_default_config()
+        self._default_index = flatten_config(copy.deepcopy(self._default_config))
+
+        # 变更订阅：键 -> 回调列表
+        self._subscribers: Dict[str, List[ConfigSubscriber]] = {}
+        self._subscribers_lock = threading.Lock()
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        return self._config_data
+
+    @_config.setter
+    def _config(self, config: Dict[str, Any]) -> None:
+        """替换配置并重建扁平索引，通知值发生变化的订阅者"""
+        old_index = self._index
+        self._config_data = config
+        self._index = flatten_config(config)
+        self._notify_subscribers(old_index, self._index)
+
+    def subscribe(self, key: str, callback: ConfigSubscriber) -> Callable[[], None]:
+        """订阅配置项变更
+
+        配置被加载、设置或导入后，若该键的值发生变化，
+        以 callback(key, old_value, new_value) 回调（不存在的值为 None）。
+
+        Args:
+            key: 配置项键名（点分路径）
+            callback: 变更回调
+
+        Returns:
+            取消订阅的函数
+        """
+        with self._subscribers_lock:
+            self._subscribers.setdefault(key, []).append(callback)
+        return lambda: self.unsubscribe(key, callback)
+
+    def unsubscribe(self, key: str, callback: ConfigSubscriber) -> None:
+        """取消订阅配置项变更"""
+        with self._subscribers_lock:
+            callbacks = self._subscribers.get(key)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._subscribers[key]
+
+    def _notify_subscribers(
+        self, old_index: Dict[str, Any], new_index: Dict[str, Any]
+    ) -> None:
+        with self._subscribers_lock:
+            if not self._subscribers:
+                return
+            subscribers = {k: list(v) for k, v in self._subscribers.items()}
+
+        for key, callbacks in subscribers.items():
+            old_value = old_index.get(key, _MISSING)
+            new_value = new_index.get(key, _MISSING)
+            if old_value is new_value or old_value == new_value:
+                continue
+            old_value = None if old_value is _MISSING else old_value
+            new_value = None if new_value is _MISSING else new_value
+            for callback in callbacks:
+                try:
+                    callback(key, old_value, new_value)
+                except Exception as e:
+                    app_logger.log_error(e, f"config_subscriber_{key}")
 
     def load_config(self) -> bool:
         """从文件加载配置
@@ -46,7 +148,7 @@ class ConfigReader:
                 )
             else:
                 # 使用默认配置
-                self._config = self._default_config.copy()
+                self._config = copy.deepcopy(self._default_config)
 
                 app_logger.log_audio_event(
                     "Using default configuration",
@@ -57,7 +159,7 @@ class ConfigReader:
 
         except Exception as e:
             app_logger.log_error(e, "config_reader_load")
-            self._config = self._default_config.copy()
+            self._config = copy.deepcopy(self._default_config)
             return False
 
     def get_setting(self, key: str, default: Optional[T] = None) -> T:
@@ -71,16 +173,7 @@ class ConfigReader:
             配置项的值，如果不存在则返回默认值
         """
         try:
-            keys = key.split(".")
-            value = self._config
-
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-
-            return value
+            return self._index.get(key, default)
 
         except Exception as e:
             app_logger.log_error(e, f"config_reader_get_{key}")
@@ -104,16 +197,7 @@ class ConfigReader:
             默认值，不存在返回None
         """
         try:
-            keys = key.split(".")
-            value = self._default_config
-
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return None
-
-            return value
+            return self._default_index.get(key)
 
         except Exception:
             return None
@@ -130,7 +214,7 @@ class ConfigReader:
         Returns:
             合并后的配置
         """
-        result = default.copy()
+        result = copy.deepcopy(default)
 
         def merge_recursive(base: Dict[str, Any], update: Dict[str, Any]) -> None:
             for key, value in update.items():
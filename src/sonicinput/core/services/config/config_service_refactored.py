@@ -7,17 +7,18 @@ import copy
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from ....utils import ConfigurationError, app_logger
 from ...base.lifecycle_component import LifecycleComponent
 from ...interfaces import EventPriority, IEventService
 from ...interfaces.config import IConfigService
 from ..events import Events
+from .config_accessors import ConfigAccessors
 from .config_backup import ConfigBackupService
 from .config_keys import ConfigKeys
 from .config_migrator import ConfigMigrator
-from .config_reader import ConfigReader
+from .config_reader import ConfigReader, ConfigSubscriber
 from .config_validator import ConfigValidator
 from .config_writer import ConfigWriter
 
@@ -27,8 +28,20 @@ T = TypeVar("T")
 SPEECH_SERVICE_RELOAD_TRIGGERS = [
     ConfigKeys.TRANSCRIPTION_PROVIDER,  # local ↔ cloud, cloud ↔ cloud
     ConfigKeys.TRANSCRIPTION_LOCAL_MODEL,  # paraformer ↔ zipformer
+    ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT,  # int8 ↔ fp32
+    ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS,
 ]
 
+# Local engine settings the running local service applies by hot-swapping its
+# model; they do not affect cloud providers
+LOCAL_ENGINE_RELOAD_TRIGGERS = frozenset(
+    {
+        ConfigKeys.TRANSCRIPTION_LOCAL_MODEL,
+        ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT,
+        ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS,
+    }
+)
+
 
 class RefactoredConfigService(LifecycleComponent, IConfigService):
     """重构后的配置服务 - 门面模式
@@ -52,6 +65,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
         super().__init__("ConfigService")
         self._event_service = event_service
         self._container = container
+        self._speech_service_swap = None  # 首次热重载时创建
 
         # 设置配置文件路径
         if config_path:
@@ -67,6 +81,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
         self._validator = ConfigValidator()
         self._migrator = ConfigMigrator(self.config_path)
         self._backup = ConfigBackupService(self.config_path)
+        self._accessors = ConfigAccessors(self._reader)
 
         # 初始化上次保存的配置快照（用于计算变更）
         self._last_saved_config: Dict[str, Any] = {}
@@ -128,6 +143,10 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             # Flush any pending writes
             self._writer.cleanup()
 
+            # 作废尚未安装的 speech service 切换
+            if self._speech_service_swap:
+                self._speech_service_swap.cancel()
+
             app_logger.log_audio_event("ConfigService stopped", {})
             return True
 
@@ -147,6 +166,30 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
         """
         return self._reader.get_setting(key, default)
 
+    @property
+    def typed(self) -> ConfigAccessors:
+        """类型化访问器，例如 config.typed.ai_provider（由 ConfigKeys 生成）"""
+        return self._accessors
+
+    def subscribe(self, key: str, callback: ConfigSubscriber) -> Callable[[], None]:
+        """订阅配置项变更
+
+        值变化时（设置、加载、重置、导入）以 callback(key, old_value, new_value)
+        同步回调，消费者可以缓存配置值而无需每次查询。
+
+        Args:
+            key: 配置项键名，支持嵌套路径
+            callback: 变更回调
+
+        Returns:
+            取消订阅的函数
+        """
+        return self._reader.subscribe(key, callback)
+
+    def unsubscribe(self, key: str, callback: ConfigSubscriber) -> None:
+        """取消订阅配置项变更"""
+        self._reader.unsubscribe(key, callback)
+
     def set_setting(self, key: str, value: Any, immediate: bool = False) -> None:
         """设置配置项
 
@@ -277,7 +320,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
                 self._reader._config
             )
             self._reader._config = config
-            self._writer.set_config(config)
+            self._writer.set_config(copy.deepcopy(config))
 
             if migrated:
                 self._writer.save_config()
@@ -307,7 +350,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
 
             config = get_default_config()
             self._reader._config = config
-            self._writer.set_config(config)
+            self._writer.set_config(copy.deepcopy(config))
             self.save_config()
 
             if self._event_service:
@@ -392,7 +435,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             )
 
             self._reader._config = merged_config
-            self._writer.set_config(merged_config)
+            self._writer.set_config(copy.deepcopy(merged_config))
 
             if self.save_config():
                 if self._event_service:
@@ -408,7 +451,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             else:
                 # 恢复原配置
                 self._reader._config = old_config
-                self._writer.set_config(old_config)
+                self._writer.set_config(copy.deepcopy(old_config))
                 return False
 
         return False
@@ -454,7 +497,7 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
 
         if repaired:
             self._reader._config = config
-            self._writer.set_config(config)
+            self._writer.set_config(copy.deepcopy(config))
             self._writer.save_config()
 
         return True
@@ -709,14 +752,16 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             return False, f"Failed to validate transcription provider: {str(e)}"
 
     def _reload_speech_service(self, changed_key: str, new_value: Any) -> None:
-        """热重载 speech service当提供商或模型变更时
+        """热重载 speech service当提供商、模型、变体或线程数变更时
+
+        新服务在后台创建并加载模型，旧服务期间继续听写；就绪且没有录音、
+        处理时原子替换，旧服务排空后再清理（见 SpeechServiceSwap）。本地
+        模型、变体或线程数的变更在当前服务内热切换模型。失败时保留旧服务并发送
+        SPEECH_SERVICE_RELOAD_FAILED 事件。
 
         Args:
             changed_key: 触发重载的配置键
             new_value: 新的配置值
-
-        Raises:
-            RuntimeError: 录音进行中时不允许重载
         """
         # 检查是否有 DI 容器（可能在早期初始化时未提供）
         if not self._container:
@@ -726,67 +771,124 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             )
             return
 
+        from ...interfaces import ISpeechService
+
         try:
-            # 1. 检查录音状态
-            from ...interfaces import IStateManager
+            old_service = self._container.resolve(ISpeechService)
+        except Exception as e:
+            app_logger.log_error(e, "speech_service_reload")
+            raise ConfigurationError(
+                f"Failed to reload speech service: {str(e)}"
+            ) from e
 
-            state_manager = self._container.resolve(IStateManager)
-            if state_manager.is_recording():
-                raise RuntimeError(
-                    "Cannot change transcription provider while recording. "
-                    "Please stop recording first."
-                )
+        trigger = {
+            "changed_key": changed_key,
+            "new_value": new_value,
+            "old_provider": type(old_service).__name__,
+        }
 
-            # 2. 获取旧服务实例
-            from ...interfaces import ISpeechService
+        if (
+            changed_key in LOCAL_ENGINE_RELOAD_TRIGGERS
+            and changed_key != ConfigKeys.TRANSCRIPTION_LOCAL_MODEL
+            and self.get_setting(ConfigKeys.TRANSCRIPTION_PROVIDER, "local") != "local"
+        ):
+            # 云端提供商不使用本地变体和线程设置，下次切回本地时生效
+            app_logger.log_audio_event(
+                "Speech service reload skipped - local setting on cloud provider",
+                trigger,
+            )
+            return
 
-            old_service = self._container.resolve(ISpeechService)
-            old_provider = type(old_service).__name__
+        app_logger.log_audio_event("Starting speech service reload", trigger)
 
-            app_logger.log_audio_event(
-                "Starting speech service reload",
-                {
-                    "changed_key": changed_key,
-                    "new_value": new_value,
-                    "old_provider": old_provider,
-                },
+        swap = self._get_speech_service_swap()
+        if self._can_swap_model_in_place(changed_key, old_service):
+            # 变体/线程数变更沿用当前模型，新引擎从配置读取新设置
+            model_name = (
+                new_value
+                if changed_key == ConfigKeys.TRANSCRIPTION_LOCAL_MODEL
+                else None
+            )
+            swap.schedule_in_place(
+                lambda: old_service.reload_model_sync(model_name), trigger
+            )
+        else:
+            swap.schedule(
+                lambda: self._create_speech_service(wait_for_model=True), trigger
+            )
+
+    def _get_speech_service_swap(self):
+        if self._speech_service_swap is None:
+            from ..speech_service_swap import SpeechServiceSwap
+
+            self._speech_service_swap = SpeechServiceSwap(
+                install=self._install_speech_service,
+                cleanup=self._cleanup_speech_service,
+                is_busy=self._is_dictation_active,
+                on_failed=self._on_speech_service_reload_failed,
             )
+        return self._speech_service_swap
+
+    def _can_swap_model_in_place(self, changed_key: str, service: Any) -> bool:
+        """本地模型、变体或线程数变更：由当前本地服务热切换模型，无需重建服务"""
+        return (
+            changed_key in LOCAL_ENGINE_RELOAD_TRIGGERS
+            and self.get_setting(ConfigKeys.TRANSCRIPTION_PROVIDER, "local") == "local"
+            and getattr(service, "is_running", False)
+            and hasattr(service, "reload_model_sync")
+            and service.is_model_loaded()
+        )
 
-            # 3. 清理旧服务资源
-            self._cleanup_speech_service(old_service)
+    def _is_dictation_active(self) -> bool:
+        """录音或处理中不替换服务（控制器会随服务一起重建）"""
+        from ...interfaces import IStateManager
 
-            # 4. 创建新服务
-            new_service = self._create_speech_service()
-            new_provider = type(new_service).__name__
+        try:
+            state_manager = self._container.resolve(IStateManager)
+            return state_manager.is_recording() or state_manager.is_processing()
+        except Exception as e:
+            app_logger.log_error(e, "speech_service_swap_state_check")
+            return False
 
-            # 5. 更新 DI 容器的单例
-            self._container.update_singleton(ISpeechService, new_service)
+    def _install_speech_service(self, new_service: Any, trigger: Dict[str, Any]):
+        """原子替换 DI 容器中的 speech service 并通知应用
 
-            # 6. 发送重载完成事件
-            if self._event_service:
-                self._event_service.emit(
-                    Events.SPEECH_SERVICE_RELOADED,
-                    {
-                        "changed_key": changed_key,
-                        "old_provider": old_provider,
-                        "new_provider": new_provider,
-                    },
-                    EventPriority.HIGH,
-                )
+        Returns:
+            被替换的旧服务
+        """
+        from ...interfaces import ISpeechService
 
-            app_logger.log_audio_event(
-                "Speech service reloaded successfully",
-                {"from": old_provider, "to": new_provider, "trigger": changed_key},
+        old_service = self._container.resolve(ISpeechService)
+        self._container.update_singleton(ISpeechService, new_service)
+        new_provider = type(new_service).__name__
+
+        if self._event_service:
+            self._event_service.emit(
+                Events.SPEECH_SERVICE_RELOADED,
+                {
+                    "changed_key": trigger["changed_key"],
+                    "old_provider": type(old_service).__name__,
+                    "new_provider": new_provider,
+                },
+                EventPriority.HIGH,
             )
 
-        except RuntimeError:
-            # 重新抛出录音状态错误（用户需要看到）
-            raise
-        except Exception as e:
-            app_logger.log_error(e, "speech_service_reload")
-            raise ConfigurationError(
-                f"Failed to reload speech service: {str(e)}"
-            ) from e
+        app_logger.log_audio_event(
+            "Speech service reloaded successfully",
+            {
+                "from": type(old_service).__name__,
+                "to": new_provider,
+                "trigger": trigger["changed_key"],
+            },
+        )
+        return old_service
+
+    def _on_speech_service_reload_failed(self, info: Dict[str, Any]) -> None:
+        app_logger.log_audio_event("Speech service reload failed", info)
+        if self._event_service:
+            self._event_service.emit(
+                Events.SPEECH_SERVICE_RELOAD_FAILED, info, EventPriority.HIGH
+            )
 
     def _cleanup_speech_service(self, service: Any) -> None:
         """清理旧 speech service 的资源
@@ -824,8 +926,13 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
             app_logger.log_error(e, "speech_service_cleanup")
             # 尽力清理，不抛出异常
 
-    def _create_speech_service(self) -> Any:
-        """Create a speech service instance after config changes."""
+    def _create_speech_service(self, wait_for_model: bool = False) -> Any:
+        """Create a speech service instance after config changes.
+
+        Args:
+            wait_for_model: 本地提供商时同步加载模型（后台热切换使用），
+                否则异步加载
+        """
 
         provider = self.get_setting(ConfigKeys.TRANSCRIPTION_PROVIDER, "local")
 
@@ -910,15 +1017,22 @@ class RefactoredConfigService(LifecycleComponent, IConfigService):
                     "Auto-loading model after hot reload",
                     {"model": model_name, "trigger": "hot_reload"},
                 )
-                wrapped_service.load_model_async(
-                    model_name=model_name,
-                    callback=lambda result: app_logger.log_audio_event(
-                        "Model reloaded after hot-reload", result
-                    ),
-                    error_callback=lambda err: app_logger.log_error(
-                        err, "model_reload_after_hot_reload"
-                    ),
-                )
+                if wait_for_model:
+                    if not wrapped_service.load_model(model_name):
+                        wrapped_service.stop()
+                        raise ConfigurationError(
+                            f"Failed to load local model '{model_name}'"
+                        )
+                else:
+                    wrapped_service.load_model_async(
+                        model_name=model_name,
+                        callback=lambda result: app_logger.log_audio_event(
+                            "Model reloaded after hot-reload", result
+                        ),
+                        error_callback=lambda err: app_logger.log_error(
+                            err, "model_reload_after_hot_reload"
+                        ),
+                    )
 
             app_logger.log_audio_event(
                 "Created local speech service",
@@ -6,6 +6,11 @@
 3. 一次性监听器（once）
 4. 动态事件类型注册
 5. 线程安全保证
+6. 投递方式（INLINE / WORKER / MAIN_THREAD）：异步监听器只在 emit 时入队，
+   不阻塞音频采集线程等实时路径；慢监听器检测
+7. 高频事件合并（events.py 中声明的 CoalescePolicy，订阅时可覆盖）
+8. emit 无锁：监听器以按优先级排序的不可变元组保存，订阅/取消订阅时
+   整体替换（写时复制）；统计信息按采样间隔收集，可关闭
 
 简化说明：
 - 移除了未使用的插件系统
@@ -14,16 +19,27 @@
 - 保留了所有核心功能，减少了代码复杂度
 """
 
+import itertools
 import threading
 import time
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..base.lifecycle_component import LifecycleComponent
-from ..interfaces import EventPriority, IEventService
-from .events import EVENT_METADATA, iter_event_names
+from ..interfaces import EventDelivery, EventPriority, IEventService
+from .event_dispatch import (
+    POST_COALESCED,
+    POST_REJECTED,
+    DelayScheduler,
+    EventCoalescer,
+    EventDispatchStats,
+    ListenerMailbox,
+    MainThreadInvoker,
+)
+from .events import EVENT_METADATA, CoalescePolicy, iter_event_names
 
 
 # 延迟导入logger以避免循环依赖
@@ -50,11 +66,15 @@ class EventMetadata:
     tags: List[str] = field(default_factory=list)
     created_at: float = field(default_factory=time.time)
     created_by: str = "system"
+    coalesce: Optional[CoalescePolicy] = None
 
 
 @dataclass
 class EventListener:
-    """事件监听器信息"""
+    """事件监听器信息
+
+    call_count / last_called / slow_calls 只在采样到的调用上更新。
+    """
 
     id: str
     callback: Callable
@@ -65,6 +85,9 @@ class EventListener:
     is_once: bool = False
     namespace: str = "default"
     metadata: Dict[str, Any] = field(default_factory=dict)
+    delivery: EventDelivery = EventDelivery.INLINE
+    slow_calls: int = 0
+    coalescer: Optional[EventCoalescer] = None
 
 
 class DynamicEventSystem(LifecycleComponent, IEventService):
@@ -74,13 +97,25 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
     完全兼容原有的EventBus接口，移除了未使用的高级特性以提高性能和可维护性。
     """
 
-    def __init__(self):
-        """初始化动态事件系统"""
+    # 单次回调超过该耗时（秒）视为慢监听器
+    SLOW_LISTENER_THRESHOLD = 0.05
+    # 慢监听器告警日志间隔（每 N 次慢调用记录一次）
+    SLOW_LISTENER_LOG_EVERY = 100
+
+    def __init__(self, worker_threads: int = 4, stats_sample_interval: int = 16):
+        """初始化动态事件系统
+
+        Args:
+            worker_threads: WORKER 投递方式使用的线程池大小
+            stats_sample_interval: 每 N 次 emit 采样一次 INLINE 监听器的耗时和
+                调用统计，0 表示不采样（异步投递始终统计）
+        """
         # Initialize LifecycleComponent
         super().__init__("EventBus")
 
-        # 基础数据结构
-        self._listeners: Dict[str, List[EventListener]] = defaultdict(list)
+        # 基础数据结构：事件名 -> 按优先级排序的监听器元组
+        # 元组不可变，订阅/取消订阅时在锁内整体替换，emit 无锁读取快照
+        self._listeners: Dict[str, Tuple[EventListener, ...]] = {}
         self._lock = threading.RLock()
         self._enabled = True
 
@@ -89,9 +124,18 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         self._event_namespaces: Dict[str, Set[str]] = defaultdict(set)
         self._registered_events: Set[str] = set()
 
-        # 性能优化：缓存机制
-        self._sorted_listeners_cache: Dict[str, List[EventListener]] = {}
-        self._listener_version: Dict[str, int] = {}
+        # 统计采样
+        self._stats_sample_interval = max(0, stats_sample_interval)
+        self._emit_counter = itertools.count()
+
+        # 异步投递：每个非 INLINE 监听器一个邮箱（按监听器ID索引）
+        self._worker_threads = max(1, worker_threads)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._main_thread = MainThreadInvoker()
+        self._mailboxes: Dict[str, ListenerMailbox] = {}
+        self._scheduler: Optional[DelayScheduler] = None
+        self._dispatch_stats: Dict[str, EventDispatchStats] = {}
+        self._stats_lock = threading.Lock()
 
         # 获取logger
         self.logger = _get_logger()
@@ -128,13 +172,23 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
             # Clear all listeners
             self.clear_all_listeners()
 
+            # 停止异步投递，丢弃尚未执行的事件
+            with self._lock:
+                executor, self._executor = self._executor, None
+                scheduler, self._scheduler = self._scheduler, None
+                for mailbox in self._mailboxes.values():
+                    mailbox.close()
+                self._mailboxes.clear()
+            if scheduler is not None:
+                scheduler.stop()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
             # Clear event metadata and registrations
             with self._lock:
                 self._event_metadata.clear()
                 self._event_namespaces.clear()
                 self._registered_events.clear()
-                self._sorted_listeners_cache.clear()
-                self._listener_version.clear()
 
             if self.logger:
                 self.logger.log_audio_event("DynamicEventSystem cleaned up", {})
@@ -182,9 +236,6 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
             self._event_namespaces[metadata.namespace].add(event_name)
             self._registered_events.add(event_name)
 
-            # 清除缓存
-            self._invalidate_cache_for_event(event_name)
-
             if self.logger:
                 self.logger.log_audio_event(
                     "Event type registered",
@@ -208,7 +259,7 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
                 return
 
             # 检查是否有监听器
-            if event_name in self._listeners and self._listeners[event_name]:
+            if self._listeners.get(event_name):
                 if self.logger:
                     self.logger.warning(
                         f"Cannot unregister event '{event_name}' - has active listeners"
@@ -223,9 +274,6 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
 
             self._registered_events.discard(event_name)
 
-            # 清除缓存
-            self._invalidate_cache_for_event(event_name)
-
             if self.logger:
                 self.logger.log_audio_event(
                     "Event type unregistered", {"event_name": event_name}
@@ -247,53 +295,188 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         if not self._enabled:
             return
 
-        start_time = time.time()
+        # 无锁读取快照：并发的订阅/取消订阅只会替换元组，不会修改正在遍历的元组
+        listeners = self._listeners.get(event_name)
+        if not listeners:
+            if event_name not in self._registered_events:
+                self._auto_register(event_name)
+            return
 
-        # 检查事件是否已注册
-        if event_name not in self._registered_events:
-            # 自动注册未定义的事件
-            self.register_event_type(event_name)
+        interval = self._stats_sample_interval
+        sampled = interval and next(self._emit_counter) % interval == 0
+        if sampled:
+            start_time = time.perf_counter()
+
+        for listener in listeners:
+            # 执行监听器：INLINE 同步调用，其余只入队；节流/防抖监听器先经过合并器
+            try:
+                if listener.coalescer is not None:
+                    listener.coalescer.offer(data)
+                elif listener.delivery is not EventDelivery.INLINE:
+                    self._enqueue(event_name, listener, data)
+                elif sampled:
+                    self._invoke_listener(event_name, listener, data)
+                else:
+                    listener.callback(data)
+            except Exception as e:
+                self._record_listener_error(event_name, e)
 
-            if self.logger:
-                self.logger.info(f"Auto-registered event '{event_name}'")
+            # 如果是一次性监听器，移除它（已入队的异步投递照常执行）
+            if listener.is_once:
+                with self._lock:
+                    self._remove_listener(event_name, listener.id, drop_pending=False)
 
-        try:
-            # 获取监听器
-            listeners = self._get_sorted_listeners(event_name)
+        if sampled:
+            self._record_sampled_emit(event_name, time.perf_counter() - start_time)
 
-            if not listeners:
-                return
+    def _auto_register(self, event_name: str) -> None:
+        """自动注册未定义的事件"""
+        self.register_event_type(event_name)
 
-            # 执行监听器
-            for listener in listeners:
-                try:
-                    # 执行回调
-                    listener.callback(data)
+        if self.logger:
+            self.logger.info(f"Auto-registered event '{event_name}'")
 
-                    # 更新监听器统计
-                    listener.call_count += 1
-                    listener.last_called = time.time()
+    def _record_sampled_emit(self, event_name: str, elapsed: float) -> None:
+        """记录采样到的 emit（emitted 按采样间隔累加，为估算值）"""
+        stats = self._stats_for(event_name)
+        with self._stats_lock:
+            stats.emitted += self._stats_sample_interval
 
-                    # 如果是一次性监听器，移除它
-                    if listener.is_once:
-                        self._remove_listener(event_name, listener.id)
+        # 记录处理时间（仅记录慢事件）
+        if self.logger and elapsed > 0.1:
+            self.logger.info(f"Event '{event_name}' processed in {elapsed:.3f}s")
 
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(
-                            f"Error in event listener for '{event_name}': {e}"
-                        )
+    def _record_listener_error(self, event_name: str, error: Exception) -> None:
+        stats = self._stats_for(event_name)
+        with self._stats_lock:
+            stats.errors += 1
+        if self.logger:
+            self.logger.error(f"Error in event listener for '{event_name}': {error}")
 
-                    # 继续处理其他监听器
+    def _deliver(self, event_name: str, listener: EventListener, data: Any) -> None:
+        """按监听器的投递方式投递"""
+        if listener.delivery is EventDelivery.INLINE:
+            self._invoke_listener(event_name, listener, data)
+        else:
+            self._enqueue(event_name, listener, data)
 
+    def _invoke_listener(
+        self, event_name: str, listener: EventListener, data: Any
+    ) -> None:
+        """执行单个监听器回调（带异常隔离和慢监听器检测）"""
+        start = time.perf_counter()
+        try:
+            listener.callback(data)
         except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error emitting event '{event_name}': {e}")
+            self._record_listener_error(event_name, e)
+        finally:
+            elapsed = time.perf_counter() - start
+            # 更新监听器统计
+            listener.call_count += 1
+            listener.last_called = time.time()
+            if elapsed >= self.SLOW_LISTENER_THRESHOLD:
+                self._record_slow_call(event_name, listener, elapsed)
+
+    def _record_slow_call(
+        self, event_name: str, listener: EventListener, elapsed: float
+    ) -> None:
+        """记录慢监听器（首次及此后每 SLOW_LISTENER_LOG_EVERY 次告警）"""
+        listener.slow_calls += 1
+        stats = self._stats_for(event_name)
+        with self._stats_lock:
+            stats.slow_calls += 1
+
+        if self.logger and listener.slow_calls % self.SLOW_LISTENER_LOG_EVERY == 1:
+            callback = getattr(
+                listener.callback, "__qualname__", repr(listener.callback)
+            )
+            self.logger.warning(
+                f"Slow event listener for '{event_name}': {callback} took "
+                f"{elapsed * 1000:.1f}ms ({listener.delivery.value} delivery, "
+                f"{listener.slow_calls} slow calls)"
+            )
 
-        # 记录处理时间（仅记录慢事件）
-        total_time = time.time() - start_time
-        if self.logger and total_time > 0.1:
-            self.logger.info(f"Event '{event_name}' processed in {total_time:.3f}s")
+    def _enqueue(self, event_name: str, listener: EventListener, data: Any) -> None:
+        """将事件投递到异步监听器的邮箱"""
+        mailbox = self._mailboxes.get(listener.id)
+        if mailbox is None:
+            return
+
+        stats = self._stats_for(event_name)
+        with self._stats_lock:
+            stats.enqueued += 1
+            stats.queue_depth += 1
+            if stats.queue_depth > stats.max_queue_depth:
+                stats.max_queue_depth = stats.queue_depth
+
+        result = mailbox.post(data)
+        if result == POST_REJECTED or result == POST_COALESCED:
+            with self._stats_lock:
+                stats.enqueued -= 1
+                stats.queue_depth -= 1
+                if result == POST_COALESCED:
+                    stats.coalesced += 1
+
+    def _create_mailbox(
+        self, event_name: str, listener: EventListener, policy: CoalescePolicy
+    ) -> None:
+        """为非 INLINE 监听器创建邮箱（调用方持有 self._lock）"""
+        stats = self._stats_for(event_name)
+
+        def deliver(data: Any) -> None:
+            with self._stats_lock:
+                stats.queue_depth -= 1
+                stats.delivered += 1
+            self._invoke_listener(event_name, listener, data)
+
+        if listener.delivery is EventDelivery.MAIN_THREAD:
+            submit = self._submit_main_thread
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._worker_threads,
+                    thread_name_prefix="EventDispatch",
+                )
+            submit = self._executor.submit
+
+        latest_only = policy if policy.mode == CoalescePolicy.LATEST else None
+        self._mailboxes[listener.id] = ListenerMailbox(deliver, submit, latest_only)
+
+    def _create_coalescer(
+        self, event_name: str, listener: EventListener, policy: CoalescePolicy
+    ) -> EventCoalescer:
+        """为节流/防抖监听器创建合并器（调用方持有 self._lock）"""
+        if self._scheduler is None:
+            self._scheduler = DelayScheduler()
+        stats = self._stats_for(event_name)
+
+        def on_coalesced() -> None:
+            with self._stats_lock:
+                stats.coalesced += 1
+
+        return EventCoalescer(
+            policy,
+            lambda data: self._deliver(event_name, listener, data),
+            self._scheduler,
+            on_coalesced,
+        )
+
+    def _resolve_coalesce_policy(
+        self, event_name: str, override: Optional[CoalescePolicy]
+    ) -> CoalescePolicy:
+        """订阅者指定的策略优先，否则使用事件元数据中声明的默认策略"""
+        if override is not None:
+            return override
+        metadata = self._event_metadata.get(event_name)
+        if metadata is not None and metadata.coalesce is not None:
+            return metadata.coalesce
+        spec = EVENT_METADATA.get(event_name, {})
+        return spec.get("coalesce") or CoalescePolicy.none()
+
+    def _submit_main_thread(self, func: Callable[[], None]) -> None:
+        # 没有 Qt 应用实例（如无界面测试）时直接在当前线程执行
+        if not self._main_thread.submit(func):
+            func()
 
     def subscribe(
         self,
@@ -303,6 +486,8 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         is_once: bool = False,
         namespace: str = "default",
         metadata: Optional[Dict[str, Any]] = None,
+        delivery: EventDelivery = EventDelivery.INLINE,
+        coalesce: Optional[CoalescePolicy] = None,
     ) -> str:
         """订阅事件（增强版）
 
@@ -313,6 +498,9 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
             is_once: 是否为一次性监听器
             namespace: 命名空间
             metadata: 监听器元数据
+            delivery: 投递方式（INLINE 在发出线程同步执行）
+            coalesce: 合并策略，None 表示使用事件默认策略，
+                CoalescePolicy.none() 表示接收每个事件
 
         Returns:
             监听器ID
@@ -327,12 +515,21 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
                 is_once=is_once,
                 namespace=namespace,
                 metadata=metadata or {},
+                delivery=delivery,
             )
 
-            self._listeners[event_name].append(listener)
-
-            # 清除缓存
-            self._invalidate_cache_for_event(event_name)
+            policy = self._resolve_coalesce_policy(event_name, coalesce)
+            if delivery is not EventDelivery.INLINE:
+                self._create_mailbox(event_name, listener, policy)
+            if policy.mode in (CoalescePolicy.THROTTLE, CoalescePolicy.DEBOUNCE):
+                listener.coalescer = self._create_coalescer(
+                    event_name, listener, policy
+                )
+            self._set_listeners(
+                event_name, self._listeners.get(event_name, ()) + (listener,)
+            )
+            if event_name not in self._registered_events:
+                self._auto_register(event_name)
 
             if self.logger:
                 self.logger.log_audio_event(
@@ -343,6 +540,8 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
                         "priority": priority.name,
                         "is_once": is_once,
                         "namespace": namespace,
+                        "delivery": delivery.value,
+                        "coalesce": policy.mode,
                     },
                 )
 
@@ -361,25 +560,33 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         with self._lock:
             return self._remove_listener(event_name, listener_id)
 
-    def _remove_listener(self, event_name: str, listener_id: str) -> bool:
+    def _remove_listener(
+        self, event_name: str, listener_id: str, drop_pending: bool = True
+    ) -> bool:
         """移除监听器（内部方法）"""
-        if event_name not in self._listeners:
-            return False
+        kept = []
+        removed = []
+        for listener in self._listeners.get(event_name, ()):
+            (removed if listener.id == listener_id else kept).append(listener)
 
-        original_count = len(self._listeners[event_name])
-        self._listeners[event_name] = [
-            listener
-            for listener in self._listeners[event_name]
-            if listener.id != listener_id
-        ]
+        if removed:
+            self._set_listeners(event_name, kept)
+            for listener in removed:
+                self._release_listener(event_name, listener, drop_pending)
 
-        removed = len(self._listeners[event_name]) < original_count
+        return bool(removed)
 
-        if removed:
-            # 清除缓存
-            self._invalidate_cache_for_event(event_name)
+    def _set_listeners(self, event_name: str, listeners) -> None:
+        """替换事件的监听器快照（调用方持有 self._lock）
 
-        return removed
+        按优先级从高到低稳定排序后生成新元组，同优先级保持订阅顺序。
+        """
+        if listeners:
+            self._listeners[event_name] = tuple(
+                sorted(listeners, key=lambda x: x.priority.value, reverse=True)
+            )
+        else:
+            self._listeners.pop(event_name, None)
 
     def unsubscribe_all(self, event_name: str) -> int:
         """取消所有订阅
@@ -391,14 +598,13 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
             移除的监听器数量
         """
         with self._lock:
-            if event_name not in self._listeners:
+            listeners = self._listeners.pop(event_name, ())
+            if not listeners:
                 return 0
 
-            count = len(self._listeners[event_name])
-            self._listeners[event_name].clear()
-
-            # 清除缓存
-            self._invalidate_cache_for_event(event_name)
+            count = len(listeners)
+            for listener in listeners:
+                self._release_listener(event_name, listener)
 
             if self.logger:
                 self.logger.log_audio_event(
@@ -408,41 +614,30 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
 
             return count
 
-    def _get_sorted_listeners(self, event_name: str) -> List[EventListener]:
-        """获取排序后的监听器列表（带缓存）"""
-        # 检查缓存
-        cache_key = f"{event_name}_{len(self._listeners.get(event_name, []))}"
-
-        if (
-            cache_key in self._sorted_listeners_cache
-            and event_name in self._listener_version
-            and self._listener_version[event_name]
-            == len(self._listeners.get(event_name, []))
-        ):
-            return self._sorted_listeners_cache[cache_key].copy()
-
-        # 排序监听器
-        listeners = self._listeners.get(event_name, []).copy()
-        listeners.sort(key=lambda x: x.priority.value, reverse=True)
-
-        # 缓存结果
-        self._sorted_listeners_cache[cache_key] = listeners.copy()
-        self._listener_version[event_name] = len(self._listeners[event_name])
-
-        return listeners
-
-    def _invalidate_cache_for_event(self, event_name: str) -> None:
-        """清除指定事件的缓存"""
-        keys_to_remove = [
-            key
-            for key in self._sorted_listeners_cache.keys()
-            if key.startswith(f"{event_name}_")
-        ]
-        for key in keys_to_remove:
-            del self._sorted_listeners_cache[key]
-
-        if event_name in self._listener_version:
-            del self._listener_version[event_name]
+    def _stats_for(self, event_name: str) -> EventDispatchStats:
+        """获取（必要时创建）事件的投递统计"""
+        stats = self._dispatch_stats.get(event_name)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._dispatch_stats.setdefault(
+                    event_name, EventDispatchStats()
+                )
+        return stats
+
+    def _release_listener(
+        self, event_name: str, listener: EventListener, drop_pending: bool = True
+    ) -> None:
+        """关闭监听器的合并器和邮箱，丢弃的事件从队列深度中扣除"""
+        if listener.coalescer is not None and drop_pending:
+            listener.coalescer.close()
+        mailbox = self._mailboxes.pop(listener.id, None)
+        if mailbox is None:
+            return
+        dropped = mailbox.close(drop_pending)
+        if dropped:
+            stats = self._stats_for(event_name)
+            with self._stats_lock:
+                stats.queue_depth -= dropped
 
     def get_registered_events(self, namespace: Optional[str] = None) -> List[str]:
         """获取已注册的事件列表
@@ -477,11 +672,32 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
                 "total_listeners": sum(
                     len(listeners) for listeners in self._listeners.values()
                 ),
-                "events_with_listeners": len(
-                    [e for e in self._listeners if self._listeners[e]]
+                "events_with_listeners": len(self._listeners),
+                "async_listeners": len(self._mailboxes),
+                "queued_events": sum(
+                    stats.queue_depth for stats in self._dispatch_stats.values()
                 ),
             }
 
+    def get_dispatch_stats(
+        self, event_name: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """获取投递统计（队列深度、投递数、慢调用次数）
+
+        Args:
+            event_name: 只返回指定事件的统计，None 表示所有发出过的事件
+
+        Returns:
+            {事件名称: 统计字典}
+        """
+        with self._stats_lock:
+            if event_name is not None:
+                stats = self._dispatch_stats.get(event_name)
+                return {event_name: stats.to_dict()} if stats else {}
+            return {
+                name: stats.to_dict() for name, stats in self._dispatch_stats.items()
+            }
+
     def enable(self) -> None:
         """启用事件系统"""
         self._enabled = True
@@ -506,9 +722,13 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         event_name: str,
         callback: Callable,
         priority: EventPriority = EventPriority.NORMAL,
+        delivery: EventDelivery = EventDelivery.INLINE,
+        coalesce: Optional[CoalescePolicy] = None,
     ) -> str:
         """监听事件（IEventService接口）"""
-        return self.subscribe(event_name, callback, priority)
+        return self.subscribe(
+            event_name, callback, priority, delivery=delivery, coalesce=coalesce
+        )
 
     def off(self, event_name: str, listener_id: str) -> bool:
         """取消监听事件（IEventService接口）"""
@@ -519,14 +739,17 @@ class DynamicEventSystem(LifecycleComponent, IEventService):
         event_name: str,
         callback: Callable,
         priority: EventPriority = EventPriority.NORMAL,
+        delivery: EventDelivery = EventDelivery.INLINE,
     ) -> str:
         """一次性监听事件（IEventService接口）"""
-        return self.subscribe(event_name, callback, priority, is_once=True)
+        return self.subscribe(
+            event_name, callback, priority, is_once=True, delivery=delivery
+        )
 
     def get_listener_count(self, event_name: str) -> int:
         """获取监听器数量（IEventService接口）"""
         with self._lock:
-            return len(self._listeners.get(event_name, []))
+            return len(self._listeners.get(event_name, ()))
 
     def get_event_names(self) -> List[str]:
         """获取所有事件名称（IEventService接口）"""
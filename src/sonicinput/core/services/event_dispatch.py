@@ -0,0 +1,357 @@
+"""事件异步投递
+
+为 DynamicEventSystem 提供非 INLINE 投递方式所需的组件：
+- ListenerMailbox：每个异步监听器一个串行邮箱，emit 只做 O(1) 入队；
+  邮箱在共享线程池（或 Qt 主线程）上排空，同一监听器的事件按发出顺序执行
+- MainThreadInvoker：把可调用对象投递到 Qt 主线程执行
+- EventCoalescer / DelayScheduler：按 CoalescePolicy 节流或防抖，
+  被合并的事件只保留最新值，窗口结束时由调度线程补发
+- EventDispatchStats：按事件统计的队列深度、投递数、合并数和慢监听器次数
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from .events import CoalescePolicy
+
+# ListenerMailbox.post() 的返回值
+POST_QUEUED = "queued"
+POST_COALESCED = "coalesced"
+POST_REJECTED = "rejected"
+
+
+@dataclass
+class EventDispatchStats:
+    """单个事件的投递统计"""
+
+    emitted: int = 0
+    enqueued: int = 0
+    delivered: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    slow_calls: int = 0
+    errors: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ListenerMailbox:
+    """单个异步监听器的串行投递队列"""
+
+    # 每次调度最多处理的事件数，之后重新提交，避免一个繁忙监听器独占工作线程
+    DRAIN_BATCH = 32
+
+    def __init__(
+        self,
+        deliver: Callable[[Any], None],
+        submit: Callable[[Callable[[], None]], None],
+        latest_only: Optional[CoalescePolicy] = None,
+    ):
+        """初始化邮箱
+
+        Args:
+            deliver: 在执行线程上处理单个事件数据的函数
+            submit: 将排空任务提交到执行线程的函数
+            latest_only: latest 合并策略；设置后每个分区只保留最新的待处理值
+        """
+        self._deliver = deliver
+        self._submit = submit
+        self._latest_only = latest_only
+        self._pending: Deque[Any] = deque()
+        # latest 模式：分区 -> 最新值（dict 保持首次入队顺序）
+        self._latest: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._closed = False
+
+    def post(self, data: Any) -> str:
+        """入队事件数据（O(1)）
+
+        Returns:
+            POST_QUEUED / POST_COALESCED（替换了尚未处理的旧值）/
+            POST_REJECTED（邮箱已关闭）
+        """
+        with self._lock:
+            if self._closed:
+                return POST_REJECTED
+            if self._latest_only is not None:
+                partition = self._latest_only.partition(data)
+                replaced = partition in self._latest
+                self._latest[partition] = data
+                if replaced:
+                    return POST_COALESCED
+            else:
+                self._pending.append(data)
+            if self._scheduled:
+                return POST_QUEUED
+            self._scheduled = True
+        self._submit(self._drain)
+        return POST_QUEUED
+
+    def close(self, drop_pending: bool = True) -> int:
+        """关闭邮箱（不再接受新事件）
+
+        Args:
+            drop_pending: 是否丢弃尚未处理的事件；False 时已入队的事件照常执行
+
+        Returns:
+            丢弃的事件数量
+        """
+        with self._lock:
+            self._closed = True
+            if not drop_pending:
+                return 0
+            dropped = len(self._pending) + len(self._latest)
+            self._pending.clear()
+            self._latest.clear()
+            return dropped
+
+    def _pop(self) -> Tuple[bool, Any]:
+        """取出下一个待处理值（调用方持有锁）"""
+        if self._pending:
+            return True, self._pending.popleft()
+        if self._latest:
+            partition = next(iter(self._latest))
+            return True, self._latest.pop(partition)
+        return False, None
+
+    def _drain(self) -> None:
+        for _ in range(self.DRAIN_BATCH):
+            with self._lock:
+                found, data = self._pop()
+                if not found:
+                    self._scheduled = False
+                    return
+            self._deliver(data)
+
+        with self._lock:
+            if not self._pending and not self._latest:
+                self._scheduled = False
+                return
+        self._submit(self._drain)
+
+
+class DelayScheduler:
+    """单线程延迟执行器（节流/防抖的尾沿投递）"""
+
+    def __init__(self, name: str = "EventCoalesce"):
+        self._name = name
+        self._heap: List[Tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def call_at(self, due: float, func: Callable[[], None]) -> None:
+        """在 time.monotonic() 时刻 due 执行 func"""
+        with self._cond:
+            if self._stopped:
+                return
+            heapq.heappush(self._heap, (due, next(self._counter), func))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self) -> None:
+        """停止调度线程，丢弃尚未到期的任务"""
+        with self._cond:
+            self._stopped = True
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+                _, _, func = heapq.heappop(self._heap)
+            try:
+                func()
+            except Exception:
+                # 投递函数自行记录监听器错误，这里只保证调度线程不退出
+                pass
+
+
+class _PartitionState:
+    __slots__ = ("last_delivery", "pending", "has_pending", "scheduled", "deadline")
+
+    def __init__(self):
+        self.last_delivery = float("-inf")
+        self.pending: Any = None
+        self.has_pending = False
+        self.scheduled = False
+        self.deadline = 0.0
+
+
+class EventCoalescer:
+    """单个监听器的节流/防抖状态（throttle / debounce 策略）
+
+    立即投递在 emit 线程上调用 forward；尾沿补发在 DelayScheduler 线程上调用，
+    INLINE 监听器此时在调度线程上执行（见 CoalescePolicy）。
+    """
+
+    def __init__(
+        self,
+        policy: CoalescePolicy,
+        forward: Callable[[Any], None],
+        scheduler: DelayScheduler,
+        on_coalesced: Callable[[], None],
+    ):
+        """初始化合并器
+
+        Args:
+            policy: 合并策略（mode 为 throttle 或 debounce）
+            forward: 实际投递函数
+            scheduler: 尾沿投递使用的调度器
+            on_coalesced: 每合并掉一个事件调用一次（用于统计）
+        """
+        self._policy = policy
+        self._forward = forward
+        self._scheduler = scheduler
+        self._on_coalesced = on_coalesced
+        self._states: Dict[Hashable, _PartitionState] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def offer(self, data: Any) -> None:
+        """提交一个事件，按策略立即投递、合并或延迟投递"""
+        partition = self._policy.partition(data)
+        now = time.monotonic()
+        deliver_now = False
+        coalesced = False
+        due = None
+
+        with self._lock:
+            if self._closed:
+                return
+            state = self._states.get(partition)
+            if state is None:
+                state = self._states[partition] = _PartitionState()
+
+            if self._policy.mode == CoalescePolicy.THROTTLE:
+                if (
+                    not state.has_pending
+                    and now - state.last_delivery >= self._policy.interval
+                ):
+                    state.last_delivery = now
+                    deliver_now = True
+                else:
+                    coalesced = state.has_pending
+                    state.pending = data
+                    state.has_pending = True
+                    if not state.scheduled:
+                        state.scheduled = True
+                        due = state.last_delivery + self._policy.interval
+            else:
+                coalesced = state.has_pending
+                state.pending = data
+                state.has_pending = True
+                state.deadline = now + self._policy.interval
+                if not state.scheduled:
+                    state.scheduled = True
+                    due = state.deadline
+
+        if coalesced:
+            self._on_coalesced()
+        if deliver_now:
+            self._forward(data)
+        elif due is not None:
+            self._scheduler.call_at(due, lambda: self._fire(partition))
+
+    def close(self) -> None:
+        """停止投递（尚未补发的值被丢弃）"""
+        with self._lock:
+            self._closed = True
+            self._states.clear()
+
+    def _fire(self, partition: Hashable) -> None:
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(partition)
+            if self._closed or state is None or not state.has_pending:
+                return
+            if self._policy.mode == CoalescePolicy.DEBOUNCE and now < state.deadline:
+                # 等待期间又有新事件，顺延到新的截止时间
+                due = state.deadline
+            else:
+                due = None
+                data = state.pending
+                state.pending = None
+                state.has_pending = False
+                state.scheduled = False
+                state.last_delivery = now
+
+        if due is not None:
+            self._scheduler.call_at(due, lambda: self._fire(partition))
+        else:
+            self._forward(data)
+
+
+class MainThreadInvoker:
+    """将可调用对象投递到 Qt 主线程
+
+    首次使用时在 QCoreApplication 所在线程创建一个桥接 QObject，
+    通过 QueuedConnection 信号把调用排入主线程事件循环。
+    """
+
+    def __init__(self):
+        self._bridge: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[[], None]) -> bool:
+        """投递到主线程，返回 False 表示没有可用的 Qt 应用实例"""
+        bridge = self._bridge or self._create_bridge()
+        if bridge is None:
+            return False
+        bridge.invoke.emit(func)
+        return True
+
+    def _create_bridge(self) -> Optional[Any]:
+        with self._lock:
+            if self._bridge is not None:
+                return self._bridge
+            try:
+                from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal, Slot
+            except ImportError:
+                return None
+
+            app = QCoreApplication.instance()
+            if app is None:
+                return None
+
+            class _MainThreadBridge(QObject):
+                invoke = Signal(object)
+
+                def __init__(self):
+                    super().__init__()
+                    self.invoke.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+                @Slot(object)
+                def _run(self, func):
+                    func()
+
+            bridge = _MainThreadBridge()
+            bridge.moveToThread(app.thread())
+            self._bridge = bridge
+            return bridge
@@ -1,6 +1,7 @@
 """Event constants and metadata."""
 
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Hashable, List, Optional
 
 
 class Events:
@@ -21,6 +22,7 @@ class Events:
     TRANSCRIPTION_SERVICE_STARTED = "transcription_service_started"
     TRANSCRIPTION_SERVICE_STOPPED = "transcription_service_stopped"
     SPEECH_SERVICE_RELOADED = "speech_service_reloaded"
+    SPEECH_SERVICE_RELOAD_FAILED = "speech_service_reload_failed"
 
     # Model loading
     MODEL_LOADING_STARTED = "model_loading_started"
@@ -29,6 +31,11 @@ class Events:
     MODEL_LOADING_FAILED = "model_loading_failed"
     MODEL_LOADING_ERROR = "model_loading_error"
     MODEL_UNLOADED = "model_unloaded"
+    MODEL_IDLE_UNLOADED = "model_idle_unloaded"
+    MODEL_IDLE_RELOADED = "model_idle_reloaded"
+    MODEL_DOWNLOAD_PROGRESS = "model_download_progress"
+    MODEL_DOWNLOAD_COMPLETED = "model_download_completed"
+    MODEL_DOWNLOAD_FAILED = "model_download_failed"
 
     # Streaming
     STREAMING_STARTED = "streaming_started"
@@ -99,6 +106,61 @@ class Events:
     ERROR_AUTO_RESOLVED = "error_auto_resolved"
 
 
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """High-frequency event coalescing policy.
+
+    Modes:
+    - latest: queued (non-inline) deliveries keep only the newest value
+    - throttle: at most one delivery per ``interval`` seconds; the newest
+      suppressed value is delivered at the end of the window
+    - debounce: deliver the newest value once no event arrived for
+      ``interval`` seconds
+    - none: deliver every event (lets a subscriber opt out of the default)
+
+    ``key`` names a field of dict payloads; values with different keys are
+    coalesced independently (e.g. one state key never hides another).
+
+    Throttle and debounce deliver the trailing value from the EventCoalesce
+    scheduler thread, after the emitter has moved on. An INLINE listener
+    therefore runs on the emitting thread for the leading edge and on the
+    scheduler thread for trailing values; WORKER and MAIN_THREAD listeners
+    are still delivered through their executor. Subscribe with
+    ``EventDelivery.MAIN_THREAD`` when the callback must run on the Qt thread.
+    """
+
+    LATEST: ClassVar[str] = "latest"
+    THROTTLE: ClassVar[str] = "throttle"
+    DEBOUNCE: ClassVar[str] = "debounce"
+    NONE: ClassVar[str] = "none"
+
+    mode: str = LATEST
+    interval: float = 0.0
+    key: Optional[str] = None
+
+    @classmethod
+    def latest(cls, key: Optional[str] = None) -> "CoalescePolicy":
+        return cls(cls.LATEST, 0.0, key)
+
+    @classmethod
+    def max_rate(cls, hz: float, key: Optional[str] = None) -> "CoalescePolicy":
+        return cls(cls.THROTTLE, 1.0 / hz, key)
+
+    @classmethod
+    def debounce(cls, seconds: float, key: Optional[str] = None) -> "CoalescePolicy":
+        return cls(cls.DEBOUNCE, seconds, key)
+
+    @classmethod
+    def none(cls) -> "CoalescePolicy":
+        return cls(cls.NONE)
+
+    def partition(self, data: Any) -> Hashable:
+        """Return the coalescing partition of an event payload."""
+        if self.key is not None and isinstance(data, dict):
+            return data.get(self.key)
+        return None
+
+
 def iter_event_names() -> List[str]:
     """Return canonical event names in definition order."""
     event_names: List[str] = []
@@ -129,6 +191,8 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
         "description": "Audio level update",
         "namespace": "audio",
         "tags": ["audio", "level"],
+        # Emitted once per captured chunk; the waveform only needs ~30 Hz
+        "coalesce": CoalescePolicy.max_rate(30),
     },
     Events.RECORDING_STATE_CHANGED: {
         "description": "Recording state changed",
@@ -171,6 +235,11 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
         "namespace": "speech",
         "tags": ["speech", "service", "reload"],
     },
+    Events.SPEECH_SERVICE_RELOAD_FAILED: {
+        "description": "Speech service reload failed, previous service kept",
+        "namespace": "speech",
+        "tags": ["speech", "service", "reload"],
+    },
     # Model loading
     Events.MODEL_LOADING_STARTED: {
         "description": "Model loading started",
@@ -202,6 +271,34 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
         "namespace": "model",
         "tags": ["model", "loading"],
     },
+    Events.MODEL_IDLE_UNLOADED: {
+        "description": "Model unloaded after idle timeout",
+        "namespace": "model",
+        "tags": ["model", "memory"],
+    },
+    Events.MODEL_IDLE_RELOADED: {
+        "description": "Idle-unloaded model reloaded",
+        "namespace": "model",
+        "tags": ["model", "memory"],
+    },
+    Events.MODEL_DOWNLOAD_PROGRESS: {
+        "description": "Model download progress",
+        "namespace": "model",
+        "tags": ["model", "download"],
+        # Each update carries cumulative byte counts, so a queued listener
+        # only needs the newest one per model
+        "coalesce": CoalescePolicy.latest("model_name"),
+    },
+    Events.MODEL_DOWNLOAD_COMPLETED: {
+        "description": "Model download completed",
+        "namespace": "model",
+        "tags": ["model", "download"],
+    },
+    Events.MODEL_DOWNLOAD_FAILED: {
+        "description": "Model download failed",
+        "namespace": "model",
+        "tags": ["model", "download", "error"],
+    },
     # Streaming
     Events.STREAMING_STARTED: {
         "description": "Streaming started",
@@ -222,6 +319,9 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
         "description": "Realtime text updated",
         "namespace": "streaming",
         "tags": ["streaming", "realtime"],
+        # Each update carries the full text, so a queued listener only
+        # needs the newest one
+        "coalesce": CoalescePolicy.latest(),
     },
     # AI processing
     Events.AI_PROCESSING_STARTED: {
@@ -373,6 +473,7 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
         "description": "State changed",
         "namespace": "state",
         "tags": ["state"],
+        "coalesce": CoalescePolicy.latest(key="key"),
     },
     # Component lifecycle
     Events.COMPONENT_REGISTERED: {
@@ -446,4 +547,4 @@ EVENT_METADATA: Dict[str, Dict[str, object]] = {
 }
 
 
-__all__ = ["Events", "EVENT_METADATA", "iter_event_names"]
+__all__ = ["CoalescePolicy", "Events", "EVENT_METADATA", "iter_event_names"]
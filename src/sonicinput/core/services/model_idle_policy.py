@@ -0,0 +1,293 @@
+"""模型空闲卸载策略 - 降低常驻内存
+
+长时间不听写时，常驻的识别模型白白占用几百 MB 内存。本策略在模型
+空闲超过设定时长后卸载它，并在下次按下热键时立即在后台重载，让模型
+加载与录音并行进行；录音结束时模型通常已经就绪。重载仍未完成时，
+转录服务可以先用云端服务兜底（见 RefactoredTranscriptionService）。
+
+策略记录每次卸载释放的常驻内存（RSS）和每次重载的耗时。
+"""
+
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from ...utils import app_logger
+
+
+def current_rss_mb() -> Optional[float]:
+    """当前进程的常驻内存（MB），psutil 读取失败时返回 None"""
+    import psutil
+
+    try:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+class ModelIdlePolicy:
+    """空闲超时卸载 + 热键预取重载
+
+    - touch(): 每次使用模型时调用，刷新空闲计时
+    - in_use(): 转录期间持有，持有期间不会卸载
+    - prefetch(): 按下热键时调用，模型被本策略卸载过则在后台重载
+    - wait_until_ready(): 等待进行中的重载完成
+    """
+
+    def __init__(
+        self,
+        model_manager,
+        idle_timeout: float,
+        on_evicted: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_reloaded: Optional[Callable[[Dict[str, Any]], None]] = None,
+        can_evict: Optional[Callable[[], bool]] = None,
+        check_interval: Optional[float] = None,
+    ):
+        """初始化空闲卸载策略
+
+        Args:
+            model_manager: ModelManager 实例
+            idle_timeout: 空闲多少秒后卸载，0 表示不卸载
+            on_evicted: 卸载后回调，参数为卸载信息（释放的内存等）
+            on_reloaded: 预取重载结束后回调，参数为重载信息（耗时、成功与否）
+            can_evict: 额外的卸载条件（例如录音中、实时模式下返回 False）
+            check_interval: 空闲检查间隔（秒），默认取超时的 1/4（5~60 秒）
+        """
+        self.model_manager = model_manager
+        self.idle_timeout = max(0.0, float(idle_timeout))
+        self._on_evicted = on_evicted
+        self._on_reloaded = on_reloaded
+        self._can_evict = can_evict
+        self._check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._in_use = 0
+        self._evicted = False
+        self._reload_thread: Optional[threading.Thread] = None
+        self._reload_done = threading.Event()
+        self._reload_done.set()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats = {
+            "evictions": 0,
+            "reloads": 0,
+            "failed_reloads": 0,
+            "fallback_transcriptions": 0,
+            "last_reload_ms": None,
+            "last_rss_saved_mb": None,
+            "total_rss_saved_mb": 0.0,
+        }
+
+    # ---- 生命周期 ----
+
+    def start(self) -> None:
+        """启动空闲检查线程（超时为 0 时不启动）"""
+        if not self.enabled or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._last_used = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="ModelIdleEvictor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止空闲检查线程"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def set_idle_timeout(self, idle_timeout: float) -> None:
+        """修改空闲超时（配置热更新），0 表示停用"""
+        self.idle_timeout = max(0.0, float(idle_timeout))
+        self.touch()
+        if self.enabled:
+            if self._thread is None:
+                self.start()
+        else:
+            self.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return self.idle_timeout > 0
+
+    @property
+    def interval(self) -> float:
+        if self._check_interval is not None:
+            return self._check_interval
+        return min(60.0, max(5.0, self.idle_timeout / 4))
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.maybe_evict()
+            except Exception as e:
+                app_logger.log_error(e, "model_idle_evict")
+
+    # ---- 使用跟踪 ----
+
+    def touch(self) -> None:
+        """记录一次模型使用"""
+        self._last_used = time.monotonic()
+
+    @contextmanager
+    def in_use(self) -> Iterator[None]:
+        """转录期间持有，阻止卸载"""
+        with self._lock:
+            self._in_use += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self.touch()
+
+    def record_fallback(self) -> None:
+        """记录一次由云端兜底完成的转录"""
+        with self._lock:
+            self._stats["fallback_transcriptions"] += 1
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self._last_used
+
+    @property
+    def is_evicted(self) -> bool:
+        """模型是否处于被本策略卸载、尚未重载完成的状态
+
+        其他途径（手动加载、热重载）把模型加载回来后不再视为已卸载。
+        """
+        return self._evicted and not self.model_manager.is_model_loaded()
+
+    @property
+    def is_reloading(self) -> bool:
+        return not self._reload_done.is_set()
+
+    # ---- 卸载与重载 ----
+
+    def maybe_evict(self) -> bool:
+        """空闲超时且允许时卸载模型
+
+        Returns:
+            True 表示本次卸载了模型
+        """
+        if not self.enabled or self.idle_seconds < self.idle_timeout:
+            return False
+        if self._can_evict is not None and not self._can_evict():
+            return False
+
+        with self._lock:
+            if (
+                self._in_use
+                or self.is_reloading
+                or self.model_manager.is_swapping
+                or not self.model_manager.is_model_loaded()
+            ):
+                return False
+
+            idle_seconds = self.idle_seconds
+            rss_before = current_rss_mb()
+            self.model_manager.unload_model()
+            gc.collect()
+            rss_after = current_rss_mb()
+            self._evicted = True
+
+            saved = None
+            if rss_before is not None and rss_after is not None:
+                saved = round(max(0.0, rss_before - rss_after), 1)
+                self._stats["total_rss_saved_mb"] = round(
+                    self._stats["total_rss_saved_mb"] + saved, 1
+                )
+            self._stats["evictions"] += 1
+            self._stats["last_rss_saved_mb"] = saved
+
+        info = {
+            "idle_seconds": round(idle_seconds, 1),
+            "idle_timeout": self.idle_timeout,
+            "rss_before_mb": None if rss_before is None else round(rss_before, 1),
+            "rss_saved_mb": saved,
+        }
+        app_logger.log_audio_event("Model unloaded after idle timeout", info)
+        self._notify(self._on_evicted, info)
+        return True
+
+    def prefetch(self) -> bool:
+        """模型被空闲卸载过时在后台开始重载（按下热键时调用）
+
+        Returns:
+            True 表示已有或新启动了一次重载
+        """
+        self.touch()
+        with self._lock:
+            if not self.is_evicted:
+                return False
+            if self.is_reloading:
+                return True
+            self._reload_done.clear()
+            self._reload_thread = threading.Thread(
+                target=self._reload, name="ModelIdleReload", daemon=True
+            )
+            self._reload_thread.start()
+        return True
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """等待进行中的重载完成
+
+        Returns:
+            True 表示当前没有进行中的重载且模型未处于卸载状态
+        """
+        self._reload_done.wait(timeout)
+        return not self.is_reloading and not self.is_evicted
+
+    def _reload(self) -> None:
+        start = time.perf_counter()
+        success = False
+        try:
+            success = bool(self.model_manager.load_model())
+        except Exception as e:
+            app_logger.log_error(e, "model_idle_reload")
+
+        reload_ms = round((time.perf_counter() - start) * 1000, 1)
+        with self._lock:
+            if success:
+                self._evicted = False
+                self._stats["reloads"] += 1
+                self._stats["last_reload_ms"] = reload_ms
+            else:
+                self._stats["failed_reloads"] += 1
+        self.touch()
+
+        info = {"success": success, "reload_ms": reload_ms}
+        app_logger.log_audio_event("Model reloaded after idle unload", info)
+        # 回调（重建转录核心）完成后才唤醒等待者
+        self._notify(self._on_reloaded, info)
+        self._reload_done.set()
+
+    def _notify(self, callback, info: Dict[str, Any]) -> None:
+        if callback is None:
+            return
+        try:
+            callback(info)
+        except Exception as e:
+            app_logger.log_error(e, "model_idle_policy_callback")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取策略统计（卸载/重载次数、最近重载耗时、释放的内存等）"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(
+            {
+                "enabled": self.enabled,
+                "idle_timeout": self.idle_timeout,
+                "idle_seconds": round(self.idle_seconds, 1),
+                "evicted": self._evicted,
+                "reloading": self.is_reloading,
+            }
+        )
+        return stats
@@ -1,10 +1,13 @@
 """模型管理器 - 负责Whisper模型的生命周期管理"""
 
+import threading
 import time
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from ...utils import app_logger
+from .task_queue_manager import CancellationToken, TaskCancelledError
 
 
 class ModelState(Enum):
@@ -22,17 +25,46 @@ class ModelManager:
 
     负责模型的加载、卸载、重载等操作，以及状态管理。
     与具体的转录逻辑解耦。
+
+    已有模型在服务时切换模型采用蓝绿切换：新引擎在后台加载、预热，
+    旧引擎照常转录；就绪后原子替换，旧引擎等持有者（engine_in_use）
+    全部退出后再卸载，切换过程中 is_model_loaded() 始终为 True。
     """
 
-    def __init__(self, speech_service_factory, event_service=None):
+    # 热切换后等待旧引擎上进行中的转录结束的最长时间（秒）
+    DRAIN_TIMEOUT = 60.0
+
+    def __init__(
+        self,
+        speech_service_factory,
+        event_service=None,
+        warm_up=True,
+        can_release: Optional[Callable[[], bool]] = None,
+        config_service=None,
+    ):
         """初始化模型管理器
 
         Args:
             speech_service_factory: 语音服务工厂函数
             event_service: 事件服务（可选）
+            warm_up: 加载后是否预热模型（引擎支持时）
+            can_release: 热切换后旧引擎可以卸载的额外条件（可选），例如实时
+                会话仍直接持有旧引擎时返回 False
+            config_service: 配置服务（可选），重载时从中读取模型变体和线程数
         """
         self.speech_service_factory = speech_service_factory
         self.event_service = event_service
+        self.warm_up_enabled = warm_up
+        self._can_release = can_release
+        self.config_service = config_service
+
+        # 引擎持有计数（按引擎 id），热切换后据此排空旧引擎
+        self._engine_users: Dict[int, int] = {}
+        self._users_cond = threading.Condition()
+        self._load_done = threading.Event()
+        self._load_done.set()
+        self._swap_in_progress = False
+        self._drain_thread: Optional[threading.Thread] = None
 
         # 模型状态管理
         self._whisper_engine = None
@@ -48,12 +80,10 @@ class ModelManager:
 
     def start(self) -> None:
         """启动模型管理器"""
-        import threading
-
         self._state_lock = threading.Lock()
 
         # 初始化引擎实例
-        self._whisper_engine = self.speech_service_factory()
+        self._whisper_engine = self._create_engine()
         self._current_model_name = self._whisper_engine.model_name
 
         app_logger.log_audio_event(
@@ -87,6 +117,9 @@ class ModelManager:
     ) -> bool:
         """同步加载模型（阻塞直到加载完成）
 
+        已有其他模型在服务时改为热切换（见 reload_model），加载期间旧模型
+        继续转录；已有加载在进行时等待它完成而不是直接失败。
+
         Args:
             model_name: 模型名称（可选，默认使用当前模型）
             timeout: 超时时间（秒）
@@ -98,18 +131,26 @@ class ModelManager:
         if not self._state_lock:
             self.start()
 
+        if self._model_state == ModelState.LOADING:
+            self._load_done.wait(timeout)
+
         with self._state_lock:
+            hot_swap = False
             if self._model_state == ModelState.LOADED:
                 if not model_name or model_name == self._current_model_name:
                     return True  # 模型已加载
+                hot_swap = True
+            elif self._model_state == ModelState.LOADING:
+                return False  # 等待进行中的加载超时
+            else:
+                # 设置加载状态
+                self._model_state = ModelState.LOADING
+                self._load_done.clear()
+                self._load_start_time = time.time()
+                self._last_load_error = None
 
-            if self._model_state == ModelState.LOADING:
-                return False  # 正在加载中
-
-            # 设置加载状态
-            self._model_state = ModelState.LOADING
-            self._load_start_time = time.time()
-            self._last_load_error = None
+        if hot_swap:
+            return self.reload_model(model_name)
 
         try:
             # 广播模型加载开始事件
@@ -125,7 +166,7 @@ class ModelManager:
             if (
                 model_name and model_name != self._current_model_name
             ) or not self._whisper_engine:
-                self._whisper_engine = self.speech_service_factory()
+                self._whisper_engine = self._create_engine()
                 self._current_model_name = target_model_name
 
             # 执行模型加载
@@ -137,21 +178,24 @@ class ModelManager:
                     self._model_state = ModelState.ERROR
                 raise Exception("Model load_model() returned False")
 
+            # 预热在 LOADED 之前完成，首次听写不会再遇到推理初始化
+            warmup = self._warm_up_engine()
+
             # 更新状态
             with self._state_lock:
                 self._model_state = ModelState.LOADED
                 load_time = time.time() - self._load_start_time
 
             # 广播模型加载完成事件
-            self._emit_model_event(
-                "model_loaded",
-                {
-                    "model_name": self._current_model_name,
-                    "device": self._whisper_engine.device,
-                    "use_gpu": getattr(self._whisper_engine, "use_gpu", False),
-                    "load_time": f"{load_time:.2f}s",
-                },
-            )
+            event_data = {
+                "model_name": self._current_model_name,
+                "device": self._whisper_engine.device,
+                "use_gpu": getattr(self._whisper_engine, "use_gpu", False),
+                "load_time": f"{load_time:.2f}s",
+            }
+            if warmup:
+                event_data["warmup"] = warmup
+            self._emit_model_event("model_loaded", event_data)
 
             app_logger.log_audio_event(
                 "Model loaded successfully",
@@ -159,6 +203,7 @@ class ModelManager:
                     "model_name": self._current_model_name,
                     "device": self._whisper_engine.device,
                     "load_time": load_time,
+                    "warmup": warmup,
                 },
             )
 
@@ -180,6 +225,9 @@ class ModelManager:
 
             return False
 
+        finally:
+            self._load_done.set()
+
     def unload_model(self) -> None:
         """卸载模型"""
         if not self._whisper_engine or self._model_state == ModelState.UNLOADED:
@@ -214,31 +262,48 @@ class ModelManager:
                 self._last_load_error = str(e)
 
     def reload_model(
-        self, model_name: Optional[str] = None, use_gpu: Optional[bool] = None
+        self,
+        model_name: Optional[str] = None,
+        use_gpu: Optional[bool] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> bool:
         """重新加载模型（用于切换GPU/CPU或更换模型）
 
+        有模型在服务时采用蓝绿切换：新引擎在后台加载并预热，旧引擎继续
+        转录；成功后原子替换，旧引擎排空后卸载。新模型加载失败时旧模型
+        继续服务。没有模型在服务时直接加载。
+
         Args:
             model_name: 新模型名称（可选）
             use_gpu: 是否使用GPU（可选）
+            cancel_token: 取消令牌（可选）。加载本身不可中断，令牌在加载前
+                和替换前检查；替换前被取消时丢弃新引擎，旧模型继续服务
 
         Returns:
             True如果重载成功
+
+        Raises:
+            TaskCancelledError: 重载被取消
         """
+        if not self._state_lock:
+            self.start()
+
         start_time = time.time()
+        target_model_name = model_name or self._current_model_name
 
         with self._state_lock:
-            if self._model_state == ModelState.RELOADING:
+            if self._swap_in_progress:
                 return False  # 已在重载中
-
-            self._model_state = ModelState.RELOADING
+            self._swap_in_progress = True
+            blue_engine = self._whisper_engine if self.is_model_loaded() else None
 
         try:
             app_logger.log_audio_event(
                 "Reloading model with new settings",
                 {
-                    "model_name": model_name or self._current_model_name,
+                    "model_name": target_model_name,
                     "use_gpu": use_gpu,
+                    "hot_swap": blue_engine is not None,
                 },
             )
 
@@ -247,41 +312,39 @@ class ModelManager:
                 "model_reloading_started",
                 {
                     "old_model": self._current_model_name,
-                    "new_model": model_name or self._current_model_name,
+                    "new_model": target_model_name,
                     "use_gpu": use_gpu,
                 },
             )
 
-            # 1. 卸载当前模型
-            if self._model_state != ModelState.UNLOADED:
-                self.unload_model()
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
 
-            # 2. 创建新的引擎实例
-            if model_name:
-                # 需要重新创建引擎以应用新配置
-                from ...speech import SherpaEngine
-
-                target_model_name = model_name or self._current_model_name
-                # sherpa-onnx 不使用 use_gpu 参数
-                self._whisper_engine = SherpaEngine(target_model_name, language="zh")
-                self._current_model_name = target_model_name
-
-            # 3. 加载新模型
-            success = self.load_model()
+            if blue_engine is None:
+                # 没有在服务的模型：直接加载（需要时重新创建引擎以应用新配置）
+                if model_name:
+                    self._whisper_engine = self._build_engine(target_model_name)
+                    self._current_model_name = target_model_name
+                success = self.load_model_sync()
+                warmup = None
+            else:
+                success, warmup = self._hot_swap(
+                    blue_engine, target_model_name, cancel_token
+                )
 
             reload_time = time.time() - start_time
 
             if success:
+                event_data = {
+                    "model_name": self._current_model_name,
+                    "device": self._whisper_engine.device,
+                    "use_gpu": getattr(self._whisper_engine, "use_gpu", False),
+                    "reload_time": f"{reload_time:.2f}s",
+                }
+                if warmup:
+                    event_data["warmup"] = warmup
                 # 广播重载成功事件
-                self._emit_model_event(
-                    "model_reloaded",
-                    {
-                        "model_name": self._current_model_name,
-                        "device": self._whisper_engine.device,
-                        "use_gpu": getattr(self._whisper_engine, "use_gpu", False),
-                        "reload_time": f"{reload_time:.2f}s",
-                    },
-                )
+                self._emit_model_event("model_reloaded", event_data)
 
                 app_logger.log_audio_event(
                     "Model reloaded successfully",
@@ -289,37 +352,215 @@ class ModelManager:
                         "model_name": self._current_model_name,
                         "device": self._whisper_engine.device,
                         "reload_time": reload_time,
+                        "hot_swap": blue_engine is not None,
                     },
                 )
 
-                with self._state_lock:
-                    self._model_state = ModelState.LOADED
-
-            else:
-                with self._state_lock:
-                    self._model_state = ModelState.ERROR
-
             return success
 
+        except TaskCancelledError:
+            app_logger.log_audio_event(
+                "Model reload cancelled", {"model_name": target_model_name}
+            )
+            raise
+
         except Exception as e:
             error_msg = f"Failed to reload model: {e}"
             app_logger.log_error(e, "reload_model")
 
             with self._state_lock:
-                self._model_state = ModelState.ERROR
+                # 热切换失败时旧引擎仍在服务
+                if not self.is_model_loaded():
+                    self._model_state = ModelState.ERROR
                 self._last_load_error = error_msg
 
             # 广播重载失败事件
             self._emit_model_event(
                 "model_reloading_failed",
                 {
-                    "model_name": model_name or self._current_model_name,
+                    "model_name": target_model_name,
                     "error": error_msg,
                 },
             )
 
             return False
 
+        finally:
+            with self._state_lock:
+                self._swap_in_progress = False
+
+    def _hot_swap(
+        self,
+        blue_engine,
+        model_name: str,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        """加载新引擎并原子替换旧引擎
+
+        Returns:
+            (是否成功, 预热指标)
+
+        Raises:
+            TaskCancelledError: 替换前被取消（新引擎已卸载，旧引擎保持不变）
+            Exception: 新引擎加载失败（旧引擎保持不变）
+        """
+        green_engine = self._build_engine(model_name)
+        if not green_engine.load_model():
+            raise Exception("Model load_model() returned False")
+        warmup = self._warm_up_engine(green_engine)
+
+        if cancel_token is not None and cancel_token.is_cancelled:
+            green_engine.unload_model()
+            cancel_token.raise_if_cancelled()
+
+        with self._state_lock:
+            self._whisper_engine = green_engine
+            self._current_model_name = model_name
+            self._model_state = ModelState.LOADED
+
+        self._emit_model_event(
+            "model_loaded",
+            {
+                "model_name": model_name,
+                "device": green_engine.device,
+                "use_gpu": getattr(green_engine, "use_gpu", False),
+            },
+        )
+        self._retire_engine(blue_engine)
+        return True, warmup
+
+    def _build_engine(self, model_name: str):
+        """为重载创建新的引擎实例
+
+        变体和线程数从配置读取（变更它们会触发重载）；没有配置服务时沿用
+        当前引擎的设置。
+        """
+        from ...speech import SherpaEngine
+        from .config import ConfigKeys
+
+        variant = getattr(self._whisper_engine, "variant", None)
+        num_threads = getattr(self._whisper_engine, "num_threads", 0)
+        if self.config_service:
+            variant = self.config_service.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT, "auto"
+            )
+            num_threads = self.config_service.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS, 0
+            )
+
+        # sherpa-onnx 不使用 use_gpu 参数
+        engine = SherpaEngine(
+            model_name, language="zh", variant=variant, num_threads=num_threads
+        )
+        self._attach_event_service(engine)
+        return engine
+
+    @contextmanager
+    def engine_in_use(self) -> Iterator[Optional[Any]]:
+        """转录期间持有，固定当前引擎
+
+        产出当前已加载的引擎（未加载时为 None）。热切换后旧引擎要等所有
+        持有者退出才会卸载，持有期间拿到的引擎始终可用。
+        """
+        with self._users_cond:
+            engine = self.get_whisper_engine()
+            if engine is not None:
+                key = id(engine)
+                self._engine_users[key] = self._engine_users.get(key, 0) + 1
+        try:
+            yield engine
+        finally:
+            if engine is not None:
+                with self._users_cond:
+                    remaining = self._engine_users.get(key, 1) - 1
+                    if remaining:
+                        self._engine_users[key] = remaining
+                    else:
+                        self._engine_users.pop(key, None)
+                    self._users_cond.notify_all()
+
+    @property
+    def is_swapping(self) -> bool:
+        """是否正在重载/热切换模型"""
+        return self._swap_in_progress
+
+    def _retire_engine(self, engine) -> None:
+        """在后台排空并卸载被替换下来的引擎"""
+        self._drain_thread = threading.Thread(
+            target=self._drain_and_unload,
+            args=(engine,),
+            name="ModelDrain",
+            daemon=True,
+        )
+        self._drain_thread.start()
+
+    def _drain_and_unload(self, engine) -> None:
+        key = id(engine)
+        start = time.monotonic()
+        deadline = start + self.DRAIN_TIMEOUT
+        with self._users_cond:
+            while True:
+                drained = not self._engine_users.get(key) and (
+                    self._can_release is None or self._can_release()
+                )
+                remaining = deadline - time.monotonic()
+                if drained or remaining <= 0:
+                    break
+                self._users_cond.wait(min(remaining, 0.1))
+
+        info = {
+            "model_name": getattr(engine, "model_name", None),
+            "drain_ms": round((time.monotonic() - start) * 1000, 1),
+        }
+        if not drained:
+            # 仍被持有：不强行卸载，最后一个持有者释放引用后由 GC 回收
+            app_logger.log_audio_event(
+                "Previous model engine still in use after drain timeout", info
+            )
+            return
+
+        try:
+            engine.unload_model()
+        except Exception as e:
+            app_logger.log_error(e, "unload_previous_engine")
+            return
+        app_logger.log_audio_event("Previous model engine drained and unloaded", info)
+
+    def _warm_up_engine(self, engine=None) -> Optional[Dict[str, Any]]:
+        """预热刚加载的引擎，失败不影响加载结果
+
+        Args:
+            engine: 要预热的引擎（默认当前引擎）
+
+        Returns:
+            预热指标（首次推理与稳态延迟），未预热时返回 None
+        """
+        engine = engine or self._whisper_engine
+        if not self.warm_up_enabled or not hasattr(engine, "warm_up"):
+            return None
+
+        try:
+            metrics = engine.warm_up()
+        except Exception as e:
+            app_logger.log_error(e, "model_warm_up")
+            return None
+
+        if not isinstance(metrics, dict):
+            return None
+        app_logger.log_audio_event("Model warmed up", metrics)
+        return metrics
+
+    def _create_engine(self):
+        """通过工厂创建引擎并接入事件服务"""
+        engine = self.speech_service_factory()
+        self._attach_event_service(engine)
+        return engine
+
+    def _attach_event_service(self, engine) -> None:
+        """让引擎通过事件汇报模型下载进度（引擎支持时）"""
+        if self.event_service and hasattr(engine, "set_event_service"):
+            engine.set_event_service(self.event_service)
+
     def get_model_state(self) -> ModelState:
         """获取当前模型状态
 
@@ -0,0 +1,220 @@
+"""语音服务热切换 - 设置变更不打断听写
+
+切换转录提供商或本地模型时，新服务（绿）在后台创建并加载模型，旧服务
+（蓝）期间继续处理听写；新服务就绪且当前没有录音/处理时原子替换，
+然后等旧服务的任务队列排空再清理它。
+
+连续多次修改设置时只安装最后一次请求的服务，较早的请求被作废。
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ...utils import app_logger
+
+
+def is_service_drained(service: Any) -> bool:
+    """旧服务上是否已经没有排队或进行中的转录"""
+    coordinator = getattr(service, "streaming_coordinator", None)
+    if coordinator is not None and coordinator.is_streaming():
+        return False
+
+    task_queue = getattr(service, "task_queue_manager", None)
+    if task_queue is None:
+        return True
+    stats = task_queue.get_stats()
+    return not stats.get("queue_size") and not stats.get("running_tasks")
+
+
+class SpeechServiceSwap:
+    """后台构建 → 空闲时安装 → 排空后清理
+
+    - schedule(): 后台创建新服务并替换当前服务
+    - schedule_in_place(): 在当前服务内完成切换（例如本地模型热切换）
+    - wait(): 等待进行中的切换结束（测试、退出时使用）
+    """
+
+    # 安装前检查录音/处理状态的间隔（秒）
+    BUSY_POLL_INTERVAL = 0.2
+    # 替换后等待旧服务排空的最长时间（秒）
+    DRAIN_TIMEOUT = 60.0
+
+    def __init__(
+        self,
+        install: Callable[[Any, Dict[str, Any]], Any],
+        cleanup: Callable[[Any], None],
+        is_busy: Optional[Callable[[], bool]] = None,
+        on_failed: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """初始化服务切换器
+
+        Args:
+            install: 安装新服务的回调 (新服务, 触发信息) -> 被替换的旧服务
+            cleanup: 清理服务资源的回调
+            is_busy: 返回 True 时推迟安装（录音或处理中）
+            on_failed: 切换失败回调，参数为失败信息（旧服务保持不变）
+        """
+        self._install = install
+        self._cleanup = cleanup
+        self._is_busy = is_busy
+        self._on_failed = on_failed
+
+        self._lock = threading.Lock()
+        # 安装（以及原地切换）串行执行
+        self._install_lock = threading.Lock()
+        self._generation = 0
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = threading.Event()
+
+    # ---- 调度 ----
+
+    def schedule(self, build: Callable[[], Any], trigger: Dict[str, Any]) -> int:
+        """后台创建新服务并在空闲时替换当前服务
+
+        Args:
+            build: 创建新服务的回调（阻塞直到模型可用）
+            trigger: 触发信息（修改的配置键和值），用于日志和事件
+
+        Returns:
+            本次请求的序号
+        """
+        return self._start(self._swap, build, trigger)
+
+    def schedule_in_place(
+        self, reload: Callable[[], bool], trigger: Dict[str, Any]
+    ) -> int:
+        """在当前服务内完成切换（当前服务自己负责不中断转录）
+
+        Args:
+            reload: 执行切换的回调，返回是否成功
+            trigger: 触发信息
+
+        Returns:
+            本次请求的序号
+        """
+        return self._start(self._reload_in_place, reload, trigger)
+
+    def _start(self, target, action, trigger: Dict[str, Any]) -> int:
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._cancelled.clear()
+            self._thread = threading.Thread(
+                target=target,
+                args=(generation, action, trigger),
+                name="SpeechServiceSwap",
+                daemon=True,
+            )
+            self._thread.start()
+        return generation
+
+    def cancel(self) -> None:
+        """作废所有未安装的请求（服务停止时调用）"""
+        with self._lock:
+            self._generation += 1
+            self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """等待最近一次切换结束
+
+        Returns:
+            True 表示没有进行中的切换
+        """
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return not self.is_pending
+
+    @property
+    def is_pending(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation and not self._cancelled.is_set()
+
+    # ---- 执行 ----
+
+    def _swap(self, generation: int, build, trigger: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        try:
+            new_service = build()
+        except Exception as e:
+            app_logger.log_error(e, "speech_service_swap_build")
+            self._fail(trigger, str(e))
+            return
+
+        with self._install_lock:
+            if not self._wait_until_idle(generation):
+                self._cleanup(new_service)
+                app_logger.log_audio_event(
+                    "Speech service swap superseded", {"trigger": trigger}
+                )
+                return
+            try:
+                old_service = self._install(new_service, trigger)
+            except Exception as e:
+                app_logger.log_error(e, "speech_service_swap_install")
+                self._cleanup(new_service)
+                self._fail(trigger, str(e))
+                return
+
+        app_logger.log_audio_event(
+            "Speech service swapped",
+            {
+                "trigger": trigger,
+                "swap_ms": round((time.perf_counter() - start) * 1000, 1),
+            },
+        )
+        if old_service is not None and old_service is not new_service:
+            self._retire(old_service)
+
+    def _reload_in_place(self, generation: int, reload, trigger) -> None:
+        with self._install_lock:
+            if not self._is_current(generation):
+                return
+            try:
+                success = reload()
+            except Exception as e:
+                app_logger.log_error(e, "speech_service_reload_in_place")
+                success = False
+        if not success:
+            self._fail(trigger, "Model reload failed")
+
+    def _wait_until_idle(self, generation: int) -> bool:
+        """等到没有录音/处理再安装；请求被作废时返回 False"""
+        while self._is_current(generation):
+            if self._is_busy is None or not self._is_busy():
+                return True
+            self._cancelled.wait(self.BUSY_POLL_INTERVAL)
+        return False
+
+    def _retire(self, service: Any) -> None:
+        """等旧服务上已提交的转录完成后清理它"""
+        deadline = time.monotonic() + self.DRAIN_TIMEOUT
+        drained = False
+        while True:
+            try:
+                drained = is_service_drained(service)
+            except Exception as e:
+                app_logger.log_error(e, "speech_service_drain_check")
+                drained = True
+            if drained or time.monotonic() >= deadline:
+                break
+            time.sleep(self.BUSY_POLL_INTERVAL)
+
+        if not drained:
+            app_logger.log_audio_event(
+                "Previous speech service not drained before cleanup",
+                {"timeout": self.DRAIN_TIMEOUT},
+            )
+        self._cleanup(service)
+
+    def _fail(self, trigger: Dict[str, Any], error: str) -> None:
+        if self._on_failed is None:
+            return
+        try:
+            self._on_failed(dict(trigger, error=error))
+        except Exception as e:
+            app_logger.log_error(e, "speech_service_swap_callback")
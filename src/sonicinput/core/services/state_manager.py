@@ -192,15 +192,17 @@ class StateManager(LifecycleComponent, IStateManager):
                 EventPriority.NORMAL,
             )
 
-        app_logger.log_audio_event(
-            "State changed",
-            {
-                "key": key,
-                "old_value": str(old_value),
-                "new_value": str(value),
-                "subscribers_notified": len(subscribers),
-            },
-        )
+        # 每次状态迁移都会走到这里，只在 DEBUG 级别记录
+        if app_logger.is_debug_enabled():
+            app_logger.log_audio_event(
+                "State changed",
+                {
+                    "key": key,
+                    "old_value": str(old_value),
+                    "new_value": str(value),
+                    "subscribers_notified": len(subscribers),
+                },
+            )
 
     def get_state(self, key: str, default: T = None) -> T:
         """获取状态值
@@ -1,5 +1,24 @@
 """存储服务模块"""
 
+from .connection_manager import PragmaSettings, SQLiteConnectionManager
+from .history_reconciler import HistoryReconciler
+from .history_retention import (
+    HistoryRetentionManager,
+    RetentionPolicy,
+    RetentionReport,
+)
 from .history_storage_service import HistoryStorageService
+from .history_transfer import HistoryExporter, HistoryImporter, TransferReport
 
-__all__ = ["HistoryStorageService"]
+__all__ = [
+    "HistoryStorageService",
+    "HistoryReconciler",
+    "HistoryRetentionManager",
+    "RetentionPolicy",
+    "RetentionReport",
+    "HistoryExporter",
+    "HistoryImporter",
+    "TransferReport",
+    "SQLiteConnectionManager",
+    "PragmaSettings",
+]
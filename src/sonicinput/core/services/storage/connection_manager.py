@@ -0,0 +1,229 @@
+"""SQLite 连接管理
+
+替代每线程一个连接的做法（只有调用 stop() 的线程会关闭自己的连接，
+Qt 工作线程、任务队列线程和 AI 回调线程创建的连接都会泄漏）：
+
+- 一个写连接：所有写事务串行化（SQLite 本身同一时刻只允许一个写者），
+  显式 BEGIN IMMEDIATE 避免读升级写时的 SQLITE_BUSY
+- 一组只读连接：按需创建、用完归还，WAL 模式下读不阻塞写
+- 连接长期复用，sqlite3 的语句缓存（cached_statements）对固定 SQL 文本生效，
+  相当于预编译语句
+- close() 关闭所有连接；使用中的读连接在归还时关闭
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Generator, Optional
+
+from ....utils import app_logger
+
+
+@dataclass
+class PragmaSettings:
+    """连接级 PRAGMA 调优参数"""
+
+    # WAL 模式下 NORMAL 只在 checkpoint 时 fsync，崩溃不会损坏数据库，
+    # 最多丢失最近一次提交
+    synchronous: str = "NORMAL"
+    # 负数表示 KiB：每个连接 8 MiB 页缓存
+    cache_size: int = -8192
+    # 读路径使用内存映射，避免 read() 系统调用和额外拷贝
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+
+
+class SQLiteConnectionManager:
+    """单写者 + 只读连接池"""
+
+    # 每个连接缓存的预编译语句数量
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        db_path: Path,
+        read_pool_size: int = 4,
+        pragmas: Optional[PragmaSettings] = None,
+    ):
+        """初始化连接管理器
+
+        Args:
+            db_path: 数据库文件路径
+            read_pool_size: 空闲只读连接的最大保留数量
+            pragmas: PRAGMA 调优参数
+        """
+        self._db_path = Path(db_path)
+        self._read_pool_size = max(1, read_pool_size)
+        self._pragmas = pragmas or PragmaSettings()
+
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._writer_thread: Optional[int] = None
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._closed = True
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def is_open(self) -> bool:
+        return not self._closed
+
+    def open(self) -> None:
+        """打开写连接（数据库文件和 WAL 模式由写连接建立）"""
+        with self._write_lock:
+            if not self._closed:
+                return
+            self._writer = self._connect(read_only=False)
+            self._writer.execute("PRAGMA journal_mode=WAL")
+            self._closed = False
+
+    def close(self) -> None:
+        """关闭所有连接（可在任意线程调用）"""
+        with self._write_lock:
+            self._closed = True
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except sqlite3.Error as e:
+                    app_logger.log_error(e, "close_writer_connection")
+                self._writer = None
+
+        closed_readers = 0
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            self._close_reader(conn)
+            closed_readers += 1
+
+        app_logger.log_audio_event(
+            "History DB connections closed",
+            {"readers_closed": closed_readers, "readers_open": self._reader_count},
+        )
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        # isolation_level=None：事务由 write() 显式控制
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        pragmas = self._pragmas
+        conn.execute(f"PRAGMA busy_timeout={int(pragmas.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA synchronous={pragmas.synchronous}")
+        conn.execute(f"PRAGMA cache_size={int(pragmas.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size={int(pragmas.mmap_size)}")
+        conn.execute(f"PRAGMA temp_store={pragmas.temp_store}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _close_reader(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            app_logger.log_error(e, "close_reader_connection")
+        with self._pool_lock:
+            self._reader_count -= 1
+
+    @contextmanager
+    def write(self) -> Generator[sqlite3.Cursor, None, None]:
+        """写事务：成功提交，异常回滚
+
+        同一线程内嵌套调用时并入外层事务，由最外层提交。
+        """
+        with self._write_lock:
+            if self._closed or self._writer is None:
+                raise sqlite3.ProgrammingError("History database is closed")
+
+            conn = self._writer
+            outermost = self._write_depth == 0
+            if outermost:
+                conn.execute("BEGIN IMMEDIATE")
+                self._writer_thread = threading.get_ident()
+            self._write_depth += 1
+            try:
+                yield conn.cursor()
+            except BaseException:
+                self._write_depth -= 1
+                if outermost:
+                    self._writer_thread = None
+                    conn.execute("ROLLBACK")
+                raise
+            else:
+                self._write_depth -= 1
+                if outermost:
+                    self._writer_thread = None
+                    conn.execute("COMMIT")
+
+    @contextmanager
+    def writer_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """独占写连接，不开启事务（用于 VACUUM、wal_checkpoint 等维护语句）"""
+        with self._write_lock:
+            if self._closed or self._writer is None:
+                raise sqlite3.ProgrammingError("History database is closed")
+            if self._write_depth:
+                raise sqlite3.ProgrammingError(
+                    "Maintenance statements cannot run inside a transaction"
+                )
+            yield self._writer
+
+    @contextmanager
+    def read(self) -> Generator[sqlite3.Connection, None, None]:
+        """借用只读连接
+
+        当前线程正处于写事务中时返回写连接，以便读到本事务尚未提交的修改。
+        """
+        if self._writer_thread == threading.get_ident():
+            yield self._writer  # type: ignore[misc]
+            return
+
+        if self._closed:
+            raise sqlite3.ProgrammingError("History database is closed")
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect(read_only=True)
+            with self._pool_lock:
+                self._reader_count += 1
+
+        try:
+            yield conn
+        finally:
+            if self._closed or self._readers.qsize() >= self._read_pool_size:
+                self._close_reader(conn)
+            else:
+                self._readers.put(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """连接池状态（用于日志和基准测试）"""
+        with self._pool_lock:
+            open_readers = self._reader_count
+        return {
+            "writer_open": self._writer is not None,
+            "readers_open": open_readers,
+            "readers_idle": self._readers.qsize(),
+            "read_pool_size": self._read_pool_size,
+        }
+
+    def get_pragmas(self) -> Dict[str, Any]:
+        """读取一个读连接当前生效的 PRAGMA 值（用于诊断）"""
+        with self.read() as conn:
+            return {
+                name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in ("journal_mode", "synchronous", "cache_size", "mmap_size")
+            }
@@ -0,0 +1,227 @@
+"""历史记录孤立文件修复器
+
+替代启动时的同步目录扫描：
+1. 启动后在后台重放文件操作日志（file_journal），只处理崩溃时未完成的操作
+2. 全量目录扫描仅在显式请求时执行，按批次推进并持久化游标，可中断后恢复
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+from ....utils import app_logger
+from ...base.lifecycle_component import LifecycleComponent
+
+if TYPE_CHECKING:
+    from .history_storage_service import HistoryStorageService
+
+# maintenance_state 中保存全量扫描进度的键
+FULL_SCAN_CURSOR_KEY = "orphan_scan_cursor"
+
+
+class HistoryReconciler(LifecycleComponent):
+    """孤立文件后台修复器
+
+    日志重放规则：
+    - "write" 条目：早于本次服务启动且没有对应记录 -> 删除文件；
+      本次会话内创建的条目可能仍在录音/转录中，保持不动
+    - "delete" 条目：记录已删除但文件可能残留 -> 删除文件
+    """
+
+    # 启动后延迟重放日志，避免与应用启动争抢IO
+    INITIAL_DELAY_SECONDS = 5.0
+
+    # 全量扫描每批处理的文件数
+    SCAN_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        history_service: "HistoryStorageService",
+        initial_delay: Optional[float] = None,
+    ):
+        """初始化修复器
+
+        Args:
+            history_service: 历史记录存储服务
+            initial_delay: 日志重放延迟（秒），默认 INITIAL_DELAY_SECONDS
+        """
+        super().__init__("HistoryReconciler")
+        self._history_service = history_service
+        self._initial_delay = (
+            self.INITIAL_DELAY_SECONDS if initial_delay is None else initial_delay
+        )
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._scan_requested = threading.Event()
+        self._scan_lock = threading.Lock()
+        self._journal_replayed = threading.Event()
+
+    @property
+    def journal_replayed(self) -> threading.Event:
+        """日志重放完成事件（可用于等待后台重放结束）"""
+        return self._journal_replayed
+
+    @property
+    def has_pending_scan(self) -> bool:
+        """是否存在被中断、尚未完成的全量扫描"""
+        cursor = self._history_service.get_maintenance_value(FULL_SCAN_CURSOR_KEY)
+        return cursor is not None
+
+    def _do_start(self) -> bool:
+        """启动后台修复线程"""
+        self._stop_event.clear()
+        self._journal_replayed.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="HistoryReconciler", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _do_stop(self) -> bool:
+        """停止后台修复线程（进行中的全量扫描会在当前批次后中断）"""
+        self._stop_event.set()
+        self._scan_requested.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        return True
+
+    def request_full_scan(self) -> None:
+        """请求在后台执行一次全量目录扫描"""
+        self._history_service.set_maintenance_value(FULL_SCAN_CURSOR_KEY, "")
+        self._scan_requested.set()
+
+    def _run_loop(self) -> None:
+        """后台线程主循环"""
+        if self._stop_event.wait(self._initial_delay):
+            return
+
+        try:
+            self.replay_journal()
+        except Exception as e:
+            app_logger.log_error(e, "history_reconciler_replay")
+        finally:
+            self._journal_replayed.set()
+
+        # 上次被中断的全量扫描自动恢复
+        if self.has_pending_scan:
+            self._scan_requested.set()
+
+        while not self._stop_event.is_set():
+            self._scan_requested.wait()
+            if self._stop_event.is_set():
+                break
+            self._scan_requested.clear()
+            try:
+                self.run_full_scan()
+            except Exception as e:
+                app_logger.log_error(e, "history_reconciler_full_scan")
+
+    def replay_journal(self) -> int:
+        """重放文件操作日志，修复崩溃遗留的文件
+
+        Returns:
+            删除的文件数量
+        """
+        service = self._history_service
+        entries = service.get_journal_entries()
+        if not entries:
+            return 0
+
+        cutoff = service.session_started_at
+        stale_writes = [
+            path
+            for path, operation, created_at in entries
+            if operation == "write" and created_at < cutoff
+        ]
+        pending_deletes = [
+            path for path, operation, _ in entries if operation == "delete"
+        ]
+
+        # 有对应记录的 "write" 条目说明入库成功，仅清除日志
+        referenced = service.filter_referenced_paths(stale_writes)
+        orphans = [path for path in stale_writes if path not in referenced]
+        orphans.extend(path for path in pending_deletes if path not in referenced)
+
+        deleted_files, freed_bytes = service.unlink_audio_files(orphans)
+        service.clear_journal_entries(stale_writes + pending_deletes)
+
+        app_logger.log_audio_event(
+            "File journal replayed",
+            {
+                "entries": len(entries),
+                "stale_writes": len(stale_writes),
+                "pending_deletes": len(pending_deletes),
+                "files_deleted": deleted_files,
+                "bytes_freed": freed_bytes,
+            },
+        )
+        return deleted_files
+
+    def run_full_scan(self, restart: bool = False) -> int:
+        """执行（或恢复）全量目录扫描，删除没有对应记录的音频文件
+
+        按文件名顺序分批处理，每批完成后持久化游标；
+        调用 stop() 会在当前批次结束后中断，下次启动自动从游标继续。
+
+        Args:
+            restart: 忽略已保存的游标，从头开始扫描
+
+        Returns:
+            本次调用删除的孤立文件数量
+        """
+        service = self._history_service
+        try:
+            recordings_dir = service.get_storage_path() / "recordings"
+        except RuntimeError:
+            return 0
+
+        with self._scan_lock:
+            cursor = ""
+            if not restart:
+                cursor = service.get_maintenance_value(FULL_SCAN_CURSOR_KEY) or ""
+            try:
+                names = sorted(
+                    entry.name
+                    for entry in os.scandir(recordings_dir)
+                    if entry.name.endswith(".wav") and entry.name > cursor
+                )
+            except OSError as e:
+                app_logger.log_error(e, "history_reconciler_scan_dir")
+                return 0
+
+            # 本次会话仍在使用的路径（录音中/转录中）不视为孤立文件
+            in_flight = {
+                path
+                for path, operation, _ in service.get_journal_entries()
+                if operation == "write"
+            }
+
+            deleted_total = 0
+            completed = True
+            for start in range(0, len(names), self.SCAN_BATCH_SIZE):
+                if self._stop_event.is_set():
+                    completed = False
+                    break
+
+                batch = names[start : start + self.SCAN_BATCH_SIZE]
+                paths = [str(recordings_dir / name) for name in batch]
+                referenced = service.filter_referenced_paths(paths)
+                orphans: List[str] = [
+                    path
+                    for path in paths
+                    if path not in referenced and path not in in_flight
+                ]
+                deleted, _ = service.unlink_audio_files(orphans)
+                deleted_total += deleted
+                service.set_maintenance_value(FULL_SCAN_CURSOR_KEY, batch[-1])
+
+            if completed:
+                service.set_maintenance_value(FULL_SCAN_CURSOR_KEY, None)
+
+        app_logger.log_audio_event(
+            "Orphan full scan finished" if completed else "Orphan full scan paused",
+            {"files_scanned": len(names), "files_deleted": deleted_total},
+        )
+        return deleted_total
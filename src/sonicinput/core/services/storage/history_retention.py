@@ -0,0 +1,323 @@
+"""历史记录保留策略引擎
+
+按年龄、记录数和录音文件占用空间三种预算清理历史记录，
+并按计划执行 WAL checkpoint 与 VACUUM。作为后台任务运行。
+"""
+
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ....utils import app_logger
+from ...base.lifecycle_component import LifecycleComponent
+from ...interfaces import IConfigService
+from ...services.config import ConfigKeys
+
+if TYPE_CHECKING:
+    from .history_storage_service import HistoryStorageService
+
+
+@dataclass
+class RetentionPolicy:
+    """保留策略配置（0 表示对应预算不限制）"""
+
+    enabled: bool = True
+    max_age_days: int = 0
+    max_records: int = 0
+    max_storage_mb: int = 0
+    interval_minutes: int = 60
+    vacuum_interval_hours: int = 168
+
+    @classmethod
+    def from_config(cls, config_service: IConfigService) -> "RetentionPolicy":
+        """从配置服务读取保留策略"""
+        defaults = cls()
+        return cls(
+            enabled=bool(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_ENABLED, defaults.enabled
+                )
+            ),
+            max_age_days=int(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_MAX_AGE_DAYS, defaults.max_age_days
+                )
+                or 0
+            ),
+            max_records=int(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_MAX_RECORDS, defaults.max_records
+                )
+                or 0
+            ),
+            max_storage_mb=int(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_MAX_STORAGE_MB,
+                    defaults.max_storage_mb,
+                )
+                or 0
+            ),
+            interval_minutes=int(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_INTERVAL_MINUTES,
+                    defaults.interval_minutes,
+                )
+                or defaults.interval_minutes
+            ),
+            vacuum_interval_hours=int(
+                config_service.get_setting(
+                    ConfigKeys.HISTORY_RETENTION_VACUUM_INTERVAL_HOURS,
+                    defaults.vacuum_interval_hours,
+                )
+                or 0
+            ),
+        )
+
+    @property
+    def has_budget(self) -> bool:
+        """是否配置了任何删除预算"""
+        return self.max_age_days > 0 or self.max_records > 0 or self.max_storage_mb > 0
+
+
+@dataclass
+class RetentionReport:
+    """单次保留策略执行结果"""
+
+    started_at: float
+    duration: float = 0.0
+    expired_by_age: int = 0
+    expired_by_count: int = 0
+    expired_by_size: int = 0
+    records_deleted: int = 0
+    files_deleted: int = 0
+    audio_bytes_freed: int = 0
+    db_bytes_before: int = 0
+    db_bytes_after: int = 0
+    wal_checkpointed: bool = False
+    vacuumed: bool = False
+
+    @property
+    def db_bytes_reclaimed(self) -> int:
+        """数据库文件（含WAL）回收的字节数"""
+        return max(0, self.db_bytes_before - self.db_bytes_after)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（用于日志和事件）"""
+        data = asdict(self)
+        data["db_bytes_reclaimed"] = self.db_bytes_reclaimed
+        return data
+
+
+class HistoryRetentionManager(LifecycleComponent):
+    """历史记录保留策略管理器
+
+    后台线程按 interval_minutes 周期执行 run_once()：
+    1. 根据年龄/数量/空间预算选出待删除记录
+    2. 单事务批量删除数据库行，再批量删除音频文件
+    3. 按 vacuum_interval_hours 执行 VACUUM，每次执行 WAL checkpoint
+    """
+
+    # 启动后首次执行的延迟，避免与应用启动争抢IO
+    INITIAL_DELAY_SECONDS = 60.0
+
+    def __init__(
+        self,
+        history_service: "HistoryStorageService",
+        config_service: Optional[IConfigService] = None,
+        policy: Optional[RetentionPolicy] = None,
+        initial_delay: Optional[float] = None,
+    ):
+        """初始化保留策略管理器
+
+        Args:
+            history_service: 历史记录存储服务
+            config_service: 配置服务（用于每次执行前刷新策略）
+            policy: 固定策略（优先于配置服务）
+            initial_delay: 首次执行延迟（秒），默认 INITIAL_DELAY_SECONDS
+        """
+        super().__init__("HistoryRetentionManager")
+        self._history_service = history_service
+        self._config_service = config_service
+        self._fixed_policy = policy
+        self._initial_delay = (
+            self.INITIAL_DELAY_SECONDS if initial_delay is None else initial_delay
+        )
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._run_lock = threading.Lock()
+        self._last_vacuum_at: Optional[float] = None
+        self._last_report: Optional[RetentionReport] = None
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        """当前生效的保留策略"""
+        if self._fixed_policy is not None:
+            return self._fixed_policy
+        if self._config_service is not None:
+            return RetentionPolicy.from_config(self._config_service)
+        return RetentionPolicy()
+
+    @property
+    def last_report(self) -> Optional[RetentionReport]:
+        """最近一次执行的报告"""
+        return self._last_report
+
+    def _do_start(self) -> bool:
+        """启动后台保留任务线程"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="HistoryRetention", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _do_stop(self) -> bool:
+        """停止后台保留任务线程"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        return True
+
+    def _run_loop(self) -> None:
+        """后台线程主循环"""
+        delay = self._initial_delay
+        while not self._stop_event.wait(delay):
+            policy = self.policy
+            if policy.enabled:
+                try:
+                    self.run_once(policy)
+                except Exception as e:
+                    app_logger.log_error(e, "history_retention_run")
+            delay = max(1, policy.interval_minutes) * 60.0
+
+    def run_once(
+        self, policy: Optional[RetentionPolicy] = None, force_vacuum: bool = False
+    ) -> RetentionReport:
+        """执行一次保留策略
+
+        Args:
+            policy: 使用的策略，默认读取当前策略
+            force_vacuum: 忽略计划，强制执行 VACUUM
+
+        Returns:
+            本次执行的回收报告
+        """
+        policy = policy or self.policy
+        service = self._history_service
+
+        with self._run_lock:
+            report = RetentionReport(started_at=time.time())
+            report.db_bytes_before = service.get_database_size()
+
+            if policy.has_budget:
+                record_ids = self._select_expired(policy, report)
+                if record_ids:
+                    deleted, files, freed = service.purge_records(record_ids)
+                    report.records_deleted = deleted
+                    report.files_deleted = files
+                    report.audio_bytes_freed = freed
+
+            vacuum_due = (
+                policy.vacuum_interval_hours > 0
+                and time.time() - self._get_last_vacuum_at()
+                >= policy.vacuum_interval_hours * 3600
+            )
+            if force_vacuum or vacuum_due:
+                report.vacuumed = service.vacuum()
+                if report.vacuumed:
+                    self._mark_vacuumed()
+
+            # VACUUM 在 WAL 模式下也会写入 WAL，因此最后统一 checkpoint
+            report.wal_checkpointed = service.checkpoint_wal()
+
+            report.db_bytes_after = service.get_database_size()
+            report.duration = time.time() - report.started_at
+            self._last_report = report
+
+        app_logger.log_audio_event("History retention completed", report.to_dict())
+        return report
+
+    def _vacuum_marker(self) -> Optional[Path]:
+        """VACUUM 时间标记文件（跨进程重启保留上次执行时间）"""
+        try:
+            return self._history_service.get_storage_path() / ".last_vacuum"
+        except RuntimeError:
+            return None
+
+    def _get_last_vacuum_at(self) -> float:
+        """获取上次 VACUUM 时间，没有记录时以当前时间为起点"""
+        if self._last_vacuum_at is None:
+            marker = self._vacuum_marker()
+            try:
+                self._last_vacuum_at = marker.stat().st_mtime  # type: ignore[union-attr]
+            except (AttributeError, OSError):
+                self._mark_vacuumed()
+        return self._last_vacuum_at
+
+    def _mark_vacuumed(self) -> None:
+        """记录 VACUUM 完成时间"""
+        self._last_vacuum_at = time.time()
+        marker = self._vacuum_marker()
+        if marker is not None:
+            try:
+                marker.touch()
+            except OSError as e:
+                app_logger.log_error(e, "history_retention_vacuum_marker")
+
+    def _select_expired(
+        self, policy: RetentionPolicy, report: RetentionReport
+    ) -> List[str]:
+        """按策略选出需要删除的记录ID（去重，保持顺序）"""
+        service = self._history_service
+        selected: Dict[str, None] = {}
+
+        if policy.max_age_days > 0:
+            cutoff = datetime.now() - timedelta(days=policy.max_age_days)
+            ids = service.get_record_ids_older_than(cutoff)
+            report.expired_by_age = len(ids)
+            selected.update(dict.fromkeys(ids))
+
+        if policy.max_records > 0:
+            ids = service.get_record_ids_beyond_count(policy.max_records)
+            report.expired_by_count = len(ids)
+            selected.update(dict.fromkeys(ids))
+
+        if policy.max_storage_mb > 0:
+            ids = self._select_over_storage_budget(policy.max_storage_mb * 1024 * 1024)
+            report.expired_by_size = len(ids)
+            selected.update(dict.fromkeys(ids))
+
+        return list(selected)
+
+    def _select_over_storage_budget(self, budget_bytes: int) -> List[str]:
+        """从最新记录开始累加文件大小，超出预算的较旧记录全部选中"""
+        service = self._history_service
+        try:
+            recordings_dir = service.get_storage_path() / "recordings"
+        except RuntimeError:
+            return []
+
+        # 一次目录扫描获取所有文件大小，避免逐条 stat
+        sizes: Dict[str, int] = {}
+        try:
+            with os.scandir(recordings_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sizes[os.path.normcase(entry.path)] = entry.stat().st_size
+        except OSError as e:
+            app_logger.log_error(e, "history_retention_scan_recordings")
+            return []
+
+        used = 0
+        expired: List[str] = []
+        for record_id, audio_path in service.get_audio_file_index():
+            used += sizes.get(os.path.normcase(audio_path or ""), 0)
+            if used > budget_bytes:
+                expired.append(record_id)
+        return expired
@@ -1,17 +1,25 @@
 """历史记录存储服务实现"""
 
+import os
 import sqlite3
 import threading
+import time
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Generator, Iterable, List, Optional, Set, Tuple
 
 from ....utils import app_logger
 from ...base.lifecycle_component import LifecycleComponent
 from ...interfaces import HistoryRecord, IConfigService
 from ...services.config import ConfigKeys
+from .connection_manager import SQLiteConnectionManager
+from .history_reconciler import HistoryReconciler
+from .history_retention import HistoryRetentionManager
+
+# 单条 SQL 中 IN (...) 参数的最大数量（低于 SQLite 默认的 999 变量上限）
+_SQL_BATCH_SIZE = 500
 
 
 class HistoryStorageService(LifecycleComponent):
@@ -31,7 +39,10 @@ class HistoryStorageService(LifecycleComponent):
         self._config_service = config_service
         self._db_path: Optional[Path] = None
         self._storage_path: Optional[Path] = None
-        self._local = threading.local()  # 线程本地存储，每个线程独立的数据库连接
+        self._connections: Optional[SQLiteConnectionManager] = None
+        self._retention_manager: Optional["HistoryRetentionManager"] = None
+        self._reconciler: Optional["HistoryReconciler"] = None
+        self._session_started_at: float = 0.0
 
     def _do_start(self) -> bool:
         """Start history storage and initialize database"""
@@ -59,18 +70,28 @@ class HistoryStorageService(LifecycleComponent):
             # 数据库路径
             self._db_path = self._storage_path / "history.db"
 
-            # 初始化数据库
+            # 打开连接（单写连接 + 只读连接池）并初始化数据库
+            self._connections = SQLiteConnectionManager(
+                self._db_path,
+                read_pool_size=self._config_service.get_setting(
+                    ConfigKeys.HISTORY_DB_READ_POOL_SIZE, 4
+                ),
+            )
+            self._connections.open()
             self._init_database()
 
             app_logger.log_audio_event("Database initialized successfully")
 
-            # 清理孤立文件
-            orphaned_count = self.cleanup_orphaned_files()
+            # 孤立文件在后台通过文件操作日志增量修复，不阻塞启动
+            self._session_started_at = time.time()
+            self._reconciler = HistoryReconciler(self)
+            self._reconciler.start()
 
-            if orphaned_count > 0:
-                app_logger.log_audio_event(
-                    "Cleaned up orphaned audio files", {"count": orphaned_count}
-                )
+            # 启动后台保留策略任务（首次执行会延迟，不阻塞启动）
+            self._retention_manager = HistoryRetentionManager(
+                self, self._config_service
+            )
+            self._retention_manager.start()
 
             app_logger.log_audio_event(
                 "HistoryStorageService started",
@@ -83,100 +104,108 @@ class HistoryStorageService(LifecycleComponent):
             return True
 
         except Exception as e:
-            app_logger.log_error(
-                e,
-                "HistoryStorageService_do_start",
-                {
-                    "storage_path_set": self._storage_path is not None,
-                    "db_path_set": self._db_path is not None,
-                },
-            )
+            app_logger.log_error(e, "HistoryStorageService_do_start")
             # Reset state on failure to ensure consistent state
+            if self._connections is not None:
+                self._connections.close()
+                self._connections = None
             self._storage_path = None
             self._db_path = None
             return False
 
     def _init_database(self) -> None:
-        """初始化数据库表（使用临时连接）"""
-        # 使用临时连接进行初始化，不保存到线程本地存储
-        conn = sqlite3.connect(str(self._db_path))
-        cursor = conn.cursor()
-
-        # 创建历史记录表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS history_records (
-                id TEXT PRIMARY KEY,
-                timestamp TEXT NOT NULL,
-                audio_file_path TEXT NOT NULL,
-                duration REAL NOT NULL,
-                transcription_text TEXT NOT NULL,
-                transcription_provider TEXT NOT NULL,
-                transcription_status TEXT NOT NULL,
-                transcription_error TEXT,
-                ai_optimized_text TEXT,
-                ai_provider TEXT,
-                ai_status TEXT NOT NULL,
-                ai_error TEXT,
-                final_text TEXT NOT NULL
-            )
-        """)
-
-        # 创建索引以提高查询性能
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp
-            ON history_records(timestamp DESC)
-        """)
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_transcription_status
-            ON history_records(transcription_status)
-        """)
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_ai_status
-            ON history_records(ai_status)
-        """)
-
-        # 启用 WAL 模式以优化并发性能
-        cursor.execute("PRAGMA journal_mode=WAL")
+        """初始化数据库表"""
+        with self._connections.write() as cursor:
+            # 创建历史记录表
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS history_records (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    audio_file_path TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    transcription_text TEXT NOT NULL,
+                    transcription_provider TEXT NOT NULL,
+                    transcription_status TEXT NOT NULL,
+                    transcription_error TEXT,
+                    ai_optimized_text TEXT,
+                    ai_provider TEXT,
+                    ai_status TEXT NOT NULL,
+                    ai_error TEXT,
+                    final_text TEXT NOT NULL
+                )
+            """)
+
+            # 创建索引以提高查询性能
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_timestamp
+                ON history_records(timestamp DESC)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transcription_status
+                ON history_records(transcription_status)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ai_status
+                ON history_records(ai_status)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_audio_file_path
+                ON history_records(audio_file_path)
+            """)
+
+            # 文件操作日志：记录尚未与数据库行对齐的文件操作，崩溃后据此增量修复
+            # operation: "write"（已分配路径但记录未入库）| "delete"（记录已删除但文件未删除）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS file_journal (
+                    path TEXT PRIMARY KEY,
+                    operation TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
 
-        conn.commit()
-        conn.close()  # 关闭临时连接
+            # 维护任务状态（例如可恢复全量扫描的游标）
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS maintenance_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
 
-        app_logger.log_audio_event("History database initialized", {"wal_mode": True})
+        app_logger.log_audio_event(
+            "History database initialized",
+            {"wal_mode": True, **self._connections.get_pragmas()},
+        )
 
     def _do_stop(self) -> bool:
         """Stop history storage and clean up resources"""
-        # 关闭当前线程的数据库连接
-        if hasattr(self._local, "conn") and self._local.conn is not None:
+        if self._retention_manager is not None:
+            self._retention_manager.stop()
+            self._retention_manager = None
+        if self._reconciler is not None:
+            self._reconciler.stop()
+            self._reconciler = None
+
+        # 关闭所有线程借用过的连接（不仅是调用 stop() 的线程）
+        if self._connections is not None:
             try:
-                self._local.conn.close()
-                self._local.conn = None
-                app_logger.log_audio_event(
-                    "Thread-local DB connection closed",
-                    {"thread_id": threading.get_ident()},
-                )
+                self._connections.close()
             except Exception as e:
                 app_logger.log_error(e, "close_database_connection_on_stop")
                 return False
+            finally:
+                self._connections = None
         return True
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """获取当前线程的数据库连接（线程安全）
-
-        Returns:
-            当前线程的 SQLite 连接对象
-        """
-        if not hasattr(self._local, "conn") or self._local.conn is None:
-            self._local.conn = sqlite3.connect(str(self._db_path))
-            self._local.conn.row_factory = sqlite3.Row  # 启用列名访问
-
-            app_logger.log_audio_event(
-                "Thread-local DB connection created",
-                {"thread_id": threading.get_ident()},
-            )
-
-        return self._local.conn
+    @contextmanager
+    def _read(self) -> Generator[sqlite3.Connection, None, None]:
+        """借用只读连接（当前线程处于写事务中时返回写连接）"""
+        if self._connections is None:
+            raise sqlite3.ProgrammingError("History database is not open")
+        with self._connections.read() as conn:
+            yield conn
 
     @contextmanager
     def _transaction(self) -> Generator[sqlite3.Cursor, None, None]:
@@ -195,43 +224,26 @@ class HistoryStorageService(LifecycleComponent):
             # Automatic commit on success, rollback on exception
 
         Thread Safety:
-            Uses thread-local connection from _get_connection()
+            Writes are serialized on the single writer connection; nested
+            calls on the same thread join the outer transaction
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if self._connections is None:
+            raise sqlite3.ProgrammingError("History database is not open")
 
         try:
-            yield cursor
-            conn.commit()
+            with self._connections.write() as cursor:
+                yield cursor
             app_logger.log_audio_event(
                 "Database transaction committed", {"thread_id": threading.get_ident()}
             )
         except sqlite3.IntegrityError as e:
-            conn.rollback()
-            app_logger.log_error(
-                e,
-                "database_integrity_error",
-                {"thread_id": threading.get_ident(), "error_type": "IntegrityError"},
-            )
+            app_logger.log_error(e, "database_integrity_error")
             raise
         except sqlite3.OperationalError as e:
-            conn.rollback()
-            app_logger.log_error(
-                e,
-                "database_operational_error",
-                {"thread_id": threading.get_ident(), "error_type": "OperationalError"},
-            )
+            app_logger.log_error(e, "database_operational_error")
             raise
         except Exception as e:
-            conn.rollback()
-            app_logger.log_error(
-                e,
-                "database_transaction_error",
-                {
-                    "thread_id": threading.get_ident(),
-                    "error_type": type(e).__name__,
-                },
-            )
+            app_logger.log_error(e, "database_transaction_error")
             raise
 
     def save_record(self, record: HistoryRecord) -> bool:
@@ -277,6 +289,10 @@ class HistoryStorageService(LifecycleComponent):
                         record.final_text,
                     ),
                 )
+                cursor.execute(
+                    "DELETE FROM file_journal WHERE path = ?",
+                    (record.audio_file_path,),
+                )
 
             app_logger.log_audio_event(
                 "History record saved",
@@ -399,6 +415,11 @@ class HistoryStorageService(LifecycleComponent):
                     )
                     saved_count += 1
 
+                cursor.executemany(
+                    "DELETE FROM file_journal WHERE path = ?",
+                    [(record.audio_file_path,) for record in records],
+                )
+
             app_logger.log_audio_event(
                 "Batch records saved",
                 {
@@ -410,11 +431,68 @@ class HistoryStorageService(LifecycleComponent):
             return saved_count
 
         except Exception as e:
-            app_logger.log_error(
-                e, "save_records_batch", {"attempted_count": len(records)}
-            )
+            app_logger.log_error(e, "save_records_batch")
             return 0
 
+    def update_records_batch(self, records: List[HistoryRecord]) -> List[str]:
+        """Update multiple records in a single transaction
+
+        Only the transcription / AI result columns are written, so concurrent
+        edits to other columns are preserved.
+
+        Args:
+            records: List of HistoryRecord objects with updated fields
+
+        Returns:
+            IDs of the records that still existed and were updated
+        """
+        if not records:
+            return []
+
+        try:
+            with self._transaction() as cursor:
+                updated_ids: List[str] = []
+                for record in records:
+                    cursor.execute(
+                        """
+                        UPDATE history_records
+                        SET transcription_text = ?,
+                            transcription_provider = ?,
+                            transcription_status = ?,
+                            transcription_error = ?,
+                            ai_optimized_text = ?,
+                            ai_provider = ?,
+                            ai_status = ?,
+                            ai_error = ?,
+                            final_text = ?
+                        WHERE id = ?
+                    """,
+                        (
+                            record.transcription_text,
+                            record.transcription_provider,
+                            record.transcription_status,
+                            record.transcription_error,
+                            record.ai_optimized_text,
+                            record.ai_provider,
+                            record.ai_status,
+                            record.ai_error,
+                            record.final_text,
+                            record.id,
+                        ),
+                    )
+                    if cursor.rowcount:
+                        updated_ids.append(record.id)
+
+            app_logger.log_audio_event(
+                "Batch records updated",
+                {"count": len(updated_ids), "total_records": len(records)},
+            )
+            return updated_ids
+
+        except Exception as e:
+            app_logger.log_error(e, "update_records_batch")
+            raise
+
     def get_record_by_id(self, record_id: str) -> Optional[HistoryRecord]:
         """根据ID获取单条记录（线程安全）"""
         if not self._db_path:
@@ -425,15 +503,17 @@ class HistoryStorageService(LifecycleComponent):
             return None
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM history_records WHERE id = ?", (record_id,))
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM history_records WHERE id = ?", (record_id,)
+                )
 
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_record(row)
+                row = cursor.fetchone()
+                if row:
+                    return self._row_to_record(row)
 
-            return None
+                return None
 
         except Exception as e:
             app_logger.log_error(e, "get_record_by_id")
@@ -451,39 +531,79 @@ class HistoryStorageService(LifecycleComponent):
             return []
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._read() as conn:
+                cursor = conn.cursor()
 
-            # 验证order_by以防止SQL注入
-            allowed_fields = [
-                "timestamp",
-                "duration",
-                "transcription_status",
-                "ai_status",
-            ]
-            allowed_orders = ["ASC", "DESC"]
-
-            order_parts = order_by.split()
-            if (
-                len(order_parts) != 2
-                or order_parts[0] not in allowed_fields
-                or order_parts[1] not in allowed_orders
-            ):
-                order_by = "timestamp DESC"  # 默认排序
-
-            query = (
-                f"SELECT * FROM history_records ORDER BY {order_by} LIMIT ? OFFSET ?"
-            )
+                # 验证order_by以防止SQL注入
+                allowed_fields = [
+                    "timestamp",
+                    "duration",
+                    "transcription_status",
+                    "ai_status",
+                ]
+                allowed_orders = ["ASC", "DESC"]
+
+                order_parts = order_by.split()
+                if (
+                    len(order_parts) != 2
+                    or order_parts[0] not in allowed_fields
+                    or order_parts[1] not in allowed_orders
+                ):
+                    order_by = "timestamp DESC"  # 默认排序
 
-            cursor.execute(query, (limit, offset))
+                query = f"SELECT * FROM history_records ORDER BY {order_by} LIMIT ? OFFSET ?"
 
-            rows = cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
+                cursor.execute(query, (limit, offset))
+
+                rows = cursor.fetchall()
+                return [self._row_to_record(row) for row in rows]
 
         except Exception as e:
             app_logger.log_error(e, "get_records")
             return []
 
+    def get_records_after(
+        self, after: Optional[Tuple[str, str]] = None, limit: int = 500
+    ) -> List[HistoryRecord]:
+        """按 (timestamp, id) 升序做键集分页（线程安全）
+
+        与 OFFSET 分页不同，新插入的记录不会导致已遍历的页发生偏移，
+        适合长时间运行的批处理和导出。
+
+        Args:
+            after: 上一页最后一条记录的 (timestamp_iso, id)，None 表示从头开始
+            limit: 每页数量
+
+        Returns:
+            记录列表
+        """
+        if not self._db_path:
+            return []
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                if after is None:
+                    cursor.execute(
+                        "SELECT * FROM history_records "
+                        "ORDER BY timestamp ASC, id ASC LIMIT ?",
+                        (limit,),
+                    )
+                else:
+                    # 外层 timestamp >= ? 让 idx_timestamp 做范围查找；
+                    # 写成 a > x OR (a = x AND ...) 时规划器会扫描整个索引
+                    cursor.execute(
+                        "SELECT * FROM history_records "
+                        "WHERE timestamp >= ? AND (timestamp > ? OR id > ?) "
+                        "ORDER BY timestamp ASC, id ASC LIMIT ?",
+                        (after[0], after[0], after[1], limit),
+                    )
+                return [self._row_to_record(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            app_logger.log_error(e, "get_records_after")
+            return []
+
     @staticmethod
     def _escape_like_pattern(value: str) -> str:
         """Escape LIKE wildcards so user queries behave like literal substring search."""
@@ -508,55 +628,55 @@ class HistoryStorageService(LifecycleComponent):
             return []
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # 构建查询条件
-            conditions = []
-            params = []
-
-            if query:
-                normalized_query = query.strip().lower()
-                if normalized_query:
-                    escaped_query = self._escape_like_pattern(normalized_query)
-                    search_term = f"%{escaped_query}%"
-                    conditions.append(
-                        "("
-                        "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(final_text) LIKE ? ESCAPE '\\'"
-                        ")"
-                    )
-                    params.extend([search_term, search_term, search_term])
+            with self._read() as conn:
+                cursor = conn.cursor()
+
+                # 构建查询条件
+                conditions = []
+                params = []
+
+                if query:
+                    normalized_query = query.strip().lower()
+                    if normalized_query:
+                        escaped_query = self._escape_like_pattern(normalized_query)
+                        search_term = f"%{escaped_query}%"
+                        conditions.append(
+                            "("
+                            "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(final_text) LIKE ? ESCAPE '\\'"
+                            ")"
+                        )
+                        params.extend([search_term, search_term, search_term])
 
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
+                if start_date:
+                    conditions.append("timestamp >= ?")
+                    params.append(start_date.isoformat())
 
-            if end_date:
-                conditions.append("timestamp <= ?")
-                params.append(end_date.isoformat())
+                if end_date:
+                    conditions.append("timestamp <= ?")
+                    params.append(end_date.isoformat())
 
-            if transcription_status:
-                conditions.append("transcription_status = ?")
-                params.append(transcription_status)
+                if transcription_status:
+                    conditions.append("transcription_status = ?")
+                    params.append(transcription_status)
 
-            if ai_status:
-                conditions.append("ai_status = ?")
-                params.append(ai_status)
+                if ai_status:
+                    conditions.append("ai_status = ?")
+                    params.append(ai_status)
 
-            # 构建完整查询
-            sql = "SELECT * FROM history_records"
-            if conditions:
-                sql += " WHERE " + " AND ".join(conditions)
-            sql += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+                # 构建完整查询
+                sql = "SELECT * FROM history_records"
+                if conditions:
+                    sql += " WHERE " + " AND ".join(conditions)
+                sql += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
 
-            params.extend([limit, offset])
+                params.extend([limit, offset])
 
-            cursor.execute(sql, params)
+                cursor.execute(sql, params)
 
-            rows = cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
+                rows = cursor.fetchall()
+                return [self._row_to_record(row) for row in rows]
 
         except Exception as e:
             app_logger.log_error(e, "search_records")
@@ -564,49 +684,211 @@ class HistoryStorageService(LifecycleComponent):
 
     def delete_record(self, record_id: str) -> bool:
         """删除记录（包括音频文件）"""
+        return self.delete_records([record_id]) == 1
+
+    def delete_records(self, record_ids: List[str]) -> int:
+        """批量删除记录（单事务删除数据库行，随后批量删除音频文件）
+
+        Args:
+            record_ids: 要删除的记录ID列表
+
+        Returns:
+            实际删除的记录数量
+        """
+        deleted_count, _, _ = self.purge_records(record_ids)
+        return deleted_count
+
+    def purge_records(self, record_ids: List[str]) -> Tuple[int, int, int]:
+        """在单个事务中删除记录，并批量删除对应的音频文件
+
+        Args:
+            record_ids: 要删除的记录ID列表
+
+        Returns:
+            (deleted_records, deleted_files, freed_bytes)
+        """
+        if not self._db_path or not record_ids:
+            return (0, 0, 0)
+
+        audio_paths: List[str] = []
+        deleted_count = 0
+
         try:
-            # 获取数据库连接
-            conn = self._get_connection()
-            if not conn:
-                return False
+            with self._transaction() as cursor:
+                for start in range(0, len(record_ids), _SQL_BATCH_SIZE):
+                    batch = record_ids[start : start + _SQL_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    cursor.execute(
+                        "SELECT audio_file_path FROM history_records "
+                        f"WHERE id IN ({placeholders})",
+                        batch,
+                    )
+                    batch_paths = [row[0] for row in cursor.fetchall()]
+                    audio_paths.extend(batch_paths)
+                    cursor.execute(
+                        f"DELETE FROM history_records WHERE id IN ({placeholders})",
+                        batch,
+                    )
+                    deleted_count += cursor.rowcount
+                    self._journal_files(cursor, batch_paths, "delete")
 
-            # 先获取记录以找到音频文件路径
-            record = self.get_record_by_id(record_id)
-            if not record:
-                return False
+        except Exception as e:
+            app_logger.log_error(e, "purge_records")
+            return (0, 0, 0)
+
+        # 数据库提交成功后再删除文件，避免回滚后记录指向已删除的文件
+        # 删除完成前崩溃时，由 file_journal 中的 "delete" 条目在下次启动时补删
+        deleted_files, freed_bytes = self.unlink_audio_files(audio_paths)
+        self.clear_journal_entries(audio_paths)
+
+        app_logger.log_audio_event(
+            "History records deleted",
+            {
+                "requested": len(record_ids),
+                "deleted": deleted_count,
+                "files_deleted": deleted_files,
+                "bytes_freed": freed_bytes,
+            },
+        )
+        return (deleted_count, deleted_files, freed_bytes)
 
-            # 删除音频文件
-            audio_path = Path(record.audio_file_path)
-            if audio_path.exists():
-                audio_path.unlink()
-                app_logger.log_audio_event(
-                    "Audio file deleted", {"path": str(audio_path)}
-                )
+    @staticmethod
+    def unlink_audio_files(paths: Iterable[str]) -> Tuple[int, int]:
+        """批量删除文件
 
-            # 删除数据库记录
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM history_records WHERE id = ?", (record_id,))
-            conn.commit()
+        Args:
+            paths: 文件路径列表
+
+        Returns:
+            (deleted_files, freed_bytes)
+        """
+        deleted_files = 0
+        freed_bytes = 0
+        failed = 0
 
+        for path in paths:
+            if not path:
+                continue
+            try:
+                size = os.stat(path).st_size
+                os.unlink(path)
+                deleted_files += 1
+                freed_bytes += size
+            except FileNotFoundError:
+                continue
+            except OSError:
+                failed += 1
+
+        if failed:
             app_logger.log_audio_event(
-                "History record deleted", {"record_id": record_id}
+                "Some audio files could not be deleted", {"failed": failed}
             )
 
-            return True
+        return (deleted_files, freed_bytes)
+
+    def get_record_ids_older_than(self, cutoff: datetime) -> List[str]:
+        """获取早于指定时间的记录ID（线程安全）"""
+        if not self._db_path:
+            return []
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id FROM history_records WHERE timestamp < ?",
+                    (cutoff.isoformat(),),
+                )
+                return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            app_logger.log_error(e, "get_record_ids_older_than")
+            return []
+
+    def get_record_ids_beyond_count(self, keep: int) -> List[str]:
+        """获取保留最新 keep 条记录之外的所有记录ID（线程安全）"""
+        if not self._db_path:
+            return []
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id FROM history_records ORDER BY timestamp DESC "
+                    "LIMIT -1 OFFSET ?",
+                    (max(0, keep),),
+                )
+                return [row[0] for row in cursor.fetchall()]
 
         except Exception as e:
-            app_logger.log_error(e, "delete_record")
+            app_logger.log_error(e, "get_record_ids_beyond_count")
+            return []
+
+    def get_audio_file_index(self) -> List[Tuple[str, str]]:
+        """获取 (id, audio_file_path) 列表，按时间从新到旧排序（线程安全）"""
+        if not self._db_path:
+            return []
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id, audio_file_path FROM history_records "
+                    "ORDER BY timestamp DESC"
+                )
+                return [(row[0], row[1]) for row in cursor.fetchall()]
+
+        except Exception as e:
+            app_logger.log_error(e, "get_audio_file_index")
+            return []
+
+    def get_database_size(self) -> int:
+        """获取数据库文件（含WAL）占用的字节数"""
+        if not self._db_path:
+            return 0
+
+        total = 0
+        for suffix in ("", "-wal"):
+            try:
+                total += os.stat(f"{self._db_path}{suffix}").st_size
+            except OSError:
+                pass
+        return total
+
+    def checkpoint_wal(self) -> bool:
+        """执行 WAL checkpoint 并截断 WAL 文件
+
+        Returns:
+            True if checkpoint completed without being blocked by readers
+        """
+        if not self._db_path:
             return False
 
-    def delete_records(self, record_ids: List[str]) -> int:
-        """批量删除记录"""
-        deleted_count = 0
+        try:
+            with self._connections.writer_connection() as conn:
+                row = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+                # (busy, log_frames, checkpointed_frames)
+                return bool(row) and row[0] == 0
 
-        for record_id in record_ids:
-            if self.delete_record(record_id):
-                deleted_count += 1
+        except Exception as e:
+            app_logger.log_error(e, "checkpoint_wal")
+            return False
 
-        return deleted_count
+    def vacuum(self) -> bool:
+        """执行 VACUUM 压缩数据库文件
+
+        在写连接上执行（持有写锁，不会与进行中的写事务交错）。
+        """
+        if not self._db_path:
+            return False
+
+        try:
+            with self._connections.writer_connection() as conn:
+                conn.execute("VACUUM")
+            return True
+
+        except Exception as e:
+            app_logger.log_error(e, "vacuum_database")
+            return False
 
     def get_total_count(
         self,
@@ -625,52 +907,52 @@ class HistoryStorageService(LifecycleComponent):
             return 0
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # 构建查询条件（与search_records相同）
-            conditions = []
-            params = []
-
-            if query:
-                normalized_query = query.strip().lower()
-                if normalized_query:
-                    escaped_query = self._escape_like_pattern(normalized_query)
-                    search_term = f"%{escaped_query}%"
-                    conditions.append(
-                        "("
-                        "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(final_text) LIKE ? ESCAPE '\\'"
-                        ")"
-                    )
-                    params.extend([search_term, search_term, search_term])
+            with self._read() as conn:
+                cursor = conn.cursor()
+
+                # 构建查询条件（与search_records相同）
+                conditions = []
+                params = []
+
+                if query:
+                    normalized_query = query.strip().lower()
+                    if normalized_query:
+                        escaped_query = self._escape_like_pattern(normalized_query)
+                        search_term = f"%{escaped_query}%"
+                        conditions.append(
+                            "("
+                            "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(final_text) LIKE ? ESCAPE '\\'"
+                            ")"
+                        )
+                        params.extend([search_term, search_term, search_term])
 
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
+                if start_date:
+                    conditions.append("timestamp >= ?")
+                    params.append(start_date.isoformat())
 
-            if end_date:
-                conditions.append("timestamp <= ?")
-                params.append(end_date.isoformat())
+                if end_date:
+                    conditions.append("timestamp <= ?")
+                    params.append(end_date.isoformat())
 
-            if transcription_status:
-                conditions.append("transcription_status = ?")
-                params.append(transcription_status)
+                if transcription_status:
+                    conditions.append("transcription_status = ?")
+                    params.append(transcription_status)
 
-            if ai_status:
-                conditions.append("ai_status = ?")
-                params.append(ai_status)
+                if ai_status:
+                    conditions.append("ai_status = ?")
+                    params.append(ai_status)
 
-            # 构建完整查询
-            sql = "SELECT COUNT(*) FROM history_records"
-            if conditions:
-                sql += " WHERE " + " AND ".join(conditions)
+                # 构建完整查询
+                sql = "SELECT COUNT(*) FROM history_records"
+                if conditions:
+                    sql += " WHERE " + " AND ".join(conditions)
 
-            cursor.execute(sql, params)
+                cursor.execute(sql, params)
 
-            result = cursor.fetchone()
-            return result[0] if result else 0
+                result = cursor.fetchone()
+                return result[0] if result else 0
 
         except Exception as e:
             app_logger.log_error(e, "get_total_count")
@@ -697,123 +979,252 @@ class HistoryStorageService(LifecycleComponent):
             return (0, 0.0, 0)
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            conditions = []
-            params = []
-
-            if query:
-                normalized_query = query.strip().lower()
-                if normalized_query:
-                    escaped_query = self._escape_like_pattern(normalized_query)
-                    search_term = f"%{escaped_query}%"
-                    conditions.append(
-                        "("
-                        "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
-                        "LOWER(final_text) LIKE ? ESCAPE '\\'"
-                        ")"
-                    )
-                    params.extend([search_term, search_term, search_term])
-
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
-
-            if end_date:
-                conditions.append("timestamp <= ?")
-                params.append(end_date.isoformat())
-
-            if transcription_status:
-                conditions.append("transcription_status = ?")
-                params.append(transcription_status)
-
-            if ai_status:
-                conditions.append("ai_status = ?")
-                params.append(ai_status)
-
-            sql = """
-                SELECT
-                    COUNT(*) AS total_count,
-                    COALESCE(SUM(duration), 0) AS total_duration,
-                    COALESCE(
-                        SUM(
-                            CASE
-                                WHEN transcription_status = 'success'
-                                    AND ai_status IN ('success', 'skipped')
-                                THEN 1
-                                ELSE 0
-                            END
-                        ),
-                        0
-                    ) AS success_count
-                FROM history_records
-            """
-
-            if conditions:
-                sql += " WHERE " + " AND ".join(conditions)
-
-            cursor.execute(sql, params)
-            row = cursor.fetchone()
-            if not row:
-                return (0, 0.0, 0)
-
-            total_count = int(row[0] or 0)
-            total_duration = float(row[1] or 0.0)
-            success_count = int(row[2] or 0)
-            return (total_count, total_duration, success_count)
+            with self._read() as conn:
+                cursor = conn.cursor()
+
+                conditions = []
+                params = []
+
+                if query:
+                    normalized_query = query.strip().lower()
+                    if normalized_query:
+                        escaped_query = self._escape_like_pattern(normalized_query)
+                        search_term = f"%{escaped_query}%"
+                        conditions.append(
+                            "("
+                            "LOWER(transcription_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(ai_optimized_text) LIKE ? ESCAPE '\\' OR "
+                            "LOWER(final_text) LIKE ? ESCAPE '\\'"
+                            ")"
+                        )
+                        params.extend([search_term, search_term, search_term])
+
+                if start_date:
+                    conditions.append("timestamp >= ?")
+                    params.append(start_date.isoformat())
+
+                if end_date:
+                    conditions.append("timestamp <= ?")
+                    params.append(end_date.isoformat())
+
+                if transcription_status:
+                    conditions.append("transcription_status = ?")
+                    params.append(transcription_status)
+
+                if ai_status:
+                    conditions.append("ai_status = ?")
+                    params.append(ai_status)
+
+                sql = """
+                    SELECT
+                        COUNT(*) AS total_count,
+                        COALESCE(SUM(duration), 0) AS total_duration,
+                        COALESCE(
+                            SUM(
+                                CASE
+                                    WHEN transcription_status = 'success'
+                                        AND ai_status IN ('success', 'skipped')
+                                    THEN 1
+                                    ELSE 0
+                                END
+                            ),
+                            0
+                        ) AS success_count
+                    FROM history_records
+                """
+
+                if conditions:
+                    sql += " WHERE " + " AND ".join(conditions)
+
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+                if not row:
+                    return (0, 0.0, 0)
+
+                total_count = int(row[0] or 0)
+                total_duration = float(row[1] or 0.0)
+                success_count = int(row[2] or 0)
+                return (total_count, total_duration, success_count)
 
         except Exception as e:
             app_logger.log_error(e, "get_aggregate_stats")
             return (0, 0.0, 0)
 
+    @property
+    def retention_manager(self) -> Optional["HistoryRetentionManager"]:
+        """后台保留策略管理器（服务未启动时为None）"""
+        return self._retention_manager
+
     def get_storage_path(self) -> Path:
         """获取存储路径"""
         if not self._storage_path:
             raise RuntimeError("Storage service not initialized")
         return self._storage_path
 
+    @property
+    def reconciler(self) -> Optional["HistoryReconciler"]:
+        """后台孤立文件修复器（服务未启动时为None）"""
+        return self._reconciler
+
+    @property
+    def session_started_at(self) -> float:
+        """本次服务启动时间（早于该时间的 "write" 日志条目视为中断的写入）"""
+        return self._session_started_at
+
     def cleanup_orphaned_files(self) -> int:
-        """清理孤立的音频文件（数据库中没有对应记录的文件，线程安全）"""
+        """同步执行完整的孤立文件清理（线程安全）
+
+        先重放文件操作日志，再执行（可恢复的）全量目录扫描。
+        启动流程不再调用此方法，孤立文件由后台 HistoryReconciler 处理。
+
+        Returns:
+            删除的孤立文件数量
+        """
         if not self._storage_path:
             return 0
 
         try:
-            # 获取所有数据库中的音频文件路径
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT audio_file_path FROM history_records")
-            db_files = {row[0] for row in cursor.fetchall()}
-
-            # 获取recordings目录中的所有wav文件
-            recordings_dir = self._storage_path / "recordings"
-            if not recordings_dir.exists():
-                return 0
-
-            disk_files = list(recordings_dir.glob("*.wav"))
-
-            # 找出孤立文件并删除
-            deleted_count = 0
-            for file_path in disk_files:
-                if str(file_path) not in db_files:
-                    try:
-                        file_path.unlink()
-                        deleted_count += 1
-                        app_logger.log_audio_event(
-                            "Orphaned file deleted", {"path": str(file_path)}
-                        )
-                    except Exception as e:
-                        app_logger.log_error(
-                            e, f"delete_orphaned_file_{file_path.name}"
-                        )
-
+            reconciler = self._reconciler or HistoryReconciler(self)
+            deleted_count = reconciler.replay_journal()
+            deleted_count += reconciler.run_full_scan(restart=True)
             return deleted_count
 
         except Exception as e:
             app_logger.log_error(e, "cleanup_orphaned_files")
             return 0
 
+    @staticmethod
+    def _journal_files(
+        cursor: sqlite3.Cursor, paths: Iterable[str], operation: str
+    ) -> None:
+        """在当前事务中写入文件操作日志"""
+        now = time.time()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO file_journal (path, operation, created_at) "
+            "VALUES (?, ?, ?)",
+            [(path, operation, now) for path in paths if path],
+        )
+
+    def get_journal_entries(self) -> List[Tuple[str, str, float]]:
+        """获取所有文件操作日志条目 (path, operation, created_at)"""
+        if not self._db_path:
+            return []
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT path, operation, created_at FROM file_journal")
+                return [(row[0], row[1], row[2]) for row in cursor.fetchall()]
+
+        except Exception as e:
+            app_logger.log_error(e, "get_journal_entries")
+            return []
+
+    def clear_journal_entries(self, paths: List[str]) -> None:
+        """删除指定路径的文件操作日志条目"""
+        if not self._db_path or not paths:
+            return
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    "DELETE FROM file_journal WHERE path = ?",
+                    [(path,) for path in paths],
+                )
+
+        except Exception as e:
+            app_logger.log_error(e, "clear_journal_entries")
+
+    def filter_referenced_paths(self, paths: List[str]) -> Set[str]:
+        """返回 paths 中仍被历史记录引用的路径（线程安全）"""
+        if not self._db_path or not paths:
+            return set()
+
+        referenced: Set[str] = set()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(paths), _SQL_BATCH_SIZE):
+                batch = paths[start : start + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    "SELECT audio_file_path FROM history_records "
+                    f"WHERE audio_file_path IN ({placeholders})",
+                    batch,
+                )
+                referenced.update(row[0] for row in cursor.fetchall())
+            return referenced
+
+    def filter_existing_ids(self, record_ids: List[str]) -> Set[str]:
+        """返回 record_ids 中已存在于数据库的ID（线程安全）"""
+        if not self._db_path or not record_ids:
+            return set()
+
+        existing: Set[str] = set()
+        with self._read() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(record_ids), _SQL_BATCH_SIZE):
+                batch = record_ids[start : start + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(
+                    f"SELECT id FROM history_records WHERE id IN ({placeholders})",
+                    batch,
+                )
+                existing.update(row[0] for row in cursor.fetchall())
+            return existing
+
+    def journal_pending_files(self, paths: List[str]) -> None:
+        """登记尚未入库的音频文件（如导入时解包的文件）
+
+        记录入库时日志条目自动清除；若进程在此之前退出，
+        下次启动时由 HistoryReconciler 清理这些文件。
+        """
+        if not paths:
+            return
+        try:
+            with self._transaction() as cursor:
+                self._journal_files(cursor, paths, "write")
+        except Exception as e:
+            app_logger.log_error(e, "journal_pending_files")
+
+    def get_maintenance_value(self, key: str) -> Optional[str]:
+        """读取维护任务状态值"""
+        if not self._db_path:
+            return None
+
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT value FROM maintenance_state WHERE key = ?", (key,)
+                )
+                row = cursor.fetchone()
+                return row[0] if row else None
+
+        except Exception as e:
+            app_logger.log_error(e, "get_maintenance_value")
+            return None
+
+    def set_maintenance_value(self, key: str, value: Optional[str]) -> None:
+        """写入维护任务状态值（None 表示删除）"""
+        if not self._db_path:
+            return
+
+        try:
+            with self._transaction() as cursor:
+                if value is None:
+                    cursor.execute(
+                        "DELETE FROM maintenance_state WHERE key = ?", (key,)
+                    )
+                else:
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO maintenance_state (key, value) "
+                        "VALUES (?, ?)",
+                        (key, value),
+                    )
+
+        except Exception as e:
+            app_logger.log_error(e, "set_maintenance_value")
+
     def generate_audio_file_path(self) -> str:
         """生成新的音频文件路径
 
@@ -829,7 +1240,16 @@ class HistoryStorageService(LifecycleComponent):
         filename = f"{timestamp}_{unique_id}.wav"
 
         recordings_dir = self._storage_path / "recordings"
-        return str(recordings_dir / filename)
+        audio_file_path = str(recordings_dir / filename)
+
+        # 记录待写入文件，若在记录入库前崩溃，下次启动时据此清理
+        try:
+            with self._transaction() as cursor:
+                self._journal_files(cursor, [audio_file_path], "write")
+        except Exception as e:
+            app_logger.log_error(e, "journal_audio_file_path")
+
+        return audio_file_path
 
     def _row_to_record(self, row: sqlite3.Row) -> HistoryRecord:
         """将数据库行转换为HistoryRecord对象"""
@@ -0,0 +1,393 @@
+"""历史记录批量导出/导入
+
+流式处理，内存占用与记录数无关：
+- 导出：键集分页读取记录，逐行写入 JSONL 或 CSV；可选将音频文件
+  顺序写入 tar 包（文件名以 .gz 结尾时使用 gzip 压缩）
+- 导入：逐行解析，攒够一批后通过 save_records_batch 单事务写入；
+  音频 tar 包以流模式顺序解包到 recordings 目录
+"""
+
+import csv
+import json
+import os
+import tarfile
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+from ....utils import app_logger
+from ...interfaces import HistoryRecord
+
+if TYPE_CHECKING:
+    from .history_storage_service import HistoryStorageService
+
+PathLike = Union[str, Path]
+
+# 导出列顺序（audio_file 为音频在 tar 包中的成员名，未导出音频时为空）
+RECORD_FIELDS = [f.name for f in fields(HistoryRecord)]
+EXPORT_FIELDS = RECORD_FIELDS + ["audio_file"]
+
+# CSV 中以空字符串表示 None 的可选字段
+_OPTIONAL_FIELDS = {
+    "transcription_error",
+    "ai_optimized_text",
+    "ai_provider",
+    "ai_error",
+}
+
+# tar 包中音频文件所在目录
+AUDIO_ARCHIVE_DIR = "recordings"
+
+SUPPORTED_FORMATS = ("jsonl", "csv")
+
+
+@dataclass
+class TransferReport:
+    """导出/导入结果"""
+
+    records: int = 0
+    audio_files: int = 0
+    audio_bytes: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    duration: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.duration if self.duration > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（用于日志和基准输出）"""
+        data = asdict(self)
+        data["records_per_second"] = round(self.records_per_second, 1)
+        return data
+
+
+def _resolve_format(path: PathLike, fmt: Optional[str]) -> str:
+    """根据参数或文件扩展名确定格式"""
+    fmt = (fmt or Path(path).suffix.lstrip(".")).lower()
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported history format: {fmt!r} (expected one of {SUPPORTED_FORMATS})"
+        )
+    return fmt
+
+
+def _tar_mode(path: PathLike, write: bool) -> str:
+    gz = str(path).endswith((".gz", ".tgz"))
+    if write:
+        return "w:gz" if gz else "w"
+    return "r|gz" if gz else "r|"
+
+
+class HistoryExporter:
+    """历史记录流式导出器"""
+
+    def __init__(self, history_service: "HistoryStorageService", page_size: int = 1000):
+        """初始化导出器
+
+        Args:
+            history_service: 历史记录存储服务
+            page_size: 每次从数据库读取的记录数
+        """
+        self._history_service = history_service
+        self._page_size = max(1, page_size)
+
+    def iter_records(self) -> Iterator[HistoryRecord]:
+        """按时间升序逐条产出所有记录（键集分页，内存占用恒定）"""
+        after = None
+        while True:
+            records = self._history_service.get_records_after(after, self._page_size)
+            if not records:
+                return
+            yield from records
+            last = records[-1]
+            after = (last.timestamp.isoformat(), last.id)
+
+    def export_records(
+        self,
+        target: PathLike,
+        fmt: Optional[str] = None,
+        audio_archive: Optional[PathLike] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> TransferReport:
+        """导出全部历史记录
+
+        Args:
+            target: 输出文件路径（.jsonl 或 .csv）
+            fmt: 格式（"jsonl" | "csv"），默认按扩展名判断
+            audio_archive: 音频 tar 包路径（可选，.tar 或 .tar.gz）
+            progress_callback: 进度回调，参数为已导出记录数
+
+        Returns:
+            导出结果
+        """
+        fmt = _resolve_format(target, fmt)
+        report = TransferReport()
+        start = time.perf_counter()
+
+        tar = (
+            tarfile.open(audio_archive, _tar_mode(audio_archive, write=True))
+            if audio_archive
+            else None
+        )
+        try:
+            with open(target, "w", encoding="utf-8", newline="") as out:
+                writer = None
+                if fmt == "csv":
+                    writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+                    writer.writeheader()
+
+                for record in self.iter_records():
+                    row = self._record_to_row(record)
+                    if tar is not None:
+                        row["audio_file"] = self._add_audio(tar, record, report)
+
+                    if writer is not None:
+                        writer.writerow(
+                            {k: "" if v is None else v for k, v in row.items()}
+                        )
+                    else:
+                        out.write(json.dumps(row, ensure_ascii=False))
+                        out.write("\n")
+
+                    report.records += 1
+                    if progress_callback and report.records % self._page_size == 0:
+                        progress_callback(report.records)
+        finally:
+            if tar is not None:
+                tar.close()
+
+        report.duration = time.perf_counter() - start
+        if progress_callback:
+            progress_callback(report.records)
+
+        app_logger.log_audio_event(
+            "History exported",
+            {"target": str(target), "format": fmt, **report.to_dict()},
+        )
+        return report
+
+    @staticmethod
+    def _record_to_row(record: HistoryRecord) -> Dict[str, Any]:
+        row: Dict[str, Any] = {name: getattr(record, name) for name in RECORD_FIELDS}
+        row["timestamp"] = record.timestamp.isoformat()
+        row["audio_file"] = None
+        return row
+
+    @staticmethod
+    def _add_audio(
+        tar: tarfile.TarFile, record: HistoryRecord, report: TransferReport
+    ) -> Optional[str]:
+        """将记录的音频写入 tar 包，返回成员名（文件缺失时返回 None）"""
+        path = record.audio_file_path
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        member = f"{AUDIO_ARCHIVE_DIR}/{os.path.basename(path)}"
+        tar.add(path, arcname=member, recursive=False)
+        report.audio_files += 1
+        report.audio_bytes += stat.st_size
+        return member
+
+
+class HistoryImporter:
+    """历史记录流式导入器"""
+
+    def __init__(
+        self, history_service: "HistoryStorageService", batch_size: int = 5000
+    ):
+        """初始化导入器
+
+        Args:
+            history_service: 历史记录存储服务
+            batch_size: 单个事务写入的记录数
+        """
+        self._history_service = history_service
+        self._batch_size = max(1, batch_size)
+
+    def import_records(
+        self,
+        source: PathLike,
+        fmt: Optional[str] = None,
+        audio_archive: Optional[PathLike] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> TransferReport:
+        """导入历史记录
+
+        已存在的记录ID会被跳过（计入 duplicates），无法解析的行计入 invalid。
+
+        Args:
+            source: 输入文件路径（.jsonl 或 .csv）
+            fmt: 格式（"jsonl" | "csv"），默认按扩展名判断
+            audio_archive: 导出时生成的音频 tar 包（可选）
+            progress_callback: 进度回调，参数为已导入记录数
+
+        Returns:
+            导入结果
+        """
+        fmt = _resolve_format(source, fmt)
+        report = TransferReport()
+        start = time.perf_counter()
+
+        recordings_dir = self._history_service.get_storage_path() / "recordings"
+        if audio_archive:
+            self._extract_audio(audio_archive, recordings_dir, report)
+
+        batch: List[HistoryRecord] = []
+        with open(source, "r", encoding="utf-8", newline="") as src:
+            rows = self._iter_csv(src) if fmt == "csv" else self._iter_jsonl(src)
+            for row in rows:
+                record = self._row_to_record(row, recordings_dir)
+                if record is None:
+                    report.invalid += 1
+                    continue
+                batch.append(record)
+                if len(batch) >= self._batch_size:
+                    self._flush(batch, report)
+                    batch = []
+                    if progress_callback:
+                        progress_callback(report.records)
+        self._flush(batch, report)
+
+        report.duration = time.perf_counter() - start
+        if progress_callback:
+            progress_callback(report.records)
+
+        app_logger.log_audio_event(
+            "History imported",
+            {"source": str(source), "format": fmt, **report.to_dict()},
+        )
+        return report
+
+    def _flush(self, batch: List[HistoryRecord], report: TransferReport) -> None:
+        """跳过已存在及批内重复的ID后单事务写入"""
+        if not batch:
+            return
+
+        existing = self._history_service.filter_existing_ids([r.id for r in batch])
+        seen: Set[str] = set(existing)
+        new_records = []
+        for record in batch:
+            if record.id in seen:
+                report.duplicates += 1
+                continue
+            seen.add(record.id)
+            new_records.append(record)
+
+        if new_records:
+            saved = self._history_service.save_records_batch(new_records)
+            if saved != len(new_records):
+                raise RuntimeError(
+                    f"Failed to save imported history batch ({len(new_records)} records)"
+                )
+            report.records += saved
+
+    def _extract_audio(
+        self, archive: PathLike, recordings_dir: Path, report: TransferReport
+    ) -> None:
+        """以流模式解包音频，只接受 recordings/ 下的普通文件"""
+        recordings_dir.mkdir(parents=True, exist_ok=True)
+        extracted: List[str] = []
+
+        with tarfile.open(archive, _tar_mode(archive, write=False)) as tar:
+            for member in tar:
+                name = os.path.basename(member.name)
+                if (
+                    not member.isfile()
+                    or member.name != f"{AUDIO_ARCHIVE_DIR}/{name}"
+                    or not name
+                ):
+                    continue
+
+                target = recordings_dir / name
+                if target.exists():
+                    continue
+
+                fileobj = tar.extractfile(member)
+                if fileobj is None:
+                    continue
+                with fileobj, open(target, "wb") as out:
+                    while True:
+                        chunk = fileobj.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                extracted.append(str(target))
+                report.audio_files += 1
+                report.audio_bytes += member.size
+
+                # 解包的文件在对应记录入库前登记到文件日志，
+                # 导入中断或记录重复时由日志重放清理
+                if len(extracted) >= self._batch_size:
+                    self._history_service.journal_pending_files(extracted)
+                    extracted = []
+
+        self._history_service.journal_pending_files(extracted)
+
+    @staticmethod
+    def _iter_jsonl(src) -> Iterator[Optional[Dict[str, Any]]]:
+        for line in src:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield None
+                continue
+            yield row if isinstance(row, dict) else None
+
+    @staticmethod
+    def _iter_csv(src) -> Iterator[Optional[Dict[str, Any]]]:
+        for row in csv.DictReader(src):
+            yield {
+                key: (None if value == "" and key in _OPTIONAL_FIELDS else value)
+                for key, value in row.items()
+            }
+
+    @staticmethod
+    def _row_to_record(
+        row: Optional[Dict[str, Any]], recordings_dir: Path
+    ) -> Optional[HistoryRecord]:
+        if not row:
+            return None
+        try:
+            audio_file = row.get("audio_file")
+            audio_file_path = row.get("audio_file_path") or ""
+            if audio_file:
+                audio_file_path = str(recordings_dir / os.path.basename(audio_file))
+
+            return HistoryRecord(
+                id=str(row["id"]),
+                timestamp=datetime.fromisoformat(row["timestamp"]),
+                audio_file_path=audio_file_path,
+                duration=float(row.get("duration") or 0.0),
+                transcription_text=row.get("transcription_text") or "",
+                transcription_provider=row.get("transcription_provider") or "",
+                transcription_status=row.get("transcription_status") or "success",
+                transcription_error=row.get("transcription_error"),
+                ai_optimized_text=row.get("ai_optimized_text"),
+                ai_provider=row.get("ai_provider"),
+                ai_status=row.get("ai_status") or "pending",
+                ai_error=row.get("ai_error"),
+                final_text=row.get("final_text") or "",
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
@@ -3,12 +3,19 @@
 支持两种流式模式：
 - chunked: 30秒分块处理模式（带AI优化）
 - realtime: 边到边流式转录模式（利用sherpa-onnx流式API）
+
+chunked 模式的块队列：
+- 待取块保存在 deque 中，get_next_chunk 在条件变量上阻塞等待，不再轮询
+- 未完成的块按 ID 索引，complete_chunk / get_chunk_result 为 O(1) 查找
+- 自有内存的音频数组（录音器每次交出的都是新数组）零拷贝接管并设为只读，
+  只有视图（借用他人缓冲区）才复制
 """
 
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Deque, Dict, List, Literal, Optional
 
 import numpy as np
 
@@ -29,6 +36,8 @@ class StreamingChunk:
     timestamp: float
     result_event: threading.Event
     result_container: Dict[str, Any]
+    # 被 get_next_chunk 取走的时间（None 表示仍在队列中）
+    picked_up_at: Optional[float] = None
 
 
 class StreamingCoordinator(LifecycleComponent):
@@ -60,15 +69,21 @@ class StreamingCoordinator(LifecycleComponent):
         self._streaming_mode_type: StreamingMode = streaming_mode
         self._streaming_active = False
         self._streaming_lock = threading.RLock()
+        # 有新块或流式结束时通知 get_next_chunk 的等待者
+        self._chunk_available = threading.Condition(self._streaming_lock)
 
         # chunked 模式：流式块管理
         with self._streaming_lock:
-            self._streaming_chunks: List[StreamingChunk] = []
+            # 等待处理的块（按加入顺序）
+            self._streaming_chunks: Deque[StreamingChunk] = deque()
+            # 所有尚未完成的块（包括已被取走、正在处理的块）
+            self._chunks_by_id: Dict[int, StreamingChunk] = {}
             self._next_chunk_id = 0
 
         # realtime 模式：流式会话管理
         self._realtime_session = None
         self._realtime_partial_text = ""
+        self._realtime_segments: List[Dict[str, Any]] = []
         self._realtime_last_update = time.time()
 
         # 流式统计
@@ -79,6 +94,9 @@ class StreamingCoordinator(LifecycleComponent):
             "failed_chunks": 0,
             "total_audio_duration": 0.0,
             "average_chunk_time": 0.0,
+            "average_wait_time": 0.0,  # 块从加入到被取走的平均等待时间
+            "max_wait_time": 0.0,
+            "picked_chunks": 0,
             "realtime_updates": 0,  # realtime 模式统计
         }
 
@@ -122,7 +140,9 @@ class StreamingCoordinator(LifecycleComponent):
             # 清理所有资源
             with self._streaming_lock:
                 self._streaming_chunks.clear()
+                self._chunks_by_id.clear()
                 self._realtime_session = None
+                self._chunk_available.notify_all()
 
             app_logger.log_audio_event(
                 "StreamingCoordinator lifecycle stopped",
@@ -152,6 +172,7 @@ class StreamingCoordinator(LifecycleComponent):
             if self._streaming_mode_type == "realtime":
                 self._realtime_session = streaming_session
                 self._realtime_partial_text = ""
+                self._realtime_segments = []
                 self._realtime_last_update = time.time()
 
             app_logger.log_audio_event(
@@ -169,22 +190,26 @@ class StreamingCoordinator(LifecycleComponent):
         Returns:
             流式转录统计信息
         """
+        session = None
         with self._streaming_lock:
             if not self._streaming_active:
                 return self._get_stats()
 
             self._streaming_active = False
 
+            # 唤醒等待新块的消费者
+            self._chunk_available.notify_all()
+
             # chunked 模式：处理剩余的块
             if self._streaming_mode_type == "chunked":
-                pending_chunks = len(self._streaming_chunks)
+                pending_chunks = len(self._chunks_by_id)
                 if pending_chunks > 0:
                     app_logger.log_audio_event(
                         "Cleaning up pending chunks", {"pending_count": pending_chunks}
                     )
 
                     # 标记剩余块为失败
-                    for chunk in self._streaming_chunks:
+                    for chunk in self._chunks_by_id.values():
                         chunk.result_container.update(
                             {
                                 "success": False,
@@ -195,36 +220,22 @@ class StreamingCoordinator(LifecycleComponent):
                         chunk.result_event.set()
 
                     self._streaming_chunks.clear()
+                    self._chunks_by_id.clear()
 
-            # realtime 模式：仅清理session，不获取最终结果
-            # 重要：realtime 模式文本已在录音过程中逐字输入，
-            # 不应该再调用 get_final_result()，否则会导致文本重复
+            # realtime 模式：取出会话，在锁外结束它
             elif self._streaming_mode_type == "realtime":
-                if self._realtime_session:
-                    app_logger.log_audio_event(
-                        "Realtime mode: keeping partial text, not calling get_final_result",
-                        {"partial_text_length": len(self._realtime_partial_text)},
-                    )
+                session, self._realtime_session = self._realtime_session, None
 
-                    # 显式清理sherpa-onnx streaming session
-                    try:
-                        if (
-                            hasattr(self._realtime_session, "is_active")
-                            and self._realtime_session.is_active
-                        ):
-                            if (
-                                hasattr(self._realtime_session, "stream")
-                                and self._realtime_session.stream
-                            ):
-                                self._realtime_session.stream.input_finished()
-                            self._realtime_session.is_active = False
-                            app_logger.log_audio_event(
-                                "Realtime session explicitly cleaned up", {}
-                            )
-                    except Exception as e:
-                        app_logger.log_error(e, "realtime_session_cleanup")
+        # 只解码最后一段尚未结束的音频，会话返回的是完整转录（已结束分段 +
+        # 最后一段），不需要离线重新识别。最终解码可能等待分段重打分完成，
+        # 不能持有锁，否则期间的状态查询和 get_next_chunk 都会被阻塞
+        final = self._finish_realtime_session(session) if session else None
 
-                    self._realtime_session = None
+        with self._streaming_lock:
+            # 文本已在录音过程中逐字输入，这里只把最后一段交给输入端提交；
+            # 结束期间已开始新的会话时不覆盖它的状态
+            if final is not None and not self._streaming_active:
+                self._apply_final_result(final)
 
             stats = self._get_stats()
 
@@ -242,7 +253,8 @@ class StreamingCoordinator(LifecycleComponent):
         """添加流式转录块（仅chunked模式）
 
         Args:
-            audio_data: 音频数据
+            audio_data: 音频数据。自有内存的数组直接接管并设为只读，
+                调用方之后不能再修改它；数组视图会被复制
 
         Returns:
             块ID（chunked模式）或 -1（不适用）
@@ -276,13 +288,15 @@ class StreamingCoordinator(LifecycleComponent):
             # 创建流式块
             chunk = StreamingChunk(
                 chunk_id=chunk_id,
-                audio_data=audio_data.copy(),  # 复制数据避免引用问题
+                audio_data=self._take_audio(audio_data),
                 timestamp=time.time(),
                 result_event=result_event,
                 result_container=result_container,
             )
 
             self._streaming_chunks.append(chunk)
+            self._chunks_by_id[chunk_id] = chunk
+            self._chunk_available.notify()
             self._streaming_stats["total_chunks"] += 1
             self._streaming_stats["total_audio_duration"] += (
                 len(audio_data) / 16000
@@ -299,6 +313,19 @@ class StreamingCoordinator(LifecycleComponent):
 
             return chunk_id
 
+    @staticmethod
+    def _take_audio(audio_data: np.ndarray) -> np.ndarray:
+        """接管音频缓冲区
+
+        录音器每个块都交出新分配的数组且之后不再修改，直接接管即可；
+        设为只读使任何意外的写入立即报错，而不是悄悄改变待转录的音频。
+        视图（base 不为 None）与他人共享缓冲区，仍需复制。
+        """
+        if audio_data.base is not None or not audio_data.flags.owndata:
+            audio_data = audio_data.copy()
+        audio_data.flags.writeable = False
+        return audio_data
+
     def add_realtime_audio(self, audio_data: np.ndarray) -> Optional[str]:
         """添加实时音频数据（仅realtime模式）
 
@@ -349,8 +376,11 @@ class StreamingCoordinator(LifecycleComponent):
                     {"partial_result": partial_result[:50] if partial_result else ""},
                 )
 
-                # 检查是否有更新
-                if partial_result != self._realtime_partial_text:
+                # 检查是否有更新（端点即使文本未变也通知，让输入端提交整句）
+                endpoint = (
+                    getattr(self._realtime_session, "endpoint_detected", False) is True
+                )
+                if partial_result != self._realtime_partial_text or endpoint:
                     self._realtime_partial_text = partial_result
                     self._realtime_last_update = time.time()
                     self._streaming_stats["realtime_updates"] += 1
@@ -361,6 +391,7 @@ class StreamingCoordinator(LifecycleComponent):
                         {
                             "text": partial_result,
                             "timestamp": self._realtime_last_update,
+                            "endpoint": endpoint,
                         },
                     )
 
@@ -372,6 +403,42 @@ class StreamingCoordinator(LifecycleComponent):
                 app_logger.log_error(e, "add_realtime_audio")
                 return None
 
+    def _finish_realtime_session(self, session) -> Optional[Dict[str, Any]]:
+        """结束 realtime 会话并取得完整转录（调用方不持有锁）"""
+        try:
+            if not getattr(session, "is_active", False):
+                return None
+            return session.get_final_result()
+        except Exception as e:
+            app_logger.log_error(e, "realtime_session_cleanup")
+            return None
+
+    def _apply_final_result(self, final: Dict[str, Any]) -> None:
+        """记录完整转录并提交最后一段（调用方持有锁）"""
+        text = final.get("text", "")
+        self._realtime_segments = list(final.get("segments", []))
+        app_logger.log_audio_event(
+            "Realtime session finalized",
+            {
+                "text_length": len(text),
+                "segments": len(self._realtime_segments),
+                "tail_changed": text != self._realtime_partial_text,
+            },
+        )
+
+        if text and text != self._realtime_partial_text:
+            self._realtime_partial_text = text
+            self._realtime_last_update = time.time()
+            self._streaming_stats["realtime_updates"] += 1
+            self._emit_streaming_event(
+                Events.REALTIME_TEXT_UPDATED,
+                {
+                    "text": text,
+                    "timestamp": self._realtime_last_update,
+                    "endpoint": True,
+                },
+            )
+
     def get_realtime_text(self) -> str:
         """获取当前实时转录文本（仅realtime模式）
 
@@ -381,6 +448,16 @@ class StreamingCoordinator(LifecycleComponent):
         with self._streaming_lock:
             return self._realtime_partial_text
 
+    def get_realtime_segments(self) -> List[Dict[str, Any]]:
+        """获取最近一次 realtime 会话的分段（停止流式后可用）
+
+        Returns:
+            分段列表，每项包含 text、start_sample、end_sample、
+            start_time、end_time、finalized_at
+        """
+        with self._streaming_lock:
+            return list(self._realtime_segments)
+
     def get_pending_chunks(self) -> List[StreamingChunk]:
         """获取所有待处理的流式块
 
@@ -396,30 +473,29 @@ class StreamingCoordinator(LifecycleComponent):
     ) -> Optional[StreamingChunk]:
         """获取下一个待处理的流式块
 
+        在条件变量上阻塞等待，有新块加入或流式结束时立即唤醒。
+        取走的块仍可通过 complete_chunk / get_chunk_result 按 ID 访问。
+
         Args:
-            timeout: 超时时间（秒）
+            timeout: 超时时间（秒），None 表示一直等到有块或流式结束
 
         Returns:
             流式块对象，如果没有块则返回None
         """
-        start_time = time.time()
-
-        while True:
-            with self._streaming_lock:
-                if self._streaming_chunks:
-                    chunk = self._streaming_chunks.pop(0)
-                    return chunk
-
-                # 检查超时
-                if timeout and (time.time() - start_time) > timeout:
-                    return None
-
-                # 检查是否仍在流式模式
-                if not self._streaming_active:
-                    return None
+        with self._chunk_available:
+            ready = self._chunk_available.wait_for(
+                lambda: self._streaming_chunks or not self._streaming_active,
+                timeout=timeout,
+            )
+            if not ready or not self._streaming_chunks:
+                return None
 
-            # 短暂等待
-            time.sleep(0.01)
+            chunk = self._streaming_chunks.popleft()
+            chunk.picked_up_at = time.time()
+            wait_time = chunk.picked_up_at - chunk.timestamp
+            chunk.result_container["wait_time"] = wait_time
+            self._update_wait_stats(wait_time)
+            return chunk
 
     def complete_chunk(self, chunk_id: int, result: Dict[str, Any]) -> None:
         """标记流式块处理完成
@@ -430,11 +506,7 @@ class StreamingCoordinator(LifecycleComponent):
         """
         with self._streaming_lock:
             # 查找对应的块
-            chunk = None
-            for c in self._streaming_chunks:
-                if c.chunk_id == chunk_id:
-                    chunk = c
-                    break
+            chunk = self._chunks_by_id.pop(chunk_id, None)
 
             if chunk:
                 # 更新结果容器
@@ -452,8 +524,9 @@ class StreamingCoordinator(LifecycleComponent):
                 # 设置事件标志
                 chunk.result_event.set()
 
-                # 从队列中移除
-                self._streaming_chunks.remove(chunk)
+                # 未经 get_next_chunk 直接处理的块仍在队列中，需移除
+                if chunk.picked_up_at is None:
+                    self._streaming_chunks.remove(chunk)
 
                 app_logger.log_audio_event(
                     "Streaming chunk completed",
@@ -486,11 +559,7 @@ class StreamingCoordinator(LifecycleComponent):
         """
         with self._streaming_lock:
             # 查找对应的块
-            chunk = None
-            for c in self._streaming_chunks:
-                if c.chunk_id == chunk_id:
-                    chunk = c
-                    break
+            chunk = self._chunks_by_id.get(chunk_id)
 
         if not chunk:
             return None
@@ -575,7 +644,7 @@ class StreamingCoordinator(LifecycleComponent):
             completed_chunks = []
 
             # 遍历所有块，找到已完成的
-            for chunk in self._streaming_chunks:
+            for chunk in self._chunks_by_id.values():
                 if chunk.result_event.is_set():
                     completed_chunks.append(chunk)
 
@@ -604,6 +673,7 @@ class StreamingCoordinator(LifecycleComponent):
                 {
                     "current_text": self._realtime_partial_text,
                     "text_length": len(self._realtime_partial_text),
+                    "segment_count": len(self._realtime_segments),
                     "last_update": self._realtime_last_update,
                     "has_session": self._realtime_session is not None,
                 }
@@ -620,6 +690,9 @@ class StreamingCoordinator(LifecycleComponent):
             "failed_chunks": 0,
             "total_audio_duration": 0.0,
             "average_chunk_time": 0.0,
+            "average_wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "picked_chunks": 0,
             "realtime_updates": 0,
         }
         self._next_chunk_id = 0
@@ -649,6 +722,18 @@ class StreamingCoordinator(LifecycleComponent):
                 current_avg * (completed - 1) + processing_time
             ) / completed
 
+    def _update_wait_stats(self, wait_time: float) -> None:
+        """更新块等待时间统计（调用方持有锁）
+
+        Args:
+            wait_time: 块从加入到被取走的时间
+        """
+        stats = self._streaming_stats
+        stats["picked_chunks"] += 1
+        picked = stats["picked_chunks"]
+        stats["average_wait_time"] += (wait_time - stats["average_wait_time"]) / picked
+        stats["max_wait_time"] = max(stats["max_wait_time"], wait_time)
+
     def _emit_streaming_event(self, event_name: str, data: Dict[str, Any]) -> None:
         """发送流式转录事件
 
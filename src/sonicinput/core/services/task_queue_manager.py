@@ -1,12 +1,25 @@
-"""任务队列管理器 - 负责任务队列和线程管理"""
-
-import queue
+"""任务队列管理器 - 负责任务队列和线程管理
+
+- 固定数量的工作线程执行所有任务，超时不再为每个任务新建线程
+- 待执行任务保存在二叉堆中，取消排队任务时打墓碑标记，出队时跳过
+- 每个任务携带一个 CancellationToken；处理器声明 cancel_token 参数即可
+  协作式地检查取消/超时。超时由看门狗线程判定：任务立即按超时失败处理，
+  令牌被取消，处理器稍后返回的结果被丢弃
+- 任务分为交互（实时听写）和后台（批量重处理、预热等）两条通道，各自
+  有独立容量；交互任务总是先出队，并保留工作线程。后台通道可暂停，暂停时
+  可抢占正在运行的可取消后台任务（取消后重新排队）。通道满时 submit_task
+  立即抛出 TaskQueueFullError，不阻塞调用方
+"""
+
+import heapq
+import inspect
+import itertools
 import threading
 import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ...utils import app_logger
 from ..base.lifecycle_component import LifecycleComponent
@@ -21,6 +34,52 @@ class TaskPriority(Enum):
     CRITICAL = 4
 
 
+class TaskLane(Enum):
+    """任务通道"""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class TaskQueueFullError(RuntimeError):
+    """任务通道已满，提交被拒绝"""
+
+
+class TaskCancelledError(Exception):
+    """任务已被取消或已超时（由 CancellationToken.raise_if_cancelled 抛出）"""
+
+
+class CancellationToken:
+    """协作式取消令牌
+
+    处理器在耗时步骤之间调用 raise_if_cancelled()，或把 is_cancelled
+    作为循环条件；超时和 cancel_task() 都通过它通知处理器停止。
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """请求取消（重复调用保留第一次的原因）"""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """已取消时抛出 TaskCancelledError"""
+        if self._event.is_set():
+            raise TaskCancelledError(self.reason or "cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """等待取消，返回是否已取消（可代替 time.sleep 使用）"""
+        return self._event.wait(timeout)
+
+
 class TaskStatus(Enum):
     """任务状态"""
 
@@ -50,6 +109,10 @@ class Task:
     error: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 0
+    lane: TaskLane = TaskLane.INTERACTIVE
+    cancel_token: CancellationToken = field(
+        default_factory=CancellationToken, repr=False, compare=False
+    )
 
     def __lt__(self, other):
         """用于优先队列排序"""
@@ -65,11 +128,20 @@ class TaskQueueManager(LifecycleComponent):
     与具体的业务逻辑解耦，专注于任务管理。
     """
 
+    # 每条通道最多保留的待执行任务数
+    LANE_CAPACITY = {TaskLane.INTERACTIVE: 32, TaskLane.BACKGROUND: 100}
+
+    # 保留给交互任务的工作线程数：在 worker_count 之外额外启动，
+    # 每条通道最多同时占用 worker_count 个线程，因此后台任务占满配额时
+    # 交互任务仍有空闲线程
+    RESERVED_INTERACTIVE_WORKERS = 1
+
     def __init__(self, worker_count: int = 1, event_service=None):
         """初始化任务队列管理器
 
         Args:
-            worker_count: 工作线程数量
+            worker_count: 每条通道的并发任务数（另有
+                RESERVED_INTERACTIVE_WORKERS 个线程保留给交互任务）
             event_service: 事件服务（可选）
         """
         super().__init__("TaskQueueManager")
@@ -77,27 +149,51 @@ class TaskQueueManager(LifecycleComponent):
         self.worker_count = worker_count
         self.event_service = event_service
 
-        # 任务队列（优先队列）
-        self._task_queue = queue.PriorityQueue(maxsize=100)
+        # 任务队列：每条通道一个 (-优先级, 序号, 任务) 的二叉堆
+        # 取消的任务留在堆中作为墓碑，出队时跳过；_pending 只包含有效任务
+        self._lanes: Dict[TaskLane, List[Tuple[int, int, Task]]] = {
+            lane: [] for lane in TaskLane
+        }
+        self._lane_pending: Dict[TaskLane, int] = {lane: 0 for lane in TaskLane}
+        self._lane_running: Dict[TaskLane, int] = {lane: 0 for lane in TaskLane}
+        self._paused_lanes: Set[TaskLane] = set()
+        # 通道开放时置位（供不经过队列的后台工作等待）
+        self._lane_open: Dict[TaskLane, threading.Event] = {
+            lane: threading.Event() for lane in TaskLane
+        }
+        for event in self._lane_open.values():
+            event.set()
+        self._pending: Dict[str, Task] = {}
+        self._sequence = itertools.count()
+        self._queue_cond = threading.Condition(threading.Lock())
         self._running_tasks: Dict[str, Task] = {}
 
         # 线程管理
         self._workers: List[threading.Thread] = []
         self._shutdown_event = threading.Event()
 
+        # 超时看门狗：(截止时间, 序号, 任务) 的二叉堆
+        self._deadlines: List[Tuple[float, int, Task, CancellationToken]] = []
+        self._deadline_cond = threading.Condition(threading.Lock())
+        self._watchdog: Optional[threading.Thread] = None
+
         # 统计信息
         self._stats = {
             "total_tasks": 0,
             "completed_tasks": 0,
             "failed_tasks": 0,
             "cancelled_tasks": 0,
+            "timed_out_tasks": 0,
+            "abandoned_results": 0,
+            "rejected_tasks": 0,
+            "preempted_tasks": 0,
             "average_execution_time": 0.0,
             "queue_size": 0,
             "active_workers": 0,
         }
 
-        # 任务处理器注册表
-        self._task_handlers: Dict[str, Callable] = {}
+        # 任务处理器注册表（处理器, 是否接受 cancel_token 参数）
+        self._task_handlers: Dict[str, Tuple[Callable, bool]] = {}
 
         # 锁
         self._stats_lock = threading.Lock()
@@ -112,10 +208,25 @@ class TaskQueueManager(LifecycleComponent):
 
         Args:
             task_type: 任务类型
-            handler: 处理器函数
+            handler: 处理器函数，签名为 handler(data) 或
+                handler(data, cancel_token=...)；后者会收到任务的 CancellationToken
         """
-        self._task_handlers[task_type] = handler
-        app_logger.log_audio_event("Task handler registered", {"task_type": task_type})
+        accepts_token = self._accepts_cancel_token(handler)
+        self._task_handlers[task_type] = (handler, accepts_token)
+        app_logger.log_audio_event(
+            "Task handler registered",
+            {"task_type": task_type, "cancellable": accepts_token},
+        )
+
+    @staticmethod
+    def _accepts_cancel_token(handler: Callable) -> bool:
+        try:
+            parameters = inspect.signature(handler).parameters
+        except (TypeError, ValueError):
+            return False
+        return "cancel_token" in parameters or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        )
 
     def _do_start(self) -> bool:
         """启动任务队列管理器
@@ -126,13 +237,18 @@ class TaskQueueManager(LifecycleComponent):
         self._shutdown_event.clear()
 
         # 启动工作线程
-        for i in range(self.worker_count):
+        for i in range(self.worker_count + self.RESERVED_INTERACTIVE_WORKERS):
             worker = threading.Thread(
                 target=self._worker_loop, name=f"TaskWorker-{i}", daemon=True
             )
             worker.start()
             self._workers.append(worker)
 
+        self._watchdog = threading.Thread(
+            target=self._watchdog_loop, name="TaskWatchdog", daemon=True
+        )
+        self._watchdog.start()
+
         app_logger.log_audio_event(
             "TaskQueueManager started", {"worker_count": len(self._workers)}
         )
@@ -153,12 +269,26 @@ class TaskQueueManager(LifecycleComponent):
         timeout = 10.0
         app_logger.log_audio_event("TaskQueueManager stopping", {"timeout": timeout})
 
-        # 设置关闭事件
+        # 设置关闭事件，唤醒等待中的工作线程和看门狗
         self._shutdown_event.set()
+        with self._queue_cond:
+            self._queue_cond.notify_all()
+        with self._deadline_cond:
+            self._deadlines.clear()
+            self._deadline_cond.notify_all()
+
+        # 通知正在执行的处理器尽快退出
+        with self._tasks_lock:
+            running = list(self._running_tasks.values())
+        for task in running:
+            task.cancel_token.cancel("shutdown")
 
         # 等待工作线程结束
         for worker in self._workers:
             worker.join(timeout=timeout)
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=timeout)
+            self._watchdog = None
 
         # 清理资源
         with self._tasks_lock:
@@ -167,12 +297,19 @@ class TaskQueueManager(LifecycleComponent):
         self._workers.clear()
 
         # 清空队列 (merged from cleanup())
-        while not self._task_queue.empty():
-            try:
-                self._task_queue.get_nowait()
-                self._task_queue.task_done()
-            except queue.Empty:
-                break
+        with self._queue_cond:
+            for task in self._pending.values():
+                task.status = TaskStatus.CANCELLED
+                task.cancel_token.cancel("shutdown")
+            self._pending.clear()
+            for lane in TaskLane:
+                self._lanes[lane].clear()
+                self._lane_pending[lane] = 0
+                self._lane_running[lane] = 0
+            # 释放等待通道开放的后台工作
+            self._paused_lanes.clear()
+            for event in self._lane_open.values():
+                event.set()
 
         # 清理注册的处理器 (merged from cleanup())
         self._task_handlers.clear()
@@ -193,20 +330,25 @@ class TaskQueueManager(LifecycleComponent):
         error_callback: Optional[Callable] = None,
         timeout: Optional[float] = None,
         max_retries: int = 0,
+        lane: TaskLane = TaskLane.INTERACTIVE,
     ) -> str:
         """提交任务
 
         Args:
             task_type: 任务类型
             data: 任务数据
-            priority: 任务优先级
+            priority: 任务优先级（通道内排序）
             callback: 成功回调
             error_callback: 错误回调
             timeout: 超时时间
             max_retries: 最大重试次数
+            lane: 任务通道
 
         Returns:
             任务ID
+
+        Raises:
+            TaskQueueFullError: 通道已满
         """
         if not self.is_running:
             raise RuntimeError("TaskQueueManager is not running")
@@ -224,61 +366,253 @@ class TaskQueueManager(LifecycleComponent):
             error_callback=error_callback,
             timeout=timeout,
             max_retries=max_retries,
+            lane=lane,
         )
 
-        try:
-            # 添加到队列
-            self._task_queue.put(task, timeout=1.0)
-
-            # 更新统计
+        # 添加到队列（准入控制：通道满时立即拒绝）
+        if not self._enqueue(task):
             with self._stats_lock:
-                self._stats["total_tasks"] += 1
-
+                self._stats["rejected_tasks"] += 1
+            capacity = self.LANE_CAPACITY[lane]
             app_logger.log_audio_event(
-                "Task submitted",
-                {
-                    "task_id": task.task_id,
-                    "task_type": task_type,
-                    "priority": priority.name,
-                    "queue_size": self._task_queue.qsize(),
-                },
+                "Task rejected",
+                {"task_type": task_type, "lane": lane.value, "capacity": capacity},
+            )
+            raise TaskQueueFullError(
+                f"{lane.value} task queue is full ({capacity} tasks)"
             )
 
-            # 发送任务提交事件
-            self._emit_task_event(
-                "task_submitted", {"task_id": task.task_id, "task_type": task_type}
+        # 更新统计
+        with self._stats_lock:
+            self._stats["total_tasks"] += 1
+
+        app_logger.log_audio_event(
+            "Task submitted",
+            {
+                "task_id": task.task_id,
+                "task_type": task_type,
+                "priority": priority.name,
+                "lane": lane.value,
+                "queue_size": self.get_queue_size(),
+            },
+        )
+
+        # 发送任务提交事件
+        self._emit_task_event(
+            "task_submitted", {"task_id": task.task_id, "task_type": task_type}
+        )
+
+        return task.task_id
+
+    def _enqueue(self, task: Task, force: bool = False) -> bool:
+        """加入所属通道的待执行堆
+
+        Args:
+            task: 任务对象
+            force: 忽略通道容量（重试和被抢占的任务重新排队时使用）
+
+        Returns:
+            False 表示通道已满或管理器正在关闭
+        """
+        lane = task.lane
+        with self._queue_cond:
+            if self._shutdown_event.is_set():
+                return False
+            if not force and self._lane_pending[lane] >= self.LANE_CAPACITY[lane]:
+                return False
+
+            heapq.heappush(
+                self._lanes[lane], (-task.priority.value, next(self._sequence), task)
             )
+            self._pending[task.task_id] = task
+            self._lane_pending[lane] += 1
+            self._queue_cond.notify_all()
+        return True
 
-            return task.task_id
+    def _lane_available(self, lane: TaskLane) -> bool:
+        """通道当前是否可以出队（调用方持有 _queue_cond）"""
+        if lane in self._paused_lanes:
+            return False
+        return self._lane_running[lane] < self.worker_count
+
+    def _peek(self, lane: TaskLane) -> Optional[Task]:
+        """返回通道中下一个有效任务，顺带清理堆顶墓碑（调用方持有 _queue_cond）"""
+        heap = self._lanes[lane]
+        while heap:
+            task = heap[0][2]
+            if self._pending.get(task.task_id) is task:
+                return task
+            heapq.heappop(heap)
+        return None
+
+    def _dequeue(self, timeout: float) -> Optional[Task]:
+        """取出下一个可执行任务：交互通道优先，后台通道受暂停和线程配额限制"""
+        with self._queue_cond:
+            for attempt in range(2):
+                for lane in TaskLane:
+                    if not self._lane_available(lane):
+                        continue
+                    task = self._peek(lane)
+                    if task is None:
+                        continue
+                    heapq.heappop(self._lanes[lane])
+                    del self._pending[task.task_id]
+                    self._lane_pending[lane] -= 1
+                    self._lane_running[lane] += 1
+                    return task
+                if attempt == 0:
+                    self._queue_cond.wait(timeout)
+            return None
+
+    def _release_worker(self, lane: TaskLane) -> None:
+        """任务执行结束，归还通道的线程配额"""
+        with self._queue_cond:
+            self._lane_running[lane] = max(0, self._lane_running[lane] - 1)
+            self._queue_cond.notify_all()
+
+    def pause_lane(self, lane: TaskLane, preempt: bool = False) -> int:
+        """暂停通道出队
+
+        Args:
+            lane: 任务通道
+            preempt: 是否抢占该通道中正在运行的可取消任务（取消后重新排队）
 
-        except queue.Full:
-            raise RuntimeError("Task queue is full")
+        Returns:
+            被抢占的任务数量
+        """
+        with self._queue_cond:
+            already_paused = lane in self._paused_lanes
+            self._paused_lanes.add(lane)
+            self._lane_open[lane].clear()
+
+        preempted = 0
+        if preempt:
+            with self._tasks_lock:
+                running = [t for t in self._running_tasks.values() if t.lane is lane]
+            for task in running:
+                if self._preempt(task):
+                    preempted += 1
+
+        if not already_paused or preempted:
+            app_logger.log_audio_event(
+                "Task lane paused", {"lane": lane.value, "preempted": preempted}
+            )
+        return preempted
+
+    def resume_lane(self, lane: TaskLane) -> None:
+        """恢复通道出队"""
+        with self._queue_cond:
+            if lane not in self._paused_lanes:
+                return
+            self._paused_lanes.discard(lane)
+            self._lane_open[lane].set()
+            self._queue_cond.notify_all()
+
+        app_logger.log_audio_event("Task lane resumed", {"lane": lane.value})
+
+    def is_lane_paused(self, lane: TaskLane) -> bool:
+        return lane in self._paused_lanes
+
+    def wait_for_lane(self, lane: TaskLane, timeout: Optional[float] = None) -> bool:
+        """等待通道开放（供不经过队列、直接调用模型的后台工作使用）
+
+        Returns:
+            True 表示通道已开放，False 表示超时
+        """
+        return self._lane_open[lane].wait(timeout)
+
+    def _preempt(self, task: Task) -> bool:
+        """抢占运行中的任务：取消本次运行并重新排队（不计入重试次数）
+
+        只抢占处理器接受 cancel_token 的任务，否则旧运行无法停止，
+        重新执行会造成重复工作。
+        """
+        entry = self._task_handlers.get(task.task_type)
+        if not entry or not entry[1]:
+            return False
+
+        token = task.cancel_token
+        with self._tasks_lock:
+            if not self._claim(task, token, TaskStatus.PENDING):
+                return False
+        token.cancel("preempted")
+        task.started_at = None
+        task.completed_at = None
+
+        with self._stats_lock:
+            self._stats["preempted_tasks"] += 1
+        self._enqueue(task, force=True)
+
+        app_logger.log_audio_event(
+            "Task preempted",
+            {"task_id": task.task_id, "task_type": task.task_type},
+        )
+        return True
 
     def cancel_task(self, task_id: str) -> bool:
         """取消任务
 
+        排队中的任务直接移出队列；运行中的任务立即标记为取消，
+        并通过 CancellationToken 通知处理器，处理器返回的结果被丢弃。
+
         Args:
             task_id: 任务ID
 
         Returns:
             True如果成功取消
         """
-        # 首先检查是否在运行中
-        with self._tasks_lock:
-            if task_id in self._running_tasks:
-                task = self._running_tasks[task_id]
+        with self._queue_cond:
+            task = self._pending.pop(task_id, None)
+            if task is not None:
                 task.status = TaskStatus.CANCELLED
-                app_logger.log_audio_event(
-                    "Running task cancelled", {"task_id": task_id}
-                )
-                return True
+                self._lane_pending[task.lane] -= 1
+                self._compact_heap(task.lane)
+                self._queue_cond.notify_all()
 
-        # 尝试从队列中移除（这个比较困难，因为PriorityQueue不支持直接移除）
-        # 这里简化处理，通过标记来取消
-        app_logger.log_audio_event("Task cancel requested", {"task_id": task_id})
+        if task is not None:
+            task.cancel_token.cancel("cancelled")
+            self._record_cancelled(task, was_running=False)
+            return True
 
+        with self._tasks_lock:
+            task = self._running_tasks.get(task_id)
+            claimed = task is not None and self._claim(
+                task, task.cancel_token, TaskStatus.CANCELLED
+            )
+
+        if claimed:
+            task.cancel_token.cancel("cancelled")
+            self._record_cancelled(task, was_running=True)
+            return True
+
+        app_logger.log_audio_event("Task cancel requested", {"task_id": task_id})
         return False
 
+    def _compact_heap(self, lane: TaskLane) -> None:
+        """墓碑超过一半时重建通道的堆（调用方持有 _queue_cond）"""
+        heap = self._lanes[lane]
+        if len(heap) > 2 * self._lane_pending[lane] + 16:
+            heap = [
+                entry
+                for entry in heap
+                if self._pending.get(entry[2].task_id) is entry[2]
+            ]
+            heapq.heapify(heap)
+            self._lanes[lane] = heap
+
+    def _record_cancelled(self, task: Task, was_running: bool) -> None:
+        task.completed_at = time.time()
+        with self._stats_lock:
+            self._stats["cancelled_tasks"] += 1
+
+        app_logger.log_audio_event(
+            "Running task cancelled" if was_running else "Queued task cancelled",
+            {"task_id": task.task_id, "task_type": task.task_type},
+        )
+        self._emit_task_event(
+            "task_cancelled", {"task_id": task.task_id, "was_running": was_running}
+        )
+
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """获取任务状态
 
@@ -293,6 +627,11 @@ class TaskQueueManager(LifecycleComponent):
                 task = self._running_tasks[task_id]
                 return self._task_to_dict(task)
 
+        with self._queue_cond:
+            task = self._pending.get(task_id)
+            if task is not None:
+                return self._task_to_dict(task)
+
         return None
 
     def get_queue_size(self) -> int:
@@ -301,7 +640,8 @@ class TaskQueueManager(LifecycleComponent):
         Returns:
             队列中的任务数量
         """
-        return self._task_queue.qsize()
+        with self._queue_cond:
+            return len(self._pending)
 
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息
@@ -311,10 +651,21 @@ class TaskQueueManager(LifecycleComponent):
         """
         with self._stats_lock:
             stats = self._stats.copy()
-            stats["queue_size"] = self._task_queue.qsize()
+        with self._queue_cond:
+            stats["queue_size"] = len(self._pending)
+            stats["lanes"] = {
+                lane.value: {
+                    "queued": self._lane_pending[lane],
+                    "running": self._lane_running[lane],
+                    "capacity": self.LANE_CAPACITY[lane],
+                    "paused": lane in self._paused_lanes,
+                }
+                for lane in TaskLane
+            }
+        with self._tasks_lock:
             stats["running_tasks"] = len(self._running_tasks)
-            stats["is_running"] = self.is_running
-            return stats
+        stats["is_running"] = self.is_running
+        return stats
 
     def _worker_loop(self) -> None:
         """工作线程主循环"""
@@ -326,13 +677,19 @@ class TaskQueueManager(LifecycleComponent):
         while not self._shutdown_event.is_set():
             try:
                 # 获取任务（带超时）
-                try:
-                    task = self._task_queue.get(timeout=0.1)
-                except queue.Empty:
+                task = self._dequeue(timeout=0.1)
+                if task is None:
                     continue
 
                 # 执行任务
-                self._execute_task(task)
+                with self._stats_lock:
+                    self._stats["active_workers"] += 1
+                try:
+                    self._execute_task(task)
+                finally:
+                    self._release_worker(task.lane)
+                    with self._stats_lock:
+                        self._stats["active_workers"] -= 1
 
             except Exception as e:
                 app_logger.log_error(e, "worker_loop_error")
@@ -341,6 +698,20 @@ class TaskQueueManager(LifecycleComponent):
             "Worker thread stopped", {"worker_name": worker_name}
         )
 
+    def _claim(self, task: Task, token: CancellationToken, status: TaskStatus) -> bool:
+        """结束任务的一次运行（调用方持有 _tasks_lock）
+
+        工作线程、看门狗和 cancel_task 可能同时尝试结束同一次运行，
+        只有第一个调用者成功，其余调用者的结果被丢弃。token 标识运行：
+        超时后重试的任务会换用新令牌，旧运行的迟到结果不会被误认。
+        """
+        if task.status is not TaskStatus.RUNNING or task.cancel_token is not token:
+            return False
+        task.status = status
+        task.completed_at = time.time()
+        self._running_tasks.pop(task.task_id, None)
+        return True
+
     def _execute_task(self, task: Task) -> None:
         """执行任务
 
@@ -348,175 +719,186 @@ class TaskQueueManager(LifecycleComponent):
             task: 任务对象
         """
         # 更新任务状态
-        task.status = TaskStatus.RUNNING
-        task.started_at = time.time()
-
+        token = CancellationToken()
+        started = time.monotonic()
         with self._tasks_lock:
+            task.status = TaskStatus.RUNNING
+            task.started_at = time.time()
+            task.cancel_token = token
             self._running_tasks[task.task_id] = task
 
-        # Refactored to avoid try-finally with return for Nuitka compatibility
-        retry_scheduled = False
+        if task.timeout:
+            self._watch_deadline(task, token, started + task.timeout)
 
-        try:
-            app_logger.log_audio_event(
-                "Task execution started",
-                {"task_id": task.task_id, "task_type": task.task_type},
-            )
+        app_logger.log_audio_event(
+            "Task execution started",
+            {"task_id": task.task_id, "task_type": task.task_type},
+        )
 
+        try:
             # 获取处理器
-            handler = self._task_handlers.get(task.task_type)
-            if not handler:
+            entry = self._task_handlers.get(task.task_type)
+            if not entry:
                 raise ValueError(f"No handler for task type: {task.task_type}")
 
             # 执行处理器
-            if task.timeout:
-                result = self._execute_with_timeout(handler, task.data, task.timeout)
+            handler, accepts_token = entry
+            if accepts_token:
+                result = handler(task.data, cancel_token=token)
             else:
                 result = handler(task.data)
+        except Exception as e:
+            with self._tasks_lock:
+                claimed = self._claim(task, token, TaskStatus.FAILED)
+            if claimed:
+                task.error = str(e)
+                self._handle_failure(task, e)
+            else:
+                self._record_abandoned(task, token, time.monotonic() - started)
+            return
 
-            # 任务成功
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = time.time()
-            task.result = result
-
-            # 更新统计
-            with self._stats_lock:
-                self._stats["completed_tasks"] += 1
-                self._update_execution_time_stats(task)
+        with self._tasks_lock:
+            claimed = self._claim(task, token, TaskStatus.COMPLETED)
+        if not claimed:
+            # 已超时或已取消：丢弃结果
+            self._record_abandoned(task, token, time.monotonic() - started)
+            return
 
-            app_logger.log_audio_event(
-                "Task completed successfully",
-                {
-                    "task_id": task.task_id,
-                    "execution_time": task.completed_at - task.started_at,
-                },
-            )
+        # 任务成功
+        task.result = result
 
-            # 执行成功回调
-            if task.callback:
-                try:
-                    task.callback(result)
-                except Exception as e:
-                    app_logger.log_error(e, "task_callback_error")
+        # 更新统计
+        with self._stats_lock:
+            self._stats["completed_tasks"] += 1
+            self._update_execution_time_stats(task)
 
-            # 发送任务完成事件
-            self._emit_task_event(
-                "task_completed", {"task_id": task.task_id, "result": result}
-            )
+        app_logger.log_audio_event(
+            "Task completed successfully",
+            {
+                "task_id": task.task_id,
+                "execution_time": task.completed_at - task.started_at,
+            },
+        )
 
-        except Exception as e:
-            # 任务失败
-            task.status = TaskStatus.FAILED
-            task.completed_at = time.time()
-            task.error = str(e)
+        # 执行成功回调
+        if task.callback:
+            try:
+                task.callback(result)
+            except Exception as e:
+                app_logger.log_error(e, "task_callback_error")
 
-            # 检查是否需要重试
-            if task.retry_count < task.max_retries:
-                task.retry_count += 1
-                task.status = TaskStatus.PENDING
-                task.started_at = None
-                task.completed_at = None
+        # 发送任务完成事件
+        self._emit_task_event(
+            "task_completed", {"task_id": task.task_id, "result": result}
+        )
 
-                # 重新加入队列
-                try:
-                    self._task_queue.put(task, timeout=1.0)
-
-                    app_logger.log_audio_event(
-                        "Task retry scheduled",
-                        {
-                            "task_id": task.task_id,
-                            "retry_count": task.retry_count,
-                            "max_retries": task.max_retries,
-                        },
-                    )
-
-                    retry_scheduled = True
-                except queue.Full:
-                    app_logger.log_error(
-                        Exception("Queue full during retry"), "task_retry_failed"
-                    )
-
-            # Only continue with error handling if retry was not scheduled
-            if not retry_scheduled:
-                # 更新统计
-                with self._stats_lock:
-                    self._stats["failed_tasks"] += 1
-
-                app_logger.log_error(e, f"task_execution_failed_{task.task_type}")
-
-                # 执行错误回调
-                if task.error_callback:
-                    try:
-                        task.error_callback(str(e))
-                    except Exception as callback_error:
-                        app_logger.log_error(
-                            callback_error, "task_error_callback_error"
-                        )
-
-                # 发送任务失败事件
-                self._emit_task_event(
-                    "task_failed",
+    def _handle_failure(self, task: Task, error: Exception) -> None:
+        """处理失败任务：需要时重新排队，否则回调错误处理器"""
+        # 检查是否需要重试
+        if task.retry_count < task.max_retries and not self._shutdown_event.is_set():
+            task.retry_count += 1
+            task.status = TaskStatus.PENDING
+            task.started_at = None
+            task.completed_at = None
+
+            # 重新加入队列
+            if self._enqueue(task, force=True):
+                app_logger.log_audio_event(
+                    "Task retry scheduled",
                     {
                         "task_id": task.task_id,
-                        "error": str(e),
                         "retry_count": task.retry_count,
+                        "max_retries": task.max_retries,
                     },
                 )
+                return
 
-        finally:
-            # 清理运行任务记录
-            with self._tasks_lock:
-                self._running_tasks.pop(task.task_id, None)
+            task.status = TaskStatus.FAILED
+            task.completed_at = time.time()
+            app_logger.log_error(
+                Exception("Task queue stopped during retry"), "task_retry_failed"
+            )
 
-            # 标记队列任务完成
-            self._task_queue.task_done()
+        # 更新统计
+        with self._stats_lock:
+            self._stats["failed_tasks"] += 1
 
-    def _execute_with_timeout(
-        self, handler: Callable, data: Dict[str, Any], timeout: float
-    ) -> Any:
-        """带超时执行处理器
+        app_logger.log_error(error, f"task_execution_failed_{task.task_type}")
 
-        Args:
-            handler: 处理器函数
-            data: 任务数据
-            timeout: 超时时间
+        # 执行错误回调
+        if task.error_callback:
+            try:
+                task.error_callback(str(error))
+            except Exception as callback_error:
+                app_logger.log_error(callback_error, "task_error_callback_error")
 
-        Returns:
-            处理结果
+        # 发送任务失败事件
+        self._emit_task_event(
+            "task_failed",
+            {
+                "task_id": task.task_id,
+                "error": str(error),
+                "retry_count": task.retry_count,
+            },
+        )
 
-        Raises:
-            TimeoutError: 如果执行超时
-        """
-        # 使用线程和Event来实现超时
-        result_container = {}
-        exception_container = {}
-        completed_event = threading.Event()
+    def _record_abandoned(
+        self, task: Task, token: CancellationToken, elapsed: float
+    ) -> None:
+        """处理器在超时/取消之后才返回"""
+        with self._stats_lock:
+            self._stats["abandoned_results"] += 1
 
-        def target():
-            try:
-                result_container["result"] = handler(data)
-            except Exception as e:
-                exception_container["exception"] = e
-            finally:
-                completed_event.set()
+        app_logger.log_audio_event(
+            "Abandoned task finished",
+            {
+                "task_id": task.task_id,
+                "reason": token.reason,
+                "elapsed": round(elapsed, 3),
+            },
+        )
 
-        # 启动执行线程 - 设置daemon标志防止阻止进程退出
-        thread = threading.Thread(target=target, daemon=True)
-        thread.start()
+    def _watch_deadline(
+        self, task: Task, token: CancellationToken, deadline: float
+    ) -> None:
+        with self._deadline_cond:
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._sequence), task, token)
+            )
+            self._deadline_cond.notify()
+
+    def _watchdog_loop(self) -> None:
+        """超时看门狗：到期仍在运行的任务按超时失败处理"""
+        while not self._shutdown_event.is_set():
+            with self._deadline_cond:
+                if not self._deadlines:
+                    self._deadline_cond.wait()
+                    continue
+                deadline, _, task, token = self._deadlines[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._deadline_cond.wait(delay)
+                    continue
+                heapq.heappop(self._deadlines)
 
-        # 等待完成或超时
-        if completed_event.wait(timeout=timeout):
-            thread.join(timeout=5.0)  # 增加join超时时间到5秒
+            self._expire(task, token)
 
-            if "exception" in exception_container:
-                raise exception_container["exception"]
+    def _expire(self, task: Task, token: CancellationToken) -> None:
+        with self._tasks_lock:
+            claimed = self._claim(task, token, TaskStatus.FAILED)
+        if not claimed:
+            return
+
+        token.cancel("timeout")
+        error_msg = f"Task execution timed out after {task.timeout}s"
+        task.error = error_msg
+        with self._stats_lock:
+            self._stats["timed_out_tasks"] += 1
 
-            return result_container.get("result")
-        else:
-            # 超时处理 - daemon线程会自动清理，不会阻止进程退出
-            error_msg = f"Task execution timed out after {timeout}s"
-            app_logger.log_error(TimeoutError(error_msg), "task_timeout")
-            raise TimeoutError(error_msg)
+        try:
+            self._handle_failure(task, TimeoutError(error_msg))
+        except Exception as e:
+            app_logger.log_error(e, "task_timeout_handling")
 
     def _update_execution_time_stats(self, task: Task) -> None:
         """更新执行时间统计
@@ -550,6 +932,7 @@ class TaskQueueManager(LifecycleComponent):
             "task_id": task.task_id,
             "task_type": task.task_type,
             "priority": task.priority.name,
+            "lane": task.lane.value,
             "status": task.status.value,
             "created_at": task.created_at,
             "started_at": task.started_at,
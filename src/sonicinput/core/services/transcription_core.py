@@ -1,7 +1,7 @@
 """重构后的转录核心模块 - 纯转录功能"""
 
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -92,6 +92,65 @@ class TranscriptionCore:
 
             return error_result
 
+    def transcribe_batch(
+        self,
+        audio_batch: List[np.ndarray],
+        language: Optional[str] = None,
+        temperature: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """批量转录多段音频
+
+        引擎提供 transcribe_batch 时一次解码整批，否则逐条调用 transcribe_audio。
+        整批失败时退回逐条转录，使单条坏数据不影响其他记录。
+
+        Args:
+            audio_batch: 音频数据列表
+            language: 指定语言（可选）
+            temperature: 温度参数
+
+        Returns:
+            与输入顺序一致的转录结果列表
+        """
+        if not audio_batch:
+            return []
+
+        batch_fn = getattr(self.whisper_engine, "transcribe_batch", None)
+        if batch_fn is None or len(audio_batch) == 1:
+            return [
+                self.transcribe_audio(audio, language, temperature)
+                for audio in audio_batch
+            ]
+
+        if not self.whisper_engine.is_model_loaded:
+            raise WhisperLoadError("Model not loaded. Call load_model first.")
+
+        start_time = time.time()
+        try:
+            results = batch_fn(audio_batch, language=language)
+        except Exception as e:
+            app_logger.log_error(e, "transcribe_batch")
+            return [
+                self.transcribe_audio(audio, language, temperature)
+                for audio in audio_batch
+            ]
+
+        processing_time = time.time() - start_time
+        app_logger.log_audio_event(
+            "Audio batch transcribed successfully",
+            {
+                "batch_size": len(audio_batch),
+                "duration": sum(len(audio) for audio in audio_batch) / 16000,
+                "processing_time": processing_time,
+            },
+        )
+
+        # 批处理耗时按条数平均分摊
+        per_item_time = processing_time / len(audio_batch)
+        return [
+            self._format_transcription_result(result, per_item_time)
+            for result in results
+        ]
+
     def _format_transcription_result(
         self, whisper_result: Dict[str, Any], processing_time: float
     ) -> Dict[str, Any]:
@@ -46,7 +46,15 @@ import numpy as np
 from .error_recovery_service import ErrorCategory, ErrorRecoveryService, ErrorSeverity
 from .model_manager import ModelManager, ModelState
 from .streaming_coordinator import StreamingChunk, StreamingCoordinator
-from .task_queue_manager import TaskPriority, TaskQueueManager, TaskStatus
+from .task_queue_manager import (
+    CancellationToken,
+    TaskCancelledError,
+    TaskLane,
+    TaskPriority,
+    TaskQueueFullError,
+    TaskQueueManager,
+    TaskStatus,
+)
 
 # 导出新的类名和类型
 from .transcription_core import TranscriptionCore
@@ -116,6 +124,10 @@ __all__ = [
     "ModelState",
     "TaskPriority",
     "TaskStatus",
+    "CancellationToken",
+    "TaskCancelledError",
+    "TaskLane",
+    "TaskQueueFullError",
     "StreamingChunk",
     "ErrorSeverity",
     "ErrorCategory",
@@ -5,21 +5,29 @@
 """
 
 import threading
-from typing import Any, Callable, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import numpy as np
 
 from ...core.base.lifecycle_component import LifecycleComponent
 from ...core.interfaces.speech import ISpeechService
+from ...core.interfaces.state import AppState
 from ...utils import WhisperLoadError, app_logger
 
 # IConfigReloadable removed - using service rebuild pattern instead
 from .config import ConfigKeys
 from .events import Events
 from .error_recovery_service import ErrorRecoveryService
+from .model_idle_policy import ModelIdlePolicy
 from .model_manager import ModelManager
 from .streaming_coordinator import StreamingCoordinator
-from .task_queue_manager import TaskPriority, TaskQueueManager
+from .task_queue_manager import (
+    CancellationToken,
+    TaskLane,
+    TaskPriority,
+    TaskQueueManager,
+)
 from .transcription_core import TranscriptionCore
 
 
@@ -34,19 +42,50 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
     - ErrorRecoveryService: 错误恢复服务
 
     这个类主要负责组件间的协调和对外提供统一的API接口。
+
+    录音和处理期间（AppState.RECORDING / PROCESSING）后台通道暂停，
+    正在运行的可取消后台任务被抢占；模型加载和重载走后台通道，不经过任务
+    队列的后台工作（批量重处理、历史记录重试）通过 wait_for_background_slot()
+    等待。
+
+    模型空闲超过 transcription.local.idle_unload_minutes 后由 ModelIdlePolicy
+    卸载；按下热键时 prefetch_model() 在后台重载，与录音并行。重载尚未完成时
+    转录请求优先交给 fallback_service_factory 创建的云端服务，没有云端服务时
+    等待重载完成。
+
+    启用 transcription.local.realtime_rescoring 时持有一个 SegmentRescorer，
+    realtime 会话用它在后台以离线模型重打分每个已结束的分段（两遍识别）。
     """
 
-    def __init__(self, speech_service_factory, event_service=None, config_service=None):
+    # 这些应用状态下只运行交互任务
+    INTERACTIVE_APP_STATES = frozenset(
+        {AppState.RECORDING.value, AppState.PROCESSING.value}
+    )
+
+    # 空闲卸载后没有云端兜底时，转录请求等待重载的最长时间（秒）
+    IDLE_RELOAD_WAIT_TIMEOUT = 120.0
+
+    def __init__(
+        self,
+        speech_service_factory,
+        event_service=None,
+        config_service=None,
+        fallback_service_factory: Optional[Callable[[], Any]] = None,
+    ):
         """初始化重构后的转录服务
 
         Args:
             speech_service_factory: 语音服务工厂函数
             event_service: 事件服务（可选）
             config_service: 配置服务（可选）
+            fallback_service_factory: 云端兜底服务工厂（可选），空闲卸载的
+                模型重载期间用它转录，返回 None 表示没有可用的云端服务
         """
         super().__init__("TranscriptionService")
         self.event_service = event_service
         self.config_service = config_service
+        self._fallback_service_factory = fallback_service_factory
+        self._fallback_service = None
 
         app_logger.audio(
             "TranscriptionService __init__ called",
@@ -77,17 +116,48 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 {"streaming_mode": streaming_mode},
             )
 
+        warm_up = True
+        idle_unload_minutes = 0
+        if config_service:
+            warm_up = config_service.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_WARM_UP, True
+            )
+            idle_unload_minutes = config_service.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_IDLE_UNLOAD_MINUTES, 0
+            )
+
         # 创建专职组件
-        self.model_manager = ModelManager(speech_service_factory, event_service)
+        # 实时会话直接持有引擎，会话结束前不卸载热切换下来的旧引擎
+        self.model_manager = ModelManager(
+            speech_service_factory,
+            event_service,
+            warm_up=warm_up,
+            can_release=lambda: not self.streaming_coordinator.is_streaming(),
+            config_service=config_service,
+        )
         self.transcription_core = None  # 将在model加载后创建
         self.streaming_coordinator = StreamingCoordinator(event_service, streaming_mode)
         self.task_queue_manager = TaskQueueManager(
             worker_count=1, event_service=event_service
         )
         self.error_recovery_service = ErrorRecoveryService(event_service)
+        self.idle_policy = ModelIdlePolicy(
+            self.model_manager,
+            idle_timeout=self._idle_minutes_to_seconds(idle_unload_minutes),
+            on_evicted=self._on_model_idle_unloaded,
+            on_reloaded=self._on_model_idle_reloaded,
+            can_evict=self._can_idle_unload,
+        )
+
+        # realtime 两遍识别的离线重打分器（按配置启用）
+        self.segment_rescorer = None
 
         # 状态管理（LifecycleComponent 提供 _state，不需要 _is_started）
         self._service_lock = threading.RLock()
+        self._app_state_listener_id: Optional[str] = None
+        self._processing = False
+        self._idle_config_unsubscribe: Optional[Callable[[], None]] = None
+        self._rescoring_config_unsubscribe: Optional[Callable[[], None]] = None
 
         # 注册任务处理器
         self._register_task_handlers()
@@ -108,6 +178,16 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 # 启动各个组件
                 self.model_manager.start()
                 self.task_queue_manager.start()
+                self._subscribe_app_state()
+                self._subscribe_idle_config()
+                self.idle_policy.start()
+                self._subscribe_rescoring_config()
+                if self.config_service:
+                    self._set_realtime_rescoring(
+                        self.config_service.get_setting(
+                            ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_RESCORING, False
+                        )
+                    )
 
                 # 不再自动加载模型，由ApplicationOrchestrator根据配置决定是否加载
                 # 这避免了冗余的模型加载
@@ -178,7 +258,16 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 # 停止流式转录 (LifecycleComponent)
                 self.streaming_coordinator.stop()
 
+                # 停止空闲卸载
+                self.idle_policy.stop()
+                self._unsubscribe_idle_config()
+
+                # 停止离线重打分
+                self._unsubscribe_rescoring_config()
+                self._set_realtime_rescoring(False)
+
                 # 停止任务队列
+                self._unsubscribe_app_state()
                 self.task_queue_manager.stop()
 
                 # 停止模型管理器
@@ -206,6 +295,232 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 )
                 return False
 
+    def _subscribe_app_state(self) -> None:
+        """订阅应用状态，录音/处理期间暂停后台通道"""
+        if not self.event_service or self._app_state_listener_id:
+            return
+        try:
+            self._app_state_listener_id = self.event_service.subscribe(
+                Events.APP_STATE_CHANGED, self._on_app_state_changed
+            )
+        except Exception as e:
+            app_logger.log_error(e, "transcription_subscribe_app_state")
+
+    def _unsubscribe_app_state(self) -> None:
+        if self.event_service and self._app_state_listener_id:
+            try:
+                self.event_service.unsubscribe(
+                    Events.APP_STATE_CHANGED, self._app_state_listener_id
+                )
+            except Exception as e:
+                app_logger.log_error(e, "transcription_unsubscribe_app_state")
+        self._app_state_listener_id = None
+
+    def _on_app_state_changed(self, data: Dict[str, Any]) -> None:
+        new_state = (data or {}).get("new_state")
+        if new_state in self.INTERACTIVE_APP_STATES:
+            self._processing = True
+            self.prefetch_model()
+            self.pause_background_work()
+        elif new_state is not None:
+            self._processing = False
+            self.resume_background_work()
+
+    # ---- 空闲卸载 ----
+
+    @staticmethod
+    def _idle_minutes_to_seconds(minutes: Any) -> float:
+        try:
+            return max(0.0, float(minutes)) * 60
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _subscribe_idle_config(self) -> None:
+        """空闲卸载时长修改后立即生效"""
+        subscribe = getattr(self.config_service, "subscribe", None)
+        if not callable(subscribe) or self._idle_config_unsubscribe:
+            return
+        try:
+            self._idle_config_unsubscribe = subscribe(
+                ConfigKeys.TRANSCRIPTION_LOCAL_IDLE_UNLOAD_MINUTES,
+                lambda key, old, new: self.idle_policy.set_idle_timeout(
+                    self._idle_minutes_to_seconds(new)
+                ),
+            )
+        except Exception as e:
+            app_logger.log_error(e, "transcription_subscribe_idle_config")
+
+    def _unsubscribe_idle_config(self) -> None:
+        if self._idle_config_unsubscribe:
+            self._idle_config_unsubscribe()
+        self._idle_config_unsubscribe = None
+
+    # ---- realtime 两遍识别 ----
+
+    def _set_realtime_rescoring(self, enabled: Any) -> None:
+        """启用或关闭离线重打分器，启用时在后台加载离线模型"""
+        if enabled and self.segment_rescorer is None:
+            from ...speech.segment_rescorer import SegmentRescorer
+
+            get = self.config_service.get_setting
+            self.segment_rescorer = SegmentRescorer(
+                model_name=get(
+                    ConfigKeys.TRANSCRIPTION_LOCAL_RESCORING_MODEL,
+                    SegmentRescorer.DEFAULT_MODEL,
+                ),
+                variant=get(ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT, None),
+                num_threads=get(ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS, 0),
+            )
+            self.segment_rescorer.start()
+            app_logger.audio(
+                "Realtime rescoring enabled",
+                {"model": self.segment_rescorer.model_name},
+            )
+        elif not enabled and self.segment_rescorer is not None:
+            self.segment_rescorer.stop()
+            self.segment_rescorer = None
+            app_logger.audio("Realtime rescoring disabled", {})
+
+    def get_segment_rescorer(self):
+        """realtime 会话使用的重打分器；未启用或离线模型尚未就绪时返回 None"""
+        rescorer = self.segment_rescorer
+        if rescorer is None or not rescorer.is_ready:
+            return None
+        return rescorer
+
+    def _subscribe_rescoring_config(self) -> None:
+        """两遍识别开关修改后立即生效（从下一次录音开始）"""
+        subscribe = getattr(self.config_service, "subscribe", None)
+        if not callable(subscribe) or self._rescoring_config_unsubscribe:
+            return
+        try:
+            self._rescoring_config_unsubscribe = subscribe(
+                ConfigKeys.TRANSCRIPTION_LOCAL_REALTIME_RESCORING,
+                lambda key, old, new: self._set_realtime_rescoring(new),
+            )
+        except Exception as e:
+            app_logger.log_error(e, "transcription_subscribe_rescoring_config")
+
+    def _unsubscribe_rescoring_config(self) -> None:
+        if self._rescoring_config_unsubscribe:
+            self._rescoring_config_unsubscribe()
+        self._rescoring_config_unsubscribe = None
+
+    def _can_idle_unload(self) -> bool:
+        """录音/处理期间不卸载；实时模式的会话在按下热键时就需要模型，也不卸载"""
+        return (
+            not self._processing
+            and not self.streaming_coordinator.is_streaming()
+            and self.streaming_coordinator.get_streaming_mode() != "realtime"
+        )
+
+    def _on_model_idle_unloaded(self, info: Dict[str, Any]) -> None:
+        self.transcription_core = None
+        # 下次使用时重新创建，期间修改的云端配置也能生效
+        self._fallback_service = None
+        if self.event_service:
+            self.event_service.emit(Events.MODEL_IDLE_UNLOADED, info)
+
+    def _on_model_idle_reloaded(self, info: Dict[str, Any]) -> None:
+        if info.get("success"):
+            whisper_engine = self.model_manager.get_whisper_engine()
+            if whisper_engine:
+                self.transcription_core = TranscriptionCore(whisper_engine)
+        if self.event_service:
+            self.event_service.emit(Events.MODEL_IDLE_RELOADED, info)
+
+    @contextmanager
+    def _model_in_use(self) -> Iterator[None]:
+        """转录期间持有：阻止空闲卸载，并固定当前引擎直到转录结束
+
+        模型热切换后，第一次使用时把转录核心换到新引擎上；旧引擎上
+        进行中的转录照常完成。
+        """
+        with self.idle_policy.in_use(), self.model_manager.engine_in_use() as engine:
+            if engine is not None and (
+                self.transcription_core is None
+                or self.transcription_core.whisper_engine is not engine
+            ):
+                self.transcription_core = TranscriptionCore(engine)
+            yield
+
+    def prefetch_model(self) -> bool:
+        """模型被空闲卸载时在后台开始重载（按下热键时调用）
+
+        Returns:
+            True 表示重载正在进行
+        """
+        return self.idle_policy.prefetch()
+
+    def _get_fallback_service(self):
+        if self._fallback_service is None and self._fallback_service_factory:
+            try:
+                self._fallback_service = self._fallback_service_factory()
+            except Exception as e:
+                app_logger.log_error(e, "create_fallback_speech_service")
+        return self._fallback_service
+
+    def _transcribe_with_fallback(
+        self, audio_data: np.ndarray, language: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """模型被空闲卸载、重载尚未完成时用云端服务转录
+
+        Returns:
+            转录结果；本地模型可用、没有云端服务或云端转录失败时返回 None
+            （调用方改为等待本地模型）
+        """
+        if not self.idle_policy.is_evicted:
+            return None
+        self.idle_policy.prefetch()
+        fallback = self._get_fallback_service()
+        if fallback is None:
+            return None
+
+        try:
+            result = dict(fallback.transcribe(audio_data, language=language))
+        except Exception as e:
+            app_logger.log_error(e, "fallback_transcribe")
+            return None
+        if result.get("error"):
+            return None
+
+        self.idle_policy.record_fallback()
+        result.setdefault("success", True)
+        result["fallback_provider"] = getattr(
+            fallback, "provider_id", type(fallback).__name__
+        )
+        app_logger.log_audio_event(
+            "Transcribed with cloud fallback while model reloads",
+            {
+                "provider": result["fallback_provider"],
+                "text_length": len(result.get("text", "")),
+            },
+        )
+        return result
+
+    def pause_background_work(self, preempt: bool = True) -> int:
+        """暂停后台任务通道（用户开始听写时调用）
+
+        Args:
+            preempt: 是否抢占正在运行的可取消后台任务
+
+        Returns:
+            被抢占的任务数量
+        """
+        return self.task_queue_manager.pause_lane(TaskLane.BACKGROUND, preempt)
+
+    def resume_background_work(self) -> None:
+        """恢复后台任务通道"""
+        self.task_queue_manager.resume_lane(TaskLane.BACKGROUND)
+
+    def wait_for_background_slot(self, timeout: Optional[float] = None) -> bool:
+        """等待后台通道开放（批量重处理等直接调用模型的后台工作使用）
+
+        Returns:
+            True 表示可以执行后台工作，False 表示超时
+        """
+        return self.task_queue_manager.wait_for_lane(TaskLane.BACKGROUND, timeout)
+
     def transcribe(
         self,
         audio_data: np.ndarray,
@@ -292,8 +607,23 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         Raises:
             WhisperLoadError: 如果转录核心不可用
         """
+        with self._model_in_use():
+            return self._transcribe_sync_locked(
+                audio_data, language, temperature, emit_event
+            )
+
+    def _transcribe_sync_locked(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str],
+        temperature: float,
+        emit_event: bool,
+    ) -> Dict[str, Any]:
+        """transcribe_sync 的实现，调用方持有 _model_in_use()"""
+        result = self._transcribe_with_fallback(audio_data, language)
+
         # 检查核心资源（而非服务状态）
-        if not self.ensure_transcription_core():
+        if result is None and not self.ensure_transcription_core():
             raise WhisperLoadError(
                 "Transcription core not available. "
                 "Please ensure the model is loaded or the service is started."
@@ -301,9 +631,10 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
 
         try:
             # 使用转录核心进行同步转录
-            result = self.transcription_core.transcribe_audio(
-                audio_data, language, temperature
-            )
+            if result is None:
+                result = self.transcription_core.transcribe_audio(
+                    audio_data, language, temperature
+                )
 
             # 仅在明确要求时发送转录完成事件
             # 注意：retry等手动转录不应触发事件，避免与正常录音流程冲突
@@ -339,6 +670,44 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 "error_result": error_result,
             }
 
+    def transcribe_batch(
+        self,
+        audio_batch: List[np.ndarray],
+        language: Optional[str] = None,
+        temperature: float = 0.0,
+    ) -> List[Dict[str, Any]]:
+        """批量转录多段音频（同步，不发送事件）
+
+        用于历史记录批量重处理。本地引擎一次解码整批，其他引擎逐条转录。
+
+        Args:
+            audio_batch: 音频数据列表
+            language: 指定语言（可选）
+            temperature: 温度参数
+
+        Returns:
+            与输入顺序一致的转录结果列表
+
+        Raises:
+            WhisperLoadError: 如果转录核心不可用
+        """
+        with self._model_in_use():
+            if not self.ensure_transcription_core():
+                raise WhisperLoadError(
+                    "Transcription core not available. "
+                    "Please ensure the model is loaded or the service is started."
+                )
+
+            try:
+                return self.transcription_core.transcribe_batch(
+                    audio_batch, language, temperature
+                )
+            except Exception as e:
+                app_logger.log_error(e, "transcribe_batch")
+                return [
+                    {"success": False, "text": "", "error": str(e)} for _ in audio_batch
+                ]
+
     def start_streaming(self) -> None:
         """开始流式转录模式"""
         if not self.is_running:
@@ -357,19 +726,21 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         streaming_mode = self.streaming_coordinator.get_streaming_mode()
 
         if streaming_mode == "realtime":
-            # Realtime 模式：直接获取最终文本
+            # Realtime 模式：停止时会话只解码最后一段，返回完整转录和分段
+            stats = self.streaming_coordinator.stop_streaming()
             final_text = self.streaming_coordinator.get_realtime_text()
+            segments = self.streaming_coordinator.get_realtime_segments()
 
             app_logger.audio(
-                "Getting realtime transcription text", {"text_length": len(final_text)}
+                "Realtime streaming stopped",
+                {
+                    "text_length": len(final_text),
+                    "segments": len(segments),
+                    "stats": stats,
+                },
             )
 
-            # 停止流式模式
-            stats = self.streaming_coordinator.stop_streaming()
-
-            app_logger.audio("Realtime streaming stopped", stats)
-
-            return {"text": final_text, "stats": stats}
+            return {"text": final_text, "stats": stats, "segments": segments}
 
         else:
             # Chunked 模式：处理待处理的块
@@ -491,7 +862,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         Returns:
             任务ID
         """
-        # 提交模型加载任务
+        # 提交模型加载任务（后台通道：听写期间暂停，需要时由转录路径直接加载）
         task_id = self.task_queue_manager.submit_task(
             task_type="load_model",
             data={"model_name": model_name, "timeout": timeout},
@@ -500,6 +871,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             error_callback=error_callback,
             timeout=float(timeout + 60),  # 额外60秒缓冲
             max_retries=1,
+            lane=TaskLane.BACKGROUND,
         )
 
         return task_id
@@ -532,7 +904,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         Returns:
             任务ID
         """
-        # 提交模型重载任务
+        # 提交模型重载任务（后台通道：开始听写时被抢占，旧模型继续服务）
         task_id = self.task_queue_manager.submit_task(
             task_type="reload_model",
             data={"model_name": model_name, "use_gpu": use_gpu},
@@ -541,6 +913,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             error_callback=error_callback,
             timeout=600.0,  # 10分钟超时
             max_retries=1,
+            lane=TaskLane.BACKGROUND,
         )
 
         return task_id
@@ -591,6 +964,10 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         status = {
             "service_started": self.is_running,
             "model_status": self.model_manager.get_model_info(),
+            "idle_unload": self.idle_policy.get_stats(),
+            "rescoring": self.segment_rescorer.get_stats()
+            if self.segment_rescorer
+            else None,
             "streaming_status": self.streaming_coordinator.get_stats(),
             "task_queue_status": self.task_queue_manager.get_stats(),
             "error_recovery_status": self.error_recovery_service.get_error_stats(),
@@ -631,8 +1008,9 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         检查并尝试恢复转录核心资源。支持以下场景：
         1. 核心已存在 - 直接返回 True
         2. 核心丢失但模型可用 - 自动恢复（如热重载后）
-        3. 模型未加载（本地提供商）- 自动加载模型然后创建核心
-        4. 无法恢复 - 返回 False，记录详细诊断信息
+        3. 模型被空闲卸载 - 触发（或等待进行中的）后台重载
+        4. 模型未加载（本地提供商）- 自动加载模型然后创建核心
+        5. 无法恢复 - 返回 False，记录详细诊断信息
 
         Returns:
             True如果转录核心可用，False表示无法恢复
@@ -641,11 +1019,21 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             在独立调用场景（如 retry、测试）中使用此方法验证资源可用性，
             而不是检查服务生命周期状态（is_running）。
         """
-        # 1. 核心已存在
-        if self.transcription_core:
+        # 1. 核心已存在（且没有被热切换换下）
+        current_engine = self.model_manager.get_whisper_engine()
+        if self.transcription_core and (
+            current_engine is None
+            or self.transcription_core.whisper_engine is current_engine
+        ):
             return True
 
         try:
+            # 3. 空闲卸载后的重载（与热键预取共用同一次加载）；模型已加载但
+            # 重载回调尚未完成时同样等待
+            if self.idle_policy.is_evicted or self.idle_policy.is_reloading:
+                self.idle_policy.prefetch()
+                self.idle_policy.wait_until_ready(self.IDLE_RELOAD_WAIT_TIMEOUT)
+
             # 2. 尝试从已加载的引擎恢复
             whisper_engine = self.model_manager.get_whisper_engine()
             if whisper_engine:
@@ -656,7 +1044,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                 )
                 return True
 
-            # 3. 模型未加载，尝试自动加载（仅本地提供商）
+            # 4. 模型未加载，尝试自动加载（仅本地提供商）
             if self.config_service:
                 provider = self.config_service.get_setting(
                     "transcription.provider", "local"
@@ -677,7 +1065,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
                             )
                             return True
 
-            # 4. 无法恢复 - 记录详细诊断信息
+            # 5. 无法恢复 - 记录详细诊断信息
             app_logger.warning(
                 "Cannot recreate transcription core: whisper engine unavailable",
                 context={
@@ -698,11 +1086,16 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             )
             return False
 
-    def _handle_transcribe_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_transcribe_task(
+        self,
+        task_data: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
         """处理转录任务
 
         Args:
             task_data: 任务数据
+            cancel_token: 取消令牌（任务超时或被取消后不再开始转录）
 
         Returns:
             转录结果
@@ -711,48 +1104,64 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         language = task_data.get("language")
         temperature = task_data.get("temperature", 0.0)
 
-        # 尝试确保转录核心可用
-        if not self.ensure_transcription_core():
-            # 提供详细的错误信息帮助诊断
-            error_info = {
-                "service_started": self.is_running,
-                "model_loaded": self.model_manager.is_model_loaded()
-                if self.model_manager
-                else False,
-                "whisper_engine_available": self.model_manager.get_whisper_engine()
-                is not None
-                if self.model_manager
-                else False,
-            }
-            app_logger.error(
-                "Transcription core not available",
-                Exception("Transcription core not available"),
-                context=error_info,
-                category="transcribe_task_failed",
-            )
-            raise WhisperLoadError("Transcription core not available")
+        with self._model_in_use():
+            # 模型被空闲卸载、重载尚未完成时先用云端兜底
+            result = self._transcribe_with_fallback(audio_data, language)
+            if result is not None:
+                return result
+
+            # 尝试确保转录核心可用
+            if not self.ensure_transcription_core():
+                # 提供详细的错误信息帮助诊断
+                error_info = {
+                    "service_started": self.is_running,
+                    "model_loaded": self.model_manager.is_model_loaded()
+                    if self.model_manager
+                    else False,
+                    "whisper_engine_available": self.model_manager.get_whisper_engine()
+                    is not None
+                    if self.model_manager
+                    else False,
+                }
+                app_logger.error(
+                    "Transcription core not available",
+                    Exception("Transcription core not available"),
+                    context=error_info,
+                    category="transcribe_task_failed",
+                )
+                raise WhisperLoadError("Transcription core not available")
 
-        try:
-            return self.transcription_core.transcribe_audio(
-                audio_data, language, temperature
-            )
-        except Exception as e:
-            app_logger.error(
-                "Transcription core transcription failed",
-                e,
-                context={
-                    "audio_length": len(audio_data),
-                    "language": language,
-                    "temperature": temperature,
-                },
-            )
-            raise
+            # 确保转录核心可能触发模型恢复，耗时较长，开始推理前再检查一次
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            try:
+                return self.transcription_core.transcribe_audio(
+                    audio_data, language, temperature
+                )
+            except Exception as e:
+                app_logger.error(
+                    "Transcription core transcription failed",
+                    e,
+                    context={
+                        "audio_length": len(audio_data),
+                        "language": language,
+                        "temperature": temperature,
+                    },
+                )
+                raise
 
-    def _handle_load_model_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_load_model_task(
+        self,
+        task_data: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
         """处理模型加载任务
 
         Args:
             task_data: 任务数据
+            cancel_token: 取消令牌（加载开始前检查；被抢占的任务稍后重新执行，
+                届时模型若已加载则立即返回）
 
         Returns:
             加载结果
@@ -760,6 +1169,9 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         model_name = task_data.get("model_name")
         timeout = task_data.get("timeout", 300)
 
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
         success = self.model_manager.load_model(model_name, timeout)
 
         if success:
@@ -774,11 +1186,16 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             "model_info": self.model_manager.get_model_info(),
         }
 
-    def _handle_reload_model_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_reload_model_task(
+        self,
+        task_data: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
         """处理模型重载任务
 
         Args:
             task_data: 任务数据
+            cancel_token: 取消令牌（抢占时丢弃尚未替换的新引擎）
 
         Returns:
             重载结果
@@ -786,7 +1203,7 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         model_name = task_data.get("model_name")
         use_gpu = task_data.get("use_gpu")
 
-        success = self.model_manager.reload_model(model_name, use_gpu)
+        success = self.model_manager.reload_model(model_name, use_gpu, cancel_token)
 
         if success:
             # 更新转录核心
@@ -801,11 +1218,16 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             "model_info": self.model_manager.get_model_info(),
         }
 
-    def _handle_streaming_chunk_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_streaming_chunk_task(
+        self,
+        task_data: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
         """处理流式转录块任务
 
         Args:
             task_data: 任务数据
+            cancel_token: 取消令牌（排队期间已取消的块不再转录）
 
         Returns:
             处理结果
@@ -813,64 +1235,68 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
         chunk_id = task_data["chunk_id"]
         audio_data = task_data["audio_data"]
 
-        if not self.transcription_core:
-            # 提供详细的错误信息帮助诊断
-            error_info = {
-                "service_started": self.is_running,
-                "model_loaded": self.model_manager.is_model_loaded()
-                if self.model_manager
-                else False,
-                "whisper_engine_available": self.model_manager.get_whisper_engine()
-                is not None
-                if self.model_manager
-                else False,
-                "chunk_id": chunk_id,
-            }
-            app_logger.error(
-                "Transcription core not available for streaming chunk",
-                Exception("Transcription core not available for streaming chunk"),
-                context=error_info,
-                category="streaming_chunk_failed",
-            )
+        with self._model_in_use():
+            # 模型被空闲卸载时：有云端兜底就直接转录，否则等待重载完成
+            result = self._transcribe_with_fallback(audio_data)
+            if result is not None:
+                self.streaming_coordinator.complete_chunk(chunk_id, result)
+                return result
+            if self.transcription_core is None and (
+                self.idle_policy.is_evicted or self.idle_policy.is_reloading
+            ):
+                self.ensure_transcription_core()
+
+            if not self.transcription_core:
+                # 提供详细的错误信息帮助诊断
+                error_info = {
+                    "service_started": self.is_running,
+                    "model_loaded": self.model_manager.is_model_loaded()
+                    if self.model_manager
+                    else False,
+                    "whisper_engine_available": self.model_manager.get_whisper_engine()
+                    is not None
+                    if self.model_manager
+                    else False,
+                    "chunk_id": chunk_id,
+                }
+                app_logger.error(
+                    "Transcription core not available for streaming chunk",
+                    Exception("Transcription core not available for streaming chunk"),
+                    context=error_info,
+                    category="streaming_chunk_failed",
+                )
 
-            error_result = {
-                "success": False,
-                "error": "Transcription core not available",
-            }
-            self.streaming_coordinator.complete_chunk(chunk_id, error_result)
-            return error_result
+                error_result = {
+                    "success": False,
+                    "error": "Transcription core not available",
+                }
+                self.streaming_coordinator.complete_chunk(chunk_id, error_result)
+                return error_result
 
-        try:
-            # 转录音频块
-            result = self.transcription_core.transcribe_audio(audio_data)
+            try:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
 
-            # 完成流式块
-            self.streaming_coordinator.complete_chunk(chunk_id, result)
+                # 转录音频块
+                result = self.transcription_core.transcribe_audio(audio_data)
 
-            return result
+                # 完成流式块
+                self.streaming_coordinator.complete_chunk(chunk_id, result)
 
-        except Exception as e:
-            # 标记块为失败
-            error_result = {"success": False, "error": str(e)}
-            self.streaming_coordinator.complete_chunk(chunk_id, error_result)
+                return result
 
-            app_logger.error(
-                "Streaming chunk transcription failed",
-                e,
-                context={"chunk_id": chunk_id, "audio_length": len(audio_data)},
-            )
+            except Exception as e:
+                # 标记块为失败
+                error_result = {"success": False, "error": str(e)}
+                self.streaming_coordinator.complete_chunk(chunk_id, error_result)
 
-            raise
+                app_logger.error(
+                    "Streaming chunk transcription failed",
+                    e,
+                    context={"chunk_id": chunk_id, "audio_length": len(audio_data)},
+                )
 
-    def start_streaming_processing(self) -> None:
-        """开始处理流式转录块"""
-        # 提交一个持续处理流式块的任务
-        self.task_queue_manager.submit_task(
-            task_type="streaming_processor",
-            data={},
-            priority=TaskPriority.LOW,
-            max_retries=0,
-        )
+                raise
 
     def reload_streaming_mode(self) -> None:
         """重新加载流式模式配置"""
@@ -985,6 +1411,9 @@ class RefactoredTranscriptionService(LifecycleComponent, ISpeechService):
             "transcription.local.language",
             "transcription.local.auto_load",
             "transcription.local.streaming_mode",
+            "transcription.local.variant",
+            "transcription.local.num_threads",
+            "transcription.local.idle_unload_minutes",
             "transcription.groq.api_key",
             "transcription.groq.model",
             "transcription.groq.base_url",
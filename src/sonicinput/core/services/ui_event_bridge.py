@@ -10,7 +10,7 @@
 from typing import Any, Callable, Dict
 
 from ...utils import app_logger
-from ..interfaces import IEventService
+from ..interfaces import EventDelivery, IEventService
 from .events import Events
 
 
@@ -187,8 +187,13 @@ class UIEventBridge:
         self.events.on(Events.TEXT_INPUT_COMPLETED, self.handle_text_input_completed)
         self.events.on(Events.AUDIO_LEVEL_UPDATE, self.handle_audio_level_update)
 
-        # Realtime 转录更新事件
-        self.events.on(Events.REALTIME_TEXT_UPDATED, self.handle_realtime_text_update)
+        # Realtime 转录更新事件：处理器只记录日志和调用自定义处理器，
+        # 放到事件工作线程执行，不占用转录线程
+        self.events.on(
+            Events.REALTIME_TEXT_UPDATED,
+            self.handle_realtime_text_update,
+            delivery=EventDelivery.WORKER,
+        )
 
         # 错误事件
         self.events.on(Events.TRANSCRIPTION_ERROR, self.handle_error)
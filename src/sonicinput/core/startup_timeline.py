@@ -0,0 +1,130 @@
+"""启动时间线
+
+记录应用启动过程中各服务的启动区间（所在线程、起止时间、结果）和
+关键里程碑（如热键就绪），用于分析启动耗时和并行度。
+时间均为相对于时间线原点的秒数，原点默认是时间线创建时刻。
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from ..utils import app_logger
+
+
+@dataclass
+class StartupSpan:
+    """单个启动步骤"""
+
+    name: str
+    category: str
+    thread: str
+    start: float
+    end: Optional[float] = None
+    status: str = "running"
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.end is None:
+            return None
+        return self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["duration"] = self.duration
+        return data
+
+
+class StartupTimeline:
+    """线程安全的启动时间线"""
+
+    def __init__(self, origin: Optional[float] = None):
+        """初始化时间线
+
+        Args:
+            origin: time.perf_counter() 基准时刻，默认取当前时刻
+        """
+        self._origin = time.perf_counter() if origin is None else origin
+        self._spans: List[StartupSpan] = []
+        self._marks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        """相对原点的当前时间（秒）"""
+        return time.perf_counter() - self._origin
+
+    def begin(self, name: str, category: str = "service") -> StartupSpan:
+        """开始记录一个启动步骤"""
+        span = StartupSpan(
+            name=name,
+            category=category,
+            thread=threading.current_thread().name,
+            start=self.now(),
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def end(self, span: StartupSpan, status: str = "ok") -> None:
+        """结束启动步骤"""
+        span.end = self.now()
+        span.status = status
+
+    def mark(self, name: str) -> float:
+        """记录里程碑（同名里程碑只保留第一次）"""
+        with self._lock:
+            return self._marks.setdefault(name, self.now())
+
+    def get_mark(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._marks.get(name)
+
+    def get_report(self) -> Dict[str, Any]:
+        """生成启动报告
+
+        Returns:
+            包含 spans（按开始时间排序）、marks、total（最晚结束时间）、
+            busy（各步骤耗时之和）和 parallelism（busy / total）的字典
+        """
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: s.start)
+            marks = dict(self._marks)
+
+        finished = [s for s in spans if s.end is not None]
+        total = max((s.end for s in finished), default=0.0)
+        busy = sum(s.duration for s in finished if s.category == "service")
+        return {
+            "spans": [s.to_dict() for s in spans],
+            "marks": marks,
+            "total": total,
+            "busy": busy,
+            "parallelism": busy / total if total > 0 else 0.0,
+        }
+
+    def log_report(self, message: str = "Startup timeline") -> Dict[str, Any]:
+        """将启动报告写入日志并返回"""
+        report = self.get_report()
+        app_logger.log_audio_event(
+            message,
+            {
+                "marks_ms": {k: round(v * 1000, 1) for k, v in report["marks"].items()},
+                "total_ms": round(report["total"] * 1000, 1),
+                "parallelism": round(report["parallelism"], 2),
+                "spans": [
+                    {
+                        "name": s["name"],
+                        "thread": s["thread"],
+                        "start_ms": round(s["start"] * 1000, 1),
+                        "duration_ms": (
+                            None
+                            if s["duration"] is None
+                            else round(s["duration"] * 1000, 1)
+                        ),
+                        "status": s["status"],
+                    }
+                    for s in report["spans"]
+                ],
+            },
+        )
+        return report
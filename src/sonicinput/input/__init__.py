@@ -1,7 +1,34 @@
-"""文本输入模块初始化"""
+"""文本输入模块初始化
 
-from .clipboard_input import ClipboardInput
-from .sendinput import SendInputMethod
-from .smart_input import SmartTextInput
+导出对象在首次访问时才导入（PEP 562）。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .clipboard_input import ClipboardInput
+    from .sendinput import SendInputMethod
+    from .smart_input import SmartTextInput
+
+_LAZY_IMPORTS = {
+    "ClipboardInput": ".clipboard_input",
+    "SendInputMethod": ".sendinput",
+    "SmartTextInput": ".smart_input",
+}
 
 __all__ = ["ClipboardInput", "SendInputMethod", "SmartTextInput"]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
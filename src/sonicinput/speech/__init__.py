@@ -1,17 +1,50 @@
-"""语音识别模块初始化"""
+"""语音识别模块初始化
 
-from .groq_speech_service import GroqSpeechService
-from .null_speech_service import NullSpeechService
-from .sherpa_engine import SherpaEngine
-from .sherpa_models import SherpaModelManager
-from .sherpa_streaming import SherpaStreamingSession
-from .speech_service_factory import SpeechServiceFactory
+导出对象在首次访问时才导入（PEP 562）：仅使用云服务时不会加载 sherpa-onnx。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .groq_speech_service import GroqSpeechService
+    from .null_speech_service import NullSpeechService
+    from .segment_rescorer import SegmentRescorer
+    from .sherpa_engine import SherpaEngine
+    from .sherpa_models import SherpaModelManager
+    from .sherpa_streaming import SherpaStreamingSession
+    from .speech_service_factory import SpeechServiceFactory
+
+_LAZY_IMPORTS = {
+    "GroqSpeechService": ".groq_speech_service",
+    "NullSpeechService": ".null_speech_service",
+    "SegmentRescorer": ".segment_rescorer",
+    "SherpaEngine": ".sherpa_engine",
+    "SherpaModelManager": ".sherpa_models",
+    "SherpaStreamingSession": ".sherpa_streaming",
+    "SpeechServiceFactory": ".speech_service_factory",
+}
 
 __all__ = [
     "SherpaEngine",
     "SherpaModelManager",
     "SherpaStreamingSession",
+    "SegmentRescorer",
     "GroqSpeechService",
     "NullSpeechService",
     "SpeechServiceFactory",
 ]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,61 @@
+"""识别质量与速度指标 - 错误率和实时率
+
+中英混合文本按"中文逐字、英文逐词"切分后计算编辑距离，
+即中文部分为 CER、英文部分为 WER（混合错误率，MER）。
+"""
+
+import re
+from typing import Iterable, List, Tuple
+
+# CJK 统一表意文字（含扩展 A 和兼容区）逐字；字母数字串逐词
+_TOKEN_PATTERN = re.compile(r"[\u3400-\u9fff\uf900-\ufaff]|[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    """切分为评测单元：汉字逐字、英文/数字逐词，忽略标点和大小写"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def edit_distance(reference: List[str], hypothesis: List[str]) -> int:
+    """两个单元序列的 Levenshtein 距离（替换、插入、删除各记 1）"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_token in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_token in enumerate(hypothesis, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_token != hyp_token),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def error_counts(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """返回 (编辑次数, 参考文本单元数)"""
+    ref_tokens = tokenize(reference)
+    return edit_distance(ref_tokens, tokenize(hypothesis)), len(ref_tokens)
+
+
+def word_error_rate(pairs: Iterable[Tuple[str, str]]) -> float:
+    """语料级错误率：所有句子编辑次数之和 / 参考单元数之和
+
+    Args:
+        pairs: (参考文本, 识别结果) 序列
+
+    Returns:
+        错误率（0.0 表示完全正确，可能大于 1.0）
+    """
+    edits = total = 0
+    for reference, hypothesis in pairs:
+        e, n = error_counts(reference, hypothesis)
+        edits += e
+        total += n
+    return edits / total if total else 0.0
+
+
+def real_time_factor(processing_seconds: float, audio_seconds: float) -> float:
+    """实时率（RTF）：处理耗时 / 音频时长，小于 1 表示快于实时"""
+    return processing_seconds / audio_seconds if audio_seconds > 0 else 0.0
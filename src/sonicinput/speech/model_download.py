@@ -0,0 +1,377 @@
+"""模型下载器 - 断点续传、边下边解压、SHA-256 校验
+
+下载的数据一边追加到 .part 文件、一边送入 tarfile 流式解压（"r|bz2"），
+只解压需要的文件到暂存目录；下载完成且校验通过后才把暂存目录换成模型目录。
+
+网络中断时保留 .part 文件，重试（或下次启动）通过 HTTP Range 续传：
+已下载的部分先从本地重放给解压器和哈希，再继续读取网络数据。
+"""
+
+import hashlib
+import http.client
+import shutil
+import tarfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from loguru import logger
+
+
+class ModelChecksumError(RuntimeError):
+    """下载内容的 SHA-256 与预期不符"""
+
+
+@dataclass
+class DownloadProgress:
+    """模型下载进度（字节数为整个压缩包的累计值）"""
+
+    model_name: str
+    phase: str  # "downloading" | "completed" | "failed"
+    downloaded: int = 0
+    total: int = 0
+    resumed_from: int = 0
+    extracted: List[str] = field(default_factory=list)
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def percent(self) -> float:
+        if self.total <= 0:
+            return 0.0
+        return min(100.0, self.downloaded * 100.0 / self.total)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["percent"] = round(self.percent, 1)
+        return data
+
+
+class _TeeReader:
+    """tarfile 的数据源：先重放 .part 文件，再读取网络并追加写入 .part
+
+    网络读取块大小自适应：读取很快时加倍，很慢时减半，
+    让高速链路减少系统调用、低速链路仍能及时汇报进度。
+    """
+
+    def __init__(
+        self,
+        part_path: Path,
+        resume_from: int,
+        response: Optional[BinaryIO],
+        total: int,
+        on_progress: Callable[[int], None],
+        chunk_size: int,
+        min_chunk: int,
+        max_chunk: int,
+    ):
+        self._replay: Optional[BinaryIO] = (
+            open(part_path, "rb") if resume_from > 0 else None
+        )
+        self._out = open(part_path, "ab" if resume_from > 0 else "wb")
+        self._response = response
+        self._total = total
+        self._on_progress = on_progress
+        self._buffer = bytearray()
+        self._eof = response is None
+        self.chunk_size = chunk_size
+        self._min_chunk = min_chunk
+        self._max_chunk = max_chunk
+        self.sha256 = hashlib.sha256()
+        self.downloaded = resume_from
+
+    def read(self, size: int = -1) -> bytes:
+        if self._replay is not None:
+            data = self._replay.read(size if size > 0 else -1)
+            if data:
+                self.sha256.update(data)
+                return data
+            self._replay.close()
+            self._replay = None
+
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            self._fill()
+
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+    def drain(self) -> None:
+        """读完剩余数据（解压器可能在压缩包末尾的填充之前就停止读取）"""
+        while self.read(self._max_chunk):
+            pass
+
+    def _fill(self) -> None:
+        start = time.perf_counter()
+        chunk = self._response.read(self.chunk_size)
+        elapsed = time.perf_counter() - start
+        if not chunk:
+            # 连接提前关闭时 http.client 只返回空数据，这里转成可续传的错误
+            if self._total and self.downloaded < self._total:
+                raise EOFError(
+                    f"Connection closed after {self.downloaded} of {self._total} bytes"
+                )
+            self._eof = True
+            return
+
+        self._out.write(chunk)
+        self.sha256.update(chunk)
+        self._buffer += chunk
+        self.downloaded += len(chunk)
+
+        if len(chunk) == self.chunk_size and elapsed < 0.05:
+            self.chunk_size = min(self.chunk_size * 2, self._max_chunk)
+        elif elapsed > 0.5:
+            self.chunk_size = max(self.chunk_size // 2, self._min_chunk)
+
+        self._on_progress(self.downloaded)
+
+    def close(self) -> None:
+        if self._replay is not None:
+            self._replay.close()
+        self._out.close()
+
+
+class ModelDownloader:
+    """可续传、可校验、边下边解压的模型下载器"""
+
+    INITIAL_CHUNK_SIZE = 64 * 1024
+    MIN_CHUNK_SIZE = 16 * 1024
+    MAX_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        progress_callback: Optional[Callable[[DownloadProgress], None]] = None,
+        progress_interval: float = 0.2,
+    ):
+        """初始化下载器
+
+        Args:
+            user_agent: HTTP User-Agent
+            timeout: 单次网络读取超时（秒）
+            max_retries: 网络错误后的续传重试次数
+            retry_delay: 首次重试前的等待（秒），之后指数退避
+            progress_callback: 进度回调，参数为 DownloadProgress
+            progress_interval: 下载中进度回调的最小间隔（秒）
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+
+    def download_and_extract(
+        self,
+        model_name: str,
+        url: str,
+        part_path: Path,
+        target_dir: Path,
+        files: Iterable[str],
+        sha256: Optional[str] = None,
+    ) -> Path:
+        """下载 .tar.bz2 压缩包并解压所需文件到 target_dir
+
+        Args:
+            model_name: 模型名称（用于进度汇报）
+            url: 压缩包地址
+            part_path: 未完成下载的保存路径（续传依据）
+            target_dir: 模型目录
+            files: 需要解压的文件名（压缩包内模型目录下的文件）
+            sha256: 压缩包的预期 SHA-256，None 表示只计算不校验
+
+        Returns:
+            模型目录路径
+
+        Raises:
+            ModelChecksumError: 校验失败（.part 文件会被删除）
+            RuntimeError: 重试后仍下载失败，或压缩包缺少所需文件
+        """
+        wanted = set(files)
+        staging_dir = target_dir.parent / f".{target_dir.name}.staging"
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Retrying download of {model_name} in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries + 1}): {last_error}"
+                )
+                time.sleep(delay)
+            try:
+                progress = self._attempt(
+                    model_name, url, part_path, staging_dir, wanted
+                )
+                break
+            except (
+                OSError,
+                URLError,
+                http.client.HTTPException,
+                tarfile.TarError,
+                EOFError,
+            ) as e:
+                last_error = e
+        else:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if isinstance(last_error, tarfile.TarError):
+                # 已下载的数据本身损坏，续传无意义
+                part_path.unlink(missing_ok=True)
+            self._report(DownloadProgress(model_name, "failed", error=str(last_error)))
+            raise RuntimeError(
+                f"Failed to download model {model_name}: {last_error}"
+            ) from last_error
+
+        digest = progress.sha256
+        if sha256 and digest != sha256.lower():
+            part_path.unlink(missing_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            message = f"SHA-256 mismatch for {model_name}: {digest} != {sha256}"
+            self._report(DownloadProgress(model_name, "failed", error=message))
+            raise ModelChecksumError(message)
+
+        missing = wanted - set(progress.extracted)
+        if missing:
+            part_path.unlink(missing_ok=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            message = f"Archive for {model_name} is missing {sorted(missing)}"
+            self._report(DownloadProgress(model_name, "failed", error=message))
+            raise RuntimeError(message)
+
+        # 整体替换模型目录，避免留下半新半旧的文件
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        staging_dir.rename(target_dir)
+        part_path.unlink(missing_ok=True)
+
+        progress.phase = "completed"
+        self._report(progress)
+        logger.info(
+            f"Model {model_name} downloaded: {progress.downloaded} bytes, "
+            f"sha256={digest}, files={sorted(progress.extracted)}"
+        )
+        return target_dir
+
+    def _attempt(
+        self,
+        model_name: str,
+        url: str,
+        part_path: Path,
+        staging_dir: Path,
+        wanted: set,
+    ) -> DownloadProgress:
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"User-Agent": self.user_agent}
+        if resume_from:
+            headers["Range"] = f"bytes={resume_from}-"
+
+        try:
+            response = urlopen(Request(url, headers=headers), timeout=self.timeout)
+        except HTTPError as e:
+            # 416: .part 已经是完整文件，只需本地重放
+            if e.code != 416 or not resume_from:
+                raise
+            response = None
+
+        try:
+            total = 0
+            if response is not None:
+                status = getattr(response, "status", 200)
+                if resume_from and status != 206:
+                    logger.info("Server ignored the Range request, restarting")
+                    resume_from = 0
+                length = int(response.headers.get("Content-Length") or 0)
+                total = resume_from + length if length else 0
+            else:
+                total = resume_from
+
+            progress = DownloadProgress(
+                model_name,
+                "downloading",
+                downloaded=resume_from,
+                total=total,
+                resumed_from=resume_from,
+            )
+            if resume_from:
+                logger.info(f"Resuming download of {model_name} at {resume_from} bytes")
+
+            last_report = [0.0]
+
+            def on_progress(downloaded: int) -> None:
+                progress.downloaded = downloaded
+                now = time.monotonic()
+                if now - last_report[0] >= self.progress_interval:
+                    last_report[0] = now
+                    self._report(progress)
+
+            reader = _TeeReader(
+                part_path,
+                resume_from,
+                response,
+                total,
+                on_progress,
+                self.INITIAL_CHUNK_SIZE,
+                self.MIN_CHUNK_SIZE,
+                self.MAX_CHUNK_SIZE,
+            )
+            try:
+                progress.extracted = self._extract(reader, staging_dir, wanted)
+                reader.drain()
+            finally:
+                reader.close()
+        finally:
+            if response is not None:
+                response.close()
+
+        progress.downloaded = reader.downloaded
+        if total and reader.downloaded != total:
+            raise EOFError(f"Incomplete download: {reader.downloaded} of {total} bytes")
+        progress.total = reader.downloaded
+        progress.sha256 = reader.sha256.hexdigest()
+        return progress
+
+    def _extract(self, reader: _TeeReader, staging_dir: Path, wanted: set) -> List[str]:
+        """流式读取压缩包，只把所需文件写入暂存目录
+
+        只接受位于压缩包顶层模型目录下的文件，并以文件名落盘，
+        因此不存在路径穿越问题。
+        """
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True)
+
+        extracted: List[str] = []
+        with tarfile.open(fileobj=reader, mode="r|bz2") as tar:
+            for member in tar:
+                path = PurePosixPath(member.name)
+                if (
+                    not member.isfile()
+                    or path.name not in wanted
+                    or len(path.parts) > 2
+                    or path.name in extracted
+                ):
+                    continue
+                source = tar.extractfile(member)
+                with open(staging_dir / path.name, "wb") as target:
+                    shutil.copyfileobj(source, target, self.MAX_CHUNK_SIZE)
+                extracted.append(path.name)
+        return extracted
+
+    def _report(self, progress: DownloadProgress) -> None:
+        if self.progress_callback is None:
+            return
+        try:
+            self.progress_callback(progress)
+        except Exception as e:
+            logger.warning(f"Download progress callback failed: {e}")
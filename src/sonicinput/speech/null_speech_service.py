@@ -101,6 +101,3 @@ class NullSpeechService(ISpeechService):
 
     def start_streaming_mode(self) -> None:
         return None
-
-    def start_streaming_processing(self) -> None:
-        return None
@@ -0,0 +1,194 @@
+"""两遍识别的离线重打分
+
+realtime 模式下流式识别器负责实时显示，每当一段（端点之间的一句话）
+结束，后台线程用离线（非流式）识别器重新解码这一段音频，用更准确的
+结果替换流式文本。离线模型看得到整句上下文，准确率接近 chunked 模式；
+停止录音时只剩最后一段需要重打分，最终延迟仍接近 realtime。
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+from ..core.base.lifecycle_component import LifecycleComponent
+from .sherpa_models import SherpaModelManager
+from .warmup import SAMPLE_RATE, synthetic_utterance
+
+
+class SegmentRescorer(LifecycleComponent):
+    """离线重打分器
+
+    start() 启动后台线程，线程先加载离线模型（首次使用时下载），随后
+    按提交顺序解码分段。模型就绪前 is_ready 为 False，会话此时只使用
+    流式结果。
+    """
+
+    DEFAULT_MODEL = "paraformer-offline"
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        variant: Optional[str] = None,
+        num_threads: int = 0,
+        cache_dir: Optional[str] = None,
+        decoder: Optional[Callable[[np.ndarray], str]] = None,
+    ):
+        """初始化重打分器
+
+        Args:
+            model_name: 离线模型名称
+            variant: 模型变体 (int8 | fp32)，None 表示模型默认变体
+            num_threads: 推理线程数，0 表示按物理核心数自动选择
+            cache_dir: 模型缓存目录
+            decoder: 自定义解码函数（音频 -> 文本），提供时不加载模型
+        """
+        super().__init__("SegmentRescorer")
+        self.model_name = model_name
+        self.variant = variant
+        self.num_threads = num_threads
+        self.model_manager = SherpaModelManager(cache_dir)
+        self._decoder = decoder
+        self.recognizer = None
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        # 解码串行执行（后台分段与停止时的最后一段之间）
+        self._decode_lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"segments": 0, "audio_seconds": 0.0, "decode_seconds": 0.0}
+
+    def _do_start(self) -> bool:
+        self._thread = threading.Thread(
+            target=self._run, name="SegmentRescorer", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _do_stop(self) -> bool:
+        self._queue.put(None)
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+        self._ready.clear()
+        self.recognizer = None
+        return True
+
+    @property
+    def is_ready(self) -> bool:
+        """离线模型是否已就绪"""
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def _load_model(self) -> None:
+        import sherpa_onnx
+
+        config = self.model_manager.get_model_config(
+            self.model_name, self.variant, self.num_threads
+        )
+        if config["model_type"] != "offline_paraformer":
+            raise ValueError(f"{self.model_name} is not an offline model")
+        self.recognizer = sherpa_onnx.OfflineRecognizer.from_paraformer(
+            paraformer=config["model"],
+            tokens=config["tokens"],
+            num_threads=config["num_threads"],
+            sample_rate=SAMPLE_RATE,
+            feature_dim=80,
+            decoding_method=config["decoding_method"],
+            provider=config["provider"],
+        )
+        self._decoder = self._decode_offline
+        # 首次推理的图初始化不落在第一段上
+        self._decode_offline(synthetic_utterance())
+        logger.info(
+            f"Rescoring model {self.model_name} ({config['variant']}) loaded "
+            f"with {config['num_threads']} threads"
+        )
+
+    def _decode_offline(self, samples: np.ndarray) -> str:
+        stream = self.recognizer.create_stream()
+        stream.accept_waveform(SAMPLE_RATE, samples)
+        self.recognizer.decode_stream(stream)
+        return stream.result.text
+
+    def decode(self, samples: np.ndarray) -> str:
+        """同步重打分一段音频（停止录音时的最后一段）
+
+        Raises:
+            RuntimeError: 如果模型未就绪
+        """
+        if not self.is_ready:
+            raise RuntimeError("Rescoring model not ready")
+        if samples.dtype != np.float32:
+            samples = samples.astype(np.float32)
+        with self._decode_lock:
+            start = time.perf_counter()
+            text = self._decoder(samples)
+            self._stats["segments"] += 1
+            self._stats["audio_seconds"] += samples.size / SAMPLE_RATE
+            self._stats["decode_seconds"] += time.perf_counter() - start
+        return text.strip()
+
+    def submit(self, samples: np.ndarray, on_done: Callable[[str], None]) -> bool:
+        """在后台重打分一段音频，完成后以结果文本调用 on_done
+
+        Returns:
+            是否已提交（模型未就绪时返回 False）
+        """
+        if not self.is_ready:
+            return False
+        with self._idle:
+            self._pending += 1
+        self._queue.put((samples, on_done))
+        return True
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """等待已提交的分段全部完成
+
+        Returns:
+            超时前是否全部完成
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _run(self) -> None:
+        try:
+            if self._decoder is None:
+                self._load_model()
+            self._ready.set()
+        except Exception as e:
+            logger.error(f"Failed to load rescoring model {self.model_name}: {e}")
+            return
+
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            samples, on_done = job
+            try:
+                on_done(self.decode(samples))
+            except Exception as e:
+                logger.error(f"Segment rescoring failed: {e}")
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """重打分统计：分段数、音频时长、解码耗时和实时率"""
+        stats = dict(self._stats)
+        stats["ready"] = self.is_ready
+        stats["model_name"] = self.model_name
+        stats["rtf"] = (
+            stats["decode_seconds"] / stats["audio_seconds"]
+            if stats["audio_seconds"]
+            else 0.0
+        )
+        return stats
@@ -17,7 +17,9 @@ except ImportError:
 from ..core.base.lifecycle_component import LifecycleComponent
 from ..core.interfaces.speech import ISpeechService
 from .sherpa_models import SherpaModelManager
+from .segment_rescorer import SegmentRescorer
 from .sherpa_streaming import SherpaStreamingSession
+from .warmup import synthetic_utterance, warm_up_recognizer
 
 
 class SherpaEngine(LifecycleComponent, ISpeechService):
@@ -39,6 +41,8 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
         model_name: str = "paraformer",
         language: str = "zh",
         cache_dir: Optional[str] = None,
+        variant: Optional[str] = None,
+        num_threads: int = 0,
     ):
         """初始化 sherpa-onnx 引擎
 
@@ -46,6 +50,8 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
             model_name: 模型名称 (paraformer | zipformer-small)
             language: 语言 (zh | en)
             cache_dir: 模型缓存目录
+            variant: 模型变体 (int8 | fp32)，None 或 "auto" 表示模型默认变体
+            num_threads: 推理线程数，0 表示按物理核心数自动选择
         """
         super().__init__("SherpaEngine")
 
@@ -56,9 +62,13 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
 
         self.model_name = model_name
         self.language = language
+        self.variant = variant
+        self.num_threads = num_threads
         self.model_manager = SherpaModelManager(cache_dir)
         self.recognizer: Optional[sherpa_onnx.OnlineRecognizer] = None
         self._is_loaded = False
+        self._model_config: Optional[Dict[str, Any]] = None
+        self.warmup_metrics: Optional[Dict[str, Any]] = None
 
         logger.info(
             f"SherpaEngine initialized with model: {model_name}, language: {language}"
@@ -97,7 +107,10 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
             logger.info(f"Loading model: {self.model_name}")
 
             # 获取模型配置
-            model_config = self.model_manager.get_model_config(self.model_name)
+            model_config = self.model_manager.get_model_config(
+                self.model_name, self.variant, self.num_threads
+            )
+            self._model_config = model_config
 
             # 使用工厂方法创建识别器（sherpa-onnx 1.12+ API）
             if model_config["model_type"] == "paraformer":
@@ -137,7 +150,10 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
                 raise ValueError(f"Unknown model type: {model_config['model_type']}")
 
             self._is_loaded = True
-            logger.info(f"Model {self.model_name} loaded successfully")
+            logger.info(
+                f"Model {self.model_name} ({model_config['variant']}) loaded "
+                f"successfully with {model_config['num_threads']} threads"
+            )
 
             return True
 
@@ -146,12 +162,38 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
             self._is_loaded = False
             return False
 
+    def warm_up(self, runs: int = 3) -> Dict[str, Any]:
+        """预热模型（离线和流式路径各解码一段合成语音）
+
+        Args:
+            runs: 每条路径的运行次数
+
+        Returns:
+            首次推理与稳态延迟指标，见 warm_up_recognizer
+
+        Raises:
+            RuntimeError: 如果模型未加载
+        """
+        if not self.is_model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        metrics = warm_up_recognizer(self.recognizer, synthetic_utterance(), runs)
+        metrics["model_name"] = self.model_name
+        self.warmup_metrics = metrics
+        logger.info(f"Model {self.model_name} warmed up: {metrics}")
+        return metrics
+
+    def set_event_service(self, event_service) -> None:
+        """设置事件服务，用于汇报模型下载进度"""
+        self.model_manager.event_service = event_service
+
     def unload_model(self) -> None:
         """卸载当前模型"""
         if self.recognizer:
             # sherpa-onnx 的 Python 绑定会自动释放资源
             self.recognizer = None
             self._is_loaded = False
+            self.warmup_metrics = None
             logger.info("Model unloaded")
 
     def transcribe(
@@ -200,9 +242,63 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
             logger.error(f"Transcription failed: {e}")
             raise RuntimeError(f"Failed to transcribe audio: {e}")
 
-    def create_streaming_session(self) -> SherpaStreamingSession:
+    def transcribe_batch(
+        self, audio_batch: List[np.ndarray], language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """批量转录多段音频（用于历史记录批量重处理）
+
+        所有音频各自创建流，通过 decode_streams 一次解码多个就绪的流，
+        让 onnxruntime 在一次推理中处理整批特征帧。
+
+        Args:
+            audio_batch: 音频数据列表，float32，16kHz
+            language: 语言代码（被忽略，同 transcribe）
+
+        Returns:
+            与输入顺序一致的转录结果字典列表
+        """
+        if not self.is_model_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        if not audio_batch:
+            return []
+
+        try:
+            streams = []
+            for audio_data in audio_batch:
+                if audio_data.dtype != np.float32:
+                    audio_data = audio_data.astype(np.float32)
+                stream = self.recognizer.create_stream()
+                stream.accept_waveform(16000, audio_data)
+                stream.input_finished()
+                streams.append(stream)
+
+            while True:
+                ready = [s for s in streams if self.recognizer.is_ready(s)]
+                if not ready:
+                    break
+                self.recognizer.decode_streams(ready)
+
+            return [
+                {
+                    "text": self.recognizer.get_result(stream),
+                    "language": self.language,
+                    "segments": [],
+                }
+                for stream in streams
+            ]
+
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            raise RuntimeError(f"Failed to transcribe audio batch: {e}")
+
+    def create_streaming_session(
+        self, rescorer: Optional[SegmentRescorer] = None
+    ) -> SherpaStreamingSession:
         """创建流式转录会话（用于实时模式）
 
+        Args:
+            rescorer: 两遍识别的离线重打分器，None 表示只用流式结果
+
         Returns:
             流式转录会话对象
 
@@ -213,15 +309,19 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
         stream = self.recognizer.create_stream()
-        return SherpaStreamingSession(self.recognizer, stream)
+        return SherpaStreamingSession(self.recognizer, stream, rescorer=rescorer)
 
     def get_available_models(self) -> List[str]:
-        """获取可用的模型列表
+        """获取可用的模型列表（仅流式模型，离线重打分模型不能作为主模型）
 
         Returns:
             模型名称列表
         """
-        return list(self.model_manager.MODELS.keys())
+        return [
+            name
+            for name, info in self.model_manager.MODELS.items()
+            if info.get("streaming", True)
+        ]
 
     @property
     def is_model_loaded(self) -> bool:
@@ -260,6 +360,11 @@ class SherpaEngine(LifecycleComponent, ISpeechService):
                 "device": self.device,
             }
         )
+        if self._model_config:
+            info["variant"] = self._model_config["variant"]
+            info["num_threads"] = self._model_config["num_threads"]
+        if self.warmup_metrics:
+            info["warmup"] = self.warmup_metrics
 
         return info
 
@@ -1,27 +1,49 @@
 """sherpa-onnx 模型管理器
 
 负责模型下载、缓存和配置管理
+
+每个模型压缩包里同时带有 int8 量化和 fp32 全精度权重，MODELS 中的
+variants 记录每种变体用到的文件；下载时只解压所选变体的文件。
+推理线程数默认按物理核心数自动选择。
 """
 
-import tarfile
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-from urllib.request import Request, urlopen
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
 from .. import __version__
+from ..core.base.lifecycle_component import LifecycleComponent
+from .model_download import DownloadProgress, ModelDownloader
 
-try:
-    from PySide6.QtCore import Qt
-    from PySide6.QtWidgets import QApplication, QProgressDialog
+# 流式小模型超过 4 个线程后几乎没有收益，反而与音频采集和 UI 抢占 CPU
+MAX_NUM_THREADS = 4
 
-    PYSIDE6_AVAILABLE = True
-except ImportError:
-    PYSIDE6_AVAILABLE = False
-    logger.warning("PySide6 not available, progress dialog will not be shown")
 
-from ..core.base.lifecycle_component import LifecycleComponent
+def physical_core_count() -> int:
+    """物理核心数（超线程的逻辑核心不计入）
+
+    psutil 无法判断时（部分虚拟机）退回逻辑核心数。
+    """
+    import psutil
+
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+
+def recommended_num_threads(physical_cores: Optional[int] = None) -> int:
+    """按物理核心数选择 ONNX Runtime 推理线程数
+
+    超线程对矩阵运算帮助不大，因此按物理核心计算；核心多于 2 个时
+    留一个给音频采集和 UI，且不超过 MAX_NUM_THREADS。
+
+    Args:
+        physical_cores: 物理核心数，None 表示自动检测
+    """
+    cores = physical_cores or physical_core_count()
+    if cores > 2:
+        cores -= 1
+    return max(1, min(MAX_NUM_THREADS, cores))
 
 
 class SherpaModelManager(LifecycleComponent):
@@ -31,6 +53,23 @@ class SherpaModelManager(LifecycleComponent):
         "paraformer": {
             "url": "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models/sherpa-onnx-streaming-paraformer-bilingual-zh-en.tar.bz2",
             "size_mb": 226,
+            "dir_name": "sherpa-onnx-streaming-paraformer-bilingual-zh-en",
+            # 压缩包 SHA-256，None 表示只计算（写入日志）不校验
+            "sha256": None,
+            "model_type": "paraformer",
+            "default_variant": "int8",
+            "variants": {
+                "int8": {
+                    "encoder": "encoder.int8.onnx",
+                    "decoder": "decoder.int8.onnx",
+                    "description": "int8 量化，体积和内存约为 fp32 的 1/4",
+                },
+                "fp32": {
+                    "encoder": "encoder.onnx",
+                    "decoder": "decoder.onnx",
+                    "description": "全精度，准确率略高、推理更慢",
+                },
+            },
             "language": ["zh", "en"],
             "description": "中英双语高精度模型（推荐）",
             "rtf": 0.15,
@@ -38,19 +77,68 @@ class SherpaModelManager(LifecycleComponent):
         "zipformer-small": {
             "url": "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models/sherpa-onnx-streaming-zipformer-small-bilingual-zh-en-2023-02-16.tar.bz2",
             "size_mb": 112,
+            "dir_name": "sherpa-onnx-streaming-zipformer-small-bilingual-zh-en-2023-02-16",
+            "sha256": None,
+            "model_type": "zipformer",
+            "default_variant": "fp32",
+            "variants": {
+                "fp32": {
+                    "encoder": "encoder-epoch-99-avg-1.onnx",
+                    "decoder": "decoder-epoch-99-avg-1.onnx",
+                    "joiner": "joiner-epoch-99-avg-1.onnx",
+                    "description": "全精度",
+                },
+                "int8": {
+                    "encoder": "encoder-epoch-99-avg-1.int8.onnx",
+                    "decoder": "decoder-epoch-99-avg-1.int8.onnx",
+                    "joiner": "joiner-epoch-99-avg-1.int8.onnx",
+                    "description": "int8 量化，低端 CPU 上更快",
+                },
+            },
             "language": ["zh", "en"],
             "description": "超轻量级双语模型",
             "rtf": 0.10,
         },
+        # 非流式模型：不能作为 realtime/chunked 的主模型，只用于两遍识别的重打分
+        "paraformer-offline": {
+            "url": "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models/sherpa-onnx-paraformer-zh-2024-03-09.tar.bz2",
+            "size_mb": 950,
+            "dir_name": "sherpa-onnx-paraformer-zh-2024-03-09",
+            "sha256": None,
+            "model_type": "offline_paraformer",
+            "streaming": False,
+            "default_variant": "int8",
+            "variants": {
+                "int8": {
+                    "model": "model.int8.onnx",
+                    "description": "int8 量化",
+                },
+                "fp32": {
+                    "model": "model.onnx",
+                    "description": "全精度",
+                },
+            },
+            "language": ["zh", "en"],
+            "description": "离线 Paraformer（realtime 两遍识别重打分）",
+            "rtf": 0.05,
+        },
     }
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    # 变体中对应模型文件的字段
+    MODEL_FILE_ROLES = ("encoder", "decoder", "joiner", "model")
+
+    DOWNLOAD_TIMEOUT = 60
+    DOWNLOAD_RETRIES = 3
+
+    def __init__(self, cache_dir: Optional[str] = None, event_service=None):
         """初始化模型管理器
 
         Args:
             cache_dir: 模型缓存目录，默认为 ~/.sonicinput/sherpa_models
+            event_service: 事件服务（可选），用于汇报下载进度
         """
         super().__init__("SherpaModelManager")
+        self.event_service = event_service
 
         if cache_dir:
             self.cache_dir = Path(cache_dir)
@@ -60,11 +148,48 @@ class SherpaModelManager(LifecycleComponent):
 
         self._model_cache: Dict[str, Path] = {}  # Cache for model directories
 
-    def is_model_cached(self, model_name: str) -> bool:
-        """检查模型是否已缓存
+    def resolve_variant(self, model_name: str, variant: Optional[str] = None) -> str:
+        """解析模型变体名称
 
         Args:
             model_name: 模型名称
+            variant: 变体名称（int8 | fp32），None 或 "auto" 表示模型默认变体；
+                模型没有该变体时也回退到默认变体
+
+        Returns:
+            变体名称
+        """
+        if model_name not in self.MODELS:
+            raise ValueError(f"Unknown model: {model_name}")
+
+        model_info = self.MODELS[model_name]
+        if variant in (None, "", "auto"):
+            return model_info["default_variant"]
+        if variant not in model_info["variants"]:
+            logger.warning(
+                f"Model {model_name} has no variant {variant!r}, "
+                f"using {model_info['default_variant']}"
+            )
+            return model_info["default_variant"]
+        return variant
+
+    def get_variant_files(
+        self, model_name: str, variant: Optional[str] = None
+    ) -> List[str]:
+        """获取模型变体需要的文件名列表（含 tokens.txt）"""
+        variant_info = self.MODELS[model_name]["variants"][
+            self.resolve_variant(model_name, variant)
+        ]
+        return ["tokens.txt"] + [
+            variant_info[role] for role in self.MODEL_FILE_ROLES if role in variant_info
+        ]
+
+    def is_model_cached(self, model_name: str, variant: Optional[str] = None) -> bool:
+        """检查模型（变体）是否已缓存
+
+        Args:
+            model_name: 模型名称
+            variant: 变体名称，None 表示默认变体
 
         Returns:
             True if cached, False otherwise
@@ -76,193 +201,125 @@ class SherpaModelManager(LifecycleComponent):
         model_dir = self._get_model_dir(model_name)
 
         # 检查必要文件是否存在
-        required_files = [
-            "tokens.txt",
-            "encoder-epoch-99-avg-1.onnx",
-            "decoder-epoch-99-avg-1.onnx",
-        ]
-        if model_name == "paraformer":
-            # Paraformer 特殊文件名
-            required_files = ["tokens.txt", "encoder.int8.onnx", "decoder.int8.onnx"]
+        required_files = self.get_variant_files(model_name, variant)
 
         return model_dir.exists() and all(
             (model_dir / f).exists() for f in required_files
         )
 
-    def download_model(self, model_name: str, progress_callback=None) -> Path:
+    def download_model(
+        self,
+        model_name: str,
+        progress_callback=None,
+        variant: Optional[str] = None,
+    ) -> Path:
         """下载模型到本地缓存
 
+        边下载边解压，只保留模型需要的文件；网络中断后保留未完成的
+        下载，下次调用通过 HTTP Range 续传。进度通过
+        Events.MODEL_DOWNLOAD_PROGRESS 事件汇报（需设置 event_service）。
+
+        下载新变体时，已缓存的其他变体文件会一并重新解压，
+        因为模型目录是整体替换的。
+
         Args:
             model_name: 模型名称
             progress_callback: 进度回调函数 (bytes_downloaded, total_bytes)
+            variant: 变体名称，None 表示默认变体
 
         Returns:
             模型目录路径
 
         Raises:
             ValueError: 如果模型名称不存在
-            RuntimeError: 如果下载失败
+            RuntimeError: 如果下载失败（包括 SHA-256 校验失败）
         """
         if model_name not in self.MODELS:
             raise ValueError(f"Unknown model: {model_name}")
 
         # 检查是否已缓存
-        if self.is_model_cached(model_name):
+        if self.is_model_cached(model_name, variant):
             logger.info(f"Model {model_name} already cached")
             return self._get_model_dir(model_name)
 
+        files = self.get_variant_files(model_name, variant)
+        for other in self.MODELS[model_name]["variants"]:
+            if self.is_model_cached(model_name, other):
+                files += self.get_variant_files(model_name, other)
+
         model_info = self.MODELS[model_name]
         url = model_info["url"]
-        size_mb = model_info["size_mb"]
 
         logger.info(f"Downloading model {model_name} from {url}")
-        logger.info(f"Size: {size_mb} MB")
+        logger.info(f"Size: {model_info['size_mb']} MB")
+
+        def on_progress(progress: DownloadProgress) -> None:
+            self._emit_download_event(progress)
+            if progress_callback and progress.phase == "downloading":
+                progress_callback(progress.downloaded, progress.total)
+
+        downloader = ModelDownloader(
+            user_agent=f"SonicInput/{__version__}",
+            timeout=self.DOWNLOAD_TIMEOUT,
+            max_retries=self.DOWNLOAD_RETRIES,
+            progress_callback=on_progress,
+        )
+        return downloader.download_and_extract(
+            model_name,
+            url,
+            part_path=self.cache_dir / f"{model_name}.tar.bz2.part",
+            target_dir=self._get_model_dir(model_name),
+            files=sorted(set(files)),
+            sha256=model_info.get("sha256"),
+        )
 
-        # 创建进度对话框 (如果 PySide6 可用)
-        progress_dialog = None
-        if PYSIDE6_AVAILABLE:
-            try:
-                progress_dialog = QProgressDialog()
-                progress_dialog.setWindowTitle("模型下载")
-                progress_dialog.setLabelText(
-                    f"正在下载模型：{model_name}\n大小：{size_mb} MB"
-                )
-                progress_dialog.setCancelButton(None)  # 隐藏取消按钮
-                progress_dialog.setWindowModality(Qt.WindowModal)
-                progress_dialog.setMinimum(0)
-                progress_dialog.setMaximum(100)
-                progress_dialog.setValue(0)
-                progress_dialog.show()
-                QApplication.processEvents()
-            except Exception as e:
-                logger.warning(f"Failed to create progress dialog: {e}")
-                progress_dialog = None
+    def _emit_download_event(self, progress: DownloadProgress) -> None:
+        """通过事件服务汇报下载进度"""
+        if not self.event_service:
+            return
 
-        # 下载到临时文件
-        archive_path = self.cache_dir / f"{model_name}.tar.bz2"
+        from ..core.services.events import Events
 
+        event = {
+            "downloading": Events.MODEL_DOWNLOAD_PROGRESS,
+            "completed": Events.MODEL_DOWNLOAD_COMPLETED,
+            "failed": Events.MODEL_DOWNLOAD_FAILED,
+        }[progress.phase]
         try:
-            # 下载
-            request = Request(url, headers={"User-Agent": f"SonicInput/{__version__}"})
-            with urlopen(request, timeout=300) as response:
-                total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
-
-                with open(archive_path, "wb") as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        # 更新进度对话框
-                        if progress_dialog:
-                            try:
-                                percent = (
-                                    int(downloaded * 100 / total_size)
-                                    if total_size > 0
-                                    else 0
-                                )
-                                progress_dialog.setValue(percent)
-                                downloaded_mb = downloaded / (1024 * 1024)
-                                total_mb = total_size / (1024 * 1024)
-                                progress_dialog.setLabelText(
-                                    f"正在下载模型：{model_name}\n"
-                                    f"进度：{downloaded_mb:.1f} MB / {total_mb:.1f} MB ({percent}%)"
-                                )
-                                QApplication.processEvents()
-                            except Exception as e:
-                                logger.warning(f"Failed to update progress dialog: {e}")
-
-                        # 保持旧的回调接口兼容性
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
-
-            logger.info(f"Download complete: {archive_path}")
-
-            # 解压
-            logger.info("Extracting model files...")
-            if progress_dialog:
-                try:
-                    progress_dialog.setValue(95)
-                    progress_dialog.setLabelText(
-                        f"正在解压模型：{model_name}\n请稍候..."
-                    )
-                    QApplication.processEvents()
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to update progress dialog during extraction: {e}"
-                    )
-
-            with tarfile.open(archive_path, "r:bz2") as tar:
-                # Securely extract files with path validation (防止路径遍历攻击)
-                safe_members = []
-                for member in tar.getmembers():
-                    # Normalize member path and resolve it relative to cache_dir
-                    member_path = Path(self.cache_dir) / member.name
-                    try:
-                        # Check if resolved path is within cache_dir (防止../类攻击)
-                        member_path.resolve().relative_to(
-                            Path(self.cache_dir).resolve()
-                        )
-                        safe_members.append(member)
-                    except ValueError:
-                        logger.warning(
-                            f"Skipping potentially unsafe tar member: {member.name}"
-                        )
-
-                tar.extractall(self.cache_dir, members=safe_members)
-
-            # 删除压缩包
-            archive_path.unlink()
-            logger.info("Model extraction complete")
-
-            # 关闭进度对话框
-            if progress_dialog:
-                try:
-                    progress_dialog.setValue(100)
-                    progress_dialog.close()
-                except Exception:
-                    pass
-
-            return self._get_model_dir(model_name)
-
+            self.event_service.emit(event, progress.to_dict())
         except Exception as e:
-            logger.error(f"Failed to download model: {e}")
-
-            # 关闭进度对话框
-            if progress_dialog:
-                try:
-                    progress_dialog.close()
-                except Exception:
-                    pass
-
-            # 清理失败的下载
-            if archive_path.exists():
-                archive_path.unlink()
-            raise RuntimeError(f"Failed to download model {model_name}: {e}")
+            logger.warning(f"Failed to emit {event}: {e}")
 
-    def ensure_model_available(self, model_name: str) -> Path:
+    def ensure_model_available(
+        self, model_name: str, variant: Optional[str] = None
+    ) -> Path:
         """确保模型可用（如果不存在则下载）
 
         Args:
             model_name: 模型名称
+            variant: 变体名称，None 表示默认变体
 
         Returns:
             模型目录路径
         """
-        if not self.is_model_cached(model_name):
+        if not self.is_model_cached(model_name, variant):
             logger.info(f"Model {model_name} not cached, downloading...")
-            return self.download_model(model_name)
+            return self.download_model(model_name, variant=variant)
 
         return self._get_model_dir(model_name)
 
-    def get_model_config(self, model_name: str) -> Dict[str, Any]:
+    def get_model_config(
+        self,
+        model_name: str,
+        variant: Optional[str] = None,
+        num_threads: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """获取模型配置（供 sherpa-onnx 使用）
 
         Args:
             model_name: 模型名称
+            variant: 变体名称（int8 | fp32），None 表示默认变体
+            num_threads: 推理线程数，None 或 0 表示按物理核心数自动选择
 
         Returns:
             模型配置字典
@@ -271,34 +328,27 @@ class SherpaModelManager(LifecycleComponent):
             ValueError: 如果模型不存在
             RuntimeError: 如果模型文件缺失
         """
-        model_dir = self.ensure_model_available(model_name)
-
-        if model_name == "paraformer":
-            # Paraformer 配置（只支持greedy_search）
-            return {
-                "tokens": str(model_dir / "tokens.txt"),
-                "encoder": str(model_dir / "encoder.int8.onnx"),
-                "decoder": str(model_dir / "decoder.int8.onnx"),
-                "model_type": "paraformer",
-                "num_threads": 4,
-                "provider": "cpu",
-                "decoding_method": "greedy_search",
-            }
-        elif model_name == "zipformer-small":
-            # Zipformer 配置（保守使用greedy_search以确保兼容性）
-            return {
-                "tokens": str(model_dir / "tokens.txt"),
-                "encoder": str(model_dir / "encoder-epoch-99-avg-1.onnx"),
-                "decoder": str(model_dir / "decoder-epoch-99-avg-1.onnx"),
-                "joiner": str(model_dir / "joiner-epoch-99-avg-1.onnx"),
-                "model_type": "zipformer",
-                "num_threads": 4,
-                "provider": "cpu",
-                "decoding_method": "greedy_search",
-            }
-        else:
+        if model_name not in self.MODELS:
             raise ValueError(f"Unknown model: {model_name}")
 
+        variant = self.resolve_variant(model_name, variant)
+        model_dir = self.ensure_model_available(model_name, variant)
+        variant_info = self.MODELS[model_name]["variants"][variant]
+
+        # Paraformer 只支持 greedy_search；Zipformer 保守使用 greedy_search 以确保兼容性
+        config = {
+            "tokens": str(model_dir / "tokens.txt"),
+            "model_type": self.MODELS[model_name]["model_type"],
+            "variant": variant,
+            "num_threads": num_threads or recommended_num_threads(),
+            "provider": "cpu",
+            "decoding_method": "greedy_search",
+        }
+        for role in self.MODEL_FILE_ROLES:
+            if role in variant_info:
+                config[role] = str(model_dir / variant_info[role])
+        return config
+
     def get_model_info(self, model_name: str) -> Dict[str, Any]:
         """获取模型信息
 
@@ -313,6 +363,11 @@ class SherpaModelManager(LifecycleComponent):
 
         info = self.MODELS[model_name].copy()
         info["cached"] = self.is_model_cached(model_name)
+        info["cached_variants"] = [
+            variant
+            for variant in info["variants"]
+            if self.is_model_cached(model_name, variant)
+        ]
         info["cache_path"] = str(self._get_model_dir(model_name))
 
         return info
@@ -334,15 +389,9 @@ class SherpaModelManager(LifecycleComponent):
         Returns:
             模型目录路径
         """
-        if model_name == "paraformer":
-            # Paraformer 解压后的目录名
-            return self.cache_dir / "sherpa-onnx-streaming-paraformer-bilingual-zh-en"
-        elif model_name == "zipformer-small":
-            # Zipformer 解压后的目录名
-            return (
-                self.cache_dir
-                / "sherpa-onnx-streaming-zipformer-small-bilingual-zh-en-2023-02-16"
-            )
+        if model_name in self.MODELS:
+            # 压缩包解压后的目录名
+            return self.cache_dir / self.MODELS[model_name]["dir_name"]
         else:
             # 通用模式
             return self.cache_dir / f"sherpa-onnx-{model_name}"
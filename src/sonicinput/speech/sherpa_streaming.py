@@ -1,32 +1,96 @@
 """sherpa-onnx 流式转录会话管理
 
-支持真正的实时流式转录
+支持真正的实时流式转录。识别流在每个端点（句子结束）处重置，会话把
+已结束的句子按顺序保存为分段（样本偏移和时间戳），部分结果和最终结果
+都是完整转录文本，停止时只需解码最后一段，不必离线重新识别整段录音。
+
+提供 SegmentRescorer 时为两遍识别：每段结束后在后台用离线模型重新
+解码该段音频并替换流式文本，停止时同步重打分最后一段。
 """
 
-from typing import Any, Dict
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List
 
 import numpy as np
 from loguru import logger
 
 
+@dataclass
+class TranscriptSegment:
+    """已结束的一段识别结果"""
+
+    text: str
+    start_sample: int
+    end_sample: int
+    # 音频内的起止时间（秒）
+    start_time: float
+    end_time: float
+    # 分段结束时的系统时间
+    finalized_at: float
+    # 文本是否已由离线模型重打分
+    rescored: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def join_segment_text(left: str, right: str) -> str:
+    """拼接两段文本：两侧都是英文字母或数字时用空格分隔，中文直接相连"""
+    if not left:
+        return right
+    if not right:
+        return left
+    if (
+        left[-1].isascii()
+        and left[-1].isalnum()
+        and right[0].isascii()
+        and right[0].isalnum()
+    ):
+        return f"{left} {right}"
+    return left + right
+
+
 class SherpaStreamingSession:
     """sherpa-onnx 流式转录会话（真实时）
 
     用于实时模式：边录边转，逐字显示
     """
 
-    def __init__(self, recognizer, stream):
+    # 停止时等待后台重打分完成的最长时间（秒），超时的分段保留流式文本
+    FINAL_RESCORE_TIMEOUT = 3.0
+
+    def __init__(self, recognizer, stream, rescorer=None):
         """初始化流式会话
 
         Args:
             recognizer: sherpa_onnx.OnlineRecognizer 实例
             stream: sherpa_onnx.OnlineStream 实例
+            rescorer: 离线重打分器（SegmentRescorer），None 表示只用流式结果
         """
         self.recognizer = recognizer
         self.stream = stream
+        self.rescorer = rescorer
         self.is_active = True
         self.sample_rate = 16000
         self._last_result = ""
+        # 最近一次 get_partial_result 是否在端点处结束了一句
+        self.endpoint_detected = False
+        # 后台重打分与识别线程同时修改分段
+        self._segments_lock = threading.Lock()
+        self._init_segments()
+
+    def _init_segments(self) -> None:
+        self.segments: List[TranscriptSegment] = []
+        # 已结束分段拼接后的文本（每个端点追加一次）
+        self._committed_text = ""
+        # 当前未结束分段的部分结果
+        self._current_text = ""
+        self._samples_fed = 0
+        self._segment_start_sample = 0
+        # 当前分段的音频（仅两遍识别时保留）
+        self._segment_audio: List[np.ndarray] = []
 
     def add_samples(self, samples: np.ndarray) -> None:
         """添加音频样本（实时推送）
@@ -45,6 +109,9 @@ class SherpaStreamingSession:
 
             # 推送到 sherpa-onnx
             self.stream.accept_waveform(self.sample_rate, samples)
+            self._samples_fed += len(samples)
+            if self.rescorer is not None:
+                self._segment_audio.append(samples)
 
         except Exception as e:
             logger.error(f"Error adding samples to stream: {e}")
@@ -53,11 +120,11 @@ class SherpaStreamingSession:
     def get_partial_result(self) -> str:
         """获取部分结果（实时文本）
 
-        改进：不在检测到端点时立即reset，而是累积完整句子。
-        这样可以避免在用户说话过程中截断文本。
+        端点处结束当前分段并重置识别流，返回值始终是已结束分段加上
+        当前部分结果的完整文本，不会因为重置而只剩最后一句。
 
         Returns:
-            当前识别的部分文本
+            当前完整的部分识别文本
         """
         if not self.is_active:
             return self._last_result
@@ -78,22 +145,27 @@ class SherpaStreamingSession:
 
             # 检查是否到达端点（句子结束）
             is_endpoint = self.recognizer.is_endpoint(self.stream)
+            self.endpoint_detected = bool(is_endpoint and result.strip())
 
             if is_endpoint:
                 # 端点检测：句子结束
                 # 关键修复：立即reset stream避免重复识别
                 # 符合sherpa-onnx官方示例的标准做法
                 if result.strip():
-                    self._last_result = result
+                    self._finalize_segment(result)
                     # 立即重置stream,清空内部状态,防止下次识别时重复
                     self.recognizer.reset(self.stream)
                     logger.debug(
-                        f"Endpoint detected, stream reset. Text length: {len(self._last_result)}"
+                        f"Endpoint detected, stream reset. Segments: {len(self.segments)}"
                     )
             else:
                 # 部分结果：句子未结束
                 if result.strip():
-                    self._last_result = result
+                    with self._segments_lock:
+                        self._current_text = result.strip()
+                        self._last_result = join_segment_text(
+                            self._committed_text, self._current_text
+                        )
 
             return self._last_result
 
@@ -104,12 +176,14 @@ class SherpaStreamingSession:
     def get_final_result(self) -> Dict[str, Any]:
         """获取最终结果
 
+        只解码最后一段尚未结束的音频，之前的分段直接复用。
+
         Returns:
-            完整转录结果字典
+            完整转录结果字典（text、language、segments）
         """
         if not self.is_active:
             logger.warning("Stream already finalized")
-            return {"text": self._last_result, "language": "zh"}
+            return self._final_result()
 
         try:
             # 标记输入结束
@@ -119,21 +193,91 @@ class SherpaStreamingSession:
             while self.recognizer.is_ready(self.stream):
                 self.recognizer.decode_stream(self.stream)
 
-            # 获取最终结果
-            result = self.recognizer.get_result(self.stream)
-            self._last_result = result
+            # 最后一段（没有等到端点）
+            result = self.recognizer.get_result(self.stream).strip()
+            tail = result or self._current_text
+            if tail:
+                self._finalize_segment(tail, rescore_async=False)
+            self._segment_audio = []
 
             self.is_active = False
 
-            return {
-                "text": result,
-                "language": "zh",  # sherpa-onnx 不提供语言检测
-            }
+            # 之前的分段大多已在录音过程中重打分，只等待仍在进行的
+            if self.rescorer is not None and not self.rescorer.wait_idle(
+                self.FINAL_RESCORE_TIMEOUT
+            ):
+                logger.warning("Rescoring timed out, keeping streaming text")
+
+            return self._final_result()
 
         except Exception as e:
             logger.error(f"Error getting final result: {e}")
             self.is_active = False
-            return {"text": self._last_result, "language": "zh"}
+            return self._final_result()
+
+    def _finalize_segment(self, text: str, rescore_async: bool = True) -> None:
+        """结束当前分段：记录文本、样本偏移和时间戳，并交给重打分器
+
+        Args:
+            text: 流式识别的分段文本
+            rescore_async: 在后台重打分；False 时在当前线程同步重打分
+                （停止录音时的最后一段）
+        """
+        text = text.strip()
+        start, end = self._segment_start_sample, self._samples_fed
+        segment = TranscriptSegment(
+            text=text,
+            start_sample=start,
+            end_sample=end,
+            start_time=start / self.sample_rate,
+            end_time=end / self.sample_rate,
+            finalized_at=time.time(),
+        )
+        with self._segments_lock:
+            self.segments.append(segment)
+            self._committed_text = join_segment_text(self._committed_text, text)
+            self._current_text = ""
+            self._last_result = self._committed_text
+        self._segment_start_sample = end
+
+        audio, self._segment_audio = self._segment_audio, []
+        if self.rescorer is None or not audio:
+            return
+        audio = np.concatenate(audio)
+        if rescore_async:
+            self.rescorer.submit(
+                audio, lambda rescored: self._apply_rescore(segment, rescored)
+            )
+            return
+        try:
+            if self.rescorer.is_ready:
+                self._apply_rescore(segment, self.rescorer.decode(audio))
+        except Exception as e:
+            logger.error(f"Final segment rescoring failed: {e}")
+
+    def _apply_rescore(self, segment: TranscriptSegment, text: str) -> None:
+        """用离线重打分结果替换分段文本（后台线程调用）"""
+        text = text.strip()
+        if not text:
+            return
+        with self._segments_lock:
+            segment.rescored = True
+            if text == segment.text:
+                return
+            segment.text = text
+            committed = ""
+            for item in self.segments:
+                committed = join_segment_text(committed, item.text)
+            self._committed_text = committed
+            self._last_result = join_segment_text(committed, self._current_text)
+
+    def _final_result(self) -> Dict[str, Any]:
+        with self._segments_lock:
+            return {
+                "text": self._last_result,
+                "language": "zh",  # sherpa-onnx 不提供语言检测
+                "segments": [segment.to_dict() for segment in self.segments],
+            }
 
     def reset(self) -> None:
         """重置会话（重新开始）"""
@@ -142,6 +286,8 @@ class SherpaStreamingSession:
             self.stream = self.recognizer.create_stream()
             self.is_active = True
             self._last_result = ""
+            self.endpoint_detected = False
+            self._init_segments()
             logger.info("Stream reset successfully")
 
         except Exception as e:
@@ -33,8 +33,7 @@ class SpeechServiceFactory:
             bool: True if sherpa-onnx is installed, False otherwise
         """
         try:
-            import sherpa_onnx  # noqa: F401
-
+            importlib.import_module("sherpa_onnx")
             return True
         except Exception as exc:
             SpeechServiceFactory._log_local_unavailable(exc)
@@ -102,6 +101,8 @@ class SpeechServiceFactory:
         use_gpu: Optional[bool] = None,
         base_url: Optional[str] = None,
         enable_itn: bool = True,
+        variant: Optional[str] = None,
+        num_threads: int = 0,
     ) -> ISpeechService:
         """Create speech service instance
 
@@ -112,6 +113,8 @@ class SpeechServiceFactory:
             use_gpu: Use GPU for local provider (None = auto-detect)
             base_url: Custom base URL for cloud providers (optional)
             enable_itn: Enable Inverse Text Normalization for Qwen (optional)
+            variant: Local model variant, "int8" | "fp32" (None = model default)
+            num_threads: Local inference threads (0 = from physical cores)
 
         Returns:
             ISpeechService: Speech service instance
@@ -128,7 +131,9 @@ class SpeechServiceFactory:
 
                 # sherpa-onnx 不使用 use_gpu 参数，始终使用 CPU
                 # model 参数应该是 sherpa 模型名称 (paraformer | zipformer-small)
-                return SherpaEngine(model_name=model)
+                return SherpaEngine(
+                    model_name=model, variant=variant, num_threads=num_threads
+                )
 
             elif provider_lower == "groq":
                 from .groq_speech_service import GroqSpeechService
@@ -201,7 +206,14 @@ class SpeechServiceFactory:
                 )
                 # sherpa-onnx 不需要 use_gpu 参数，始终使用 CPU
                 return SpeechServiceFactory.create_service(
-                    provider="local", model=model
+                    provider="local",
+                    model=model,
+                    variant=config.get_setting(
+                        ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT, "auto"
+                    ),
+                    num_threads=config.get_setting(
+                        ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS, 0
+                    ),
                 )
 
             elif provider == "groq":
@@ -359,6 +371,82 @@ class SpeechServiceFactory:
                 )
                 return None
 
+    @staticmethod
+    def create_cloud_fallback(config: IConfigService) -> Optional[ISpeechService]:
+        """Create a cloud service that covers for the local model while it reloads
+
+        Uses the first cloud provider with an API key configured
+        (qwen, groq, siliconflow), regardless of the selected provider.
+
+        Args:
+            config: Configuration service instance
+
+        Returns:
+            ISpeechService: Cloud speech service, None if no provider is configured
+        """
+        candidates = (
+            (
+                "qwen",
+                ConfigKeys.TRANSCRIPTION_QWEN_API_KEY,
+                ConfigKeys.TRANSCRIPTION_QWEN_MODEL,
+                "qwen3-asr-flash",
+                ConfigKeys.TRANSCRIPTION_QWEN_BASE_URL,
+                "https://dashscope.aliyuncs.com",
+            ),
+            (
+                "groq",
+                ConfigKeys.TRANSCRIPTION_GROQ_API_KEY,
+                ConfigKeys.TRANSCRIPTION_GROQ_MODEL,
+                "whisper-large-v3-turbo",
+                ConfigKeys.TRANSCRIPTION_GROQ_BASE_URL,
+                "https://api.groq.com/openai/v1",
+            ),
+            (
+                "siliconflow",
+                ConfigKeys.TRANSCRIPTION_SILICONFLOW_API_KEY,
+                ConfigKeys.TRANSCRIPTION_SILICONFLOW_MODEL,
+                "FunAudioLLM/SenseVoiceSmall",
+                ConfigKeys.TRANSCRIPTION_SILICONFLOW_BASE_URL,
+                "https://api.siliconflow.cn/v1",
+            ),
+        )
+
+        for (
+            provider,
+            key_key,
+            model_key,
+            default_model,
+            url_key,
+            default_url,
+        ) in candidates:
+            api_key = config.get_setting(key_key, "")
+            if not api_key or not api_key.strip():
+                continue
+
+            base_url = config.get_setting(url_key, default_url)
+            try:
+                service = SpeechServiceFactory.create_service(
+                    provider=provider,
+                    api_key=api_key,
+                    model=config.get_setting(model_key, default_model),
+                    base_url=None if base_url == default_url else base_url,
+                    enable_itn=config.get_setting(
+                        ConfigKeys.TRANSCRIPTION_QWEN_ENABLE_ITN, True
+                    ),
+                )
+            except (ImportError, ValueError) as e:
+                app_logger.log_error(e, "SpeechServiceFactory.create_cloud_fallback")
+                continue
+
+            if hasattr(service, "load_model"):
+                service.load_model()
+            app_logger.log_audio_event(
+                "Cloud fallback speech service created", {"provider": provider}
+            )
+            return service
+
+        return None
+
     @staticmethod
     def create_from_config_local_fallback(config: IConfigService) -> ISpeechService:
         """Create local speech service as fallback
@@ -374,4 +462,11 @@ class SpeechServiceFactory:
             "paraformer",  # 默认使用 paraformer 模型
         )
         # sherpa-onnx 不需要 use_gpu 参数
-        return SpeechServiceFactory.create_service(provider="local", model=model)
+        return SpeechServiceFactory.create_service(
+            provider="local",
+            model=model,
+            variant=config.get_setting(ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT, "auto"),
+            num_threads=config.get_setting(
+                ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS, 0
+            ),
+        )
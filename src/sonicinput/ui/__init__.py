@@ -1,7 +1,34 @@
-"""用户界面模块初始化"""
+"""用户界面模块初始化
 
-from .main_window import MainWindow
-from .recording_overlay import RecordingOverlay
-from .settings_window import SettingsWindow
+导出对象在首次访问时才导入（PEP 562）。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main_window import MainWindow
+    from .recording_overlay import RecordingOverlay
+    from .settings_window import SettingsWindow
+
+_LAZY_IMPORTS = {
+    "MainWindow": ".main_window",
+    "RecordingOverlay": ".recording_overlay",
+    "SettingsWindow": ".settings_window",
+}
 
 __all__ = ["SettingsWindow", "RecordingOverlay", "MainWindow"]
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
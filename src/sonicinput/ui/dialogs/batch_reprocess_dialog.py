@@ -1,7 +1,7 @@
 """批量重新处理对话框
 
 此对话框允许用户配置批量重新处理历史记录的参数：
-- CD（冷却）时间：每条记录处理之间的延迟
+- 云端转录速率限制：每分钟最多请求数（本地转录不受限制）
 - 记录数量预览
 - 时间估算
 """
@@ -22,6 +22,13 @@ from PySide6.QtWidgets import (
 class BatchReprocessDialog(QDialog):
     """批量重新处理配置对话框"""
 
+    # 默认云端请求速率（多数云端服务免费额度约为每分钟20次）
+    DEFAULT_REQUESTS_PER_MINUTE = 20
+
+    # 时间估算参数：单次云端请求耗时（秒）与并发请求数
+    CLOUD_REQUEST_SECONDS = 5
+    CLOUD_CONCURRENCY = 4
+
     def __init__(self, total_records: int, parent=None):
         """初始化对话框
 
@@ -31,7 +38,6 @@ class BatchReprocessDialog(QDialog):
         """
         super().__init__(parent)
         self.total_records = total_records
-        self.cd_seconds = 5  # 默认CD时间
 
         self.setup_ui()
         self.update_estimation()
@@ -57,38 +63,38 @@ class BatchReprocessDialog(QDialog):
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
 
-        # CD配置组
-        cd_group = QGroupBox("Cooldown Configuration")
-        cd_layout = QFormLayout()
-        self.cd_group = cd_group
-        self.cd_layout = cd_layout
-
-        # CD时间输入
-        self.cd_spinbox = QSpinBox()
-        self.cd_spinbox.setMinimum(0)
-        self.cd_spinbox.setMaximum(60)
-        self.cd_spinbox.setValue(5)
-        self.cd_spinbox.setSuffix(" seconds")
-        self.cd_spinbox.setToolTip(
-            "Delay between processing each record.\n"
-            "Useful for avoiding API rate limits when using cloud transcription."
+        # 速率限制配置组
+        rate_group = QGroupBox("Rate Limit Configuration")
+        rate_layout = QFormLayout()
+        self.rate_group = rate_group
+        self.rate_layout = rate_layout
+
+        # 每分钟请求数输入（0 = 不限制）
+        self.rate_spinbox = QSpinBox()
+        self.rate_spinbox.setMinimum(0)
+        self.rate_spinbox.setMaximum(600)
+        self.rate_spinbox.setValue(self.DEFAULT_REQUESTS_PER_MINUTE)
+        self.rate_spinbox.setSpecialValueText("Unlimited")
+        self.rate_spinbox.setToolTip(
+            "Maximum cloud transcription requests per minute.\n"
+            "Requests are sent in parallel up to this limit."
         )
-        self.cd_spinbox.valueChanged.connect(self.update_estimation)
+        self.rate_spinbox.valueChanged.connect(self.update_estimation)
 
-        self.cd_label = QLabel("Cooldown between records:")
-        cd_layout.addRow(self.cd_label, self.cd_spinbox)
+        self.rate_label = QLabel("Cloud requests per minute:")
+        rate_layout.addRow(self.rate_label, self.rate_spinbox)
 
         # 说明文本
-        self.cd_help = QLabel(
-            "⚠ Recommended: 5 seconds for cloud providers to avoid rate limits.\n"
-            "💡 For local transcription (sherpa-onnx), 0-1 seconds is sufficient."
+        self.rate_help = QLabel(
+            "Set this to your provider's quota to avoid rate limit errors.\n"
+            "Local transcription (sherpa-onnx) is not rate limited."
         )
-        self.cd_help.setWordWrap(True)
-        self.cd_help.setStyleSheet("color: #666; font-size: 10px;")
-        cd_layout.addRow(self.cd_help)
+        self.rate_help.setWordWrap(True)
+        self.rate_help.setStyleSheet("color: #666; font-size: 10px;")
+        rate_layout.addRow(self.rate_help)
 
-        cd_group.setLayout(cd_layout)
-        layout.addWidget(cd_group)
+        rate_group.setLayout(rate_layout)
+        layout.addWidget(rate_group)
 
         # 时间估算组
         estimate_group = QGroupBox("Time Estimation")
@@ -102,7 +108,8 @@ class BatchReprocessDialog(QDialog):
         estimate_layout.addRow(self.estimate_text_label, self.estimate_label)
 
         self.estimate_help = QLabel(
-            "Based on average transcription time (5s for cloud, 0.2s for local) + CD time."
+            "Based on 5s per cloud request with 4 parallel requests, "
+            "capped by the rate limit. Local transcription is usually much faster."
         )
         self.estimate_help.setWordWrap(True)
         self.estimate_help.setStyleSheet("color: #666; font-size: 10px;")
@@ -148,13 +155,15 @@ class BatchReprocessDialog(QDialog):
 
     def update_estimation(self) -> None:
         """更新时间估算"""
-        cd_seconds = self.cd_spinbox.value()
+        requests_per_minute = self.rate_spinbox.value()
 
-        # 估算平均转录时间（假设使用云端API约5秒，本地sherpa约0.2秒）
-        # 这里使用保守估计：5秒
-        avg_transcription_time = 5
+        # 保守估计按云端转录计算：单次请求约5秒，并发4个请求，
+        # 同时不能超过速率限制
+        seconds_per_record = self.CLOUD_REQUEST_SECONDS / self.CLOUD_CONCURRENCY
+        if requests_per_minute > 0:
+            seconds_per_record = max(seconds_per_record, 60 / requests_per_minute)
 
-        total_seconds = self.total_records * (avg_transcription_time + cd_seconds)
+        total_seconds = round(self.total_records * seconds_per_record)
 
         # 转换为人类可读格式
         if total_seconds < 60:
@@ -174,13 +183,13 @@ class BatchReprocessDialog(QDialog):
 
         self.estimate_label.setText(time_str)
 
-    def get_cd_seconds(self) -> int:
-        """获取用户配置的CD时间
+    def get_requests_per_minute(self) -> int:
+        """获取用户配置的云端请求速率限制
 
         Returns:
-            int: CD时间（秒）
+            int: 每分钟最多请求数，0 表示不限制
         """
-        return self.cd_spinbox.value()
+        return self.rate_spinbox.value()
 
     def retranslate_ui(self) -> None:
         """Update UI text for the current language."""
@@ -198,29 +207,31 @@ class BatchReprocessDialog(QDialog):
             )
         )
 
-        self.cd_group.setTitle(
-            QCoreApplication.translate("BatchReprocessDialog", "Cooldown Configuration")
+        self.rate_group.setTitle(
+            QCoreApplication.translate(
+                "BatchReprocessDialog", "Rate Limit Configuration"
+            )
         )
-        self.cd_label.setText(
+        self.rate_label.setText(
             QCoreApplication.translate(
-                "BatchReprocessDialog", "Cooldown between records:"
+                "BatchReprocessDialog", "Cloud requests per minute:"
             )
         )
-        self.cd_spinbox.setSuffix(
-            QCoreApplication.translate("BatchReprocessDialog", " seconds")
+        self.rate_spinbox.setSpecialValueText(
+            QCoreApplication.translate("BatchReprocessDialog", "Unlimited")
         )
-        self.cd_spinbox.setToolTip(
+        self.rate_spinbox.setToolTip(
             QCoreApplication.translate(
                 "BatchReprocessDialog",
-                "Delay between processing each record.\n"
-                "Useful for avoiding API rate limits when using cloud transcription.",
+                "Maximum cloud transcription requests per minute.\n"
+                "Requests are sent in parallel up to this limit.",
             )
         )
-        self.cd_help.setText(
+        self.rate_help.setText(
             QCoreApplication.translate(
                 "BatchReprocessDialog",
-                "Recommended: 5 seconds for cloud providers to avoid rate limits.\n"
-                "For local transcription (sherpa-onnx), 0-1 seconds is sufficient.",
+                "Set this to your provider's quota to avoid rate limit errors.\n"
+                "Local transcription (sherpa-onnx) is not rate limited.",
             )
         )
 
@@ -233,7 +244,8 @@ class BatchReprocessDialog(QDialog):
         self.estimate_help.setText(
             QCoreApplication.translate(
                 "BatchReprocessDialog",
-                "Based on average transcription time (5s for cloud, 0.2s for local) + CD time.",
+                "Based on 5s per cloud request with 4 parallel requests, "
+                "capped by the rate limit. Local transcription is usually much faster.",
             )
         )
 
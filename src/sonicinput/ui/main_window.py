@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ..core.interfaces import EventDelivery
 from ..core.services.events import Events
 from ..core.services.ui_services import UIMainService, UIModelService, UISettingsService
 from ..utils import app_logger
@@ -284,14 +285,27 @@ class MainWindow(QMainWindow):
             return
 
         # 录音状态事件
+        # 这些回调直接操作控件，而事件可能在录音线程或快捷键线程上发出，
+        # 因此投递到 Qt 主线程执行
         events = self.ui_main_service.get_event_service()
-        events.on(Events.RECORDING_STARTED, self._on_recording_started)
-        events.on(Events.RECORDING_STOPPED, self._on_recording_stopped)
+        main_thread = EventDelivery.MAIN_THREAD
+        events.on(
+            Events.RECORDING_STARTED, self._on_recording_started, delivery=main_thread
+        )
+        events.on(
+            Events.RECORDING_STOPPED, self._on_recording_stopped, delivery=main_thread
+        )
         events.on(Events.UI_LANGUAGE_CHANGED, self._on_language_changed)
 
         # 快捷键事件
-        events.on(Events.HOTKEY_CONFLICT, self._on_hotkey_conflict)
-        events.on(Events.HOTKEY_REGISTRATION_ERROR, self._on_hotkey_registration_error)
+        events.on(
+            Events.HOTKEY_CONFLICT, self._on_hotkey_conflict, delivery=main_thread
+        )
+        events.on(
+            Events.HOTKEY_REGISTRATION_ERROR,
+            self._on_hotkey_registration_error,
+            delivery=main_thread,
+        )
 
     def _on_language_changed(self, data: object = None) -> None:
         """Handle runtime UI language change."""
@@ -49,6 +49,23 @@ class ReprocessingWorker(QThread):
         self.history_service = history_service
         self.should_stop = False
 
+    def _wait_for_background_slot(self) -> bool:
+        """用户正在听写时等待后台通道开放，重试不与实时听写争抢模型
+
+        Returns:
+            False 表示等待期间被停止
+        """
+        wait = getattr(self.transcription_service, "wait_for_background_slot", None)
+        if callable(wait) and not wait(timeout=0):
+            self.progress_updated.emit(
+                QCoreApplication.translate(
+                    "HistoryTab", "Waiting for dictation to finish..."
+                )
+            )
+            while not self.should_stop and not wait(timeout=0.2):
+                pass
+        return not self.should_stop
+
     def run(self):
         """后台线程执行重处理流程"""
         try:
@@ -93,7 +110,7 @@ class ReprocessingWorker(QThread):
                 )
                 return
 
-            if self.should_stop:
+            if not self._wait_for_background_slot():
                 return
 
             # 2. 重新转录
@@ -294,288 +311,141 @@ class ReprocessingWorker(QThread):
 
 
 class BatchReprocessingWorker(QThread):
-    """批量重新处理录音的后台工作线程"""
+    """批量重新处理录音的后台工作线程
+
+    实际处理由 BatchReprocessingEngine 的并发流水线完成，
+    本线程只负责驱动引擎并把进度事件转换为 Qt 信号。
+    """
 
     # 信号定义
-    progress_updated = Signal(int, int, str)  # (current, total, record_id)
+    progress_updated = Signal(int, int, str)  # (processed, total, record_id)
     batch_completed = Signal(dict)  # 批处理完成信号，包含统计结果
     record_processed = Signal(str, bool)  # (record_id, success) - 单条记录处理完成
 
     def __init__(
         self,
-        total_records: int,
-        cd_seconds: int,
+        requests_per_minute: int,
         transcription_service,
         ai_processing_controller,
         config_service,
         history_service,
+        resume: bool = True,
         page_size: int = 500,
     ):
         super().__init__()
-        self.total_records = total_records
-        self.page_size = page_size
-        self.cd_seconds = cd_seconds
-        self.transcription_service = transcription_service
-        self.ai_processing_controller = ai_processing_controller
-        self.config_service = config_service
-        self.history_service = history_service
-        self.should_stop = False
-        self.stats = {"total": 0, "success": 0, "skipped": 0, "failed": 0, "errors": []}
+        from ...core.services.batch_reprocessing_engine import (
+            BatchReprocessingEngine,
+        )
+
+        self.resume = resume
+        self.engine = BatchReprocessingEngine(
+            history_service=history_service,
+            transcription_service=transcription_service,
+            config_service=config_service,
+            ai_processing_controller=ai_processing_controller,
+            requests_per_minute=requests_per_minute,
+            page_size=page_size,
+        )
+        self.engine.subscribe(self._on_engine_event)
 
     def run(self):
         """后台线程执行批量重处理流程"""
-        import time
-
-        from ...utils import app_logger
-
-        total_records = max(int(self.total_records or 0), 0)
-        self.stats["total"] = total_records
-
-        processed = 0
-        offset = 0
-        page_size = max(int(self.page_size or 0), 1)
-
-        while not self.should_stop and processed < total_records:
-            records = self.history_service.get_records(limit=page_size, offset=offset)
-            if not records:
-                break
-
-            for record in records:
-                if self.should_stop or processed >= total_records:
-                    break
-
-                processed += 1
-
-                # 发送进度更新
-                self.progress_updated.emit(processed, total_records, record.id)
-
-                # 处理单条记录
-                success = self._process_single_record(record)
-
-                # 发送单条记录完成信号
-                self.record_processed.emit(record.id, success)
-
-                # CD间隔（除了最后一条记录）
-                if processed < total_records and self.cd_seconds > 0:
-                    time.sleep(self.cd_seconds)
-
-            offset += len(records)
-
-        if self.should_stop:
-            app_logger.log_audio_event(
-                "Batch reprocessing cancelled by user",
-                {"processed": processed, "total": total_records},
-            )
-
-        # 发送批处理完成信号
-        self.batch_completed.emit(self.stats)
-
-    def _process_single_record(self, record) -> bool:
-        """处理单条记录
-
-        Args:
-            record: 历史记录对象
-
-        Returns:
-            bool: 是否成功
-        """
-        from ...audio.recorder import AudioRecorder
         from ...utils import app_logger
 
         try:
-            # 1. 加载音频文件
-            audio_file_path = record.audio_file_path
-
-            if not audio_file_path:
-                self.stats["skipped"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab", "[SKIP] {record_id}: No audio file path"
-                    ).format(record_id=record.id)
-                )
-                return False
-
-            try:
-                audio_data = AudioRecorder.load_audio_from_file(audio_file_path)
-                if audio_data is None or len(audio_data) == 0:
-                    self.stats["skipped"] += 1
-                    self.stats["errors"].append(
-                        QCoreApplication.translate(
-                            "HistoryTab", "[SKIP] {record_id}: Failed to load audio"
-                        ).format(record_id=record.id)
-                    )
-                    return False
-            except FileNotFoundError:
-                self.stats["skipped"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab", "[SKIP] {record_id}: Audio file not found"
-                    ).format(record_id=record.id)
-                )
-                return False
-            except Exception as e:
-                self.stats["skipped"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab",
-                        "[SKIP] {record_id}: Error loading audio - {error}",
-                    ).format(record_id=record.id, error=str(e))
-                )
-                return False
-
-            # 2. 重新转录
-            try:
-                transcription_provider = self.config_service.get_setting(
-                    "transcription.provider", "local"
-                )
-                if transcription_provider == "local":
-                    language = self.config_service.get_setting(
-                        "transcription.local.language", "zh"
-                    )
-                else:
-                    language = "auto"
-
-                temperature = 0.0
-
-                transcription_result = self.transcription_service.transcribe_sync(
-                    audio_data=audio_data,
-                    language=language if language != "auto" else None,
-                    temperature=temperature,
-                )
-
-                if not transcription_result.get("success", True):
-                    error_msg = transcription_result.get(
-                        "error",
-                        QCoreApplication.translate("HistoryTab", "Unknown error"),
-                    )
-                    self.stats["failed"] += 1
-                    self.stats["errors"].append(
-                        QCoreApplication.translate(
-                            "HistoryTab",
-                            "[FAIL] {record_id}: Transcription failed - {error}",
-                        ).format(record_id=record.id, error=error_msg)
-                    )
-                    return False
-
-                transcription_text = transcription_result.get("text", "")
-
-                if not transcription_text.strip():
-                    self.stats["failed"] += 1
-                    self.stats["errors"].append(
+            stats = self.engine.run(resume=self.resume)
+        except Exception as e:
+            app_logger.log_error(e, "batch_reprocessing_worker")
+            self.batch_completed.emit(
+                {
+                    "total": 0,
+                    "success": 0,
+                    "skipped": 0,
+                    "failed": 0,
+                    "cancelled": False,
+                    "errors": [
                         QCoreApplication.translate(
-                            "HistoryTab", "[FAIL] {record_id}: Empty transcription"
-                        ).format(record_id=record.id)
-                    )
-                    return False
-
-            except Exception as e:
-                app_logger.log_error(e, "batch_reprocessing_transcription")
-                self.stats["failed"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab",
-                        "[FAIL] {record_id}: Transcription error - {error}",
-                    ).format(record_id=record.id, error=str(e))
-                )
-                return False
-
-            # 3. 重新AI优化（如果启用）
-            ai_enabled = self.config_service.get_setting("ai.enabled", False)
-            ai_optimized_text = None
-            ai_provider = None
-            ai_status = "skipped"
-            ai_error = None
-
-            if ai_enabled and transcription_text.strip():
-                if not self.ai_processing_controller:
-                    ai_status = "skipped"
-                    ai_error = QCoreApplication.translate(
-                        "HistoryTab", "AI controller not available"
-                    )
-                else:
-                    try:
-                        ai_optimized_text = (
-                            self.ai_processing_controller.process_with_ai(
-                                transcription_text, record_id=record.id
-                            )
-                        )
-                        ai_provider = self.config_service.get_setting(
-                            "ai.provider", "groq"
-                        )
-
-                        if ai_optimized_text and ai_optimized_text.strip():
-                            ai_status = "success"
-                        else:
-                            ai_status = "failed"
-                            ai_error = QCoreApplication.translate(
-                                "HistoryTab", "AI returned empty text"
-                            )
-
-                    except Exception as e:
-                        app_logger.log_error(e, "batch_reprocessing_ai")
-                        ai_status = "failed"
-                        ai_error = str(e)
-
-            # 4. 更新数据库
-            final_text = (
-                ai_optimized_text
-                if (ai_status == "success" and ai_optimized_text)
-                else transcription_text
+                            "HistoryTab", "Failed to start batch reprocessing: {error}"
+                        ).format(error=str(e))
+                    ],
+                }
             )
+            return
 
-            # 从数据库重新获取记录以确保最新状态
-            fresh_record = self.history_service.get_record_by_id(record.id)
-            if not fresh_record:
-                self.stats["failed"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab",
-                        "[FAIL] {record_id}: Record not found in database",
-                    ).format(record_id=record.id)
-                )
-                return False
-
-            fresh_record.transcription_text = transcription_text
-            fresh_record.transcription_provider = transcription_provider
-            fresh_record.transcription_status = "success"
-            fresh_record.transcription_error = None
-            fresh_record.ai_optimized_text = ai_optimized_text
-            fresh_record.ai_provider = ai_provider
-            fresh_record.ai_status = ai_status
-            fresh_record.ai_error = ai_error
-            fresh_record.final_text = final_text
+        self.batch_completed.emit(
+            {
+                "total": stats.total,
+                "success": stats.success,
+                "skipped": stats.skipped,
+                "failed": stats.failed,
+                "cancelled": stats.cancelled,
+                "elapsed": stats.elapsed,
+                "errors": [self._format_error(error) for error in stats.errors],
+            }
+        )
 
-            try:
-                self.history_service.update_record(fresh_record)
-                self.stats["success"] += 1
-                return True
-            except Exception as e:
-                app_logger.log_error(e, "batch_reprocessing_update")
-                self.stats["failed"] += 1
-                self.stats["errors"].append(
-                    QCoreApplication.translate(
-                        "HistoryTab",
-                        "[FAIL] {record_id}: Database update failed - {error}",
-                    ).format(record_id=record.id, error=str(e))
-                )
-                return False
+    def _on_engine_event(self, event) -> None:
+        """引擎事件 -> Qt 信号（在引擎写入线程中调用，信号跨线程排队投递）"""
+        if event.kind == "started":
+            self.progress_updated.emit(event.processed, event.total, "")
+        elif event.kind == "record":
+            self.progress_updated.emit(event.processed, event.total, event.record_id)
+            self.record_processed.emit(event.record_id, bool(event.success))
 
-        except Exception as e:
-            from ...utils import app_logger
+    @staticmethod
+    def _format_error(error) -> str:
+        """将引擎错误转换为本地化的报告文本"""
+        record_id = error.record_id
+        detail = error.detail or QCoreApplication.translate(
+            "HistoryTab", "Unknown error"
+        )
+        kind = error.kind
 
-            app_logger.log_error(e, "batch_reprocessing_worker")
-            self.stats["failed"] += 1
-            self.stats["errors"].append(
-                QCoreApplication.translate(
-                    "HistoryTab",
-                    "[FAIL] {record_id}: Unexpected error - {error}",
-                ).format(record_id=record.id, error=str(e))
+        if kind == "no_audio_path":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[SKIP] {record_id}: No audio file path"
+            )
+        elif kind == "file_not_found":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[SKIP] {record_id}: Audio file not found"
+            )
+        elif kind == "load_failed":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[SKIP] {record_id}: Failed to load audio"
+            )
+        elif kind == "load_error":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[SKIP] {record_id}: Error loading audio - {error}"
+            )
+        elif kind == "transcription_failed":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Transcription failed - {error}"
             )
-            return False
+        elif kind == "empty_transcription":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Empty transcription"
+            )
+        elif kind == "transcription_error":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Transcription error - {error}"
+            )
+        elif kind == "record_not_found":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Record not found in database"
+            )
+        elif kind == "update_failed":
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Database update failed - {error}"
+            )
+        else:
+            text = QCoreApplication.translate(
+                "HistoryTab", "[FAIL] {record_id}: Unexpected error - {error}"
+            )
+        return text.format(record_id=record_id, error=detail)
 
     def stop(self):
-        """请求停止处理"""
-        self.should_stop = True
+        """请求停止处理（进度已保存，下次可继续）"""
+        self.engine.stop()
 
 
 class HistoryDetailDialog(QDialog):
@@ -1279,7 +1149,7 @@ class HistoryTab(BaseSettingsTab):
         self.batch_reprocess_button = QPushButton("Batch Reprocess")
         self.batch_reprocess_button.clicked.connect(self._on_batch_reprocess_clicked)
         self.batch_reprocess_button.setToolTip(
-            "Re-transcribe all history records with customizable cooldown delay"
+            "Re-transcribe all history records in parallel (resumable)"
         )
         toolbar_layout.addWidget(self.batch_reprocess_button)
 
@@ -1373,7 +1243,7 @@ class HistoryTab(BaseSettingsTab):
         self.batch_reprocess_button.setToolTip(
             QCoreApplication.translate(
                 "HistoryTab",
-                "Re-transcribe all history records with customizable cooldown delay",
+                "Re-transcribe all history records in parallel (resumable)",
             )
         )
         self.history_table.setHorizontalHeaderLabels(
@@ -1719,6 +1589,7 @@ class HistoryTab(BaseSettingsTab):
 
     def _on_batch_reprocess_clicked(self) -> None:
         """处理批量重新处理按钮点击"""
+        from ...core.services.batch_reprocessing_engine import load_checkpoint
         from ..dialogs.batch_reprocess_dialog import BatchReprocessDialog
 
         # 获取所有历史记录
@@ -1746,12 +1617,46 @@ class HistoryTab(BaseSettingsTab):
                 )
                 return
 
+            # 上次中断的批处理可以从检查点继续
+            resume = False
+            checkpoint = load_checkpoint(service)
+            if checkpoint and checkpoint.get("processed", 0) < total_records:
+                processed = checkpoint.get("processed", 0)
+                reply = QMessageBox.question(
+                    self.parent_window,
+                    QCoreApplication.translate(
+                        "HistoryTab", "Resume Batch Reprocessing"
+                    ),
+                    QCoreApplication.translate(
+                        "HistoryTab",
+                        "A previous batch reprocessing run was interrupted after "
+                        "{processed} of {total} records.\n\n"
+                        "Resume from where it stopped? Choose No to start over.",
+                    ).format(processed=processed, total=total_records),
+                    QMessageBox.StandardButton.Yes
+                    | QMessageBox.StandardButton.No
+                    | QMessageBox.StandardButton.Cancel,
+                    QMessageBox.StandardButton.Yes,
+                )
+                if reply == QMessageBox.StandardButton.Cancel:
+                    return
+                resume = reply == QMessageBox.StandardButton.Yes
+
+            remaining = total_records - (checkpoint or {}).get("processed", 0)
+            records_to_process = remaining if resume else total_records
+
             # 显示配置对话框
-            dialog = BatchReprocessDialog(total_records, self.parent_window)
+            dialog = BatchReprocessDialog(records_to_process, self.parent_window)
             if dialog.exec() != QDialog.DialogCode.Accepted:
                 return
 
-            cd_seconds = dialog.get_cd_seconds()
+            requests_per_minute = dialog.get_requests_per_minute()
+            if requests_per_minute > 0:
+                rate_text = QCoreApplication.translate(
+                    "HistoryTab", "{rate} requests per minute"
+                ).format(rate=requests_per_minute)
+            else:
+                rate_text = QCoreApplication.translate("HistoryTab", "Unlimited")
 
             # 确认操作
             reply = QMessageBox.question(
@@ -1760,10 +1665,10 @@ class HistoryTab(BaseSettingsTab):
                 QCoreApplication.translate(
                     "HistoryTab",
                     "You are about to re-transcribe {total} records.\n\n"
-                    "Cooldown: {cooldown} seconds between records\n"
+                    "Cloud rate limit: {rate}\n"
                     "This operation may take a long time and consume API quota.\n\n"
                     "Are you sure you want to continue?",
-                ).format(total=total_records, cooldown=cd_seconds),
+                ).format(total=records_to_process, rate=rate_text),
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No,
             )
@@ -1772,7 +1677,7 @@ class HistoryTab(BaseSettingsTab):
                 return
 
             # 启动批量处理
-            self._start_batch_reprocessing(total_records, cd_seconds)
+            self._start_batch_reprocessing(total_records, requests_per_minute, resume)
 
         except Exception as e:
             QMessageBox.critical(
@@ -1783,12 +1688,15 @@ class HistoryTab(BaseSettingsTab):
                 ).format(error=str(e)),
             )
 
-    def _start_batch_reprocessing(self, total_records: int, cd_seconds: int) -> None:
+    def _start_batch_reprocessing(
+        self, total_records: int, requests_per_minute: int, resume: bool = False
+    ) -> None:
         """启动批量重新处理流程
 
         Args:
-            total_records: 要处理的记录总数
-            cd_seconds: CD时间（秒）
+            total_records: 历史记录总数
+            requests_per_minute: 云端转录每分钟请求上限（0 表示不限制）
+            resume: 是否从上次中断的检查点继续
         """
         # 获取必要的服务
         transcription_service = self.transcription_service
@@ -1823,12 +1731,12 @@ class HistoryTab(BaseSettingsTab):
 
         # 创建Worker线程
         self.batch_worker = BatchReprocessingWorker(
-            total_records=total_records,
-            cd_seconds=cd_seconds,
+            requests_per_minute=requests_per_minute,
             transcription_service=transcription_service,
             ai_processing_controller=ai_processing_controller,
             config_service=self.config_manager,
             history_service=history_service,
+            resume=resume,
         )
 
         # 连接信号
@@ -1845,11 +1753,12 @@ class HistoryTab(BaseSettingsTab):
         """批量处理进度更新
 
         Args:
-            current: 当前处理的索引（1-based）
+            current: 已完成的记录数（含从检查点恢复的部分）
             total: 总记录数
-            record_id: 当前记录ID
+            record_id: 最近完成的记录ID（开始时为空）
         """
         if self.batch_progress_dialog:
+            self.batch_progress_dialog.setMaximum(total)
             self.batch_progress_dialog.setValue(current)
             self.batch_progress_dialog.setLabelText(
                 QCoreApplication.translate(
@@ -1878,6 +1787,10 @@ class HistoryTab(BaseSettingsTab):
         # 刷新历史记录列表
         self._load_history()
 
+        # 取消时已在 _on_batch_canceled 中提示，不再显示完成报告
+        if stats.get("cancelled"):
+            return
+
         # 显示完成报告
         total = stats.get("total", 0)
         success = stats.get("success", 0)
@@ -1941,6 +1854,8 @@ class HistoryTab(BaseSettingsTab):
             self.parent_window,
             QCoreApplication.translate("HistoryTab", "Batch Reprocessing Canceled"),
             QCoreApplication.translate(
-                "HistoryTab", "Batch reprocessing operation has been canceled."
+                "HistoryTab",
+                "Batch reprocessing operation has been canceled.\n"
+                "Progress has been saved and can be resumed next time.",
             ),
         )
@@ -141,11 +141,18 @@ class SettingsWindow(QMainWindow):
 
         # 监听模型加载完成事件
         if self.ui_settings_service:
+            from ..core.interfaces import EventDelivery
             from ..core.services.events import Events
 
             events = self.ui_settings_service.get_event_service()
             events.on(Events.MODEL_LOADED, self._on_model_loaded)
             events.on(Events.UI_LANGUAGE_CHANGED, self._on_language_changed)
+            # 下载进度在下载线程上发出，投递到 Qt 主线程更新状态标签
+            events.on(
+                Events.MODEL_DOWNLOAD_PROGRESS,
+                self._on_model_download_progress,
+                delivery=EventDelivery.MAIN_THREAD,
+            )
 
             # 检查模型是否已经加载，如果已加载则更新status label显示runtime状态
             # 注意: 此时dropdown已经显示config值，status label会显示runtime值
@@ -320,7 +327,6 @@ class SettingsWindow(QMainWindow):
 
     def load_current_config(self) -> None:
         """加载当前配置"""
-        self.current_config = self.ui_settings_service.get_all_settings()
         self.update_ui_from_config()
 
         # Initialize audio devices
@@ -334,6 +340,8 @@ class SettingsWindow(QMainWindow):
 
     def update_ui_from_config(self) -> None:
         """从配置更新UI"""
+        # 重新读取配置：重置标签页后 current_config 已过期
+        self.current_config = self.ui_settings_service.get_all_settings()
         # 使用各标签页的 load_config 方法
         self.application_tab.load_config(self.current_config)
         self.hotkey_tab.load_config(self.current_config)
@@ -1230,6 +1238,28 @@ class SettingsWindow(QMainWindow):
 
             app_logger.log_error(e, "_check_initial_model_status")
 
+    def _on_model_download_progress(self, event_data: dict) -> None:
+        """模型下载进度事件处理器
+
+        Args:
+            event_data: DownloadProgress.to_dict() 数据
+        """
+        try:
+            status_text = QCoreApplication.translate(
+                "SettingsWindow",
+                "Downloading model {model}: {done:.1f} / {total:.1f} MB",
+            ).format(
+                model=event_data.get("model_name", "Unknown"),
+                done=event_data.get("downloaded", 0) / (1024 * 1024),
+                total=event_data.get("total", 0) / (1024 * 1024),
+            )
+            self.transcription_tab.model_status_label.setText(status_text)
+
+        except Exception as e:
+            from ..utils import app_logger
+
+            app_logger.log_error(e, "_on_model_download_progress")
+
     def _on_model_loaded(self, event_data: dict = None) -> None:
         """模型加载完成事件处理器
 
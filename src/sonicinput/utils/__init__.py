@@ -1,9 +1,158 @@
-"""Enhanced utilities module with unified logging system"""
+"""Enhanced utilities module with unified logging system
+
+Exceptions and the logger are imported eagerly (nearly every module needs
+them). Diagnostics, error reporting and the validation/config helpers are
+imported on first access (PEP 562): common_utils pulls in PySide6 and
+validators pulls in the config constants.
+"""
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+from .exceptions import *  # noqa: F403
+
+if TYPE_CHECKING:
+    from .common_utils import (
+        ComponentTracker,
+        EventCounter,
+        PerformanceTracker,
+        SafeTimer,
+        ThreadSafeContainer,
+        TimestampTracker,
+        log_with_context,
+        safe_file_operation,
+    )
+    from .config_utils import (
+        ConfigMerger,
+        ConfigPathHelper,
+        get_nested_value,
+        set_nested_value,
+    )
+    from .dependency_diagnostics import dependency_diagnostics
+    from .environment_validator import environment_validator
+    from .error_reporting import (
+        error_context,
+        get_error_reporter,
+        report_error,
+        report_warning,
+        safe_call,
+        setup_error_reporter,
+    )
+    from .startup_diagnostics import startup_diagnostics
+    from .validation_utils import (
+        ConfigValidator,
+        validate_chain,
+        validate_config_structure,
+        validate_dict_structure,
+        validate_in_choices,
+        validate_not_empty,
+        validate_range,
+        validate_type,
+    )
+
+_LAZY_MODULES = {
+    ".dependency_diagnostics": ["dependency_diagnostics"],
+    ".environment_validator": ["environment_validator"],
+    ".startup_diagnostics": ["startup_diagnostics"],
+    ".error_reporting": [
+        "error_context",
+        "get_error_reporter",
+        "report_error",
+        "report_warning",
+        "safe_call",
+        "setup_error_reporter",
+    ],
+    ".common_utils": [
+        "ComponentTracker",
+        "EventCounter",
+        "PerformanceTracker",
+        "SafeTimer",
+        "ThreadSafeContainer",
+        "TimestampTracker",
+        "log_with_context",
+        "safe_file_operation",
+    ],
+    ".config_utils": [
+        "ConfigMerger",
+        "ConfigPathHelper",
+        "get_nested_value",
+        "set_nested_value",
+    ],
+    ".validation_utils": [
+        "ConfigValidator",
+        "validate_chain",
+        "validate_config_structure",
+        "validate_dict_structure",
+        "validate_in_choices",
+        "validate_not_empty",
+        "validate_range",
+        "validate_type",
+    ],
+}
+_LAZY_IMPORTS = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+# 可用性标志需要尝试导入才能确定，同样在首次访问时计算
+_AVAILABILITY_FLAGS = {
+    "ERROR_REPORTING_AVAILABLE": (".error_reporting",),
+    "UTILITY_MODULES_AVAILABLE": (
+        ".common_utils",
+        ".config_utils",
+        ".validation_utils",
+    ),
+}
+
+
+def _is_available(*module_names: str) -> bool:
+    try:
+        for module_name in module_names:
+            importlib.import_module(module_name, __name__)
+    except ImportError:
+        return False
+    return True
+
+
+def __getattr__(name: str):
+    """首次访问时导入导出对象（PEP 562）"""
+    if name in _AVAILABILITY_FLAGS:
+        value = _is_available(*_AVAILABILITY_FLAGS[name])
+    else:
+        module_name = _LAZY_IMPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+# 与所在模块同名的单例（如 startup_diagnostics）
+_SHADOWED_SINGLETONS = frozenset(
+    name for name, module_name in _LAZY_IMPORTS.items() if module_name == "." + name
+)
+
+
+class _UtilsModule(types.ModuleType):
+    """首次导入子模块时，导入系统会把同名包属性设为模块对象
+
+    忽略这次赋值，使包属性始终是单例，与导入顺序无关；子模块本身
+    通过 sys.modules 访问。
+    """
+
+    def __setattr__(self, name, value):
+        if name in _SHADOWED_SINGLETONS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _UtilsModule
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_AVAILABILITY_FLAGS))
 
-from .dependency_diagnostics import dependency_diagnostics  # noqa: F401
-from .environment_validator import environment_validator  # noqa: F401
-from .exceptions import *  # noqa: F403, F401
-from .startup_diagnostics import startup_diagnostics  # noqa: F401
 
 # Import unified logging system (新)
 # 注意：不导入from .logger避免循环导入
@@ -81,54 +230,6 @@ try:
 except ImportError:
     ERROR_MESSAGES_AVAILABLE = False
 
-# Import error reporting utilities
-try:
-    from .error_reporting import (  # noqa: F401
-        error_context,
-        get_error_reporter,
-        report_error,
-        report_warning,
-        safe_call,
-        setup_error_reporter,
-    )
-
-    ERROR_REPORTING_AVAILABLE = True
-except ImportError:
-    ERROR_REPORTING_AVAILABLE = False
-
-# Import validation and configuration utilities
-try:
-    from .common_utils import (  # noqa: F401
-        ComponentTracker,
-        EventCounter,
-        PerformanceTracker,
-        SafeTimer,
-        ThreadSafeContainer,
-        TimestampTracker,
-        log_with_context,
-        safe_file_operation,
-    )
-    from .config_utils import (  # noqa: F401
-        ConfigMerger,
-        ConfigPathHelper,
-        get_nested_value,
-        set_nested_value,
-    )
-    from .validation_utils import (  # noqa: F401
-        ConfigValidator,
-        validate_chain,
-        validate_config_structure,
-        validate_dict_structure,
-        validate_in_choices,
-        validate_not_empty,
-        validate_range,
-        validate_type,
-    )
-
-    UTILITY_MODULES_AVAILABLE = True
-except ImportError:
-    UTILITY_MODULES_AVAILABLE = False
-
 __all__ = [  # noqa: F405
     # Core exceptions
     "VoiceInputError",
@@ -150,6 +251,34 @@ __all__ = [  # noqa: F405
     "environment_validator",
     "startup_diagnostics",
     "dependency_diagnostics",
+    # Error reporting
+    "get_error_reporter",
+    "setup_error_reporter",
+    "report_error",
+    "report_warning",
+    "error_context",
+    "safe_call",
+    # Validation and configuration utilities
+    "validate_type",
+    "validate_not_empty",
+    "validate_dict_structure",
+    "validate_range",
+    "validate_in_choices",
+    "validate_chain",
+    "validate_config_structure",
+    "ConfigValidator",
+    "ConfigMerger",
+    "ConfigPathHelper",
+    "get_nested_value",
+    "set_nested_value",
+    "ThreadSafeContainer",
+    "TimestampTracker",
+    "ComponentTracker",
+    "EventCounter",
+    "SafeTimer",
+    "PerformanceTracker",
+    "safe_file_operation",
+    "log_with_context",
 ]
 
 # Add unified logging to exports if available
@@ -181,52 +310,16 @@ if ERROR_MESSAGES_AVAILABLE:
         ]
     )
 
-# Add error reporting to exports if available
-if ERROR_REPORTING_AVAILABLE:
-    __all__.extend(
-        [
-            "get_error_reporter",
-            "setup_error_reporter",
-            "report_error",
-            "report_warning",
-            "error_context",
-            "safe_call",
-        ]
-    )
-
-# Add utility modules to exports if available
-if UTILITY_MODULES_AVAILABLE:
-    __all__.extend(
-        [
-            "validate_type",
-            "validate_not_empty",
-            "validate_dict_structure",
-            "validate_range",
-            "validate_in_choices",
-            "validate_chain",
-            "validate_config_structure",
-            "ConfigValidator",
-            "ConfigMerger",
-            "ConfigPathHelper",
-            "get_nested_value",
-            "set_nested_value",
-            "ThreadSafeContainer",
-            "TimestampTracker",
-            "ComponentTracker",
-            "EventCounter",
-            "SafeTimer",
-            "PerformanceTracker",
-            "safe_file_operation",
-            "log_with_context",
-        ]
-    )
-
 
 def get_utils_status() -> dict:
     """Get status of available utility modules"""
     return {
         "enhanced_logging": ENHANCED_LOGGING_AVAILABLE,
-        "error_reporting": ERROR_REPORTING_AVAILABLE,
-        "utility_modules": UTILITY_MODULES_AVAILABLE,
+        "error_reporting": _is_available(
+            *_AVAILABILITY_FLAGS["ERROR_REPORTING_AVAILABLE"]
+        ),
+        "utility_modules": _is_available(
+            *_AVAILABILITY_FLAGS["UTILITY_MODULES_AVAILABLE"]
+        ),
         "core_modules": True,
     }
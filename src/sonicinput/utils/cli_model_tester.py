@@ -136,8 +136,12 @@ class CLIModelTester:
                 "confidence": float,
                 "is_hallucination": bool,
                 "transcription_time": float,
+                "warmup": Optional[dict],
                 "error": Optional[str]
             }
+
+            "warmup" holds the engine's first-inference and steady-state
+            latency metrics when it supports warm-up (None otherwise).
         """
         result = {
             "success": False,
@@ -146,6 +150,7 @@ class CLIModelTester:
             "confidence": 0.0,
             "is_hallucination": False,
             "transcription_time": 0.0,
+            "warmup": None,
             "error": None,
         }
 
@@ -162,6 +167,8 @@ class CLIModelTester:
                     result["error"] = error_msg
                     return result
 
+            result["warmup"] = self._collect_warmup_metrics()
+
             # Generate test audio
             self._report_progress("Generating test audio (2 seconds, low noise)...")
             test_audio = self._generate_test_audio(duration=2.0, amplitude=0.001)
@@ -219,6 +226,46 @@ class CLIModelTester:
 
         return result
 
+    def _collect_warmup_metrics(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the engine's warm-up metrics, warming it up if needed.
+
+        Engines loaded through ModelManager are already warmed up; their
+        recorded metrics are reused so the first-inference number reflects
+        the real first decode.
+
+        Returns:
+            Warm-up metrics dict, or None if the engine has no warm-up
+        """
+        metrics = getattr(self.whisper_engine, "warmup_metrics", None)
+        if isinstance(metrics, dict):
+            return metrics
+
+        warm_up = getattr(self.whisper_engine, "warm_up", None)
+        if not callable(warm_up):
+            return None
+
+        self._report_progress("Warming up model...")
+        try:
+            metrics = warm_up()
+        except Exception as e:
+            self._report_progress(f"Warm-up failed: {e}")
+            return None
+        return metrics if isinstance(metrics, dict) else None
+
+    def _format_warmup(self, warmup: Optional[Dict[str, Any]]) -> str:
+        """Format warm-up latency metrics for console output."""
+        if not warmup:
+            return "  Not available for this engine"
+
+        return (
+            f"  First Inference (offline): {warmup['offline_first_ms']:.1f} ms\n"
+            f"  Steady State (offline): {warmup['offline_steady_ms']:.1f} ms"
+            f" per {warmup['audio_seconds']:.1f}s utterance\n"
+            f"  First Chunk (streaming): {warmup['streaming_first_chunk_ms']:.1f} ms\n"
+            f"  Steady Chunk (streaming): {warmup['streaming_steady_chunk_ms']:.1f} ms"
+        )
+
     def format_results(self, result: Dict[str, Any]) -> str:
         """
         Format test results for console output.
@@ -271,6 +318,9 @@ Performance:
   Transcription Time: {result["transcription_time"]:.2f}s
   RTF (Real-Time Factor): {result["transcription_time"] / 2.0:.2f}x
 
+Warm-up Latency:
+{self._format_warmup(result.get("warmup"))}
+
 Analysis:
   Is Hallucination: {result["is_hallucination"]}
   Interpretation: {interpretation}
@@ -1,23 +1,63 @@
-"""安全存储工具 - 用于敏感信息加密存储"""
+"""安全存储工具 - 用于敏感信息加密存储
+
+密钥派生（PBKDF2，100,000 次迭代）开销较大：
+- 派生结果按 (app_name, machine_id) 在进程内缓存，只计算一次
+- 构造 SecureStorage 不再派生密钥；首次加解密时才派生
+- cryptography 在派生时才导入
+- 解密结果缓存在内存中，通过 invalidate_secrets() 显式清除
+"""
 
 import base64
 import hashlib
+import importlib.util
 import os
-from typing import Any, Dict
-
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from . import app_logger
 
+_KDF_SALT = b"sonicinput_salt_2025"  # 固定salt，确保同一机器上密钥一致
+_KDF_ITERATIONS = 100000
+
+# 进程内密钥缓存：(app_name, machine_id) -> Fernet key
+_derived_keys: Dict[Tuple[str, str], bytes] = {}
+_derive_lock = threading.Lock()
+_machine_id: Optional[str] = None
+_cryptography_available: Optional[bool] = None
+
+
+def _derive_key(app_name: str, machine_id: str) -> bytes:
+    """派生 Fernet 密钥（每个进程每组参数只计算一次）"""
+    cache_key = (app_name, machine_id)
+    with _derive_lock:
+        key = _derived_keys.get(cache_key)
+        if key is None:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=_KDF_SALT,
+                iterations=_KDF_ITERATIONS,
+            )
+            key = base64.urlsafe_b64encode(
+                kdf.derive(f"{app_name}:{machine_id}".encode())
+            )
+            _derived_keys[cache_key] = key
+        return key
+
 
 class SecureStorage:
     """安全存储类 - 提供敏感信息的加密存储功能"""
 
+    # 解密结果缓存的最大条目数
+    SECRET_CACHE_SIZE = 64
+
     def __init__(self, app_name: str = "SonicInput"):
         """
-        初始化安全存储
+        初始化安全存储（不派生密钥，首次加解密时才派生）
 
         Args:
             app_name: 应用程序名称，用于生成唯一的加密密钥
@@ -25,35 +65,47 @@ class SecureStorage:
         self.app_name = app_name
         self._key = None
         self._cipher = None
-        self._init_encryption()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+        # 密文 -> 明文
+        self._secret_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _ensure_cipher(self):
+        """返回加密器，首次调用时派生密钥（并发调用只派生一次）"""
+        if self._initialized:
+            return self._cipher
+        with self._init_lock:
+            if not self._initialized:
+                self._init_encryption()
+                self._initialized = True
+        return self._cipher
 
     def _init_encryption(self) -> None:
         """初始化加密器"""
         try:
-            # 基于系统信息和应用程序名称生成密钥
-            machine_id = self._get_machine_id()
-            key_material = f"{self.app_name}:{machine_id}".encode()
-
-            # 使用PBKDF2生成密钥
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b"sonicinput_salt_2025",  # 固定salt，确保同一机器上密钥一致
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(key_material))
+            from cryptography.fernet import Fernet
 
-            self._cipher = Fernet(key)
+            # 基于系统信息和应用程序名称生成密钥
+            self._key = _derive_key(self.app_name, self._get_machine_id())
+            self._cipher = Fernet(self._key)
             app_logger.log_audio_event("SecureStorage initialized successfully", {})
 
         except Exception as e:
             app_logger.log_error(e, "SecureStorage_init")
             # 降级到不安全存储（仅在Windows环境中）
             self._cipher = None
-            app_logger.log_warning("SecureStorage falling back to plain text", {})
+            app_logger.log_audio_event("SecureStorage falling back to plain text", {})
 
     def _get_machine_id(self) -> str:
-        """获取机器唯一标识"""
+        """获取机器唯一标识（进程内缓存；uuid.getnode() 可能很慢）"""
+        global _machine_id
+        if _machine_id is None:
+            _machine_id = self._compute_machine_id()
+        return _machine_id
+
+    def _compute_machine_id(self) -> str:
         try:
             import platform
             import uuid
@@ -71,14 +123,7 @@ class SecureStorage:
                 try:
                     combined_id += source() + "|"
                 except Exception as e:
-                    app_logger.log_error(
-                        e,
-                        "machine_id_source_failed",
-                        {
-                            "context": f"Failed to get machine ID from source #{idx}",
-                            "source_index": idx,
-                        },
-                    )
+                    app_logger.log_error(e, f"machine_id_source_failed_{idx}")
                     continue
 
             # 如果所有方法都失败，使用默认值
@@ -101,11 +146,14 @@ class SecureStorage:
         Returns:
             加密后的base64字符串，如果加密失败则返回原始数据
         """
-        if not self._cipher or not data:
+        if not data:
+            return data
+        cipher = self._ensure_cipher()
+        if not cipher:
             return data
 
         try:
-            encrypted_data = self._cipher.encrypt(data.encode())
+            encrypted_data = cipher.encrypt(data.encode())
             return base64.urlsafe_b64encode(encrypted_data).decode()
         except Exception as e:
             app_logger.log_error(e, "SecureStorage_encrypt")
@@ -121,18 +169,45 @@ class SecureStorage:
         Returns:
             解密后的原始字符串，如果解密失败则返回原始数据
         """
-        if not self._cipher or not encrypted_data:
+        if not encrypted_data:
+            return encrypted_data
+
+        with self._cache_lock:
+            cached = self._secret_cache.get(encrypted_data)
+            if cached is not None:
+                self._secret_cache.move_to_end(encrypted_data)
+                return cached
+
+        cipher = self._ensure_cipher()
+        if not cipher:
             return encrypted_data
 
         try:
             # 尝试解密
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted_data = self._cipher.decrypt(encrypted_bytes)
-            return decrypted_data.decode()
+            decrypted = cipher.decrypt(encrypted_bytes).decode()
         except Exception:
             # 如果解密失败，可能是未加密的数据，直接返回
             return encrypted_data
 
+        with self._cache_lock:
+            self._secret_cache[encrypted_data] = decrypted
+            while len(self._secret_cache) > self.SECRET_CACHE_SIZE:
+                self._secret_cache.popitem(last=False)
+        return decrypted
+
+    def invalidate_secrets(self, encrypted_data: Optional[str] = None) -> None:
+        """清除解密缓存，避免已替换的密钥明文继续留在内存中
+
+        Args:
+            encrypted_data: 只清除该密文对应的条目；None 表示全部清除
+        """
+        with self._cache_lock:
+            if encrypted_data is None:
+                self._secret_cache.clear()
+            else:
+                self._secret_cache.pop(encrypted_data, None)
+
     def secure_store_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         安全存储字典（加密所有字符串值）
@@ -184,17 +259,27 @@ class SecureStorage:
         return data
 
     def is_encryption_available(self) -> bool:
-        """检查加密是否可用"""
-        return self._cipher is not None
+        """检查加密是否可用（密钥尚未派生时不触发派生）"""
+        global _cryptography_available
+        if self._initialized:
+            return self._cipher is not None
+        if _cryptography_available is None:
+            _cryptography_available = (
+                importlib.util.find_spec("cryptography") is not None
+            )
+        return _cryptography_available
 
 
 # 全局安全存储实例
 _secure_storage = None
+_secure_storage_lock = threading.Lock()
 
 
 def get_secure_storage() -> SecureStorage:
-    """获取全局安全存储实例"""
+    """获取全局安全存储实例（不触发密钥派生）"""
     global _secure_storage
     if _secure_storage is None:
-        _secure_storage = SecureStorage()
+        with _secure_storage_lock:
+            if _secure_storage is None:
+                _secure_storage = SecureStorage()
     return _secure_storage
@@ -0,0 +1,331 @@
+"""Batch Reprocessing Engine Tests
+
+Tests for the pipelined history reprocessing engine: batched local ASR,
+rate-limited cloud calls, concurrent AI refinement, error accounting and
+checkpoint/resume.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.batch_reprocessing_engine import (
+    CHECKPOINT_KEY,
+    BatchReprocessingEngine,
+    RateLimiter,
+)
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import HistoryStorageService
+
+
+def _make_config(storage_path: Path, overrides=None) -> Mock:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+        ConfigKeys.TRANSCRIPTION_PROVIDER: "local",
+        ConfigKeys.AI_ENABLED: False,
+    }
+    settings.update(overrides or {})
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    return config
+
+
+@pytest.fixture
+def history_service(tmp_path):
+    service = HistoryStorageService(_make_config(tmp_path))
+    assert service.start()
+    yield service
+    service.stop()
+
+
+def _add_records(service, count):
+    base = datetime(2024, 1, 1)
+    records = [
+        HistoryRecord(
+            id=f"r{i:04d}",
+            timestamp=base + timedelta(seconds=i),
+            audio_file_path=f"audio_{i:04d}.wav",
+            duration=1.0,
+            transcription_text="old",
+            transcription_provider="local",
+            transcription_status="success",
+        )
+        for i in range(count)
+    ]
+    assert service.save_records_batch(records) == count
+    return records
+
+
+def _loader(path: str) -> np.ndarray:
+    # Encode the record number in the audio so fake ASR can echo it back
+    return np.full(4, int(path[6:10]), dtype=np.float32)
+
+
+class _FakeTranscription:
+    def __init__(self):
+        self.batch_sizes = []
+        self.sync_calls = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _text(audio):
+        return {"success": True, "text": f"text {int(audio[0])}"}
+
+    def transcribe_batch(self, audio_batch, language=None, temperature=0.0):
+        with self.lock:
+            self.batch_sizes.append(len(audio_batch))
+        return [self._text(audio) for audio in audio_batch]
+
+    def transcribe_sync(self, audio_data, language=None, temperature=0.0):
+        with self.lock:
+            self.sync_calls += 1
+        return self._text(audio_data)
+
+
+def _engine(history_service, tmp_path, settings=None, **kwargs):
+    return BatchReprocessingEngine(
+        history_service,
+        kwargs.pop("transcription_service", _FakeTranscription()),
+        _make_config(tmp_path, settings),
+        audio_loader=kwargs.pop("audio_loader", _loader),
+        **kwargs,
+    )
+
+
+class TestPipeline:
+    """Test end-to-end processing"""
+
+    def test_local_provider_batches_and_updates_all(self, history_service, tmp_path):
+        _add_records(history_service, 40)
+        asr = _FakeTranscription()
+        engine = _engine(
+            history_service, tmp_path, transcription_service=asr, asr_batch_size=8
+        )
+
+        stats = engine.run()
+
+        assert (stats.total, stats.success, stats.failed, stats.skipped) == (
+            40,
+            40,
+            0,
+            0,
+        )
+        assert sum(asr.batch_sizes) == 40
+        assert max(asr.batch_sizes) <= 8
+        record = history_service.get_record_by_id("r0007")
+        assert record.transcription_text == "text 7"
+        assert record.final_text == "text 7"
+        assert history_service.get_maintenance_value(CHECKPOINT_KEY) is None
+
+    def test_cloud_provider_uses_concurrent_sync_calls(self, history_service, tmp_path):
+        _add_records(history_service, 10)
+        asr = _FakeTranscription()
+        engine = _engine(
+            history_service,
+            tmp_path,
+            {ConfigKeys.TRANSCRIPTION_PROVIDER: "groq"},
+            transcription_service=asr,
+        )
+
+        stats = engine.run()
+
+        assert stats.success == 10
+        assert asr.sync_calls == 10
+        assert asr.batch_sizes == []
+
+    def test_ai_stage_refines_text(self, history_service, tmp_path):
+        _add_records(history_service, 5)
+        ai = Mock()
+        ai.process_with_ai.side_effect = lambda text, record_id=None: text.upper()
+        engine = _engine(
+            history_service,
+            tmp_path,
+            {ConfigKeys.AI_ENABLED: True, ConfigKeys.AI_PROVIDER: "groq"},
+            ai_processing_controller=ai,
+        )
+
+        assert engine.run().success == 5
+        record = history_service.get_record_by_id("r0003")
+        assert record.ai_status == "success"
+        assert record.ai_provider == "groq"
+        assert record.final_text == "TEXT 3"
+
+    def test_transcription_waits_for_background_slot(self, history_service, tmp_path):
+        _add_records(history_service, 4)
+        lane_open = threading.Event()
+        asr = _FakeTranscription()
+        asr.wait_for_background_slot = lambda timeout=None: lane_open.wait(timeout)
+        engine = _engine(history_service, tmp_path, transcription_service=asr)
+
+        runner = threading.Thread(target=engine.run)
+        runner.start()
+        time.sleep(0.3)
+        assert asr.batch_sizes == []
+
+        lane_open.set()
+        runner.join(5)
+        assert not runner.is_alive()
+        assert sum(asr.batch_sizes) == 4
+
+    def test_errors_are_classified(self, history_service, tmp_path):
+        _add_records(history_service, 4)
+
+        def loader(path):
+            if path.startswith("audio_0000"):
+                raise FileNotFoundError(path)
+            if path.startswith("audio_0001"):
+                return np.zeros(0, dtype=np.float32)
+            return _loader(path)
+
+        asr = _FakeTranscription()
+        asr.transcribe_batch = lambda batch, language=None: [
+            {"success": False, "error": "boom"}
+            if int(audio[0]) == 2
+            else {"success": True, "text": ""}
+            for audio in batch
+        ]
+        events = []
+        engine = _engine(
+            history_service, tmp_path, transcription_service=asr, audio_loader=loader
+        )
+        engine.subscribe(events.append)
+
+        stats = engine.run()
+
+        kinds = {error.record_id: error.kind for error in stats.errors}
+        assert kinds == {
+            "r0000": "file_not_found",
+            "r0001": "load_failed",
+            "r0002": "transcription_failed",
+            "r0003": "empty_transcription",
+        }
+        assert (stats.skipped, stats.failed) == (2, 2)
+        assert [e.kind for e in events if e.kind != "record"] == [
+            "started",
+            "completed",
+        ]
+        assert sum(1 for e in events if e.kind == "record") == 4
+
+
+class TestCheckpoint:
+    """Test checkpoint persistence and resume"""
+
+    def test_stop_keeps_checkpoint_and_resume_finishes(self, history_service, tmp_path):
+        _add_records(history_service, 30)
+        engine = _engine(
+            history_service,
+            tmp_path,
+            asr_batch_size=1,
+            max_in_flight=2,
+            write_batch_size=1,
+        )
+
+        def stop_after_ten(event):
+            if event.kind == "record" and event.processed >= 10:
+                engine.stop()
+
+        engine.subscribe(stop_after_ten)
+        first = engine.run()
+
+        assert first.cancelled
+        checkpoint = engine.get_checkpoint()
+        assert checkpoint is not None
+        assert 10 <= checkpoint["processed"] < 30
+
+        resumed = _engine(history_service, tmp_path)
+        second = resumed.run()
+
+        assert not second.cancelled
+        assert second.resumed_from == checkpoint["processed"]
+        assert second.processed == 30
+        assert resumed.get_checkpoint() is None
+        assert all(
+            r.transcription_text.startswith("text")
+            for r in history_service.get_records(limit=30)
+        )
+
+    def test_resume_false_starts_over(self, history_service, tmp_path):
+        _add_records(history_service, 5)
+        engine = _engine(history_service, tmp_path)
+        history_service.set_maintenance_value(
+            CHECKPOINT_KEY, '{"after": ["2030-01-01T00:00:00", "z"], "processed": 5}'
+        )
+
+        assert engine.run(resume=False).success == 5
+
+
+class TestKeysetPaging:
+    """Test get_records_after, which the engine pages the history with"""
+
+    def test_pages_cover_all_records_in_order_across_timestamp_ties(
+        self, history_service
+    ):
+        records = _add_records(history_service, 7)
+        # Records sharing a timestamp are ordered by id
+        tied = [
+            HistoryRecord(
+                id=f"t{i}",
+                timestamp=records[3].timestamp,
+                audio_file_path=f"tied_{i}.wav",
+                duration=1.0,
+                transcription_text="old",
+                transcription_provider="local",
+                transcription_status="success",
+            )
+            for i in range(3)
+        ]
+        assert history_service.save_records_batch(tied) == 3
+
+        seen, after = [], None
+        while True:
+            page = history_service.get_records_after(after, limit=2)
+            if not page:
+                break
+            seen.extend(record.id for record in page)
+            after = (page[-1].timestamp.isoformat(), page[-1].id)
+
+        assert seen == [
+            "r0000",
+            "r0001",
+            "r0002",
+            "r0003",
+            "t0",
+            "t1",
+            "t2",
+            "r0004",
+            "r0005",
+            "r0006",
+        ]
+
+
+class TestRateLimiter:
+    """Test token bucket rate limiting"""
+
+    def test_unlimited_never_waits(self):
+        limiter = RateLimiter(0)
+        start = time.monotonic()
+        assert all(limiter.acquire() for _ in range(100))
+        assert time.monotonic() - start < 0.1
+
+    def test_rate_is_enforced(self):
+        limiter = RateLimiter(600)  # 10 per second
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.25
+
+    def test_stop_event_interrupts_wait(self):
+        limiter = RateLimiter(1)
+        limiter.acquire()
+        stop = threading.Event()
+        stop.set()
+        assert limiter.acquire(stop) is False
@@ -0,0 +1,161 @@
+"""Config Reader Index Tests
+
+Tests for the precompiled flat key index, typed accessors generated from
+ConfigKeys and the config change subscription API.
+"""
+
+import json
+
+from sonicinput.core.services.config import ConfigAccessors, ConfigKeys
+from sonicinput.core.services.config.config_reader import ConfigReader
+from sonicinput.core.services.config.config_service_refactored import (
+    RefactoredConfigService,
+)
+
+
+def _walk(config, key, default=None):
+    """Reference lookup: split the key and walk the nested dicts"""
+    value = config
+    for k in key.split("."):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return default
+    return value
+
+
+def _service(tmp_path, config=None):
+    config_path = tmp_path / "config.json"
+    if config is not None:
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+    service = RefactoredConfigService(config_path=str(config_path))
+    assert service.load_config()
+    return service
+
+
+class TestFlatIndex:
+    """Test get_setting against the nested-walk semantics"""
+
+    def test_index_matches_nested_walk(self, tmp_path):
+        reader = ConfigReader(tmp_path / "config.json")
+        reader._config = {
+            "ai": {"provider": "groq", "groq": {"model_id": "m", "opt": None}},
+            "list": [1, 2],
+            "dotted.key": 1,
+        }
+
+        for key in (
+            "ai",
+            "ai.provider",
+            "ai.groq",
+            "ai.groq.model_id",
+            "ai.groq.opt",
+            "ai.provider.extra",
+            "list",
+            "list.0",
+            "dotted.key",
+            "missing",
+            "",
+        ):
+            assert reader.get_setting(key, "fallback") == _walk(
+                reader._config, key, "fallback"
+            ), key
+
+    def test_set_setting_rebuilds_index(self, tmp_path):
+        service = _service(tmp_path)
+
+        service.set_setting("ai.groq.model_id", "llama-new")
+        service.set_settings_batch({"ai.provider": "groq", "ai.custom.x": 1})
+
+        assert service.get_setting("ai.groq.model_id") == "llama-new"
+        assert service.get_setting(ConfigKeys.AI_PROVIDER) == "groq"
+        assert service.get_setting("ai.custom") == {"x": 1}
+        service._writer.cleanup()
+
+    def test_loading_does_not_mutate_defaults(self, tmp_path):
+        service = _service(tmp_path, {"ai": {"provider": "nvidia"}})
+
+        assert service.get_setting(ConfigKeys.AI_PROVIDER) == "nvidia"
+        assert service._reader._get_default_value(ConfigKeys.AI_PROVIDER) == (
+            "openrouter"
+        )
+
+
+class TestTypedAccessors:
+    """Test accessors generated from ConfigKeys"""
+
+    def test_every_config_key_has_an_accessor(self):
+        names = [n for n in vars(ConfigKeys) if n.isupper()]
+
+        assert set(names) == set(ConfigAccessors.KEY_TYPES)
+        assert all(hasattr(ConfigAccessors, n.lower()) for n in names)
+
+    def test_accessor_reads_value_and_falls_back_on_bad_type(self, tmp_path):
+        service = _service(
+            tmp_path,
+            {"ai": {"provider": "groq", "enabled": "yes"}, "audio": {"channels": 2}},
+        )
+
+        assert service.typed.ai_provider == "groq"
+        assert service.typed.get("AI_PROVIDER") == "groq"
+        assert service.typed.audio_channels == 2
+        # "yes" is not a bool: the default is returned
+        assert service.typed.ai_enabled is True
+
+
+class TestSubscriptions:
+    """Test change subscriptions"""
+
+    def test_subscriber_called_only_on_change(self, tmp_path):
+        service = _service(tmp_path)
+        calls = []
+        unsubscribe = service.subscribe(
+            ConfigKeys.AI_PROVIDER, lambda *args: calls.append(args)
+        )
+
+        service.set_setting(ConfigKeys.AI_PROVIDER, "groq")
+        service.set_setting(ConfigKeys.AI_PROVIDER, "groq")
+        service.set_setting(ConfigKeys.AI_ENABLED, False)
+        unsubscribe()
+        service.set_setting(ConfigKeys.AI_PROVIDER, "nvidia")
+
+        assert calls == [(ConfigKeys.AI_PROVIDER, "openrouter", "groq")]
+        service._writer.cleanup()
+
+    def test_parent_subscriber_fires_on_first_change_after_load(self, tmp_path):
+        service = _service(tmp_path, {"ai": {"provider": "groq"}})
+        calls = []
+        service.subscribe("ai", lambda key, old, new: calls.append((old, new)))
+
+        service.set_setting(ConfigKeys.AI_PROVIDER, "nvidia")
+
+        assert len(calls) == 1
+        old, new = calls[0]
+        assert old["provider"] == "groq"
+        assert new["provider"] == "nvidia"
+        service._writer.cleanup()
+
+    def test_parent_subscriber_fires_on_first_change_after_reset(self, tmp_path):
+        service = _service(tmp_path, {"ai": {"provider": "groq"}})
+        service.reset_to_default()
+        calls = []
+        service.subscribe("ai", lambda *args: calls.append(args))
+
+        service.set_setting(ConfigKeys.AI_PROVIDER, "nvidia")
+
+        assert len(calls) == 1
+        service._writer.cleanup()
+
+    def test_subscriber_notified_on_reset_and_errors_are_isolated(self, tmp_path):
+        service = _service(tmp_path, {"ai": {"provider": "groq"}})
+        calls = []
+
+        def broken(*args):
+            raise RuntimeError("boom")
+
+        service.subscribe(ConfigKeys.AI_PROVIDER, broken)
+        service.subscribe(ConfigKeys.AI_PROVIDER, lambda *args: calls.append(args))
+
+        service.reset_to_default()
+
+        assert calls == [(ConfigKeys.AI_PROVIDER, "groq", "openrouter")]
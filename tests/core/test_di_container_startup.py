@@ -0,0 +1,177 @@
+"""DI Container Startup Tests
+
+Tests for dependency-aware parallel startup: dependency ordering,
+concurrent start of independent services, background services joined on
+first use and the startup timeline report.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sonicinput.core.di_container import DIContainer, StartupMode
+from sonicinput.core.startup_timeline import StartupTimeline
+
+
+class _Service:
+    """Minimal lifecycle service that records when it starts"""
+
+    def __init__(self, name, log, delay=0.0, result=True):
+        self.name = name
+        self._log = log
+        self._delay = delay
+        self._result = result
+        self.is_running = False
+
+    def start(self):
+        self._log.append(("begin", self.name))
+        time.sleep(self._delay)
+        self.is_running = self._result
+        self._log.append(("end", self.name))
+        return self._result
+
+
+class IConfig:
+    pass
+
+
+class IState:
+    pass
+
+
+class IHotkey:
+    pass
+
+
+class IHistory:
+    pass
+
+
+def _register(container, interface, log, startup, depends_on=(), **kwargs):
+    container.register_singleton(
+        interface,
+        factory=lambda: _Service(interface.__name__, log, **kwargs),
+        depends_on=depends_on,
+        startup=startup,
+    )
+
+
+class TestStartServices:
+    """Test start_services() scheduling"""
+
+    def test_dependencies_start_first(self):
+        log = []
+        container = DIContainer()
+        _register(container, IHotkey, log, StartupMode.CRITICAL, (IConfig,))
+        _register(container, IConfig, log, StartupMode.CRITICAL, delay=0.02)
+
+        assert container.start_services(timeout=2.0)
+
+        assert log.index(("end", "IConfig")) < log.index(("begin", "IHotkey"))
+        assert container.resolve(IHotkey).is_running
+
+    def test_independent_services_start_concurrently(self):
+        log = []
+        barrier = threading.Barrier(2, timeout=1.0)
+
+        class _BarrierService(_Service):
+            def start(self):
+                barrier.wait()
+                return super().start()
+
+        container = DIContainer()
+        for interface in (IConfig, IState):
+            container.register_singleton(
+                interface,
+                factory=lambda i=interface: _BarrierService(i.__name__, log),
+                startup=StartupMode.CRITICAL,
+            )
+
+        # Sequential startup would break the barrier
+        assert container.start_services(timeout=2.0)
+        spans = container.get_startup_report()["spans"]
+        assert {s["name"] for s in spans} == {"IConfig", "IState"}
+        assert len({s["thread"] for s in spans}) == 2
+
+    def test_background_service_does_not_block_startup(self):
+        log = []
+        container = DIContainer()
+        _register(container, IConfig, log, StartupMode.CRITICAL)
+        _register(
+            container, IHistory, log, StartupMode.BACKGROUND, (IConfig,), delay=0.3
+        )
+
+        start = time.monotonic()
+        assert container.start_services(timeout=2.0)
+        assert time.monotonic() - start < 0.25
+
+        # First use waits until the background start has finished
+        assert container.resolve(IHistory).is_running
+        assert container.wait_for_startup(timeout=1.0)
+
+    def test_failed_critical_service_is_reported(self):
+        log = []
+        container = DIContainer()
+        _register(container, IConfig, log, StartupMode.CRITICAL, result=False)
+        _register(container, IHotkey, log, StartupMode.CRITICAL, (IConfig,))
+
+        assert not container.start_services(timeout=2.0)
+
+        services = container.get_startup_report()["services"]
+        assert services["IConfig"]["started"] is False
+        assert services["IHotkey"]["started"] is True
+        assert services["IHotkey"]["depends_on"] == ["IConfig"]
+
+    def test_dependency_cycle_is_rejected(self):
+        log = []
+        container = DIContainer()
+        _register(container, IConfig, log, StartupMode.CRITICAL, (IHotkey,))
+        _register(container, IHotkey, log, StartupMode.CRITICAL, (IConfig,))
+
+        with pytest.raises(ValueError, match="Circular"):
+            container.start_services()
+
+    def test_concurrent_resolve_creates_singleton_once(self):
+        created = []
+
+        def factory():
+            created.append(1)
+            time.sleep(0.02)
+            return object()
+
+        container = DIContainer()
+        container.register_singleton(IConfig, factory=factory)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(container.resolve(IConfig)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(1.0)
+
+        assert len(created) == 1
+        assert len({id(r) for r in results}) == 1
+
+
+class TestStartupTimeline:
+    """Test the startup timeline report"""
+
+    def test_report_contains_marks_and_parallelism(self):
+        timeline = StartupTimeline()
+        first = timeline.begin("a")
+        second = timeline.begin("b")
+        time.sleep(0.02)
+        timeline.end(first)
+        timeline.end(second, "failed")
+        timeline.mark("hotkey_armed")
+        timeline.mark("hotkey_armed")
+
+        report = timeline.get_report()
+
+        assert [s["status"] for s in report["spans"]] == ["ok", "failed"]
+        assert report["marks"]["hotkey_armed"] >= report["spans"][1]["end"]
+        # Two overlapping spans: roughly twice the wall time was spent
+        assert report["parallelism"] > 1.5
@@ -0,0 +1,343 @@
+"""Event Dispatch Tests
+
+Tests for the inline / worker / main-thread delivery modes of
+DynamicEventSystem, queue-depth metrics, the slow-listener detector,
+coalescing policies for high-frequency events and the copy-on-write
+listener snapshot used by emit.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sonicinput.core.interfaces import EventDelivery, EventPriority
+from sonicinput.core.services.dynamic_event_system import DynamicEventSystem
+from sonicinput.core.services.events import CoalescePolicy, Events
+
+
+@pytest.fixture
+def event_system():
+    system = DynamicEventSystem(worker_threads=2, stats_sample_interval=1)
+    assert system.start()
+    yield system
+    system.stop()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestDelivery:
+    """Test listener delivery modes"""
+
+    def test_inline_runs_on_emitting_thread(self, event_system):
+        threads = []
+        event_system.on("ping", lambda data: threads.append(threading.get_ident()))
+
+        event_system.emit("ping")
+
+        assert threads == [threading.get_ident()]
+
+    def test_worker_delivery_does_not_block_emitter(self, event_system):
+        release = threading.Event()
+        received = []
+
+        def slow_listener(data):
+            release.wait(2)
+            received.append(data)
+
+        event_system.on("tick", slow_listener, delivery=EventDelivery.WORKER)
+
+        start = time.perf_counter()
+        for i in range(5):
+            event_system.emit("tick", i)
+        emit_time = time.perf_counter() - start
+
+        assert emit_time < 0.5
+        assert event_system.get_dispatch_stats("tick")["tick"]["queue_depth"] >= 4
+
+        release.set()
+        assert _wait_for(lambda: len(received) == 5)
+        # Events for one listener are delivered in emission order
+        assert received == [0, 1, 2, 3, 4]
+        stats = event_system.get_dispatch_stats("tick")["tick"]
+        assert stats["delivered"] == 5
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] >= 4
+
+    def test_worker_once_listener_still_delivers(self, event_system):
+        received = []
+        event_system.once(
+            "ready", lambda data: received.append(data), delivery=EventDelivery.WORKER
+        )
+
+        event_system.emit("ready", "first")
+        event_system.emit("ready", "second")
+
+        assert _wait_for(lambda: received == ["first"])
+        assert event_system.get_listener_count("ready") == 0
+
+    def test_unsubscribe_drops_pending_events(self, event_system):
+        release = threading.Event()
+        received = []
+
+        def listener(data):
+            release.wait(2)
+            received.append(data)
+
+        listener_id = event_system.on("tick", listener, delivery=EventDelivery.WORKER)
+        for i in range(3):
+            event_system.emit("tick", i)
+        event_system.off("tick", listener_id)
+        release.set()
+
+        time.sleep(0.05)
+        assert received in ([], [0])
+        assert event_system.get_dispatch_stats("tick")["tick"]["queue_depth"] == 0
+
+    def test_main_thread_delivery(self, qapp, event_system):
+        main_thread = threading.get_ident()
+        threads = []
+        event_system.on(
+            "update",
+            lambda data: threads.append(threading.get_ident()),
+            delivery=EventDelivery.MAIN_THREAD,
+        )
+
+        emitter = threading.Thread(target=lambda: event_system.emit("update"))
+        emitter.start()
+        emitter.join()
+        assert threads == []
+
+        assert _wait_for(lambda: (qapp.processEvents(), threads)[1] != [])
+        assert threads == [main_thread]
+
+
+class TestSlowListeners:
+    """Test the slow-listener detector"""
+
+    def test_slow_inline_listener_is_counted(self, event_system, monkeypatch):
+        monkeypatch.setattr(DynamicEventSystem, "SLOW_LISTENER_THRESHOLD", 0.01)
+        event_system.on("slow", lambda data: time.sleep(0.02))
+        event_system.on("fast", lambda data: None)
+
+        event_system.emit("slow")
+        event_system.emit("fast")
+
+        stats = event_system.get_dispatch_stats()
+        assert stats["slow"]["slow_calls"] == 1
+        assert stats["fast"]["slow_calls"] == 0
+
+    def test_listener_errors_are_isolated(self, event_system):
+        received = []
+        event_system.on("boom", lambda data: 1 / 0)
+        event_system.on("boom", lambda data: received.append(data))
+
+        event_system.emit("boom", "ok")
+
+        assert received == ["ok"]
+        assert event_system.get_dispatch_stats("boom")["boom"]["errors"] == 1
+
+
+class TestCoalescing:
+    """Test coalescing policies for high-frequency events"""
+
+    def test_throttle_caps_rate_and_delivers_last_value(self, event_system):
+        received = []
+        event_system.on(
+            "level",
+            lambda data: received.append((time.monotonic(), data)),
+            coalesce=CoalescePolicy.max_rate(20),
+        )
+
+        start = time.monotonic()
+        for i in range(50):
+            event_system.emit("level", i)
+            time.sleep(0.002)
+        elapsed = time.monotonic() - start
+
+        assert _wait_for(lambda: received and received[-1][1] == 49, timeout=1.0)
+        times = [t for t, _ in received]
+        # Leading edge, one delivery per 50ms window and the trailing value
+        assert len(received) <= elapsed / 0.05 + 2
+        assert all(b - a >= 0.045 for a, b in zip(times, times[1:]))
+        stats = event_system.get_dispatch_stats("level")["level"]
+        assert stats["coalesced"] == 50 - len(received)
+
+    def test_debounce_waits_for_quiet_period(self, event_system):
+        received = []
+        event_system.on(
+            "typing",
+            received.append,
+            coalesce=CoalescePolicy.debounce(0.2),
+        )
+
+        for i in range(5):
+            event_system.emit("typing", i)
+            time.sleep(0.01)
+        assert received == []
+
+        assert _wait_for(lambda: received == [4], timeout=1.0)
+
+    def test_latest_keeps_newest_queued_value_per_key(self, event_system):
+        release = threading.Event()
+        received = []
+
+        def listener(data):
+            release.wait(2)
+            received.append(data)
+
+        event_system.on(
+            "state",
+            listener,
+            delivery=EventDelivery.WORKER,
+            coalesce=CoalescePolicy.latest(key="key"),
+        )
+
+        event_system.emit("state", {"key": "busy", "value": 0})
+        assert _wait_for(
+            lambda: event_system.get_dispatch_stats("state")["state"]["delivered"] == 1
+        )
+        for i in range(1, 4):
+            event_system.emit("state", {"key": "app", "value": i})
+            event_system.emit("state", {"key": "recording", "value": i})
+        release.set()
+
+        assert _wait_for(lambda: len(received) == 3)
+        assert received[1:] == [
+            {"key": "app", "value": 3},
+            {"key": "recording", "value": 3},
+        ]
+        assert event_system.get_dispatch_stats("state")["state"]["coalesced"] == 4
+
+    def test_builtin_policy_and_subscriber_opt_out(self, event_system):
+        throttled = []
+        everything = []
+        event_system.on(Events.AUDIO_LEVEL_UPDATE, throttled.append)
+        event_system.on(
+            Events.AUDIO_LEVEL_UPDATE,
+            everything.append,
+            coalesce=CoalescePolicy.none(),
+        )
+
+        for i in range(10):
+            event_system.emit(Events.AUDIO_LEVEL_UPDATE, float(i))
+
+        assert len(everything) == 10
+        assert throttled == [0.0]
+        assert _wait_for(lambda: throttled == [0.0, 9.0], timeout=1.0)
+
+    def test_inline_trailing_value_runs_on_scheduler_thread(self, event_system):
+        received = []
+        event_system.on(
+            "level",
+            lambda data: received.append((data, threading.current_thread().name)),
+            coalesce=CoalescePolicy.max_rate(20),
+        )
+
+        event_system.emit("level", 1)
+        event_system.emit("level", 2)
+
+        emitter = threading.current_thread().name
+        assert received == [(1, emitter)]
+        assert _wait_for(lambda: len(received) == 2, timeout=1.0)
+        assert received[1] == (2, "EventCoalesce")
+
+    def test_main_thread_trailing_value_runs_on_main_thread(self, qapp, event_system):
+        main_thread = threading.get_ident()
+        received = []
+        event_system.on(
+            "level",
+            lambda data: received.append((data, threading.get_ident())),
+            delivery=EventDelivery.MAIN_THREAD,
+            coalesce=CoalescePolicy.max_rate(20),
+        )
+
+        emitter = threading.Thread(
+            target=lambda: [event_system.emit("level", i) for i in (1, 2)]
+        )
+        emitter.start()
+        emitter.join()
+
+        assert _wait_for(lambda: (qapp.processEvents(), len(received))[1] == 2)
+        assert received == [(1, main_thread), (2, main_thread)]
+
+    def test_unsubscribe_cancels_trailing_delivery(self, event_system):
+        received = []
+        listener_id = event_system.on(
+            "level", received.append, coalesce=CoalescePolicy.max_rate(20)
+        )
+        event_system.emit("level", 1)
+        event_system.emit("level", 2)
+
+        event_system.off("level", listener_id)
+
+        time.sleep(0.1)
+        assert received == [1]
+
+
+class TestListenerSnapshot:
+    """Test the copy-on-write listener snapshot"""
+
+    def test_priority_order_is_preserved(self, event_system):
+        order = []
+        event_system.on("ordered", lambda data: order.append("low"), EventPriority.LOW)
+        event_system.on(
+            "ordered", lambda data: order.append("high"), EventPriority.HIGH
+        )
+        event_system.on("ordered", lambda data: order.append("normal"))
+        event_system.on("ordered", lambda data: order.append("normal2"))
+
+        event_system.emit("ordered")
+
+        assert order == ["high", "normal", "normal2", "low"]
+
+    def test_unsubscribe_during_emit_uses_snapshot(self, event_system):
+        received = []
+        ids = {}
+
+        def first(data):
+            received.append("first")
+            event_system.off("snap", ids["second"])
+
+        ids["first"] = event_system.on("snap", first)
+        ids["second"] = event_system.on("snap", lambda data: received.append("second"))
+
+        event_system.emit("snap")
+        event_system.emit("snap")
+
+        assert received == ["first", "second", "first"]
+        assert event_system.get_listener_count("snap") == 1
+
+    def test_stats_are_sampled(self):
+        system = DynamicEventSystem(worker_threads=1, stats_sample_interval=4)
+        assert system.start()
+        try:
+            received = []
+            system.on("sampled", received.append)
+
+            for i in range(8):
+                system.emit("sampled", i)
+
+            assert received == list(range(8))
+            assert system.get_dispatch_stats("sampled")["sampled"]["emitted"] == 8
+        finally:
+            system.stop()
+
+    def test_sampling_can_be_disabled(self):
+        system = DynamicEventSystem(worker_threads=1, stats_sample_interval=0)
+        assert system.start()
+        try:
+            system.on("quiet", lambda data: None)
+            system.emit("quiet")
+
+            assert "quiet" not in system.get_dispatch_stats()
+            assert "quiet" in system.get_registered_events()
+        finally:
+            system.stop()
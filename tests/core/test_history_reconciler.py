@@ -0,0 +1,188 @@
+"""History Reconciler Tests
+
+Tests for journal-based orphan repair and the resumable on-demand full scan
+that replaced the synchronous startup directory scan.
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import HistoryReconciler, HistoryStorageService
+from sonicinput.core.services.storage.history_reconciler import FULL_SCAN_CURSOR_KEY
+
+
+def _create_service(storage_path: Path) -> HistoryStorageService:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    return HistoryStorageService(config)
+
+
+@pytest.fixture
+def history_service(tmp_path):
+    service = _create_service(tmp_path)
+    assert service.start()
+    yield service
+    service.stop()
+
+
+def _record_for(path: str, record_id: str) -> HistoryRecord:
+    return HistoryRecord(
+        id=record_id,
+        timestamp=datetime.now(),
+        audio_file_path=path,
+        duration=1.0,
+        transcription_text="text",
+        transcription_provider="local",
+        transcription_status="success",
+    )
+
+
+class TestFileJournal:
+    """Test journal bookkeeping in HistoryStorageService"""
+
+    def test_generated_path_is_journaled_until_saved(self, history_service):
+        path = history_service.generate_audio_file_path()
+        assert [e[0] for e in history_service.get_journal_entries()] == [path]
+
+        Path(path).write_bytes(b"\0")
+        assert history_service.save_record(_record_for(path, "r1"))
+
+        assert history_service.get_journal_entries() == []
+
+    def test_purge_clears_delete_journal(self, history_service):
+        path = history_service.generate_audio_file_path()
+        Path(path).write_bytes(b"\0")
+        history_service.save_record(_record_for(path, "r1"))
+
+        assert history_service.delete_record("r1")
+        assert history_service.get_journal_entries() == []
+        assert not Path(path).exists()
+
+
+class TestJournalReplay:
+    """Test crash repair without a directory scan"""
+
+    def test_start_does_not_scan_directory(self, tmp_path):
+        service = _create_service(tmp_path)
+        with patch.object(HistoryReconciler, "run_full_scan") as full_scan:
+            assert service.start()
+            service.stop()
+        full_scan.assert_not_called()
+
+    def test_crash_between_write_and_insert_is_repaired(self, tmp_path):
+        # Session 1: path allocated and file written, then "crash" before insert
+        service = _create_service(tmp_path)
+        service.start()
+        orphan = service.generate_audio_file_path()
+        Path(orphan).write_bytes(b"\0" * 10)
+        service.stop()
+
+        # Session 2: background replay removes the orphan
+        time.sleep(0.01)
+        service = _create_service(tmp_path)
+        service.start()
+        try:
+            assert service.reconciler.replay_journal() == 1
+            assert not Path(orphan).exists()
+            assert service.get_journal_entries() == []
+        finally:
+            service.stop()
+
+    def test_current_session_writes_are_left_alone(self, history_service):
+        in_flight = history_service.generate_audio_file_path()
+        Path(in_flight).write_bytes(b"\0")
+
+        assert history_service.reconciler.replay_journal() == 0
+        assert Path(in_flight).exists()
+
+    def test_pending_delete_is_finished(self, history_service):
+        path = history_service.generate_audio_file_path()
+        Path(path).write_bytes(b"\0")
+        history_service.save_record(_record_for(path, "r1"))
+
+        # Simulate a crash after the DELETE commit but before unlink
+        with patch.object(history_service, "unlink_audio_files", return_value=(0, 0)):
+            with patch.object(history_service, "clear_journal_entries"):
+                history_service.delete_record("r1")
+        assert Path(path).exists()
+
+        assert history_service.reconciler.replay_journal() == 1
+        assert not Path(path).exists()
+
+
+class TestFullScan:
+    """Test the on-demand, resumable full scan"""
+
+    def _write_orphans(self, service, count):
+        recordings = service.get_storage_path() / "recordings"
+        paths = []
+        for i in range(count):
+            path = recordings / f"orphan_{i:04d}.wav"
+            path.write_bytes(b"\0")
+            paths.append(path)
+        return paths
+
+    def test_full_scan_keeps_referenced_files(self, history_service):
+        kept = history_service.generate_audio_file_path()
+        Path(kept).write_bytes(b"\0")
+        history_service.save_record(_record_for(kept, "r1"))
+        orphans = self._write_orphans(history_service, 3)
+
+        assert history_service.cleanup_orphaned_files() == 3
+        assert Path(kept).exists()
+        assert not any(p.exists() for p in orphans)
+
+    def test_full_scan_resumes_from_cursor(self, history_service):
+        orphans = self._write_orphans(history_service, 6)
+        reconciler = HistoryReconciler(history_service)
+        reconciler.SCAN_BATCH_SIZE = 2
+
+        # Stop after the first batch, as if the app was closed mid-scan
+        original_unlink = history_service.unlink_audio_files
+
+        def unlink_then_stop(paths):
+            result = original_unlink(paths)
+            reconciler._stop_event.set()
+            return result
+
+        with patch.object(
+            history_service, "unlink_audio_files", side_effect=unlink_then_stop
+        ):
+            assert reconciler.run_full_scan() == 2
+
+        assert reconciler.has_pending_scan
+        assert history_service.get_maintenance_value(FULL_SCAN_CURSOR_KEY) == (
+            orphans[1].name
+        )
+
+        reconciler._stop_event.clear()
+        assert reconciler.run_full_scan() == 4
+        assert not reconciler.has_pending_scan
+
+    def test_request_full_scan_runs_in_background(self, history_service):
+        orphans = self._write_orphans(history_service, 2)
+        reconciler = HistoryReconciler(history_service, initial_delay=0)
+        reconciler.start()
+        try:
+            assert reconciler.journal_replayed.wait(2.0)
+            reconciler.request_full_scan()
+            deadline = time.time() + 2.0
+            while any(p.exists() for p in orphans) and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            reconciler.stop()
+
+        assert not any(p.exists() for p in orphans)
+        assert not reconciler.has_pending_scan
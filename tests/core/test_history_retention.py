@@ -0,0 +1,215 @@
+"""History Retention Tests
+
+Tests for bulk deletion in HistoryStorageService and the retention policy
+engine (age / count / storage budgets, WAL checkpoint and VACUUM).
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import (
+    HistoryRetentionManager,
+    HistoryStorageService,
+    RetentionPolicy,
+)
+
+
+def _make_config(storage_path: Path, overrides=None) -> Mock:
+    settings = {ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path)}
+    settings.update(overrides or {})
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    return config
+
+
+@pytest.fixture
+def history_service(tmp_path):
+    config = _make_config(tmp_path, {ConfigKeys.HISTORY_RETENTION_ENABLED: False})
+    service = HistoryStorageService(config)
+    assert service.start()
+    yield service
+    service.stop()
+
+
+def _add_records(service, count, file_size=100, age_step_days=1):
+    records = []
+    for i in range(count):
+        audio_path = Path(service.generate_audio_file_path()).with_name(
+            f"rec_{i:05d}.wav"
+        )
+        audio_path.write_bytes(b"\0" * file_size)
+        records.append(
+            HistoryRecord(
+                id=f"r{i:05d}",
+                timestamp=datetime.now() - timedelta(days=i * age_step_days),
+                audio_file_path=str(audio_path),
+                duration=1.0,
+                transcription_text="text",
+                transcription_provider="local",
+                transcription_status="success",
+            )
+        )
+    assert service.save_records_batch(records) == count
+    return records
+
+
+class TestBulkDelete:
+    """Test single-transaction bulk deletion"""
+
+    def test_delete_records_removes_rows_and_files(self, history_service):
+        records = _add_records(history_service, 10)
+        ids = [r.id for r in records[:6]]
+
+        assert history_service.delete_records(ids) == 6
+        assert history_service.get_total_count() == 4
+        for record in records[:6]:
+            assert not Path(record.audio_file_path).exists()
+        for record in records[6:]:
+            assert Path(record.audio_file_path).exists()
+
+    def test_delete_records_spans_multiple_sql_batches(self, history_service):
+        records = _add_records(history_service, 1200, file_size=1)
+
+        deleted, files, freed = history_service.purge_records([r.id for r in records])
+
+        assert deleted == 1200
+        assert files == 1200
+        assert freed == 1200
+        assert history_service.get_total_count() == 0
+
+    def test_delete_record_missing_returns_false(self, history_service):
+        _add_records(history_service, 1)
+        assert history_service.delete_record("r00000") is True
+        assert history_service.delete_record("r00000") is False
+
+    def test_delete_tolerates_missing_audio_file(self, history_service):
+        records = _add_records(history_service, 2)
+        Path(records[0].audio_file_path).unlink()
+
+        assert history_service.delete_records([r.id for r in records]) == 2
+
+
+class TestRetentionPolicy:
+    """Test retention policy selection and reporting"""
+
+    def test_policy_from_config(self, tmp_path):
+        config = _make_config(
+            tmp_path,
+            {
+                ConfigKeys.HISTORY_RETENTION_MAX_AGE_DAYS: 30,
+                ConfigKeys.HISTORY_RETENTION_MAX_RECORDS: 500,
+            },
+        )
+        policy = RetentionPolicy.from_config(config)
+
+        assert policy.enabled is True
+        assert policy.max_age_days == 30
+        assert policy.max_records == 500
+        assert policy.max_storage_mb == 0
+        assert policy.has_budget
+
+    def test_no_budget_deletes_nothing(self, history_service):
+        _add_records(history_service, 5)
+        manager = HistoryRetentionManager(history_service, policy=RetentionPolicy())
+
+        report = manager.run_once()
+
+        assert report.records_deleted == 0
+        assert history_service.get_total_count() == 5
+
+    def test_age_budget(self, history_service):
+        _add_records(history_service, 10)
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(max_age_days=5)
+        )
+
+        report = manager.run_once()
+
+        # Records 0..4 are younger than 5 days; 5 is just past the cutoff
+        assert report.expired_by_age == 5
+        assert report.records_deleted == 5
+        assert history_service.get_total_count() == 5
+
+    def test_count_budget_keeps_newest(self, history_service):
+        records = _add_records(history_service, 10)
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(max_records=3)
+        )
+
+        report = manager.run_once()
+
+        assert report.records_deleted == 7
+        kept = {r.id for r in history_service.get_records(limit=10)}
+        assert kept == {r.id for r in records[:3]}
+
+    def test_storage_budget(self, history_service):
+        one_mb = 1024 * 1024
+        records = _add_records(history_service, 5, file_size=one_mb // 2)
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(max_storage_mb=1)
+        )
+
+        report = manager.run_once()
+
+        assert report.expired_by_size == 3
+        assert report.files_deleted == 3
+        assert report.audio_bytes_freed == 3 * (one_mb // 2)
+        kept = {r.id for r in history_service.get_records(limit=10)}
+        assert kept == {r.id for r in records[:2]}
+
+    def test_overlapping_budgets_are_deduplicated(self, history_service):
+        _add_records(history_service, 10)
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(max_age_days=5, max_records=3)
+        )
+
+        report = manager.run_once()
+
+        assert report.expired_by_age == 5
+        assert report.expired_by_count == 7
+        assert report.records_deleted == 7
+
+    def test_vacuum_and_checkpoint(self, history_service):
+        _add_records(history_service, 50)
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(max_records=1)
+        )
+
+        report = manager.run_once(force_vacuum=True)
+
+        assert report.vacuumed is True
+        assert report.wal_checkpointed is True
+        assert (history_service.get_storage_path() / ".last_vacuum").exists()
+        assert "db_bytes_reclaimed" in report.to_dict()
+
+    def test_vacuum_not_due_after_recent_run(self, history_service):
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(vacuum_interval_hours=1)
+        )
+
+        assert manager.run_once(force_vacuum=True).vacuumed is True
+        assert manager.run_once().vacuumed is False
+
+
+class TestRetentionLifecycle:
+    """Test background job lifecycle"""
+
+    def test_service_owns_retention_manager(self, history_service):
+        manager = history_service.retention_manager
+        assert manager is not None
+        assert manager.is_running
+
+    def test_stop_joins_background_thread(self, history_service):
+        manager = HistoryRetentionManager(
+            history_service, policy=RetentionPolicy(), initial_delay=3600
+        )
+        assert manager.start()
+        assert manager.stop()
+        assert not manager.is_running
@@ -0,0 +1,187 @@
+"""History Transfer Tests
+
+Tests for streaming history export (JSONL / CSV + audio tarball) and the
+matching bulk import.
+"""
+
+import json
+import tarfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from sonicinput.core.interfaces import HistoryRecord
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.storage import (
+    HistoryExporter,
+    HistoryImporter,
+    HistoryStorageService,
+)
+
+
+def _create_service(storage_path: Path) -> HistoryStorageService:
+    settings = {
+        ConfigKeys.HISTORY_STORAGE_PATH: str(storage_path),
+        ConfigKeys.HISTORY_RETENTION_ENABLED: False,
+    }
+    config = Mock()
+    config.get_setting.side_effect = lambda key, default=None: settings.get(
+        key, default
+    )
+    service = HistoryStorageService(config)
+    assert service.start()
+    return service
+
+
+@pytest.fixture
+def source_service(tmp_path):
+    service = _create_service(tmp_path / "source")
+    yield service
+    service.stop()
+
+
+@pytest.fixture
+def target_service(tmp_path):
+    service = _create_service(tmp_path / "target")
+    yield service
+    service.stop()
+
+
+def _add_records(service, count, with_audio=True):
+    recordings = service.get_storage_path() / "recordings"
+    base = datetime(2024, 5, 1, 12, 0, 0)
+    records = []
+    for i in range(count):
+        path = recordings / f"rec_{i:04d}.wav"
+        if with_audio:
+            path.write_bytes(bytes([i % 256]) * 32)
+        records.append(
+            HistoryRecord(
+                id=f"r{i:04d}",
+                timestamp=base + timedelta(minutes=i),
+                audio_file_path=str(path),
+                duration=1.5,
+                transcription_text=f'text, with "quotes" {i}\nand newline',
+                transcription_provider="local",
+                transcription_status="success",
+                ai_optimized_text=None if i % 2 else f"refined {i}",
+                ai_provider=None if i % 2 else "groq",
+                ai_status="skipped" if i % 2 else "success",
+                final_text=f"final {i}",
+            )
+        )
+    assert service.save_records_batch(records) == count
+    return records
+
+
+class TestExport:
+    """Test streaming export"""
+
+    def test_jsonl_export_is_oldest_first(self, source_service, tmp_path):
+        _add_records(source_service, 25, with_audio=False)
+        target = tmp_path / "history.jsonl"
+
+        report = HistoryExporter(source_service, page_size=7).export_records(target)
+
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert report.records == 25
+        assert [json.loads(line)["id"] for line in lines] == [
+            f"r{i:04d}" for i in range(25)
+        ]
+
+    def test_audio_archive_contains_recordings(self, source_service, tmp_path):
+        _add_records(source_service, 3)
+        archive = tmp_path / "audio.tar.gz"
+
+        report = HistoryExporter(source_service).export_records(
+            tmp_path / "history.csv", audio_archive=archive
+        )
+
+        assert report.audio_files == 3
+        with tarfile.open(archive) as tar:
+            assert sorted(tar.getnames()) == [
+                f"recordings/rec_{i:04d}.wav" for i in range(3)
+            ]
+
+    def test_unknown_format_is_rejected(self, source_service, tmp_path):
+        with pytest.raises(ValueError):
+            HistoryExporter(source_service).export_records(tmp_path / "history.xml")
+
+
+class TestImport:
+    """Test bulk import"""
+
+    @pytest.mark.parametrize("suffix", ["jsonl", "csv"])
+    def test_round_trip(self, source_service, target_service, tmp_path, suffix):
+        records = _add_records(source_service, 12)
+        export_path = tmp_path / f"history.{suffix}"
+        archive = tmp_path / "audio.tar"
+        HistoryExporter(source_service).export_records(
+            export_path, audio_archive=archive
+        )
+
+        report = HistoryImporter(target_service, batch_size=5).import_records(
+            export_path, audio_archive=archive
+        )
+
+        assert report.records == 12
+        assert report.audio_files == 12
+        assert target_service.get_total_count() == 12
+        original = records[4]
+        imported = target_service.get_record_by_id(original.id)
+        assert imported.transcription_text == original.transcription_text
+        assert imported.ai_optimized_text == original.ai_optimized_text
+        assert imported.ai_provider == original.ai_provider
+        assert imported.timestamp == original.timestamp
+        assert Path(imported.audio_file_path).parent == (
+            target_service.get_storage_path() / "recordings"
+        )
+        assert Path(imported.audio_file_path).read_bytes() == bytes([4]) * 32
+        # Imported files are referenced, so nothing is left in the journal
+        assert target_service.get_journal_entries() == []
+
+    def test_existing_ids_are_skipped(self, source_service, tmp_path):
+        _add_records(source_service, 5, with_audio=False)
+        export_path = tmp_path / "history.jsonl"
+        HistoryExporter(source_service).export_records(export_path)
+
+        report = HistoryImporter(source_service).import_records(export_path)
+
+        assert report.records == 0
+        assert report.duplicates == 5
+        assert source_service.get_total_count() == 5
+
+    def test_invalid_rows_are_counted(self, target_service, tmp_path):
+        source = tmp_path / "history.jsonl"
+        source.write_text(
+            "\n".join(
+                [
+                    json.dumps({"id": "ok", "timestamp": "2024-01-01T00:00:00"}),
+                    "not json",
+                    json.dumps({"id": "bad", "timestamp": "yesterday"}),
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        report = HistoryImporter(target_service).import_records(source)
+
+        assert report.records == 1
+        assert report.invalid == 2
+
+    def test_archive_rejects_path_traversal(self, target_service, tmp_path):
+        evil = tmp_path / "evil.wav"
+        evil.write_bytes(b"x")
+        archive = tmp_path / "audio.tar"
+        with tarfile.open(archive, "w") as tar:
+            tar.add(evil, arcname="recordings/../../evil.wav")
+        source = tmp_path / "history.jsonl"
+        source.write_text("", encoding="utf-8")
+
+        report = HistoryImporter(target_service).import_records(
+            source, audio_archive=archive
+        )
+
+        assert report.audio_files == 0
@@ -0,0 +1,112 @@
+"""Import Time Budget Tests
+
+Runs `python -X importtime` in a subprocess and checks that the lazy
+package exports (PEP 562) keep heavy dependencies out of the import graph,
+that sonicinput's own module-level work stays within budget and that lazy
+exports do not depend on import order.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Self time of sonicinput.* modules when importing the application core
+IMPORT_BUDGET_MS = 150
+
+HEAVY_MODULES = (
+    "PySide6",
+    "cryptography",
+    "groq",
+    "numpy",
+    "pyaudio",
+    "pynput",
+    "requests",
+    "samplerate",
+    "sherpa_onnx",
+)
+
+
+def _run(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def _import_profile(statement):
+    """Return ({module: cumulative_us}, sonicinput self time in ms)"""
+    result = _run("-X", "importtime", "-c", statement)
+
+    modules = {}
+    own_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        modules[name] = int(cumulative_us)
+        if name.startswith("sonicinput"):
+            own_us += int(self_us)
+    return modules, own_us / 1000
+
+
+def _heavy(modules):
+    return sorted(m for m in HEAVY_MODULES if m in modules)
+
+
+@pytest.mark.parametrize(
+    "statement, allowed",
+    [
+        ("import sonicinput", ()),
+        ("import sonicinput.utils", ()),
+        ("from sonicinput.core.services.config import ConfigKeys", ()),
+        ("from sonicinput.ai import AIClientFactory", ()),
+        # Cloud-only path: no sherpa-onnx, groq SDK is imported on first use
+        (
+            "from sonicinput.speech import NullSpeechService, SpeechServiceFactory",
+            ("numpy",),
+        ),
+        (
+            "from sonicinput.speech.groq_speech_service import GroqSpeechService",
+            ("numpy", "requests"),
+        ),
+    ],
+)
+def test_lazy_exports_keep_heavy_modules_out(statement, allowed):
+    modules, _ = _import_profile(statement)
+
+    assert set(_heavy(modules)) <= set(allowed)
+
+
+def test_core_import_within_budget():
+    statement = "import sonicinput.core.voice_input_app"
+    # Best of two runs to absorb a cold filesystem cache
+    own_ms = min(_import_profile(statement)[1] for _ in range(2))
+
+    assert own_ms < IMPORT_BUDGET_MS
+
+
+def test_utils_singletons_do_not_depend_on_import_order():
+    # startup_diagnostics also imports the environment_validator submodule
+    _run(
+        "-c",
+        "import sonicinput.utils.startup_diagnostics\n"
+        "import sonicinput.utils.dependency_diagnostics\n"
+        "from sonicinput.utils import (\n"
+        "    dependency_diagnostics, environment_validator, startup_diagnostics\n"
+        ")\n"
+        "from sonicinput.utils.dependency_diagnostics import DependencyDiagnostics\n"
+        "from sonicinput.utils.environment_validator import EnvironmentValidator\n"
+        "from sonicinput.utils.startup_diagnostics import StartupDiagnostics\n"
+        "assert isinstance(dependency_diagnostics, DependencyDiagnostics)\n"
+        "assert isinstance(environment_validator, EnvironmentValidator)\n"
+        "assert isinstance(startup_diagnostics, StartupDiagnostics)\n",
+    )
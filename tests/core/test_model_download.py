@@ -0,0 +1,195 @@
+"""Model Download Tests
+
+Tests for SherpaModelManager.download_model against a local HTTP server
+serving a fixture .tar.bz2: streamed extraction of only the needed files,
+HTTP Range resume after a dropped connection, SHA-256 verification and
+progress events, and adding a second weight variant to a cached model.
+"""
+
+import hashlib
+import io
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sonicinput.core.services.events import Events
+from sonicinput.speech.model_download import ModelChecksumError
+from sonicinput.speech.sherpa_models import SherpaModelManager
+
+MODEL_DIR = "sherpa-onnx-fixture"
+FILES = ["tokens.txt", "encoder.int8.onnx", "decoder.int8.onnx"]
+FP32_FILES = ["tokens.txt", "encoder.onnx", "decoder.onnx"]
+
+
+def _build_archive():
+    contents = {
+        f"{MODEL_DIR}/tokens.txt": b"a 0\nb 1\n",
+        # Incompressible payload so the archive spans many network reads
+        f"{MODEL_DIR}/encoder.int8.onnx": os.urandom(400 * 1024),
+        f"{MODEL_DIR}/encoder.onnx": os.urandom(200 * 1024),
+        f"{MODEL_DIR}/decoder.int8.onnx": os.urandom(100 * 1024),
+        f"{MODEL_DIR}/decoder.onnx": os.urandom(50 * 1024),
+        f"{MODEL_DIR}/test_wavs/tokens.txt": b"not this one",
+    }
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:bz2") as tar:
+        for name, data in contents.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue(), contents
+
+
+class _ArchiveServer:
+    """HTTP server with Range support that can drop the first response"""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.drop_after = None
+        self.ranges = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                data = server.payload
+                start = 0
+                range_header = self.headers.get("Range")
+                server.ranges.append(range_header)
+                if range_header:
+                    start = int(range_header.split("=")[1].split("-")[0])
+                    self.send_response(206)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+                    )
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", str(len(data) - start))
+                self.end_headers()
+
+                body = data[start:]
+                if server.drop_after is not None:
+                    body = body[: server.drop_after]
+                    server.drop_after = None
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/model.tar.bz2"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _RecordingEvents:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, event, data=None):
+        self.emitted.append((event, data))
+
+
+@pytest.fixture
+def archive():
+    return _build_archive()
+
+
+@pytest.fixture
+def server(archive):
+    server = _ArchiveServer(archive[0])
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def manager(tmp_path, server, monkeypatch):
+    models = {
+        "fixture": {
+            "url": server.url,
+            "size_mb": 1,
+            "dir_name": MODEL_DIR,
+            "sha256": None,
+            "model_type": "paraformer",
+            "default_variant": "int8",
+            "variants": {
+                "int8": {"encoder": FILES[1], "decoder": FILES[2]},
+                "fp32": {"encoder": FP32_FILES[1], "decoder": FP32_FILES[2]},
+            },
+        }
+    }
+    monkeypatch.setattr(SherpaModelManager, "MODELS", models)
+    manager = SherpaModelManager(cache_dir=str(tmp_path / "models"))
+    manager.event_service = _RecordingEvents()
+    return manager
+
+
+def test_download_extracts_only_needed_files(manager, archive):
+    progress = []
+
+    model_dir = manager.download_model(
+        "fixture", progress_callback=lambda done, total: progress.append(done)
+    )
+
+    assert sorted(p.name for p in model_dir.iterdir()) == sorted(FILES)
+    for name in FILES:
+        assert (model_dir / name).read_bytes() == archive[1][f"{MODEL_DIR}/{name}"]
+    assert manager.is_model_cached("fixture")
+    assert not any(manager.cache_dir.glob("*.part"))
+
+    events = [event for event, _ in manager.event_service.emitted]
+    assert events[-1] == Events.MODEL_DOWNLOAD_COMPLETED
+    completed = manager.event_service.emitted[-1][1]
+    assert completed["sha256"] == hashlib.sha256(archive[0]).hexdigest()
+    assert completed["percent"] == 100.0
+
+
+def test_interrupted_download_resumes_with_range(manager, server, monkeypatch):
+    monkeypatch.setattr(SherpaModelManager, "DOWNLOAD_RETRIES", 0)
+    server.drop_after = 300 * 1024
+
+    with pytest.raises(RuntimeError):
+        manager.download_model("fixture")
+
+    part = manager.cache_dir / "fixture.tar.bz2.part"
+    assert part.stat().st_size == 300 * 1024
+    failed = manager.event_service.emitted[-1]
+    assert failed[0] == Events.MODEL_DOWNLOAD_FAILED
+
+    model_dir = manager.download_model("fixture")
+
+    assert server.ranges[-1] == f"bytes={300 * 1024}-"
+    assert manager.is_model_cached("fixture")
+    assert manager.event_service.emitted[-1][1]["resumed_from"] == 300 * 1024
+    assert sorted(p.name for p in model_dir.iterdir()) == sorted(FILES)
+
+
+def test_checksum_mismatch_discards_download(manager):
+    manager.MODELS["fixture"]["sha256"] = "0" * 64
+
+    with pytest.raises(ModelChecksumError):
+        manager.download_model("fixture")
+
+    assert not manager.is_model_cached("fixture")
+    assert not any(manager.cache_dir.glob("*.part"))
+    assert not any(manager.cache_dir.glob(".*.staging"))
+
+
+def test_second_variant_download_keeps_cached_variant(manager, archive):
+    manager.download_model("fixture")
+
+    model_dir = manager.download_model("fixture", variant="fp32")
+
+    assert sorted(p.name for p in model_dir.iterdir()) == sorted(
+        set(FILES + FP32_FILES)
+    )
+    assert manager.get_model_info("fixture")["cached_variants"] == ["int8", "fp32"]
+    config = manager.get_model_config("fixture", "fp32", num_threads=2)
+    assert config["encoder"].endswith("encoder.onnx")
+    assert config["num_threads"] == 2
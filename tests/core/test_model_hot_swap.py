@@ -0,0 +1,275 @@
+"""Model Hot Swap Tests
+
+Tests for switching models and speech services without a transcription gap:
+blue/green engine swap in ModelManager (old engine keeps serving while the
+new one loads, drained before unload, kept on failure), the transcription
+service following the swap, and the background SpeechServiceSwap that
+installs a new service only when dictation is idle.
+"""
+
+import threading
+
+import numpy as np
+
+import sonicinput.speech
+from sonicinput.core.services.config import ConfigKeys
+from sonicinput.core.services.config.config_service_refactored import (
+    RefactoredConfigService,
+)
+from sonicinput.core.services.model_manager import ModelManager
+from sonicinput.core.services.speech_service_swap import SpeechServiceSwap
+from sonicinput.core.services.task_queue_manager import (
+    CancellationToken,
+    TaskCancelledError,
+)
+from sonicinput.core.services.transcription_service_refactored import (
+    RefactoredTranscriptionService,
+)
+
+
+class _FakeEngine:
+    device = "CPU"
+
+    def __init__(self, model_name="blue", load_ok=True):
+        self.model_name = model_name
+        self.load_ok = load_ok
+        self.is_model_loaded = False
+        self.load_gate = threading.Event()
+        self.load_gate.set()
+
+    def load_model(self):
+        self.load_gate.wait(5)
+        self.is_model_loaded = self.load_ok
+        return self.load_ok
+
+    def unload_model(self):
+        self.is_model_loaded = False
+
+    def transcribe(self, audio_data, language=None, temperature=0.0):
+        return {"text": self.model_name, "language": "zh"}
+
+
+def _manager_with(blue, green):
+    manager = ModelManager(lambda: blue, warm_up=False)
+    assert manager.load_model_sync()
+    manager._build_engine = lambda model_name: green
+    return manager
+
+
+def _drain(manager):
+    if manager._drain_thread:
+        manager._drain_thread.join(5)
+
+
+def test_old_engine_serves_until_new_engine_is_ready():
+    blue, green = _FakeEngine("blue"), _FakeEngine("green")
+    manager = _manager_with(blue, green)
+    green.load_gate.clear()
+
+    swap = threading.Thread(target=manager.reload_model, args=("green",))
+    swap.start()
+    try:
+        assert manager.is_model_loaded()
+        with manager.engine_in_use() as engine:
+            assert engine is blue
+    finally:
+        green.load_gate.set()
+        swap.join(5)
+
+    assert manager.get_whisper_engine() is green
+    assert manager._current_model_name == "green"
+    _drain(manager)
+    assert not blue.is_model_loaded
+
+
+def test_old_engine_is_unloaded_only_after_holders_exit():
+    blue, green = _FakeEngine("blue"), _FakeEngine("green")
+    manager = _manager_with(blue, green)
+
+    with manager.engine_in_use() as engine:
+        assert manager.load_model_sync("green")
+        assert manager.get_whisper_engine() is green
+        manager._drain_thread.join(0.2)
+        assert engine.is_model_loaded  # still in use
+
+    _drain(manager)
+    assert not blue.is_model_loaded
+    assert green.is_model_loaded
+
+
+def test_failed_swap_keeps_old_engine_serving():
+    blue = _FakeEngine("blue")
+    manager = _manager_with(blue, _FakeEngine("green", load_ok=False))
+
+    assert not manager.reload_model("green")
+
+    assert manager.is_model_loaded()
+    assert manager.get_whisper_engine() is blue
+    assert "last_error" in manager.get_model_info()
+
+
+def test_preempted_swap_discards_new_engine():
+    blue, green = _FakeEngine("blue"), _FakeEngine("green")
+    manager = _manager_with(blue, green)
+    green.load_gate.clear()
+    token = CancellationToken()
+    errors = []
+
+    def reload():
+        try:
+            manager.reload_model("green", cancel_token=token)
+        except TaskCancelledError as e:
+            errors.append(e)
+
+    swap = threading.Thread(target=reload)
+    swap.start()
+    # Dictation starts while the new engine is still loading
+    token.cancel("preempted")
+    green.load_gate.set()
+    swap.join(5)
+
+    assert len(errors) == 1
+    assert manager.get_whisper_engine() is blue
+    assert not green.is_model_loaded
+    assert not manager.is_swapping
+
+
+def test_rebuilt_engine_reads_variant_and_threads_from_config(monkeypatch):
+    settings = {
+        ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT: "fp32",
+        ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS: 2,
+    }
+
+    class _Config:
+        def get_setting(self, key, default=None):
+            return settings.get(key, default)
+
+    built = []
+    monkeypatch.setattr(
+        sonicinput.speech,
+        "SherpaEngine",
+        lambda model_name, **kwargs: built.append((model_name, kwargs)),
+    )
+    manager = ModelManager(lambda: None, warm_up=False, config_service=_Config())
+    manager._whisper_engine = _FakeEngine("blue")
+    manager._whisper_engine.variant = "int8"
+
+    manager._build_engine("paraformer")
+
+    assert built == [
+        ("paraformer", {"language": "zh", "variant": "fp32", "num_threads": 2})
+    ]
+
+
+def test_variant_change_hot_swaps_local_model(tmp_path):
+    class _LocalService:
+        is_running = True
+
+        def __init__(self):
+            self.reloads = []
+
+        def is_model_loaded(self):
+            return True
+
+        def reload_model_sync(self, model_name=None):
+            self.reloads.append(model_name)
+            return True
+
+    class _Container:
+        def resolve(self, interface):
+            return service
+
+    service = _LocalService()
+    config = RefactoredConfigService(
+        config_path=str(tmp_path / "config.json"), container=_Container()
+    )
+    assert config.load_config()
+    config.set_setting(ConfigKeys.TRANSCRIPTION_PROVIDER, "local")
+
+    config.set_setting(ConfigKeys.TRANSCRIPTION_LOCAL_VARIANT, "fp32", immediate=True)
+    assert config._speech_service_swap.wait(5)
+    config.set_setting(ConfigKeys.TRANSCRIPTION_LOCAL_NUM_THREADS, 2, immediate=True)
+    assert config._speech_service_swap.wait(5)
+
+    # The current model is kept; the new engine picks the settings up from config
+    assert service.reloads == [None, None]
+    config._writer.cleanup()
+
+
+def test_concurrent_load_waits_for_in_flight_load():
+    engine = _FakeEngine()
+    engine.load_gate.clear()
+    manager = ModelManager(lambda: engine, warm_up=False)
+    manager.start()
+    first = threading.Thread(target=manager.load_model_sync)
+    first.start()
+    while manager._load_done.is_set():
+        pass
+
+    threading.Timer(0.05, engine.load_gate.set).start()
+    assert manager.load_model_sync(timeout=5)
+    first.join(5)
+
+
+def test_transcription_service_follows_swapped_engine():
+    blue, green = _FakeEngine("blue"), _FakeEngine("green")
+    service = RefactoredTranscriptionService(lambda: blue)
+    assert service.model_manager.load_model_sync()
+    service.model_manager._build_engine = lambda model_name: green
+    audio = np.zeros(1600, dtype=np.float32)
+
+    assert service.transcribe_sync(audio)["text"] == "blue"
+    assert service.model_manager.reload_model("green")
+    assert service.transcribe_sync(audio)["text"] == "green"
+
+
+class _Service:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_service_swap_waits_for_idle_and_retires_old_service():
+    current = {"service": _Service("old")}
+    busy = [True]
+    cleaned = []
+
+    def install(new_service, trigger):
+        old, current["service"] = current["service"], new_service
+        return old
+
+    swap = SpeechServiceSwap(install, cleaned.append, is_busy=lambda: busy[0])
+    swap.BUSY_POLL_INTERVAL = 0.01
+    swap.schedule(lambda: _Service("new"), {"changed_key": "provider"})
+
+    assert not swap.wait(0.1)  # dictation in progress: old service kept
+    assert current["service"].name == "old"
+
+    busy[0] = False
+    assert swap.wait(5)
+    assert current["service"].name == "new"
+    assert [s.name for s in cleaned] == ["old"]
+
+
+def test_superseded_swap_is_discarded():
+    installed, cleaned, failed = [], [], []
+    gate = threading.Event()
+
+    def slow_build():
+        gate.wait(5)
+        return _Service("stale")
+
+    swap = SpeechServiceSwap(
+        lambda new_service, trigger: installed.append(new_service),
+        cleaned.append,
+        on_failed=failed.append,
+    )
+    swap.schedule(slow_build, {"changed_key": "provider"})
+    first = swap._thread
+    swap.schedule(lambda: _Service("latest"), {"changed_key": "provider"})
+    assert swap.wait(5)
+
+    gate.set()
+    first.join(5)
+    assert [s.name for s in installed] == ["latest"]
+    assert [s.name for s in cleaned] == ["stale"]
+    assert not failed
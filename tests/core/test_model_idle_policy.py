@@ -0,0 +1,178 @@
+"""Model Idle Policy Tests
+
+Tests for idle-timeout model eviction: unloading after the timeout, the
+in-use guard, speculative background reload on prefetch, and the
+transcription service falling back to a cloud service (or waiting) while
+the reload is in flight.
+"""
+
+import threading
+
+import numpy as np
+
+from sonicinput.core.services.model_idle_policy import ModelIdlePolicy, current_rss_mb
+from sonicinput.core.services.model_manager import ModelManager
+from sonicinput.core.services.transcription_service_refactored import (
+    RefactoredTranscriptionService,
+)
+
+
+class _FakeEngine:
+    model_name = "fake"
+    device = "CPU"
+
+    def __init__(self):
+        self.is_model_loaded = False
+        self.loads = 0
+        self.load_gate = threading.Event()
+        self.load_gate.set()
+
+    def load_model(self):
+        self.load_gate.wait(5)
+        self.loads += 1
+        self.is_model_loaded = True
+        return True
+
+    def unload_model(self):
+        self.is_model_loaded = False
+
+    def transcribe(self, audio_data, language=None, temperature=0.0):
+        return {"text": "local", "language": "zh"}
+
+
+class _FakeCloud:
+    provider_id = "fake-cloud"
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio_data, language=None):
+        self.calls += 1
+        return {"text": "cloud", "provider": self.provider_id}
+
+
+class _Config:
+    def __init__(self, settings):
+        self.settings = settings
+
+    def get_setting(self, key, default=None):
+        return self.settings.get(key, default)
+
+
+def _loaded_manager(engine):
+    manager = ModelManager(lambda: engine, warm_up=False)
+    assert manager.load_model_sync()
+    return manager
+
+
+def _service(engine, fallback=None):
+    config = _Config(
+        {
+            "transcription.provider": "local",
+            "transcription.local.idle_unload_minutes": 1,
+            "transcription.local.warm_up": False,
+        }
+    )
+    service = RefactoredTranscriptionService(
+        lambda: engine,
+        config_service=config,
+        fallback_service_factory=(lambda: fallback) if fallback else None,
+    )
+    assert service.model_manager.load_model_sync()
+    return service
+
+
+def _evict(policy):
+    policy.idle_timeout = 0.01
+    policy._last_used -= 1
+    assert policy.maybe_evict()
+
+
+def test_idle_model_is_unloaded_and_memory_reported():
+    engine = _FakeEngine()
+    evicted = []
+    policy = ModelIdlePolicy(_loaded_manager(engine), 60, on_evicted=evicted.append)
+
+    assert not policy.maybe_evict()  # not idle yet
+
+    _evict(policy)
+
+    assert not engine.is_model_loaded
+    assert policy.is_evicted
+    stats = policy.get_stats()
+    assert stats["evictions"] == 1
+    assert "rss_saved_mb" in evicted[0]
+    if current_rss_mb() is not None:
+        assert stats["last_rss_saved_mb"] is not None
+
+
+def test_model_in_use_or_vetoed_is_not_unloaded():
+    engine = _FakeEngine()
+    allowed = [False]
+    policy = ModelIdlePolicy(
+        _loaded_manager(engine), 0.01, can_evict=lambda: allowed[0]
+    )
+    policy._last_used -= 1
+
+    assert not policy.maybe_evict()
+
+    allowed[0] = True
+    with policy.in_use():
+        policy._last_used -= 1
+        assert not policy.maybe_evict()
+    assert engine.is_model_loaded
+
+
+def test_prefetch_reloads_in_background_and_reports_latency():
+    engine = _FakeEngine()
+    reloaded = []
+    policy = ModelIdlePolicy(_loaded_manager(engine), 60, on_reloaded=reloaded.append)
+    assert not policy.prefetch()  # nothing to reload
+
+    _evict(policy)
+    engine.load_gate.clear()
+    assert policy.prefetch()
+    assert policy.is_reloading
+    assert not policy.wait_until_ready(timeout=0.05)
+
+    engine.load_gate.set()
+    assert policy.wait_until_ready(timeout=5)
+    assert engine.is_model_loaded
+    assert not policy.is_evicted
+    assert reloaded[0]["success"]
+    assert policy.get_stats()["last_reload_ms"] is not None
+
+
+def test_service_uses_cloud_fallback_while_reloading():
+    engine = _FakeEngine()
+    cloud = _FakeCloud()
+    service = _service(engine, fallback=cloud)
+    _evict(service.idle_policy)
+    assert service.transcription_core is None
+
+    engine.load_gate.clear()
+    result = service.transcribe_sync(np.zeros(1600, dtype=np.float32))
+
+    assert result["text"] == "cloud"
+    assert result["success"]
+    assert result["fallback_provider"] == "fake-cloud"
+    assert service.idle_policy.is_reloading
+
+    engine.load_gate.set()
+    assert service.idle_policy.wait_until_ready(timeout=5)
+    result = service.transcribe_sync(np.zeros(1600, dtype=np.float32))
+    assert result["text"] == "local"
+    assert cloud.calls == 1
+    assert service.idle_policy.get_stats()["fallback_transcriptions"] == 1
+
+
+def test_service_without_fallback_waits_for_reload():
+    engine = _FakeEngine()
+    service = _service(engine)
+    _evict(service.idle_policy)
+
+    result = service.transcribe_sync(np.zeros(1600, dtype=np.float32))
+
+    assert result["text"] == "local"
+    assert engine.loads == 2
+    assert service.idle_policy.get_stats()["reloads"] == 1
@@ -0,0 +1,139 @@
+"""Model Warm-up Tests
+
+Tests for the warm-up stage run after a model load: first-inference vs
+steady-state metrics, ModelManager integration and CLIModelTester output.
+"""
+
+import time
+
+from sonicinput.core.services.model_manager import ModelManager, ModelState
+from sonicinput.speech.warmup import (
+    SAMPLE_RATE,
+    synthetic_utterance,
+    warm_up_recognizer,
+)
+from sonicinput.utils.cli_model_tester import CLIModelTester
+
+
+class _FakeStream:
+    def __init__(self):
+        self.pending = 0
+        self.finished = False
+
+    def accept_waveform(self, sample_rate, samples):
+        self.pending += len(samples) // (SAMPLE_RATE // 10)
+
+    def input_finished(self):
+        self.finished = True
+
+
+class _FakeRecognizer:
+    """OnlineRecognizer stand-in whose first decode pays a one-off cost"""
+
+    def __init__(self, first_cost=0.05):
+        self.first_cost = first_cost
+        self.decodes = 0
+
+    def create_stream(self):
+        return _FakeStream()
+
+    def is_ready(self, stream):
+        return stream.pending > 0
+
+    def decode_stream(self, stream):
+        if self.decodes == 0:
+            time.sleep(self.first_cost)
+        self.decodes += 1
+        stream.pending -= 1
+
+    def get_result(self, stream):
+        return ""
+
+
+class _FakeEngine:
+    model_name = "fake"
+    device = "CPU"
+
+    def __init__(self, warm_up_error=None):
+        self.is_model_loaded = False
+        self.warm_up_calls = 0
+        self._warm_up_error = warm_up_error
+
+    def load_model(self):
+        self.is_model_loaded = True
+        return True
+
+    def unload_model(self):
+        self.is_model_loaded = False
+
+    def warm_up(self):
+        self.warm_up_calls += 1
+        if self._warm_up_error:
+            raise self._warm_up_error
+        return warm_up_recognizer(_FakeRecognizer(0.0), synthetic_utterance(0.3))
+
+
+class _RecordingEvents:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, event, data=None):
+        self.emitted.append((event, data))
+
+
+def test_warm_up_separates_first_and_steady_latency():
+    recognizer = _FakeRecognizer(first_cost=0.05)
+
+    metrics = warm_up_recognizer(recognizer, synthetic_utterance(0.5), runs=3)
+
+    assert metrics["offline_first_ms"] >= 50
+    assert metrics["offline_steady_ms"] < metrics["offline_first_ms"] / 2
+    assert metrics["streaming_steady_chunk_ms"] < 50
+    assert metrics["audio_seconds"] == 0.5
+
+
+def test_synthetic_utterance_is_deterministic_speech_band_audio():
+    audio = synthetic_utterance(1.0)
+
+    assert audio.dtype.name == "float32"
+    assert audio.size == SAMPLE_RATE
+    assert 0.01 < float(abs(audio).mean()) < 0.5
+    assert (audio == synthetic_utterance(1.0)).all()
+
+
+def test_model_manager_warms_up_after_load():
+    engine = _FakeEngine()
+    events = _RecordingEvents()
+    manager = ModelManager(lambda: engine, events)
+
+    assert manager.load_model_sync()
+
+    assert engine.warm_up_calls == 1
+    assert manager.get_model_state() == ModelState.LOADED
+    loaded = [data for name, data in events.emitted if name == "model_loaded"]
+    assert "offline_first_ms" in loaded[0]["warmup"]
+
+
+def test_warm_up_can_be_disabled_and_failure_does_not_fail_load():
+    disabled = _FakeEngine()
+    assert ModelManager(lambda: disabled, warm_up=False).load_model_sync()
+    assert disabled.warm_up_calls == 0
+
+    failing = _FakeEngine(warm_up_error=RuntimeError("boom"))
+    manager = ModelManager(lambda: failing)
+    assert manager.load_model_sync()
+    assert manager.get_model_state() == ModelState.LOADED
+
+
+def test_cli_model_tester_reports_warm_up_metrics():
+    engine = _FakeEngine()
+    engine.load_model()
+    engine.transcribe = lambda audio, language=None: {"text": "", "language": "zh"}
+    tester = CLIModelTester(engine)
+    tester.register_progress_callback(lambda message: None)
+
+    result = tester.run_test()
+
+    assert result["success"]
+    assert engine.warm_up_calls == 1
+    assert "First Inference (offline)" in tester.format_results(result)
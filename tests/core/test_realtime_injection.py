@@ -0,0 +1,101 @@
+"""Realtime Injection Tests
+
+Tests for the stable-prefix commit policy (K updates or T ms), holding
+back rewrites until a revision settles, committing the tail on endpoint,
+keystroke/rewrite accounting, and per-frame coalescing in the scheduler.
+"""
+
+import threading
+
+from sonicinput.core.controllers.realtime_injection import (
+    RealtimeInjectionScheduler,
+    StablePrefixPlanner,
+)
+
+
+def _replay(planner, updates, step=0.01):
+    """Feed (text) updates at a fixed interval, planning after each one"""
+    now = 0.0
+    plans = []
+    for text in updates:
+        now += step
+        planner.observe(text, now)
+        plan = planner.plan(now)
+        if plan:
+            plans.append((plan.backspaces, plan.text))
+    return plans, now
+
+
+def test_only_prefix_stable_for_k_updates_is_typed():
+    planner = StablePrefixPlanner(stable_updates=2, stable_ms=10_000)
+
+    plans, _ = _replay(planner, ["今", "今天", "今天天", "今天天气"])
+
+    # Each character is typed once it has survived two further updates
+    assert plans == [(0, "今"), (0, "天")]
+    assert planner.typed == "今天"
+
+
+def test_prefix_stable_for_t_ms_is_typed_without_new_updates():
+    planner = StablePrefixPlanner(stable_updates=100, stable_ms=300)
+    planner.observe("你好", 0.0)
+
+    assert planner.plan(0.1) is None
+    assert planner.next_stable_time(0.1) == 0.3
+    assert planner.plan(0.3).text == "你好"
+
+
+def test_flickering_tail_causes_no_rewrites():
+    planner = StablePrefixPlanner(stable_updates=3, stable_ms=10_000)
+    updates = ["我们去", "我们七", "我们去", "我们七", "我们去公", "我们去公园"]
+
+    plans, now = _replay(planner, updates)
+    planner.plan(now, commit_all=True)
+
+    assert planner.typed == "我们去公园"
+    stats = planner.get_stats()
+    assert stats["rewrites"] == 0
+    assert stats["naive_rewrites"] > 0
+    assert stats["keystrokes_saved"] > 0
+
+
+def test_revision_of_typed_text_waits_until_stable():
+    planner = StablePrefixPlanner(stable_updates=2, stable_ms=10_000)
+    _replay(planner, ["你好世界"] * 3)
+    assert planner.typed == "你好世界"
+
+    planner.observe("你好事件", 1.0)
+    assert planner.plan(1.0) is None  # revision not yet stable: keep screen
+
+    planner.observe("你好事件", 1.1)
+    planner.observe("你好事件", 1.2)
+    plan = planner.plan(1.2)
+    assert (plan.backspaces, plan.text) == (2, "事件")
+    assert planner.get_stats()["rewrites"] == 1
+
+
+def test_scheduler_coalesces_bursts_and_commits_on_endpoint():
+    injected = []
+    done = threading.Event()
+
+    def inject(plan):
+        injected.append((plan.backspaces, plan.text))
+        done.set()
+
+    scheduler = RealtimeInjectionScheduler(
+        inject,
+        StablePrefixPlanner(stable_updates=1, stable_ms=10_000),
+        frame_interval=0.05,
+    )
+    scheduler.start()
+    try:
+        for text in ["今", "今天", "今天天", "今天天气"]:
+            scheduler.submit(text)
+        assert done.wait(2)
+        scheduler.submit("今天天气很好", endpoint=True)
+    finally:
+        scheduler.stop()
+
+    # The burst became one injection; the endpoint committed the rest
+    assert injected[0] == (0, "今天天")
+    assert "".join(text for _, text in injected) == "今天天气很好"
@@ -0,0 +1,84 @@
+"""Secure Storage Tests
+
+Tests for lazy, once-per-process key derivation and the decrypted-secret
+cache.
+"""
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.hazmat.primitives.kdf import pbkdf2
+
+from sonicinput.utils import secure_storage
+from sonicinput.utils.secure_storage import SecureStorage
+
+
+@pytest.fixture
+def derive_calls(monkeypatch):
+    """Clear the process-wide key cache and count PBKDF2 derivations"""
+    monkeypatch.setattr(secure_storage, "_derived_keys", {})
+    calls = []
+    original = pbkdf2.PBKDF2HMAC
+
+    class _CountingKDF:
+        def __init__(self, **kwargs):
+            self._kdf = original(**kwargs)
+
+        def derive(self, key_material):
+            calls.append(key_material)
+            return self._kdf.derive(key_material)
+
+    monkeypatch.setattr(pbkdf2, "PBKDF2HMAC", _CountingKDF)
+    return calls
+
+
+class TestKeyDerivation:
+    """Test lazy key derivation"""
+
+    def test_construction_does_not_derive_key(self, derive_calls):
+        storage = SecureStorage()
+
+        assert derive_calls == []
+        assert storage.is_encryption_available()
+        assert derive_calls == []
+
+    def test_key_is_derived_once_per_process(self, derive_calls):
+        first = SecureStorage()
+        second = SecureStorage()
+
+        token = first.encrypt("sk-secret")
+        assert second.decrypt(token) == "sk-secret"
+        assert len(derive_calls) == 1
+
+
+class TestSecretCache:
+    """Test the decrypted-secret cache"""
+
+    def test_decrypt_is_cached_until_invalidated(self, derive_calls):
+        storage = SecureStorage()
+        token = storage.encrypt("sk-secret")
+        cipher = storage._ensure_cipher()
+        decrypts = []
+        original = cipher.decrypt
+
+        class _CountingCipher:
+            def decrypt(self, data):
+                decrypts.append(data)
+                return original(data)
+
+        storage._cipher = _CountingCipher()
+
+        assert storage.decrypt(token) == "sk-secret"
+        assert storage.decrypt(token) == "sk-secret"
+        assert len(decrypts) == 1
+
+        storage.invalidate_secrets()
+        assert storage.decrypt(token) == "sk-secret"
+        assert len(decrypts) == 2
+
+    def test_plain_text_is_returned_unchanged(self, derive_calls):
+        storage = SecureStorage()
+
+        assert storage.decrypt("not-encrypted") == "not-encrypted"
+        assert storage.decrypt("") == ""
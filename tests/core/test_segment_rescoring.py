@@ -0,0 +1,129 @@
+"""Segment Rescoring Tests
+
+Tests for realtime two-pass recognition: closed segments are re-decoded by
+the offline rescorer in the background and replace the streaming text,
+the last segment is rescored synchronously at stop, and sessions fall
+back to streaming text while the offline model is not ready.
+"""
+
+import numpy as np
+
+from sonicinput.speech.segment_rescorer import SegmentRescorer
+from sonicinput.speech.sherpa_streaming import SherpaStreamingSession
+
+
+class FakeStream:
+    def __init__(self):
+        self.finished = False
+
+    def accept_waveform(self, sample_rate, samples):
+        pass
+
+    def input_finished(self):
+        self.finished = True
+
+
+class FakeRecognizer:
+    """Replays (text, endpoint) per decode step"""
+
+    def __init__(self, script, final_text=""):
+        self.script = list(script)
+        self.final_text = final_text
+        self.endpoint = False
+
+    def is_ready(self, stream):
+        return False
+
+    def get_result(self, stream):
+        if stream.finished:
+            return self.final_text
+        text, self.endpoint = self.script.pop(0)
+        return text
+
+    def is_endpoint(self, stream):
+        return self.endpoint
+
+    def reset(self, stream):
+        pass
+
+
+def _offline_decoder(texts):
+    """Offline decoder returning the text keyed by segment length (samples)"""
+    calls = []
+
+    def decode(samples):
+        calls.append(samples.size)
+        return texts[samples.size]
+
+    return decode, calls
+
+
+def _feed(session, steps, samples=1600):
+    for _ in range(steps):
+        session.add_samples(np.zeros(samples, dtype=np.float32))
+        session.get_partial_result()
+
+
+def test_closed_segment_is_rescored_in_background():
+    decode, calls = _offline_decoder({3200: "今天天气好"})
+    rescorer = SegmentRescorer(decoder=decode)
+    rescorer.start()
+    try:
+        assert rescorer.wait_until_ready(2)
+        session = SherpaStreamingSession(
+            FakeRecognizer([("今天", False), ("今天天汽好", True), ("我们", False)]),
+            FakeStream(),
+            rescorer=rescorer,
+        )
+        _feed(session, 2)
+        assert rescorer.wait_idle(2)
+
+        _feed(session, 1)
+    finally:
+        rescorer.stop()
+
+    assert calls == [3200]
+    assert session.get_partial_result() == "今天天气好我们"
+    assert session.segments[0].rescored
+    assert rescorer.get_stats()["segments"] == 1
+
+
+def test_stop_rescores_only_the_last_segment():
+    decode, calls = _offline_decoder({1600: "你好", 3200: "我们走吧"})
+    rescorer = SegmentRescorer(decoder=decode)
+    rescorer.start()
+    try:
+        assert rescorer.wait_until_ready(2)
+        session = SherpaStreamingSession(
+            FakeRecognizer(
+                [("你号", True), ("我们", False), ("我们走", False)], "我们走八"
+            ),
+            FakeStream(),
+            rescorer=rescorer,
+        )
+        _feed(session, 3)
+
+        final = session.get_final_result()
+    finally:
+        rescorer.stop()
+
+    assert final["text"] == "你好我们走吧"
+    assert [s["rescored"] for s in final["segments"]] == [True, True]
+    # Each segment's audio was decoded offline exactly once
+    assert sorted(calls) == [1600, 3200]
+
+
+def test_session_keeps_streaming_text_until_model_is_ready():
+    rescorer = SegmentRescorer(decoder=lambda samples: "离线")
+    # Not started: the offline model is still loading
+    assert not rescorer.is_ready
+    assert not rescorer.submit(np.zeros(10, dtype=np.float32), lambda text: None)
+
+    session = SherpaStreamingSession(
+        FakeRecognizer([("流式", True)], ""), FakeStream(), rescorer=rescorer
+    )
+    _feed(session, 1)
+    final = session.get_final_result()
+
+    assert final["text"] == "流式"
+    assert not final["segments"][0]["rescored"]
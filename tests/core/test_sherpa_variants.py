@@ -0,0 +1,64 @@
+"""Sherpa Model Variant Tests
+
+Tests for the int8/fp32 variant catalog, thread-count selection from
+physical cores, and the RTF/error-rate helpers used by the variant
+benchmark.
+"""
+
+import pytest
+
+from sonicinput.speech.asr_metrics import (
+    error_counts,
+    real_time_factor,
+    tokenize,
+    word_error_rate,
+)
+from sonicinput.speech.sherpa_models import (
+    MAX_NUM_THREADS,
+    SherpaModelManager,
+    recommended_num_threads,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return SherpaModelManager(cache_dir=str(tmp_path))
+
+
+def test_every_model_variant_lists_its_weight_files(manager):
+    for model_name, info in manager.MODELS.items():
+        assert info["default_variant"] in info["variants"]
+        for variant in info["variants"]:
+            files = manager.get_variant_files(model_name, variant)
+            assert files[0] == "tokens.txt"
+            assert all(name.endswith(".onnx") for name in files[1:])
+        int8 = manager.get_variant_files(model_name, "int8")
+        fp32 = manager.get_variant_files(model_name, "fp32")
+        assert set(int8) & set(fp32) == {"tokens.txt"}
+
+
+def test_variant_resolution_falls_back_to_default(manager):
+    assert manager.resolve_variant("paraformer") == "int8"
+    assert manager.resolve_variant("paraformer", "auto") == "int8"
+    assert manager.resolve_variant("paraformer", "fp32") == "fp32"
+    assert manager.resolve_variant("zipformer-small", "fp16") == "fp32"
+    with pytest.raises(ValueError):
+        manager.resolve_variant("missing")
+
+
+def test_thread_count_follows_physical_cores():
+    assert recommended_num_threads(1) == 1
+    assert recommended_num_threads(2) == 2
+    assert recommended_num_threads(4) == 3
+    assert recommended_num_threads(16) == MAX_NUM_THREADS
+    assert 1 <= recommended_num_threads() <= MAX_NUM_THREADS
+
+
+def test_mixed_error_rate_counts_chars_and_words():
+    assert tokenize("你好, Hello World!") == ["你", "好", "hello", "world"]
+    assert error_counts("你好世界", "你好视界") == (1, 4)
+    assert error_counts("open the door", "open door") == (1, 3)
+    pairs = [("你好世界", "你好世界"), ("open the door", "open door")]
+    assert word_error_rate(pairs) == pytest.approx(1 / 7)
+    assert word_error_rate([]) == 0.0
+    assert real_time_factor(0.5, 2.0) == 0.25
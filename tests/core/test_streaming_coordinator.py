@@ -0,0 +1,107 @@
+"""Streaming Coordinator Tests
+
+Tests for the chunked-mode chunk queue: blocking hand-off, id lookup of
+in-flight chunks, zero-copy audio ownership and wait-time metrics.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from sonicinput.core.services.streaming_coordinator import StreamingCoordinator
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = StreamingCoordinator(streaming_mode="chunked")
+    assert coordinator.start()
+    coordinator.start_streaming()
+    yield coordinator
+    coordinator.stop()
+
+
+class TestChunkQueue:
+    """Test chunk hand-off between producer and consumer"""
+
+    def test_blocked_consumer_wakes_on_new_chunk(self, coordinator):
+        received = []
+
+        def consumer():
+            received.append(coordinator.get_next_chunk(timeout=2.0))
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        time.sleep(0.05)
+
+        chunk_id = coordinator.add_streaming_chunk(np.zeros(1600, dtype=np.float32))
+        thread.join(1.0)
+
+        assert not thread.is_alive()
+        assert received[0].chunk_id == chunk_id
+        assert received[0].result_container["wait_time"] < 0.5
+
+    def test_stop_streaming_releases_waiting_consumer(self, coordinator):
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(coordinator.get_next_chunk())
+        )
+        thread.start()
+        time.sleep(0.05)
+
+        coordinator.stop_streaming()
+        thread.join(1.0)
+
+        assert not thread.is_alive()
+        assert result == [None]
+
+    def test_timeout_returns_none(self, coordinator):
+        start = time.monotonic()
+        assert coordinator.get_next_chunk(timeout=0.05) is None
+        assert time.monotonic() - start < 0.5
+
+    def test_picked_chunk_can_still_be_completed(self, coordinator):
+        chunk_id = coordinator.add_streaming_chunk(np.ones(800, dtype=np.float32))
+        chunk = coordinator.get_next_chunk(timeout=1.0)
+        assert coordinator.get_pending_chunk_count() == 0
+
+        coordinator.complete_chunk(chunk_id, {"success": True, "text": "hello"})
+
+        assert chunk.result_event.is_set()
+        assert chunk.result_container["text"] == "hello"
+        stats = coordinator.get_stats()
+        assert stats["completed_chunks"] == 1
+        assert stats["picked_chunks"] == 1
+
+    def test_unpicked_chunk_is_removed_on_completion(self, coordinator):
+        first = coordinator.add_streaming_chunk(np.ones(800, dtype=np.float32))
+        second = coordinator.add_streaming_chunk(np.ones(800, dtype=np.float32))
+
+        coordinator.complete_chunk(first, {"success": True, "text": "a"})
+
+        assert [c.chunk_id for c in coordinator.get_pending_chunks()] == [second]
+        assert coordinator.get_next_chunk(timeout=1.0).chunk_id == second
+
+
+class TestAudioOwnership:
+    """Test zero-copy hand-off of audio buffers"""
+
+    def test_owned_buffer_is_taken_without_copy(self, coordinator):
+        audio = np.arange(1600, dtype=np.float32)
+        coordinator.add_streaming_chunk(audio)
+
+        chunk = coordinator.get_next_chunk(timeout=1.0)
+
+        assert chunk.audio_data is audio
+        assert not audio.flags.writeable
+
+    def test_view_is_copied(self, coordinator):
+        backing = np.arange(3200, dtype=np.float32)
+        coordinator.add_streaming_chunk(backing[1600:])
+
+        chunk = coordinator.get_next_chunk(timeout=1.0)
+        backing[1600] = -1.0
+
+        assert chunk.audio_data[0] == 1600.0
+        assert backing.flags.writeable
@@ -0,0 +1,170 @@
+"""Streaming Segment Tests
+
+Tests for endpoint-aware segment accumulation in SherpaStreamingSession:
+partial results keep every finished sentence across stream resets, sample
+offsets and times per segment, a final result that only decodes the last
+segment, and the realtime coordinator handing the tail to the injector
+without holding its lock during the final decode.
+"""
+
+import threading
+
+import numpy as np
+
+from sonicinput.core.services.events import Events
+from sonicinput.core.services.streaming_coordinator import StreamingCoordinator
+from sonicinput.speech.sherpa_streaming import SherpaStreamingSession
+
+
+class FakeStream:
+    def __init__(self):
+        self.finished = False
+
+    def accept_waveform(self, sample_rate, samples):
+        pass
+
+    def input_finished(self):
+        self.finished = True
+
+
+class FakeRecognizer:
+    """Replays (text, endpoint) per decode step; reset() clears the text"""
+
+    def __init__(self, script, final_text=""):
+        self.script = list(script)
+        self.final_text = final_text
+        self.text = ""
+        self.endpoint = False
+        self.resets = 0
+
+    def is_ready(self, stream):
+        return False
+
+    def get_result(self, stream):
+        if stream.finished:
+            return self.final_text
+        self.text, self.endpoint = self.script.pop(0)
+        return self.text
+
+    def is_endpoint(self, stream):
+        return self.endpoint
+
+    def reset(self, stream):
+        self.resets += 1
+        self.text = ""
+
+
+def _feed(session, steps, samples=1600):
+    results = []
+    for _ in range(steps):
+        session.add_samples(np.zeros(samples, dtype=np.float32))
+        results.append(session.get_partial_result())
+    return results
+
+
+def test_partial_result_keeps_finished_sentences_across_resets():
+    recognizer = FakeRecognizer(
+        [("今天", False), ("今天天气好", True), ("", False), ("我们", False)]
+    )
+    session = SherpaStreamingSession(recognizer, FakeStream())
+
+    results = _feed(session, 4)
+
+    assert results == ["今天", "今天天气好", "今天天气好", "今天天气好我们"]
+    assert recognizer.resets == 1
+    (segment,) = session.segments
+    assert (segment.text, segment.start_sample, segment.end_sample) == (
+        "今天天气好",
+        0,
+        3200,
+    )
+    assert segment.end_time == 0.2
+
+
+def test_final_result_decodes_only_the_tail():
+    recognizer = FakeRecognizer(
+        [("HELLO", True), ("GOOD", False)], final_text="GOOD MORNING"
+    )
+    session = SherpaStreamingSession(recognizer, FakeStream())
+    _feed(session, 2)
+
+    final = session.get_final_result()
+
+    assert final["text"] == "HELLO GOOD MORNING"
+    assert [s["text"] for s in final["segments"]] == ["HELLO", "GOOD MORNING"]
+    assert final["segments"][1]["start_sample"] == 1600
+    assert final["segments"][1]["end_sample"] == 3200
+    # Finalized sessions return the same transcript without decoding again
+    assert session.get_final_result()["text"] == "HELLO GOOD MORNING"
+
+
+class RecordingEvents:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, event, data=None):
+        self.emitted.append((event, data))
+
+
+def test_stop_streaming_hands_tail_to_injector_and_keeps_segments():
+    events = RecordingEvents()
+    coordinator = StreamingCoordinator(events, streaming_mode="realtime")
+    coordinator.start()
+    recognizer = FakeRecognizer(
+        [("你好", True), ("我们", False)], final_text="我们走吧"
+    )
+    coordinator.start_streaming(SherpaStreamingSession(recognizer, FakeStream()))
+
+    for _ in range(2):
+        coordinator.add_realtime_audio(np.zeros(1600, dtype=np.float32))
+    coordinator.stop_streaming()
+
+    updates = [d for e, d in events.emitted if e == Events.REALTIME_TEXT_UPDATED]
+    assert updates[-1]["text"] == "你好我们走吧"
+    assert updates[-1]["endpoint"] is True
+    assert coordinator.get_realtime_text() == "你好我们走吧"
+    assert [s["text"] for s in coordinator.get_realtime_segments()] == [
+        "你好",
+        "我们走吧",
+    ]
+    coordinator.stop()
+
+
+def test_final_decode_runs_without_holding_the_coordinator_lock():
+    class SlowSession:
+        is_active = True
+
+        def __init__(self):
+            self.finishing = threading.Event()
+            self.release = threading.Event()
+
+        def get_final_result(self):
+            # Stands in for waiting on in-flight segment rescoring
+            self.finishing.set()
+            self.release.wait(5)
+            return {"text": "你好", "segments": [{"text": "你好"}]}
+
+    events = RecordingEvents()
+    coordinator = StreamingCoordinator(events, streaming_mode="realtime")
+    coordinator.start()
+    session = SlowSession()
+    coordinator.start_streaming(session)
+
+    stopper = threading.Thread(target=coordinator.stop_streaming)
+    stopper.start()
+    try:
+        assert session.finishing.wait(5)
+        probe = threading.Thread(
+            target=lambda: (coordinator.get_stats(), coordinator.get_realtime_text())
+        )
+        probe.start()
+        probe.join(1)
+        assert not probe.is_alive()
+        assert not coordinator.is_streaming()
+    finally:
+        session.release.set()
+        stopper.join(5)
+
+    assert coordinator.get_realtime_text() == "你好"
+    assert [s["text"] for s in coordinator.get_realtime_segments()] == ["你好"]
+    coordinator.stop()
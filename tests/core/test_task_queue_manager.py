@@ -0,0 +1,308 @@
+"""Task Queue Manager Tests
+
+Tests for the fixed worker pool, heap-backed queue with cancellation
+tombstones, cooperative cancellation tokens, watchdog timeouts and the
+interactive / background lanes.
+"""
+
+import threading
+import time
+
+import pytest
+
+from sonicinput.core.services.task_queue_manager import (
+    TaskLane,
+    TaskPriority,
+    TaskQueueFullError,
+    TaskQueueManager,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+def manager():
+    manager = TaskQueueManager(worker_count=1)
+    assert manager.start()
+    yield manager
+    manager.stop()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def _block_worker(manager):
+    """Occupy the single worker until the returned event is set"""
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker(data):
+        started.set()
+        release.wait(2)
+
+    manager.register_task_handler("block", blocker)
+    manager.submit_task("block")
+    assert started.wait(1)
+    return release
+
+
+class TestQueue:
+    """Test queue ordering and cancellation of queued tasks"""
+
+    def test_higher_priority_runs_first(self, manager):
+        order = []
+        manager.register_task_handler("record", lambda data: order.append(data["n"]))
+        release = _block_worker(manager)
+
+        manager.submit_task("record", {"n": "low"}, priority=TaskPriority.LOW)
+        manager.submit_task("record", {"n": "high"}, priority=TaskPriority.HIGH)
+        manager.submit_task("record", {"n": "normal"})
+        release.set()
+
+        assert _wait_for(lambda: len(order) == 3)
+        assert order == ["high", "normal", "low"]
+
+    def test_cancel_removes_queued_task(self, manager):
+        ran = []
+        manager.register_task_handler("record", lambda data: ran.append(data["n"]))
+        release = _block_worker(manager)
+
+        keep = manager.submit_task("record", {"n": 1})
+        drop = manager.submit_task("record", {"n": 2})
+        assert manager.get_task_status(drop)["status"] == TaskStatus.PENDING.value
+
+        assert manager.cancel_task(drop)
+        assert manager.get_queue_size() == 1
+        assert manager.get_task_status(drop) is None
+        release.set()
+
+        assert _wait_for(lambda: ran == [1])
+        time.sleep(0.05)
+        assert ran == [1]
+        assert manager.get_stats()["cancelled_tasks"] == 1
+        assert manager.get_task_status(keep) is None
+
+    def test_full_lane_rejects_submit_immediately(self, manager, monkeypatch):
+        monkeypatch.setattr(
+            TaskQueueManager,
+            "LANE_CAPACITY",
+            {TaskLane.INTERACTIVE: 4, TaskLane.BACKGROUND: 2},
+        )
+        manager.register_task_handler("noop", lambda data: None)
+        # Background tasks stay queued while the lane is paused
+        manager.pause_lane(TaskLane.BACKGROUND)
+
+        manager.submit_task("noop", lane=TaskLane.BACKGROUND)
+        manager.submit_task("noop", lane=TaskLane.BACKGROUND)
+        start = time.monotonic()
+        with pytest.raises(TaskQueueFullError):
+            manager.submit_task("noop", lane=TaskLane.BACKGROUND)
+        assert time.monotonic() - start < 0.05
+
+        # A full background lane does not affect interactive admission
+        manager.submit_task("noop")
+        assert manager.get_stats()["rejected_tasks"] == 1
+
+
+class TestCancellation:
+    """Test cooperative cancellation and timeouts"""
+
+    def test_running_task_receives_cancel_token(self, manager):
+        started = threading.Event()
+        stopped = threading.Event()
+        results = []
+
+        def handler(data, cancel_token):
+            started.set()
+            while not cancel_token.wait(0.01):
+                pass
+            stopped.set()
+            return "late"
+
+        manager.register_task_handler("loop", handler)
+        task_id = manager.submit_task("loop", callback=results.append)
+        assert started.wait(1)
+
+        assert manager.cancel_task(task_id)
+        assert stopped.wait(1)
+        assert _wait_for(lambda: manager.get_stats()["abandoned_results"] == 1)
+        assert results == []
+
+    def test_timeout_fails_task_without_extra_threads(self, manager):
+        errors = []
+        tokens = []
+
+        def handler(data, cancel_token):
+            tokens.append(cancel_token)
+            cancel_token.wait(2)
+            cancel_token.raise_if_cancelled()
+
+        manager.register_task_handler("slow", handler)
+        threads_before = threading.active_count()
+
+        start = time.monotonic()
+        manager.submit_task("slow", timeout=0.1, error_callback=errors.append)
+
+        assert _wait_for(lambda: errors, timeout=1.0)
+        assert time.monotonic() - start < 1.0
+        assert "timed out" in errors[0]
+        assert tokens[0].reason == "timeout"
+        assert threading.active_count() == threads_before
+        stats = manager.get_stats()
+        assert stats["timed_out_tasks"] == 1
+        assert stats["failed_tasks"] == 1
+
+        # The worker is free again once the handler honours the token
+        done = []
+        manager.register_task_handler("quick", lambda data: done.append(True))
+        manager.submit_task("quick")
+        assert _wait_for(lambda: done)
+
+    def test_timed_out_task_is_retried_with_fresh_token(self, manager):
+        calls = []
+
+        def handler(data, cancel_token):
+            calls.append(cancel_token)
+            if len(calls) == 1:
+                cancel_token.wait(2)
+                return "stale"
+            return "fresh"
+
+        results = []
+        manager.register_task_handler("flaky", handler)
+        manager.submit_task(
+            "flaky", timeout=0.1, max_retries=1, callback=results.append
+        )
+
+        assert _wait_for(lambda: results, timeout=2.0)
+        assert results == ["fresh"]
+        assert calls[0] is not calls[1]
+        assert calls[0].is_cancelled and not calls[1].is_cancelled
+
+    def test_legacy_handler_signature_still_supported(self, manager):
+        results = []
+        manager.register_task_handler("legacy", lambda data: data["x"] * 2)
+        manager.submit_task("legacy", {"x": 21}, timeout=1.0, callback=results.append)
+
+        assert _wait_for(lambda: results == [42])
+
+
+class TestLanes:
+    """Test interactive / background lanes"""
+
+    def test_interactive_lane_runs_before_background(self):
+        manager = TaskQueueManager(worker_count=2)
+        assert manager.start()
+        try:
+            releases = {n: threading.Event() for n in ("bg1", "bg2", "live1")}
+            running = []
+            order = []
+
+            def blocker(data):
+                running.append(data["n"])
+                releases[data["n"]].wait(2)
+
+            manager.register_task_handler("block", blocker)
+            manager.register_task_handler(
+                "record", lambda data: order.append(data["n"])
+            )
+            # Every thread busy: both background slots and one interactive
+            for n in ("bg1", "bg2"):
+                manager.submit_task("block", {"n": n}, lane=TaskLane.BACKGROUND)
+            manager.submit_task("block", {"n": "live1"})
+            assert _wait_for(lambda: len(running) == 3)
+
+            manager.submit_task(
+                "record",
+                {"n": "bg"},
+                priority=TaskPriority.CRITICAL,
+                lane=TaskLane.BACKGROUND,
+            )
+            manager.submit_task("record", {"n": "live"}, priority=TaskPriority.LOW)
+            # The first thread to free up takes the interactive task
+            releases["bg1"].set()
+
+            assert _wait_for(lambda: len(order) == 2)
+            assert order == ["live", "bg"]
+        finally:
+            for release in releases.values():
+                release.set()
+            manager.stop()
+
+    def test_paused_background_lane_holds_tasks(self, manager):
+        ran = []
+        manager.register_task_handler("record", lambda data: ran.append(data["n"]))
+        manager.pause_lane(TaskLane.BACKGROUND)
+
+        manager.submit_task("record", {"n": "bg"}, lane=TaskLane.BACKGROUND)
+        manager.submit_task("record", {"n": "live"})
+
+        assert _wait_for(lambda: ran == ["live"])
+        time.sleep(0.05)
+        assert ran == ["live"]
+        assert not manager.wait_for_lane(TaskLane.BACKGROUND, timeout=0.01)
+
+        manager.resume_lane(TaskLane.BACKGROUND)
+        assert _wait_for(lambda: ran == ["live", "bg"])
+        assert manager.wait_for_lane(TaskLane.BACKGROUND, timeout=0.01)
+
+    def test_preempted_background_task_is_requeued(self, manager):
+        runs = []
+        started = threading.Event()
+
+        def handler(data, cancel_token):
+            runs.append(cancel_token)
+            started.set()
+            if len(runs) == 1:
+                cancel_token.wait(2)
+                cancel_token.raise_if_cancelled()
+            return "done"
+
+        results = []
+        manager.register_task_handler("job", handler)
+        manager.submit_task("job", lane=TaskLane.BACKGROUND, callback=results.append)
+        assert started.wait(1)
+
+        assert manager.pause_lane(TaskLane.BACKGROUND, preempt=True) == 1
+        assert runs[0].reason == "preempted"
+        time.sleep(0.05)
+        assert results == []
+        assert manager.get_stats()["lanes"]["background"]["queued"] == 1
+
+        manager.resume_lane(TaskLane.BACKGROUND)
+        assert _wait_for(lambda: results == ["done"])
+        stats = manager.get_stats()
+        assert stats["preempted_tasks"] == 1
+        assert stats["failed_tasks"] == 0
+
+    def test_background_task_does_not_block_interactive_with_one_worker(self):
+        manager = TaskQueueManager(worker_count=1)
+        assert manager.start()
+        try:
+            release = threading.Event()
+            running = []
+
+            def blocker(data):
+                running.append(data["n"])
+                release.wait(2)
+
+            manager.register_task_handler("block", blocker)
+            manager.submit_task("block", {"n": "bg1"}, lane=TaskLane.BACKGROUND)
+            manager.submit_task("block", {"n": "bg2"}, lane=TaskLane.BACKGROUND)
+            assert _wait_for(lambda: running == ["bg1"])
+
+            # The reserved worker picks up interactive work while bg1 runs
+            manager.submit_task("block", {"n": "live"})
+            assert _wait_for(lambda: running == ["bg1", "live"])
+            time.sleep(0.05)
+            assert running == ["bg1", "live"]
+            release.set()
+            assert _wait_for(lambda: len(running) == 3)
+        finally:
+            release.set()
+            manager.stop()
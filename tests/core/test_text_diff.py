@@ -0,0 +1,55 @@
+"""Text Diff Tests
+
+Tests for the realtime text diff planner: minimal backspace/append plans,
+the overlap merge after a recognizer reset, and the linear-time overlap
+and prefix searches.
+"""
+
+import random
+
+from sonicinput.core.controllers.text_diff_helper import (
+    calculate_text_diff,
+    common_prefix_length,
+    find_tail_overlap,
+)
+
+
+def _apply(screen, plan):
+    backspaces, text = plan
+    return screen[: len(screen) - backspaces] + text
+
+
+def test_plan_rewrites_only_the_unstable_tail():
+    assert calculate_text_diff("你好", "你好世界") == (0, "世界")
+    assert calculate_text_diff("你好世界", "你好事件") == (2, "事件")
+    # A revision early in a long hypothesis keeps the prefix before it
+    old = "今天下午三点在会议室讨论"
+    new = "今天夏午三点在会议室讨论产品"
+    assert calculate_text_diff(old, new) == (len(old) - 2, new[2:])
+
+
+def test_plan_merges_overlap_after_stream_reset():
+    assert calculate_text_diff("今天天气很好我们", "我们去公园") == (0, "去公园")
+    # Unrelated text is rewritten
+    assert calculate_text_diff("abcdef", "xyz") == (6, "xyz")
+
+
+def test_plans_always_end_with_the_new_hypothesis():
+    rng = random.Random(3)
+    for _ in range(300):
+        old = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+        new = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+        assert _apply(old, calculate_text_diff(old, new)).endswith(new)
+
+
+def test_overlap_and_prefix_searches():
+    rng = random.Random(5)
+    for _ in range(300):
+        s1 = "".join(rng.choice("ab") for _ in range(rng.randint(0, 15)))
+        s2 = "".join(rng.choice("ab") for _ in range(rng.randint(0, 15)))
+        start, overlap = find_tail_overlap(s1, s2)
+        assert s1[start : start + overlap] == s2[:overlap]
+        if overlap < len(s2):
+            assert s2[: overlap + 1] not in s1
+
+    assert common_prefix_length("a" * 200 + "b", "a" * 200 + "c") == 200